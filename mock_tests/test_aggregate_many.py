@@ -0,0 +1,75 @@
+import json
+import re
+from typing import List
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from weaviate.classes.aggregate import AggregateQuery, GroupByAggregate, Metrics
+from weaviate.classes.query import Filter
+from weaviate.collections.classes.aggregate import AggregateGroupByReturn, AggregateReturn
+
+
+@pytest.fixture(scope="function")
+def queries(weaviate_mock: HTTPServer) -> List[str]:
+    queries: List[str] = []
+
+    def handler(request: Request) -> Response:
+        query = request.json["query"]
+        queries.append(query)
+        data = {}
+        for alias in re.findall(r"(\w+): Test\(?", query) or ["Test"]:
+            if "groupBy" in query and (alias == "Test" or alias == "aggregate1"):
+                data[alias] = [
+                    {"groupedBy": {"path": ["color"], "value": "red"}, "meta": {"count": 2}}
+                ]
+            else:
+                data[alias] = [{"meta": {"count": 10}, "count": {"maximum": 7}}]
+        return Response(json.dumps({"data": {"Aggregate": data}}))
+
+    weaviate_mock.expect_request("/v1/graphql").respond_with_handler(handler)
+    return queries
+
+
+def _queries() -> list:
+    return [
+        AggregateQuery.over_all(
+            filters=Filter.by_property("count").greater_than(1),
+            return_metrics=Metrics("count").integer(maximum=True),
+        ),
+        AggregateQuery.near_vector(
+            [1.0, 2.0], object_limit=5, group_by=GroupByAggregate(prop="color")
+        ),
+    ]
+
+
+def test_many_merges_the_aggregations(
+    weaviate_client: weaviate.WeaviateClient, queries: List[str]
+) -> None:
+    res = weaviate_client.collections.get("Test").aggregate.many(_queries())
+
+    assert len(queries) == 1
+    assert queries[0].startswith("{Aggregate{aggregate0: Test(")
+    assert " aggregate1: Test(" in queries[0]
+    assert isinstance(res[0], AggregateReturn)
+    assert res[0].total_count == 10
+    assert res[0].properties["count"].maximum == 7
+    assert isinstance(res[1], AggregateGroupByReturn)
+    assert res[1].groups[0].grouped_by.value == "red"
+
+
+def test_many_sends_the_aggregations_concurrently(
+    weaviate_client: weaviate.WeaviateClient, queries: List[str]
+) -> None:
+    res = weaviate_client.collections.get("Test").aggregate.many(
+        _queries(), merge=False, max_concurrency=2
+    )
+
+    assert len(queries) == 2
+    assert all(query.startswith("{Aggregate{Test") for query in queries)
+    assert isinstance(res[0], AggregateReturn)
+    assert res[0].total_count == 10
+    assert isinstance(res[1], AggregateGroupByReturn)
+    assert res[1].groups[0].total_count == 2
@@ -0,0 +1,108 @@
+import json
+import time
+from typing import Dict
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from weaviate.backup import backup
+from weaviate.classes.backup import BackupHandle, BackupStorage
+from weaviate.exceptions import BackupFailedException
+from weaviate.outputs.backup import BackupStatus
+
+
+@pytest.fixture(scope="function")
+def polls(weaviate_mock: HTTPServer, monkeypatch: pytest.MonkeyPatch) -> Dict[str, int]:
+    monkeypatch.setattr(backup, "BACKUP_POLL_INITIAL_INTERVAL", 0.1)
+    polls: Dict[str, int] = {}
+    statuses = {"first": ["STARTED", "TRANSFERRING", "SUCCESS"], "second": ["STARTED", "SUCCESS"]}
+
+    def status(request: Request) -> Response:
+        backup_id = request.path.split("/")[4]
+        polls[backup_id] = polls.get(backup_id, 0) + 1
+        remaining = statuses.get(backup_id, ["FAILED"])
+        return Response(
+            json.dumps(
+                {
+                    "id": backup_id,
+                    "path": f"/backups/{backup_id}",
+                    "status": remaining[min(polls[backup_id], len(remaining)) - 1],
+                    "error": "disk full" if backup_id == "broken" else None,
+                }
+            )
+        )
+
+    weaviate_mock.expect_request("/v1/backups/filesystem", method="POST").respond_with_json(
+        {"id": "first", "path": "/backups/first", "status": "STARTED", "classes": ["Test"]}
+    )
+    for backup_id in ["first", "second", "broken"]:
+        weaviate_mock.expect_request(f"/v1/backups/filesystem/{backup_id}").respond_with_handler(
+            status
+        )
+        weaviate_mock.expect_request(
+            f"/v1/backups/filesystem/{backup_id}/restore", method="GET"
+        ).respond_with_handler(status)
+    return polls
+
+
+def test_create_waits_for_completion(
+    weaviate_client: weaviate.WeaviateClient, polls: Dict[str, int]
+) -> None:
+    ret = weaviate_client.backup.create("first", BackupStorage.FILESYSTEM, wait_for_completion=True)
+    assert ret.status == BackupStatus.SUCCESS
+    assert ret.collections == ["Test"]
+    assert polls == {"first": 3}
+
+
+def test_wait_for_several_backups_concurrently(
+    weaviate_client: weaviate.WeaviateClient, polls: Dict[str, int]
+) -> None:
+    start = time.time()
+    statuses = weaviate_client.backup.wait(
+        [
+            BackupHandle(backup_id="first", backend=BackupStorage.FILESYSTEM),
+            BackupHandle(backup_id="second", backend=BackupStorage.FILESYSTEM, restore=True),
+        ]
+    )
+    # the intervals of both backups (0.1 + 0.2 seconds) overlap
+    assert time.time() - start < 0.6
+    assert [status.status for status in statuses] == [BackupStatus.SUCCESS, BackupStatus.SUCCESS]
+    assert polls == {"first": 3, "second": 2}
+
+    with pytest.raises(BackupFailedException, match="disk full"):
+        weaviate_client.backup.wait(
+            [BackupHandle(backup_id="broken", backend=BackupStorage.FILESYSTEM)]
+        )
+
+
+def test_create_without_waiting_returns_a_handle(
+    weaviate_client: weaviate.WeaviateClient, polls: Dict[str, int]
+) -> None:
+    ret = weaviate_client.backup.create("first", BackupStorage.FILESYSTEM)
+    assert ret.status == BackupStatus.STARTED
+    assert ret.handle == BackupHandle(backup_id="first", backend=BackupStorage.FILESYSTEM)
+    assert polls == {}
+
+    statuses = weaviate_client.backup.wait([ret.handle])
+    assert [status.status for status in statuses] == [BackupStatus.SUCCESS]
+
+    waited = weaviate_client.backup.create(
+        "first", BackupStorage.FILESYSTEM, wait_for_completion=True
+    )
+    assert waited.handle is None
+
+
+def test_wait_stops_polling_the_other_backups_after_a_failure(
+    weaviate_client: weaviate.WeaviateClient, polls: Dict[str, int]
+) -> None:
+    with pytest.raises(BackupFailedException, match="disk full"):
+        weaviate_client.backup.wait(
+            [
+                BackupHandle(backup_id="first", backend=BackupStorage.FILESYSTEM),
+                BackupHandle(backup_id="broken", backend=BackupStorage.FILESYSTEM),
+            ]
+        )
+    time.sleep(0.5)
+    assert polls == {"first": 1, "broken": 1}
@@ -0,0 +1,122 @@
+import json
+import struct
+import uuid
+from typing import List
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_PORT_GRPC, MOCK_SERVER_URL
+from weaviate.config import Config
+from weaviate.proto.v1 import batch_pb2, weaviate_pb2_grpc
+
+
+@pytest.fixture(scope="function")
+def batch_requests(
+    weaviate_no_auth_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> List[batch_pb2.BatchObjectsRequest]:
+    requests: List[batch_pb2.BatchObjectsRequest] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            requests.append(request)
+            return batch_pb2.BatchObjectsReply(
+                errors=[
+                    batch_pb2.BatchObjectsReply.BatchError(index=idx, error="invalid name")
+                    for idx, obj in enumerate(request.objects)
+                    if obj.properties.non_ref_properties["name"] == "invalid"
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    return requests
+
+
+def test_batch_objects_over_grpc(batch_requests: List[batch_pb2.BatchObjectsRequest]) -> None:
+    client = weaviate.Client(
+        MOCK_SERVER_URL, additional_config=Config(grpc_port_experimental=MOCK_PORT_GRPC)
+    )
+    results: List[dict] = []
+    ref_uuid = uuid.uuid4()
+
+    with client.batch(batch_size=2, dynamic=False, use_grpc=True, callback=results.extend) as batch:
+        data = {"name": "valid", "ref": [{"beacon": f"weaviate://localhost/Other/{ref_uuid}"}]}
+        batch.add_data_object(data, "Test", vector=[1.0, 2.0])
+        data["name"] = "modified after being added"
+        batch.add_data_object({"name": "invalid"}, "Test", tenant="tenant1")
+        batch.add_data_object({"name": "valid"}, "Test")
+
+    assert [len(request.objects) for request in batch_requests] == [2, 1]
+    first = batch_requests[0].objects[0]
+    assert first.collection == "Test"
+    assert first.properties.non_ref_properties["name"] == "valid"
+    assert list(first.properties.multi_target_ref_props[0].uuids) == [str(ref_uuid)]
+    assert first.properties.multi_target_ref_props[0].target_collection == "Other"
+    assert struct.unpack("2f", first.vector_bytes) == (1.0, 2.0)
+    assert batch_requests[0].objects[1].tenant == "tenant1"
+
+    assert [result["result"] for result in results] == [
+        {},
+        {"errors": {"error": [{"message": "invalid name"}]}},
+        {},
+    ]
+
+
+def test_ambiguous_objects_are_sent_with_rest(
+    weaviate_no_auth_mock: HTTPServer, batch_requests: List[batch_pb2.BatchObjectsRequest]
+) -> None:
+    rest_objects: List[dict] = []
+
+    def handler(request: Request) -> Response:
+        rest_objects.extend(request.json["objects"])
+        return Response(
+            json.dumps([{**obj, "result": {}} for obj in request.json["objects"]]),
+            content_type="application/json",
+        )
+
+    weaviate_no_auth_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+    client = weaviate.Client(
+        MOCK_SERVER_URL, additional_config=Config(grpc_port_experimental=MOCK_PORT_GRPC)
+    )
+    results: List[dict] = []
+    uuid1, uuid2 = uuid.uuid4(), uuid.uuid4()
+
+    with client.batch(batch_size=4, dynamic=False, use_grpc=True, callback=results.extend) as batch:
+        # a geo-coordinate or an object property with the same keys
+        batch.add_data_object({"location": {"latitude": 1.0, "longitude": 2.0}}, "Test")
+        batch.add_data_object(
+            {"name": "valid", "ref": [{"beacon": f"weaviate://localhost/{uuid1}"}]}, "Test"
+        )
+        batch.add_data_object(
+            {
+                "ref": [
+                    {"beacon": f"weaviate://localhost/A/{uuid1}"},
+                    {"beacon": f"weaviate://localhost/B/{uuid2}"},
+                ]
+            },
+            "Test",
+        )
+        batch.add_data_object({"phone": {"input": "020 1234567"}}, "Test")
+
+    assert [len(request.objects) for request in batch_requests] == [1]
+    assert list(batch_requests[0].objects[0].properties.single_target_ref_props[0].uuids) == [
+        str(uuid1)
+    ]
+    assert [list(obj["properties"]) for obj in rest_objects] == [["location"], ["ref"], ["phone"]]
+    assert [list(result["properties"]) for result in results] == [
+        ["location"],
+        ["name", "ref"],
+        ["ref"],
+        ["phone"],
+    ]
+
+
+def test_use_grpc_requires_grpc_connection(weaviate_no_auth_mock: HTTPServer) -> None:
+    client = weaviate.Client(MOCK_SERVER_URL)
+    with pytest.raises(ValueError):
+        client.batch.configure(use_grpc=True)
@@ -0,0 +1,94 @@
+import json
+import threading
+import time
+import uuid
+from typing import Generator, List, Tuple
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP
+
+PIPELINE_PORT = 23538
+
+
+@pytest.fixture(scope="function")
+def threaded_weaviate_mock() -> Generator[HTTPServer, None, None]:
+    server = HTTPServer(host=MOCK_IP, port=PIPELINE_PORT, threaded=True)
+    server.start()
+    server.expect_request("/v1/meta").respond_with_json({"version": "1.25"})
+    server.expect_request("/v1/.well-known/openid-configuration").respond_with_response(
+        Response(json.dumps({}), status=404)
+    )
+    server.expect_request("/v1/nodes").respond_with_json(
+        {"nodes": [{"stats": {"objectCount": 0}, "batchStats": {"ratePerSecond": 1000}}]}
+    )
+    yield server
+    server.clear()
+    server.stop()
+
+
+def test_slow_batch_does_not_block_other_workers(threaded_weaviate_mock: HTTPServer) -> None:
+    """A slow request only occupies its own worker, the other workers keep on sending."""
+    sent: List[int] = []
+    lock = threading.Lock()
+    slow_done = threading.Event()
+
+    def handler(request: Request) -> Response:
+        with lock:
+            sent.append(len(request.json["objects"]))
+            first = len(sent) == 1
+        if first:
+            time.sleep(1)
+            slow_done.set()
+        return Response(json.dumps([]))
+
+    threaded_weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+    client = weaviate.Client(f"http://{MOCK_IP}:{PIPELINE_PORT}")
+
+    sent_during_slow_request = 0
+    with client.batch(batch_size=2, num_workers=2, dynamic=False) as batch:
+        for _ in range(20):
+            batch.add_data_object({"name": "test"}, "Test", uuid.uuid4())
+            if not slow_done.is_set():
+                sent_during_slow_request = len(sent)
+
+    assert sum(sent) == 20
+    assert sent_during_slow_request > 2
+
+
+def test_references_wait_for_their_objects(threaded_weaviate_mock: HTTPServer) -> None:
+    """References are only sent once the objects that were in flight when they were added are acknowledged."""
+    events: List[Tuple[str, int]] = []
+    lock = threading.Lock()
+
+    def objects_handler(request: Request) -> Response:
+        time.sleep(0.2)
+        with lock:
+            events.append(("objects", len(request.json["objects"])))
+        return Response(json.dumps([]))
+
+    def references_handler(request: Request) -> Response:
+        with lock:
+            events.append(("references", len(request.json)))
+        return Response(json.dumps([]))
+
+    threaded_weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    threaded_weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(
+        references_handler
+    )
+    client = weaviate.Client(f"http://{MOCK_IP}:{PIPELINE_PORT}")
+
+    with client.batch(batch_size=2, num_workers=4, dynamic=False) as batch:
+        for _ in range(4):
+            from_uuid, to_uuid = uuid.uuid4(), uuid.uuid4()
+            batch.add_data_object({"name": "from"}, "Test", from_uuid)
+            batch.add_data_object({"name": "to"}, "Test", to_uuid)
+            batch.add_reference(from_uuid, "Test", "ref", to_uuid, "Test")
+
+    first_reference = next(i for i, (kind, _) in enumerate(events) if kind == "references")
+    assert sum(n for kind, n in events[:first_reference] if kind == "objects") >= 2
+    assert sum(n for kind, n in events if kind == "objects") == 8
+    assert sum(n for kind, n in events if kind == "references") == 4
@@ -0,0 +1,74 @@
+import threading
+import uuid
+from typing import List, Set
+
+import grpc
+import pytest
+
+import weaviate
+from weaviate.proto.v1 import properties_pb2, search_get_pb2, weaviate_pb2_grpc
+
+EXISTING = {uuid.UUID(int=i) for i in range(0, 5000, 2)}
+
+
+class _MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requested: List[Set[str]] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        ids = set(request.filters.value_text_array.values)
+        with self.lock:
+            self.requested.append(ids)
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=id_.bytes,
+                        creation_time_unix=1,
+                        creation_time_unix_present=True,
+                        last_update_time_unix=2,
+                        last_update_time_unix_present=True,
+                    ),
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={"name": properties_pb2.Value(text_value=str(id_.int))}
+                        )
+                    ),
+                )
+                for id_ in EXISTING
+                if str(id_) in ids
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def service(start_grpc_server: grpc.Server) -> _MockWeaviateService:
+    service = _MockWeaviateService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
+def test_exists_many(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    uuids = [uuid.UUID(int=i) for i in range(2500)] + [uuid.UUID(int=0)]
+    existing = weaviate_client.collections.get("Test").data.exists_many(uuids)
+
+    assert existing == {id_ for id_ in EXISTING if id_.int < 2500}
+    assert sorted(len(ids) for ids in service.requested) == [500, 1000, 1000]
+
+
+def test_fetch_objects_by_ids(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    objects = weaviate_client.collections.get("Test").query.fetch_objects_by_ids(
+        [uuid.UUID(int=2), str(uuid.UUID(int=3)), uuid.UUID(int=4)]
+    )
+
+    assert len(service.requested) == 1
+    assert sorted(objects) == [uuid.UUID(int=2), uuid.UUID(int=4)]
+    assert objects[uuid.UUID(int=4)].properties == {"name": "4"}
+    assert objects[uuid.UUID(int=4)].metadata.last_update_time is not None
@@ -0,0 +1,182 @@
+import datetime
+import threading
+import uuid
+from typing import List, Tuple
+
+import grpc
+import pytest
+
+import weaviate
+from weaviate.classes.query import ChangesCheckpoint
+from weaviate.collections import changes as changes_module
+from weaviate.proto.v1 import base_pb2, search_get_pb2, weaviate_pb2_grpc
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+START_MS = int(START.timestamp() * 1000)
+
+
+def _matches(filters: base_pb2.Filters, obj: Tuple[uuid.UUID, int]) -> bool:
+    if filters.operator == base_pb2.Filters.OPERATOR_AND:
+        return all(_matches(operand, obj) for operand in filters.filters)
+    if filters.operator == base_pb2.Filters.OPERATOR_OR:
+        return any(_matches(operand, obj) for operand in filters.filters)
+    if filters.target.property == "_id":
+        assert filters.operator == base_pb2.Filters.OPERATOR_NOT_EQUAL
+        return obj[0] != uuid.UUID(filters.value_text)
+    assert filters.target.property == "_lastUpdateTimeUnix"
+    value = int(datetime.datetime.fromisoformat(filters.value_text).timestamp() * 1000)
+    return {
+        base_pb2.Filters.OPERATOR_GREATER_THAN_EQUAL: obj[1] >= value,
+        base_pb2.Filters.OPERATOR_GREATER_THAN: obj[1] > value,
+        base_pb2.Filters.OPERATOR_EQUAL: obj[1] == value,
+    }[filters.operator]
+
+
+class _MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        # a few hundred objects sharing a handful of update times, so that ties cross the pages
+        self.objects: List[Tuple[uuid.UUID, int]] = [
+            (uuid.UUID(int=i + 1), START_MS + i // 60) for i in range(250)
+        ]
+        self.requests: List[search_get_pb2.SearchRequest] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.requests.append(request)
+        assert request.sort_by[0].path == ["_lastUpdateTimeUnix"]
+        assert request.metadata.last_update_time_unix
+        # like Weaviate, the offset is applied after the filters and fails beyond QUERY_MAXIMUM_RESULTS
+        assert request.offset + request.limit <= 10_000
+        objects = [
+            obj
+            for obj in self.objects
+            if not request.HasField("filters") or _matches(request.filters, obj)
+        ]
+        # objects with the same update time are not returned in a stable order
+        objects.sort(key=lambda obj: (obj[1], -obj[0].int))
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=id_.bytes,
+                        last_update_time_unix=update_time,
+                        last_update_time_unix_present=True,
+                    )
+                )
+                for id_, update_time in objects[request.offset : request.offset + request.limit]
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def service(start_grpc_server: grpc.Server) -> _MockWeaviateService:
+    service = _MockWeaviateService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
+def test_changes_returns_each_object_once_and_resumes_from_the_checkpoint(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    collection = weaviate_client.collections.get("Test")
+    changes = collection.changes(return_properties=[], lag=0.001)
+
+    ids = [obj.uuid for obj in changes]
+    assert sorted(ids) == sorted(id_ for id_, _ in service.objects)
+    assert not service.requests[0].HasField("filters")
+    # the pages are read with a keyset, every object is read once and then once more in the lag window
+    assert all(request.offset == 0 for request in service.requests)
+    assert len(service.requests) == 4
+    checkpoint = changes.checkpoint
+    assert checkpoint is not None
+    assert checkpoint.update_time == START + datetime.timedelta(milliseconds=4)
+    assert checkpoint.uuid == ids[-1]
+    # the objects returned during the lag window, from 3ms to 4ms
+    assert {id_ for id_, _ in checkpoint.seen} == {uuid.UUID(int=i + 1) for i in range(180, 250)}
+
+    service.objects[3] = (service.objects[3][0], START_MS + 4)
+    service.objects.append((uuid.UUID(int=1000), START_MS + 5))
+    # committed after the checkpoint was taken, but with an earlier update time
+    service.objects.append((uuid.UUID(int=2000), START_MS + 3))
+    resumed = collection.changes(return_properties=[], since=checkpoint, lag=0.001)
+    assert [obj.uuid for obj in resumed] == [
+        uuid.UUID(int=2000),
+        uuid.UUID(int=4),
+        uuid.UUID(int=1000),
+    ]
+
+
+def test_changes_reads_the_lag_window_again(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    changes = weaviate_client.collections.get("Test").changes(return_properties=[])
+
+    assert sorted(obj.uuid for obj in changes) == sorted(id_ for id_, _ in service.objects)
+    assert changes.checkpoint is not None
+    assert len(changes.checkpoint.seen) == len(service.objects)
+    # the last pass starts at the lag window and only reads objects that were returned before
+    assert len(service.requests) == 6
+    assert service.requests[3].filters.value_text == (
+        START + datetime.timedelta(milliseconds=4) - datetime.timedelta(seconds=1)
+    ).isoformat(timespec="microseconds")
+
+
+def test_changes_since_a_datetime_polls_for_new_changes(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    changes = weaviate_client.collections.get("Test").changes(
+        return_properties=[],
+        since=START + datetime.timedelta(milliseconds=4),
+        poll_interval=0.01,
+    )
+
+    ids = [next(changes).uuid for _ in range(10)]
+    assert sorted(ids) == [uuid.UUID(int=i + 1) for i in range(240, 250)]
+    threading.Timer(
+        0.1, lambda: service.objects.append((uuid.UUID(int=1000), START_MS + 4))
+    ).start()
+    assert next(changes).uuid == uuid.UUID(int=1000)
+    assert len(service.requests) > 2
+    assert isinstance(changes.checkpoint, ChangesCheckpoint)
+    assert len(changes.checkpoint.seen) == 11
+
+
+def test_changes_caps_the_lag_window_by_count(
+    weaviate_client: weaviate.WeaviateClient,
+    service: _MockWeaviateService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(changes_module, "CHANGES_MAX_SEEN", 50)
+    service.objects = [(uuid.UUID(int=i + 1), START_MS + i // 10) for i in range(1_000)]
+    changes = weaviate_client.collections.get("Test").changes(return_properties=[])
+
+    ids = [obj.uuid for obj in changes]
+    assert sorted(ids) == sorted(id_ for id_, _ in service.objects)
+    assert len(ids) == len(set(ids))
+    # ten full pages and an empty one for all objects, then a single page for the window of the latest 50 of them
+    assert len(service.requests) == 12
+    assert all(request.offset == 0 for request in service.requests)
+    checkpoint = changes.checkpoint
+    assert checkpoint is not None and len(checkpoint.seen) == 50
+    assert checkpoint.dropped_until == START + datetime.timedelta(milliseconds=94)
+
+    service.objects.append((uuid.UUID(int=2000), START_MS + 90))  # older than the window
+    service.objects.append((uuid.UUID(int=3000), START_MS + 96))  # committed late within it
+    resumed = weaviate_client.collections.get("Test").changes(
+        return_properties=[], since=checkpoint
+    )
+    assert [obj.uuid for obj in resumed] == [uuid.UUID(int=3000)]
+
+
+def test_changes_pages_through_more_objects_with_the_same_update_time_than_a_page(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    service.objects = [(uuid.UUID(int=i + 1), START_MS) for i in range(250)]
+    changes = weaviate_client.collections.get("Test").changes(return_properties=[])
+
+    ids = [obj.uuid for obj in changes]
+    assert sorted(ids) == sorted(id_ for id_, _ in service.objects)
+    assert len(ids) == len(set(ids))
+    # the objects are excluded by their UUID for the first page and skipped with an offset beyond that
+    assert [request.offset for request in service.requests[:3]] == [0, 0, 200]
@@ -1,7 +1,7 @@
 import datetime
 import json
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Set
 
 import grpc
 import pytest
@@ -25,9 +25,15 @@ from weaviate.collections.classes.config import (
     VectorIndexType,
     ShardingConfig,
 )
+from weaviate.config import ConnectionConfig
 from weaviate.connect.base import ConnectionParams, ProtocolParams
 from weaviate.connect.integrations import _IntegrationConfig
-from weaviate.exceptions import UnexpectedStatusCodeError, WeaviateStartUpError
+from weaviate.exceptions import (
+    UnexpectedStatusCodeError,
+    WeaviateInvalidInputError,
+    WeaviateStartUpError,
+)
+from weaviate.proto.v1 import batch_pb2, weaviate_pb2_grpc
 
 ACCESS_TOKEN = "HELLO!IamAnAccessToken"
 REFRESH_TOKEN = "UseMeToRefreshYourAccessToken"
@@ -142,6 +148,27 @@ def test_closed_connection(weaviate_auth_mock: HTTPServer, start_grpc_server: gr
         collection.data.insert_many([{}])
 
 
+def test_closed_clients_are_not_counted_on_their_event_loop(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            connection=ConnectionConfig(event_loop_shards=2)
+        ),
+    )
+    assert client._event_loop is not None
+    clients = client._event_loop.clients
+    client.close()
+    client.close()
+    assert client._event_loop.clients == clients - 1
+    client.connect()
+    assert client._event_loop.clients == clients
+    client.close()
+
+
 def test_missing_multi_tenancy_config(
     weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
 ) -> None:
@@ -370,3 +397,102 @@ def test_node_with_timeout(
 
     nodes = client.cluster.nodes(output=output)
     assert nodes[0].status == "TIMEOUT"
+
+
+def test_wait_for_vector_indexing_drops_ready_shards(
+    weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    polls: Dict[str, int] = {}
+
+    def shards(request: Request) -> Response:
+        tenant = request.args["tenant"]
+        polls[tenant] = polls.get(tenant, 0) + 1
+        queue = 0 if tenant == "tenant1" or polls[tenant] > 2 else 10
+        return Response(json.dumps([{"name": "abc", "status": "READY", "vectorQueueSize": queue}]))
+
+    weaviate_mock.expect_request("/v1/schema/Test/shards").respond_with_handler(shards)
+
+    weaviate_client.batch.wait_for_vector_indexing(
+        shards=[
+            wvc.batch.Shard(collection="Test", tenant="tenant1"),
+            wvc.batch.Shard(collection="Test", tenant="tenant2"),
+        ],
+        max_concurrent_requests=1,
+    )
+    assert polls == {"tenant1": 1, "tenant2": 3}
+
+
+def test_wait_for_vector_indexing_with_nodes_status(
+    ready_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    polls = 0
+
+    def nodes(request: Request) -> Response:
+        nonlocal polls
+        polls += 1
+        assert request.args["output"] == "verbose"
+        status = "INDEXING" if polls == 1 else "READY"
+        shards = [
+            {"class": "Test", "name": "tenant1", "vectorIndexingStatus": "READY"},
+            {"class": "Test", "name": "tenant2", "vectorIndexingStatus": status},
+            {"class": "Other", "name": "abc", "vectorIndexingStatus": "READY"},
+        ]
+        return Response(json.dumps({"nodes": [{"name": "node1", "shards": shards}]}))
+
+    ready_mock.expect_request("/v1/meta").respond_with_json({"version": "1.25"})
+    ready_mock.expect_request("/v1/nodes").respond_with_handler(nodes)
+
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC, skip_init_checks=True
+    )
+    client.batch.wait_for_vector_indexing(
+        shards=[
+            wvc.batch.Shard(collection="Test", tenant="tenant1"),
+            wvc.batch.Shard(collection="Test", tenant="tenant2"),
+            wvc.batch.Shard(collection="Test", tenant="inactive"),
+            wvc.batch.Shard(collection="Other"),
+        ],
+        use_nodes_status=True,
+    )
+    assert polls == 2
+    client.close()
+
+
+def test_tenant_grouped_batching(
+    weaviate_client: weaviate.WeaviateClient,
+    weaviate_mock: HTTPServer,
+    start_grpc_server: grpc.Server,
+) -> None:
+    tenants_per_request: List[Set[str]] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            tenants_per_request.append({obj.tenant for obj in request.objects})
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    weaviate_mock.expect_request("/v1/schema").respond_with_json({"classes": []})
+
+    with weaviate_client.batch.tenant_grouped(batch_size=10, max_wait_seconds=60) as batch:
+        for i in range(100):
+            batch.add_object(collection="Test", properties={"i": i}, tenant=f"tenant{i % 5}")
+        batch.add_object(collection="Test", properties={"i": 100}, tenant="small")
+
+    assert len(tenants_per_request) == 11
+    assert all(len(tenants) == 1 for tenants in tenants_per_request)
+    assert {"small"} in tenants_per_request
+    assert len(weaviate_client.batch.failed_objects) == 0
+
+
+@pytest.mark.parametrize(
+    "max_wait_seconds,max_queue_size", [(0, 10_000), (-1.0, 10_000), (1.0, 0), (1.0, 99)]
+)
+def test_tenant_grouped_batching_rejects_invalid_limits(
+    weaviate_client: weaviate.WeaviateClient, max_wait_seconds: float, max_queue_size: int
+) -> None:
+    with pytest.raises(WeaviateInvalidInputError):
+        weaviate_client.batch.tenant_grouped(
+            batch_size=100, max_wait_seconds=max_wait_seconds, max_queue_size=max_queue_size
+        )
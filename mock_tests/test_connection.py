@@ -7,7 +7,9 @@ from pytest_httpserver import HTTPServer
 from werkzeug import Request, Response
 
 import weaviate
-from mock_tests.conftest import MOCK_SERVER_URL, MOCK_IP, MOCK_PORT
+from mock_tests.conftest import MOCK_SERVER_URL, MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from weaviate.config import AdditionalConfig, ConnectionConfig
+from weaviate.exceptions import AuthenticationFailedError
 
 
 @pytest.mark.parametrize(
@@ -64,3 +66,44 @@ def test_wait_for_weaviate(httpserver: HTTPServer):
 def test_user_pw_in_url(weaviate_mock):
     """Test that user and pw can be in the url."""
     weaviate.Client("http://user:pw@" + MOCK_IP + ":" + str(MOCK_PORT))  # no exception
+
+
+def test_server_version_is_cached_per_url(
+    ready_mock: HTTPServer, start_grpc_server, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("weaviate.connect.v4._server_versions", {})
+    requests = []
+
+    def meta(request: Request) -> Response:
+        requests.append(request.path)
+        return Response(json.dumps({"version": "1.25.0"}))
+
+    ready_mock.expect_request("/v1/meta").respond_with_handler(meta)
+    config = AdditionalConfig(connection=ConnectionConfig(server_version_ttl=60))
+    for _ in range(3):
+        with weaviate.connect_to_local(
+            host=MOCK_IP,
+            port=MOCK_PORT,
+            grpc_port=MOCK_PORT_GRPC,
+            skip_init_checks=True,
+            additional_config=config,
+        ) as client:
+            assert client._connection._weaviate_version.is_at_least(1, 25, 0)
+    assert requests == ["/v1/meta"]
+
+
+def test_missing_login_is_reported_before_other_failures(
+    ready_mock: HTTPServer, start_grpc_server
+) -> None:
+    ready_mock.expect_request("/v1/.well-known/openid-configuration").respond_with_json(
+        {"href": MOCK_SERVER_URL + "/endpoints", "clientId": "client"}
+    )
+    ready_mock.expect_request("/v1/meta").respond_with_response(Response(status=401))
+    with pytest.raises(AuthenticationFailedError, match="No login credentials provided"):
+        weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+
+
+@pytest.mark.parametrize("ttl", [0, -1.5])
+def test_server_version_ttl_must_be_positive(ttl: float) -> None:
+    with pytest.raises(ValueError):
+        ConnectionConfig(server_version_ttl=ttl)
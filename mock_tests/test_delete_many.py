@@ -0,0 +1,78 @@
+import uuid
+from typing import Any, List
+
+import grpc
+import pytest
+
+import weaviate
+from weaviate.classes.query import Filter
+from weaviate.collections.classes.batch import DeleteManyReturn
+from weaviate.proto.v1 import batch_delete_pb2, weaviate_pb2_grpc
+
+
+class _MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self, objects: int, per_request: int) -> None:
+        self.objects = [uuid.uuid4() for _ in range(objects)]
+        self.per_request = per_request
+        self.requests = 0
+
+    def BatchDelete(
+        self, request: batch_delete_pb2.BatchDeleteRequest, context: grpc.ServicerContext
+    ) -> batch_delete_pb2.BatchDeleteReply:
+        self.requests += 1
+        deleted = self.objects[: self.per_request]
+        if not request.dry_run:
+            self.objects = self.objects[self.per_request :]
+        return batch_delete_pb2.BatchDeleteReply(
+            matches=len(deleted),
+            successful=len(deleted),
+            failed=0,
+            objects=(
+                [
+                    batch_delete_pb2.BatchDeleteObject(uuid=id_.bytes, successful=True)
+                    for id_ in deleted
+                ]
+                if request.verbose
+                else []
+            ),
+        )
+
+
+@pytest.fixture(scope="function")
+def service(start_grpc_server: grpc.Server) -> _MockWeaviateService:
+    service = _MockWeaviateService(objects=7, per_request=3)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
+def test_delete_many_until_done(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    objects = list(service.objects)
+    progress: List[DeleteManyReturn[Any]] = []
+    res = weaviate_client.collections.get("Test").data.delete_many(
+        Filter.by_property("name").equal("a"),
+        verbose=True,
+        until_done=True,
+        on_progress=progress.append,
+    )
+
+    assert (res.matches, res.successful, res.failed, res.objects) == (7, 7, 0, None)
+    assert [round_.successful for round_ in progress] == [3, 3, 1, 0]
+    assert [obj.uuid for round_ in progress for obj in round_.objects] == objects
+    assert service.objects == []
+
+
+def test_delete_many_sends_a_single_request_by_default(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    collection = weaviate_client.collections.get("Test")
+    assert collection.data.delete_many(Filter.by_property("name").equal("a")).successful == 3
+    assert (
+        collection.data.delete_many(
+            Filter.by_property("name").equal("a"), dry_run=True, until_done=True
+        ).matches
+        == 3
+    )
+    assert service.requests == 2
+    assert len(service.objects) == 4
@@ -1,6 +1,8 @@
+import json
 from http.server import HTTPServer
 
 import pytest as pytest
+from werkzeug.wrappers import Request, Response
 
 import weaviate
 from mock_tests.conftest import MOCK_SERVER_URL
@@ -19,3 +21,24 @@ def test_warning_old_weaviate(recwarn, ready_mock: HTTPServer, version: str, war
         assert any(str(w.message).startswith("Dep003") for w in recwarn)
     else:
         assert not any(str(w.message).startswith("Dep003") for w in recwarn)
+
+
+def test_execute_many_returns_results_in_order(weaviate_no_auth_mock: HTTPServer):
+    def handler(request: Request) -> Response:
+        return Response(json.dumps({"data": {"query": request.json["query"]}}))
+
+    weaviate_no_auth_mock.expect_request("/v1/graphql").respond_with_handler(handler)
+    client = weaviate.Client(MOCK_SERVER_URL)
+
+    queries = [client.query.get(f"Class{i}", ["name"]) for i in range(10)] + ["{Get{Raw{name}}}"]
+    results = client.query.execute_many(queries, max_concurrency=4)
+
+    assert [result["data"]["query"] for result in results] == [
+        query if isinstance(query, str) else query.build() for query in queries
+    ]
+
+
+def test_execute_many_rejects_invalid_queries(weaviate_no_auth_mock: HTTPServer):
+    client = weaviate.Client(MOCK_SERVER_URL)
+    with pytest.raises(TypeError):
+        client.query.execute_many([{"query": "{Get{Raw{name}}}"}])  # type: ignore
@@ -0,0 +1,184 @@
+import contextlib
+from typing import Any, ContextManager, Dict, Generator, List, Tuple
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from mock_tests.mock_data import mock_class
+from weaviate.config import AdditionalConfig
+from weaviate.exceptions import WeaviateQueryError
+from weaviate.instrumentation import (
+    BatchSendEvent,
+    BatchStateEvent,
+    Instrumentation,
+    RequestEvent,
+)
+from weaviate.proto.v1 import batch_pb2, search_get_pb2, weaviate_pb2_grpc
+
+
+class _Recorder(Instrumentation):
+    def __init__(self) -> None:
+        self.requests: List[RequestEvent] = []
+        self.batches: List[BatchSendEvent] = []
+        self.states: List[BatchStateEvent] = []
+        self.spans: List[Tuple[str, Dict[str, Any]]] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.requests.append(event)
+
+    def on_batch_send(self, event: BatchSendEvent) -> None:
+        self.batches.append(event)
+
+    def on_batch_state(self, event: BatchStateEvent) -> None:
+        self.states.append(event)
+
+    def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+        self.spans.append((name, attributes))
+        return contextlib.nullcontext()
+
+
+@pytest.fixture(scope="function")
+def recorder() -> _Recorder:
+    return _Recorder()
+
+
+@pytest.fixture(scope="function")
+def instrumented_client(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server, recorder: _Recorder
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            if request.collection == "Broken":
+                context.abort(grpc.StatusCode.INTERNAL, "broken")
+            return search_get_pb2.SearchReply(results=[search_get_pb2.SearchResult()])
+
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    client = weaviate.connect_to_local(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=AdditionalConfig(instrumentation=recorder),
+    )
+    yield client
+    client.close()
+
+
+def test_grpc_requests_are_reported(
+    instrumented_client: weaviate.WeaviateClient, recorder: _Recorder
+) -> None:
+    instrumented_client.collections.get("Test").query.fetch_objects()
+    with pytest.raises(WeaviateQueryError):
+        instrumented_client.collections.get("Broken").query.fetch_objects()
+
+    search = [r for r in recorder.requests if r.protocol == "grpc"]
+    assert [(r.method, r.target, r.error is None) for r in search] == [
+        ("Search", "Test", True),
+        ("Search", "Broken", False),
+    ]
+    assert all(r.request_bytes > 0 and r.duration_seconds > 0 for r in search)
+    assert search[0].response_bytes > 0
+    assert ("weaviate.grpc.Search", {"collection": "Test"}) in recorder.spans
+
+
+def test_http_requests_are_reported(
+    instrumented_client: weaviate.WeaviateClient,
+    weaviate_mock: HTTPServer,
+    recorder: _Recorder,
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/Test").respond_with_json({"class": "Test"})
+    assert instrumented_client.collections.exists("Test")
+
+    event = recorder.requests[-1]
+    assert event.protocol == "http"
+    assert event.method == "GET"
+    assert event.target is not None and event.target.endswith("/v1/schema/Test")
+    assert event.status_code == 200
+    assert event.response_bytes > 0
+    assert event.serialization_seconds is not None and event.serialization_seconds >= 0
+    # the requests sent while connecting are reported too
+    assert any(r.target is not None and r.target.endswith("/v1/meta") for r in recorder.requests)
+
+
+def test_batches_are_reported(
+    instrumented_client: weaviate.WeaviateClient,
+    weaviate_mock: HTTPServer,
+    recorder: _Recorder,
+) -> None:
+    weaviate_mock.expect_request(f"/v1/schema/{mock_class['class']}").respond_with_json(mock_class)
+    collection = instrumented_client.collections.get(mock_class["class"])
+    with collection.batch.fixed_size(batch_size=5) as batch:
+        for i in range(12):
+            batch.add_object({"name": str(i)})
+
+    assert sum(b.objects for b in recorder.batches) == 12
+    assert all(b.failed_objects == 0 and b.retried_objects == 0 for b in recorder.batches)
+    assert len(recorder.states) > 0
+    assert recorder.states[0].recommended_num_objects == 5
+    batch_requests = [r for r in recorder.requests if r.method == "BatchObjects"]
+    assert len(batch_requests) == len(recorder.batches)
+    assert all(r.serialization_seconds is not None for r in batch_requests)
+
+
+def test_failing_hook_does_not_break_requests(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    class Failing(Instrumentation):
+        def on_request(self, event: RequestEvent) -> None:
+            raise ValueError("boom")
+
+    client = weaviate.connect_to_local(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=AdditionalConfig(instrumentation=Failing()),
+    )
+    assert client.is_ready()
+    client.close()
+
+
+@pytest.mark.parametrize("stage", ["span", "enter", "exit"])
+def test_failing_span_does_not_break_requests(
+    instrumented_client: weaviate.WeaviateClient, stage: str
+) -> None:
+    class FailingSpan(Instrumentation):
+        @contextlib.contextmanager
+        def failing_span(self) -> Generator[None, None, None]:
+            if stage == "enter":
+                raise ValueError("boom")
+            try:
+                yield
+            finally:
+                if stage == "exit":
+                    raise ValueError("boom")  # noqa: B012
+
+        def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+            if stage == "span":
+                raise ValueError("boom")
+            return self.failing_span()
+
+    instrumented_client._connection._instrumentation = FailingSpan()
+    assert len(instrumented_client.collections.get("Test").query.fetch_objects().objects) == 1
+    with pytest.raises(WeaviateQueryError):
+        instrumented_client.collections.get("Broken").query.fetch_objects()
+
+
+def test_span_cannot_suppress_the_error_of_a_request(
+    instrumented_client: weaviate.WeaviateClient,
+) -> None:
+    class Suppressing(Instrumentation):
+        def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+            return contextlib.suppress(Exception)
+
+    instrumented_client._connection._instrumentation = Suppressing()
+    with pytest.raises(WeaviateQueryError):
+        instrumented_client.collections.get("Broken").query.fetch_objects()
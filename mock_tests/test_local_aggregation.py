@@ -0,0 +1,129 @@
+import uuid
+from typing import List
+
+import grpc
+import pytest
+
+import weaviate
+from weaviate.classes.aggregate import GroupByAggregate
+from weaviate.classes.query import Filter, Metrics
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import properties_pb2, search_get_pb2, weaviate_pb2_grpc
+
+OBJECTS = [(str(uuid.UUID(int=i + 1)), i, "red" if i % 3 == 0 else "blue") for i in range(2500)]
+QUERY_MAXIMUM_RESULTS = 2000
+
+
+class _MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.requests: List[search_get_pb2.SearchRequest] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.requests.append(request)
+        start = request.offset
+        if request.after:
+            start = [id_ for id_, _, _ in OBJECTS].index(request.after) + 1
+        elif request.offset + request.limit > QUERY_MAXIMUM_RESULTS:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "query maximum results exceeded")
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(id_).bytes),
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={
+                                "count": properties_pb2.Value(int_value=count),
+                                "color": properties_pb2.Value(text_value=color),
+                            }
+                        )
+                    ),
+                )
+                for id_, count, color in OBJECTS[start : start + request.limit]
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def service(start_grpc_server: grpc.Server) -> _MockWeaviateService:
+    service = _MockWeaviateService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
+def test_over_all_pages_through_the_collection(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    res = weaviate_client.collections.get("Test").aggregate.over_all(
+        return_metrics=[
+            Metrics("count").integer(percentiles=[10, 50, 90], median=True, sum_=True),
+            Metrics("color").text(count=True, top_occurrences_count=True),
+        ],
+        local=True,
+    )
+
+    assert [request.after for request in service.requests] == [
+        "",
+        OBJECTS[999][0],
+        OBJECTS[1999][0],
+    ]
+    assert res.total_count == 2500
+    count = res.properties["count"]
+    assert count.sum_ == sum(range(2500))
+    assert count.median == pytest.approx(1249.5)
+    assert count.percentiles == pytest.approx({10: 249.9, 50: 1249.5, 90: 2249.1})
+    color = res.properties["color"]
+    assert color.count == 2500
+    assert [occurrence.count for occurrence in color.top_occurrences] == [1666, 834]
+
+
+def test_group_by_with_object_limit(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    res = weaviate_client.collections.get("Test").aggregate.near_vector(
+        [1.0, 2.0],
+        object_limit=30,
+        group_by=GroupByAggregate(prop="color"),
+        return_metrics=Metrics("count").integer(maximum=True),
+        local=True,
+    )
+
+    assert [request.limit for request in service.requests] == [30]
+    assert [(group.grouped_by.value, group.total_count) for group in res.groups] == [
+        ("blue", 20),
+        ("red", 10),
+    ]
+    assert [group.properties["count"].maximum for group in res.groups] == [29, 27]
+
+
+def test_percentiles_require_a_local_aggregation(
+    weaviate_client: weaviate.WeaviateClient,
+) -> None:
+    with pytest.raises(WeaviateInvalidInputError):
+        weaviate_client.collections.get("Test").aggregate.over_all(
+            return_metrics=Metrics("count").integer(percentiles=[99])
+        )
+
+
+def test_offset_paging_beyond_the_query_maximum_results_is_rejected(
+    weaviate_client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    collection = weaviate_client.collections.get("Test")
+    with pytest.raises(WeaviateInvalidInputError) as error:
+        collection.aggregate.over_all(
+            filters=Filter.by_property("count").greater_or_equal(0),
+            return_metrics=Metrics("count").integer(sum_=True),
+            local=True,
+        )
+    assert "QUERY_MAXIMUM_RESULTS" in error.value.message
+    assert "after 2000 objects" in error.value.message
+    assert [request.offset for request in service.requests] == [0, 1000, 2000]
+
+    res = collection.aggregate.near_vector(
+        [1.0, 2.0],
+        object_limit=2000,
+        return_metrics=Metrics("count").integer(sum_=True),
+        local=True,
+    )
+    assert res.total_count == 2000
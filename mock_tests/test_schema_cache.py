@@ -0,0 +1,86 @@
+import json
+from typing import Generator, List
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from mock_tests.mock_data import mock_class
+from weaviate.classes.config import Property, DataType
+from weaviate.classes.init import AdditionalConfig, SchemaCache
+
+
+@pytest.fixture(scope="function")
+def requests(weaviate_mock: HTTPServer) -> List[str]:
+    requests: List[str] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(f"{request.method} {request.path}")
+        if request.path == "/v1/schema":
+            return Response(json.dumps({"classes": [mock_class]}))
+        if request.path == "/v1/schema/Missing":
+            return Response(status=404)
+        return Response(json.dumps(mock_class))
+
+    weaviate_mock.expect_request("/v1/schema").respond_with_handler(handler)
+    weaviate_mock.expect_request(f"/v1/schema/{mock_class['class']}").respond_with_handler(handler)
+    weaviate_mock.expect_request(
+        f"/v1/schema/{mock_class['class']}/properties"
+    ).respond_with_handler(handler)
+    weaviate_mock.expect_request("/v1/schema/Missing").respond_with_handler(handler)
+    return requests
+
+
+@pytest.fixture(scope="function")
+def client(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=AdditionalConfig(schema_cache=SchemaCache(ttl=60)),
+    )
+    yield client
+    client.close()
+
+
+def test_collection_config_is_cached(client: weaviate.WeaviateClient, requests: List[str]) -> None:
+    collection = client.collections.get(mock_class["class"])
+    config = collection.config.get()
+    assert collection.config.get() is config
+    assert collection.config.get(simple=True).name == mock_class["class"]
+    assert client.collections.exists(mock_class["class"])
+    assert requests == [f"GET /v1/schema/{mock_class['class']}"]
+
+    assert not client.collections.exists("Missing")
+    assert not client.collections.exists("Missing")
+    assert requests[1:] == ["GET /v1/schema/Missing"]
+
+
+def test_schema_changes_invalidate_the_cache(
+    client: weaviate.WeaviateClient, requests: List[str]
+) -> None:
+    collection = client.collections.get(mock_class["class"])
+    collection.config.get()
+    collection.config.add_property(Property(name="new", data_type=DataType.TEXT))
+    collection.config.get()
+    # the check whether the property already exists is answered from the cache
+    assert requests == [
+        f"GET /v1/schema/{mock_class['class']}",
+        f"POST /v1/schema/{mock_class['class']}/properties",
+        f"GET /v1/schema/{mock_class['class']}",
+    ]
+
+
+def test_list_all_is_cached(client: weaviate.WeaviateClient, requests: List[str]) -> None:
+    collections = client.collections.list_all()
+    assert client.collections.list_all() is collections
+    assert list(client.collections.list_all(simple=False)) == [mock_class["class"]]
+    assert client.collections.exists(mock_class["class"])
+    assert not client.collections.exists("Missing")
+    client.collections.get(mock_class["class"]).config.get()
+    assert requests == ["GET /v1/schema"]
@@ -0,0 +1,123 @@
+import threading
+from typing import Generator, List
+from unittest.mock import patch
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+
+import weaviate
+import weaviate.classes as wvc
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from weaviate.config import AdditionalConfig, ConnectionConfig
+from weaviate.event_loop import _EventLoop
+from weaviate.proto.v1 import (
+    batch_delete_pb2,
+    batch_pb2,
+    search_get_pb2,
+    tenants_pb2,
+    weaviate_pb2_grpc,
+)
+
+
+@pytest.fixture(scope="function")
+def sync_grpc_client(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    client = weaviate.connect_to_local(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=AdditionalConfig(connection=ConnectionConfig(grpc_sync_transport=True)),
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="function")
+def sync_grpc_collection(
+    sync_grpc_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> weaviate.collections.Collection:
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            return search_get_pb2.SearchReply(
+                results=[search_get_pb2.SearchResult() for _ in range(request.limit)]
+            )
+
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            return batch_pb2.BatchObjectsReply()
+
+        def BatchDelete(
+            self, request: batch_delete_pb2.BatchDeleteRequest, context: grpc.ServicerContext
+        ) -> batch_delete_pb2.BatchDeleteReply:
+            return batch_delete_pb2.BatchDeleteReply(successful=3, matches=3)
+
+        def TenantsGet(
+            self, request: tenants_pb2.TenantsGetRequest, context: grpc.ServicerContext
+        ) -> tenants_pb2.TenantsGetReply:
+            return tenants_pb2.TenantsGetReply(
+                tenants=[
+                    tenants_pb2.Tenant(
+                        name="tenant1", activity_status=tenants_pb2.TENANT_ACTIVITY_STATUS_HOT
+                    )
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    return sync_grpc_client.collections.get("SyncGrpcCollection")
+
+
+def test_grpc_calls_do_not_use_event_loop(
+    sync_grpc_collection: weaviate.collections.Collection,
+) -> None:
+    with patch.object(_EventLoop, "run_until_complete", side_effect=AssertionError):
+        assert len(sync_grpc_collection.query.fetch_objects(limit=2).objects) == 2
+        assert len(sync_grpc_collection.query.near_vector([1.0, 2.0], limit=3).objects) == 3
+        assert (
+            sync_grpc_collection.data.insert_many([{"name": "a"}, {"name": "b"}]).has_errors
+            is False
+        )
+        assert (
+            sync_grpc_collection.data.delete_many(
+                where=wvc.query.Filter.by_property("name").equal("a")
+            ).successful
+            == 3
+        )
+        assert list(sync_grpc_collection.tenants.get().keys()) == ["tenant1"]
+
+
+def test_grpc_calls_run_in_caller_thread(
+    sync_grpc_collection: weaviate.collections.Collection,
+) -> None:
+    threads: List[threading.Thread] = []
+    search = sync_grpc_collection.query._query
+
+    original = search._connection.grpc_headers
+
+    def grpc_headers():  # type: ignore
+        threads.append(threading.current_thread())
+        return original()
+
+    with patch.object(search._connection, "grpc_headers", side_effect=grpc_headers):
+        sync_grpc_collection.query.fetch_objects(limit=1)
+    assert threads == [threading.current_thread()]
+
+
+def test_rest_calls_fall_back_to_event_loop(
+    sync_grpc_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/SyncGrpcCollection/tenants").respond_with_json(
+        [{"name": "tenant1", "activityStatus": "HOT"}]
+    )
+    # force the REST code path of tenants.get()
+    sync_grpc_client._connection._weaviate_version = weaviate.util._ServerVersion(1, 24, 0)
+    collection = sync_grpc_client.collections.get("SyncGrpcCollection")
+    assert list(collection.tenants.get().keys()) == ["tenant1"]
+
+
+def test_default_client_has_no_sync_transport(weaviate_client: weaviate.WeaviateClient) -> None:
+    assert not weaviate_client._connection.has_sync_grpc_transport()
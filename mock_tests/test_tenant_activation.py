@@ -0,0 +1,173 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, List
+from unittest.mock import patch
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from weaviate.classes.init import AdditionalConfig, TenantActivation
+from weaviate.config import ConnectionConfig
+from weaviate.event_loop import _EventLoop
+from weaviate.proto.v1 import batch_pb2, search_get_pb2, tenants_pb2, weaviate_pb2_grpc
+
+
+class _MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active: List[str] = ["hot"]
+        self.tenants_gets: List[List[str]] = []
+
+    def TenantsGet(
+        self, request: tenants_pb2.TenantsGetRequest, context: grpc.ServicerContext
+    ) -> tenants_pb2.TenantsGetReply:
+        time.sleep(0.1)
+        with self.lock:
+            self.tenants_gets.append(sorted(request.names.values))
+            return tenants_pb2.TenantsGetReply(
+                tenants=[
+                    tenants_pb2.Tenant(
+                        name=name,
+                        activity_status=(
+                            tenants_pb2.TENANT_ACTIVITY_STATUS_ACTIVE
+                            if name in self.active
+                            else tenants_pb2.TENANT_ACTIVITY_STATUS_INACTIVE
+                        ),
+                    )
+                    for name in request.names.values
+                    if name != "missing"
+                ]
+            )
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        if request.tenant not in self.active:
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "tenant not active")
+        return search_get_pb2.SearchReply()
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        return batch_pb2.BatchObjectsReply(
+            errors=[
+                batch_pb2.BatchObjectsReply.BatchError(index=idx, error="tenant not active")
+                for idx, obj in enumerate(request.objects)
+                if obj.tenant not in self.active
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def service(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> Generator[_MockWeaviateService, None, None]:
+    service = _MockWeaviateService()
+
+    def update_tenants(request: Request) -> Response:
+        with service.lock:
+            service.active.extend(tenant["name"] for tenant in request.json)
+        return Response(json.dumps(request.json))
+
+    weaviate_mock.expect_request("/v1/schema/Test/tenants", method="PUT").respond_with_handler(
+        update_tenants
+    )
+    weaviate_mock.expect_request("/v1/schema").respond_with_json({"classes": []})
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    yield service
+
+
+@pytest.fixture(scope="function")
+def client(service: _MockWeaviateService) -> Generator[weaviate.WeaviateClient, None, None]:
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=AdditionalConfig(tenant_activation=TenantActivation(ttl=60)),
+    )
+    yield client
+    client.close()
+
+
+def test_queries_activate_their_tenant_once(
+    client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    collection = client.collections.get("Test").with_tenant("cold")
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        for future in [executor.submit(collection.query.fetch_objects) for _ in range(5)]:
+            future.result()
+    collection.query.fetch_objects()
+
+    assert service.tenants_gets == [["cold"]]
+    assert service.active == ["hot", "cold"]
+
+
+def test_sync_grpc_transport_activates_before_sending_any_request(
+    service: _MockWeaviateService,
+) -> None:
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=AdditionalConfig(
+            connection=ConnectionConfig(grpc_sync_transport=True),
+            tenant_activation=TenantActivation(ttl=60),
+        ),
+    )
+    try:
+        collection = client.collections.get("Test").with_tenant("cold")
+        # the tenant has to be activated with REST, so the query runs on the event loop once
+        collection.query.fetch_objects()
+        assert service.tenants_gets == [["cold"]]
+        assert service.active == ["hot", "cold"]
+
+        with patch.object(_EventLoop, "run_until_complete", side_effect=AssertionError):
+            collection.query.fetch_objects()
+        assert service.tenants_gets == [["cold"]]
+    finally:
+        client.close()
+
+
+def test_batches_activate_their_tenants_in_bulk(
+    client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    with client.batch.fixed_size(batch_size=11, concurrent_requests=1) as batch:
+        for i in range(9):
+            batch.add_object(collection="Test", properties={}, tenant=f"tenant{i % 3}")
+        batch.add_object(collection="Test", properties={}, tenant="hot")
+        batch.add_object(collection="Test", properties={}, tenant="missing")
+
+    # every tenant is looked up once, no matter how many of its objects are sent
+    assert sorted(sum(service.tenants_gets, [])) == [
+        "hot",
+        "missing",
+        "tenant0",
+        "tenant1",
+        "tenant2",
+    ]
+    assert sorted(service.active) == ["hot", "tenant0", "tenant1", "tenant2"]
+    assert [obj.object_.tenant for obj in client.batch.failed_objects] == ["missing"]
+
+
+def test_batches_reactivate_tenants_that_were_deactivated(
+    client: weaviate.WeaviateClient, service: _MockWeaviateService
+) -> None:
+    def insert() -> int:
+        with client.batch.fixed_size(batch_size=1, concurrent_requests=1) as batch:
+            batch.add_object(collection="Test", properties={}, tenant="cold")
+        return len(client.batch.failed_objects)
+
+    assert insert() == 0
+    assert service.tenants_gets == [["cold"]]
+
+    service.active.remove("cold")
+    assert insert() == 1  # the cached status is stale, the failure invalidates it
+    assert insert() == 0
+    assert service.tenants_gets == [["cold"], ["cold"]]
+    assert service.active == ["hot", "cold"]
@@ -1,5 +1,16 @@
+import json
+import time
+from typing import List
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
 import weaviate
-from weaviate.classes.tenants import TenantActivityStatus
+from weaviate.classes.tenants import Tenant, TenantActivityStatus
+from weaviate.exceptions import UnexpectedStatusCodeError
+from weaviate.proto.v1 import tenants_pb2, weaviate_pb2_grpc
 
 
 def test_tenants_get(tenants_collection: weaviate.collections.Collection) -> None:
@@ -35,3 +46,91 @@ def test_tenants_get(tenants_collection: weaviate.collections.Collection) -> Non
 
     assert tenants[9].name == "tenant10"
     assert tenants[9].activity_status == TenantActivityStatus.ONLOADING
+
+
+def test_tenants_iterator(tenants_collection: weaviate.collections.Collection) -> None:
+    tenants = list(tenants_collection.tenants.iterator())
+    assert [tenant.name for tenant in tenants] == [f"tenant{i}" for i in range(1, 11)]
+    assert tenants[1].activity_status == TenantActivityStatus.INACTIVE
+
+
+def test_tenants_iterator_pages_named_tenants(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    requested: List[List[str]] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def TenantsGet(
+            self, request: tenants_pb2.TenantsGetRequest, context: grpc.ServicerContext
+        ) -> tenants_pb2.TenantsGetReply:
+            requested.append(list(request.names.values))
+            return tenants_pb2.TenantsGetReply(
+                tenants=[
+                    tenants_pb2.Tenant(
+                        name=name, activity_status=tenants_pb2.TENANT_ACTIVITY_STATUS_HOT
+                    )
+                    for name in request.names.values
+                    if name != "missing"
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    collection = weaviate_client.collections.get("Test")
+
+    names = ["tenant1", Tenant(name="tenant2"), "missing", "tenant4", "tenant5"]
+    tenants = list(collection.tenants.iterator(names, page_size=2))
+    assert [tenant.name for tenant in tenants] == ["tenant1", "tenant2", "tenant4", "tenant5"]
+    assert requested == [["tenant1", "tenant2"], ["missing", "tenant4"], ["tenant5"]]
+
+
+def test_tenants_are_created_updated_and_removed_in_chunks(
+    weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    chunks: List[List[str]] = []
+
+    def handler(request: Request) -> Response:
+        chunks.append(
+            [tenant if isinstance(tenant, str) else tenant["name"] for tenant in request.json]
+        )
+        return Response(json.dumps(request.json))
+
+    weaviate_mock.expect_request("/v1/schema/Test/tenants").respond_with_handler(handler)
+    collection = weaviate_client.collections.get("Test")
+    names = [f"tenant{i}" for i in range(5)]
+
+    collection.tenants.create(names, chunk_size=2, max_concurrency=2)
+    assert sorted(chunks) == [["tenant0", "tenant1"], ["tenant2", "tenant3"], ["tenant4"]]
+
+    chunks.clear()
+    collection.tenants.update(
+        [Tenant(name=name, activity_status=TenantActivityStatus.INACTIVE) for name in names],
+        chunk_size=3,
+    )
+    assert chunks == [["tenant0", "tenant1", "tenant2"], ["tenant3", "tenant4"]]
+
+    chunks.clear()
+    collection.tenants.remove(names, chunk_size=5)
+    assert chunks == [names]
+
+
+def test_failing_tenant_chunk_cancels_the_remaining_chunks(
+    weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    chunks: List[List[str]] = []
+
+    def handler(request: Request) -> Response:
+        chunks.append(request.json)
+        if "tenant2" in request.json:
+            return Response(status=500)
+        return Response(json.dumps(request.json))
+
+    weaviate_mock.expect_request("/v1/schema/Test/tenants").respond_with_handler(handler)
+    collection = weaviate_client.collections.get("Test")
+
+    # the original error is raised, with the chunks attached
+    with pytest.raises(UnexpectedStatusCodeError) as error:
+        collection.tenants.remove([f"tenant{i}" for i in range(5)], chunk_size=1)
+    assert error.value.failed_chunk == 2  # type: ignore[attr-defined]
+    assert error.value.completed_chunks == [0, 1]  # type: ignore[attr-defined]
+    time.sleep(0.1)
+    assert chunks == [["tenant0"], ["tenant1"], ["tenant2"]]
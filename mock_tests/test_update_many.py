@@ -0,0 +1,110 @@
+import asyncio
+import re
+import uuid
+from typing import List
+from unittest.mock import patch
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from weaviate.classes.data import DataObject
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import batch_pb2, weaviate_pb2_grpc
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(5)]
+
+
+def test_update_many(weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer) -> None:
+    patched: List[str] = []
+
+    def handler(request: Request) -> Response:
+        patched.append(request.path.split("/")[-1])
+        if request.path.endswith(str(UUIDS[2])):
+            return Response(status=422, response='{"error": [{"message": "invalid"}]}')
+        return Response(status=204)
+
+    for id_ in UUIDS:
+        weaviate_mock.expect_request(
+            f"/v1/objects/Test/{id_}", method="PATCH"
+        ).respond_with_handler(handler)
+
+    res = weaviate_client.collections.get("Test").data.update_many(
+        [DataObject(uuid=id_, properties={"name": "updated"}) for id_ in UUIDS],
+        max_concurrency=2,
+    )
+
+    assert sorted(patched) == sorted(str(id_) for id_ in UUIDS)
+    assert res.uuids == {0: UUIDS[0], 1: UUIDS[1], 3: UUIDS[3], 4: UUIDS[4]}
+    assert list(res.errors) == [2]
+    assert "invalid" in res.errors[2].message
+    assert res.errors[2].object_.properties == {"name": "updated"}
+    assert res.has_errors
+
+
+def test_update_many_runs_a_fixed_number_of_workers(
+    weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    patched: List[str] = []
+
+    def handler(request: Request) -> Response:
+        patched.append(request.path.split("/")[-1])
+        return Response(status=204)
+
+    weaviate_mock.expect_request(
+        re.compile("/v1/objects/Test/.*"), method="PATCH"
+    ).respond_with_handler(handler)
+    uuids = [uuid.UUID(int=i + 1) for i in range(50)]
+
+    with patch("asyncio.gather", wraps=asyncio.gather) as gather:
+        res = weaviate_client.collections.get("Test").data.update_many(
+            [DataObject(uuid=id_, properties={"name": "updated"}) for id_ in uuids],
+            max_concurrency=3,
+        )
+
+    assert res.uuids == dict(enumerate(uuids))
+    assert sorted(patched) == sorted(str(id_) for id_ in uuids)
+    # three workers, not a coroutine per object
+    assert len(gather.call_args.args) == 3
+
+
+def test_replace_many_upserts_in_a_batch(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    requests: List[batch_pb2.BatchObjectsRequest] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            requests.append(request)
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    collection = weaviate_client.collections.get("Test")
+
+    res = collection.data.replace_many(
+        [DataObject(uuid=id_, properties={"name": "replaced"}) for id_ in UUIDS]
+    )
+
+    assert len(requests) == 1
+    assert [obj.uuid for obj in requests[0].objects] == [str(id_) for id_ in UUIDS]
+    assert list(res.uuids.values()) == UUIDS
+
+    requests.clear()
+    res = collection.data.replace_many(
+        [DataObject(uuid=id_, properties={"name": "replaced"}) for id_ in UUIDS], chunk_size=2
+    )
+    assert [[obj.uuid for obj in request.objects] for request in requests] == [
+        [str(UUIDS[0]), str(UUIDS[1])],
+        [str(UUIDS[2]), str(UUIDS[3])],
+        [str(UUIDS[4])],
+    ]
+    assert res.uuids == dict(enumerate(UUIDS))
+    requests.clear()
+
+    with pytest.raises(WeaviateInvalidInputError):
+        collection.data.replace_many([DataObject(properties={"name": "replaced"})])
+    assert len(requests) == 0
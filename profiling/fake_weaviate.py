@@ -0,0 +1,182 @@
+"""In-process stand-in for a Weaviate server to measure the overhead of the client itself.
+
+The gRPC `Weaviate` service answers `Search`, `BatchObjects`, `BatchDelete` and `TenantsGet` from pre-built replies
+and the REST stub only serves the endpoints needed to connect and to batch, so that (almost) all the time measured
+against it is spent in the client.
+"""
+
+import json
+import re
+import socket
+import struct
+import uuid
+from concurrent import futures
+from typing import Dict, Optional, Tuple
+
+import grpc
+from grpc_health.v1.health_pb2 import HealthCheckRequest, HealthCheckResponse
+from grpc_health.v1.health_pb2_grpc import HealthServicer, add_HealthServicer_to_server
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from mock_tests.mock_data import mock_class
+
+import weaviate
+from weaviate.config import AdditionalConfig
+from weaviate.connect.base import MAX_GRPC_MESSAGE_LENGTH
+from weaviate.proto.v1 import (
+    batch_delete_pb2,
+    batch_pb2,
+    properties_pb2,
+    search_get_pb2,
+    tenants_pb2,
+    weaviate_pb2_grpc,
+)
+
+HOST = "127.0.0.1"
+TOTAL_OBJECTS = 10_000  # number of objects in every collection when iterating over it
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((HOST, 0))
+        return int(s.getsockname()[1])
+
+
+def object_uuid(index: int) -> uuid.UUID:
+    return uuid.UUID(int=index + 1)
+
+
+class _FakeWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.dimensions = 128
+        self.__replies: Dict[Tuple[int, int, int], search_get_pb2.SearchReply] = {}
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        offset = 0
+        if request.after != "":
+            offset = uuid.UUID(request.after).int
+        limit = min(request.limit or 100, TOTAL_OBJECTS - offset)
+        key = (offset, limit, self.dimensions)
+        if key not in self.__replies:
+            self.__replies[key] = self.__reply(offset, limit)
+        return self.__replies[key]
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        return batch_pb2.BatchObjectsReply(took=0.001)
+
+    def BatchDelete(
+        self, request: batch_delete_pb2.BatchDeleteRequest, context: grpc.ServicerContext
+    ) -> batch_delete_pb2.BatchDeleteReply:
+        return batch_delete_pb2.BatchDeleteReply(took=0.001, successful=10, matches=10)
+
+    def TenantsGet(
+        self, request: tenants_pb2.TenantsGetRequest, context: grpc.ServicerContext
+    ) -> tenants_pb2.TenantsGetReply:
+        return tenants_pb2.TenantsGetReply(
+            tenants=[
+                tenants_pb2.Tenant(
+                    name=f"tenant{i}", activity_status=tenants_pb2.TENANT_ACTIVITY_STATUS_HOT
+                )
+                for i in range(1000)
+            ]
+        )
+
+    def __reply(self, offset: int, limit: int) -> search_get_pb2.SearchReply:
+        vector = struct.pack(f"<{self.dimensions}f", *([0.5] * self.dimensions))
+        return search_get_pb2.SearchReply(
+            took=0.001,
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(
+                        id=str(object_uuid(offset + i)),
+                        id_as_bytes=object_uuid(offset + i).bytes,
+                        vector_bytes=vector,
+                        distance=0.1,
+                        distance_present=True,
+                    ),
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={
+                                "name": properties_pb2.Value(text_value=f"object {offset + i}"),
+                                "count": properties_pb2.Value(int_value=offset + i),
+                                "tags": properties_pb2.Value(
+                                    list_value=properties_pb2.ListValue(
+                                        text_values=properties_pb2.TextValues(
+                                            values=["a", "b", "c"]
+                                        )
+                                    )
+                                ),
+                            }
+                        )
+                    ),
+                )
+                for i in range(limit)
+            ],
+        )
+
+
+class _HealthService(HealthServicer):
+    def Check(
+        self, request: HealthCheckRequest, context: grpc.ServicerContext
+    ) -> HealthCheckResponse:
+        return HealthCheckResponse(status=HealthCheckResponse.SERVING)
+
+
+def _collection_config(request: Request) -> Response:
+    config = dict(mock_class, **{"class": request.path.rsplit("/", 1)[-1]})
+    return Response(json.dumps(config), content_type="application/json")
+
+
+class FakeWeaviate:
+    """A fake Weaviate server listening on free local ports."""
+
+    def __init__(self) -> None:
+        self.service = _FakeWeaviateService()
+        self.http_port = _free_port()
+        self.grpc_port = _free_port()
+
+        self.__grpc = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=10),
+            options=[("grpc.max_receive_message_length", MAX_GRPC_MESSAGE_LENGTH)],
+        )
+        add_HealthServicer_to_server(_HealthService(), self.__grpc)
+        weaviate_pb2_grpc.add_WeaviateServicer_to_server(self.service, self.__grpc)
+        self.__grpc.add_insecure_port(f"{HOST}:{self.grpc_port}")
+
+        self.__http = HTTPServer(host=HOST, port=self.http_port)
+        self.__http.expect_request("/v1/.well-known/ready").respond_with_json({})
+        self.__http.expect_request("/v1/.well-known/openid-configuration").respond_with_json(
+            {}, status=404
+        )
+        self.__http.expect_request("/v1/meta").respond_with_json({"version": "1.25.0"})
+        self.__http.expect_request("/v1/nodes").respond_with_json(
+            {"nodes": [{"batchStats": {"queueLength": 0, "ratePerSecond": 10_000}}]}
+        )
+        self.__http.expect_request("/v1/schema").respond_with_json({"classes": []})
+        self.__http.expect_request("/v1/batch/references", method="POST").respond_with_json([])
+        self.__http.expect_request(
+            re.compile(r"/v1/schema/\w+"), method="GET"
+        ).respond_with_handler(_collection_config)
+
+    def start(self) -> None:
+        self.__grpc.start()
+        self.__http.start()
+
+    def stop(self) -> None:
+        self.__http.stop()
+        self.__grpc.stop(0)
+
+    def connect(
+        self, additional_config: Optional[AdditionalConfig] = None
+    ) -> weaviate.WeaviateClient:
+        return weaviate.connect_to_local(
+            host=HOST,
+            port=self.http_port,
+            grpc_port=self.grpc_port,
+            additional_config=additional_config,
+        )
@@ -0,0 +1,169 @@
+# Measures the overhead of the client against an in-process fake server, no running Weaviate or datasets needed.
+# run:
+# - benchmark: pytest profiling/test_client_overhead.py --benchmark-only
+# - track a baseline: pytest profiling/test_client_overhead.py --benchmark-only --benchmark-autosave
+# - compare to it: pytest profiling/test_client_overhead.py --benchmark-only --benchmark-compare --benchmark-compare-fail=median:25%
+import tracemalloc
+from typing import Any, Callable, Dict, Generator, List
+
+import pytest
+
+import weaviate
+import weaviate.classes as wvc
+from weaviate.collections.classes.data import DataObject
+from weaviate.collections.filters import _FilterToGRPC
+from weaviate.config import AdditionalConfig, ConnectionConfig
+
+from .fake_weaviate import TOTAL_OBJECTS, FakeWeaviate
+
+DIMENSIONS = [32, 256, 1536]
+
+
+@pytest.fixture(scope="module")
+def fake_weaviate() -> Generator[FakeWeaviate, None, None]:
+    server = FakeWeaviate()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="module", params=["event_loop", "sync_grpc"])
+def client(
+    fake_weaviate: FakeWeaviate, request: pytest.FixtureRequest
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    client = fake_weaviate.connect(
+        AdditionalConfig(
+            connection=ConnectionConfig(grpc_sync_transport=request.param == "sync_grpc")
+        )
+    )
+    yield client
+    client.close()
+
+
+def _record_allocations(benchmark: Any, f: Callable[[], Any]) -> None:
+    """Run `f` once more outside of the timed rounds and store its peak allocations in the benchmark results."""
+    tracemalloc.start()
+    try:
+        f()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_allocated_bytes"] = peak
+
+
+def _objects(count: int, dimensions: int) -> List[DataObject[Dict[str, Any], None]]:
+    return [
+        DataObject(
+            properties={"name": f"object {i}", "count": i, "tags": ["a", "b", "c"]},
+            vector=[0.5] * dimensions,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("dimensions", DIMENSIONS)
+def test_benchmark_insert_many(
+    benchmark: Any, client: weaviate.WeaviateClient, dimensions: int
+) -> None:
+    collection = client.collections.get("Bench")
+    objects = _objects(1000, dimensions)
+
+    def insert() -> None:
+        assert not collection.data.insert_many(objects).has_errors
+
+    benchmark.extra_info["objects"] = len(objects)
+    benchmark(insert)
+    _record_allocations(benchmark, insert)
+
+
+@pytest.mark.parametrize("dimensions", DIMENSIONS)
+def test_benchmark_batch_ingestion(
+    benchmark: Any, client: weaviate.WeaviateClient, dimensions: int
+) -> None:
+    collection = client.collections.get("Bench")
+    objects = _objects(5000, dimensions)
+
+    def ingest() -> None:
+        with collection.batch.fixed_size(batch_size=500, concurrent_requests=4) as batch:
+            for obj in objects:
+                batch.add_object(properties=obj.properties, vector=obj.vector)
+        assert len(collection.batch.failed_objects) == 0
+
+    benchmark.extra_info["objects"] = len(objects)
+    benchmark.pedantic(ingest, rounds=5)
+    _record_allocations(benchmark, ingest)
+
+
+@pytest.mark.parametrize("dimensions", DIMENSIONS)
+@pytest.mark.parametrize("limit", [10, 1000])
+def test_benchmark_query(
+    benchmark: Any,
+    client: weaviate.WeaviateClient,
+    fake_weaviate: FakeWeaviate,
+    dimensions: int,
+    limit: int,
+) -> None:
+    fake_weaviate.service.dimensions = dimensions
+    collection = client.collections.get("Bench")
+
+    def query() -> None:
+        res = collection.query.near_vector(
+            [0.5] * dimensions,
+            limit=limit,
+            include_vector=True,
+            return_metadata=wvc.query.MetadataQuery(distance=True),
+        )
+        assert len(res.objects) == limit
+
+    benchmark.extra_info["objects"] = limit
+    benchmark(query)
+    _record_allocations(benchmark, query)
+
+
+@pytest.mark.parametrize("dimensions", [32, 1536])
+def test_benchmark_iterator(
+    benchmark: Any,
+    client: weaviate.WeaviateClient,
+    fake_weaviate: FakeWeaviate,
+    dimensions: int,
+) -> None:
+    fake_weaviate.service.dimensions = dimensions
+    collection = client.collections.get("Bench")
+
+    def scan() -> None:
+        assert sum(1 for _ in collection.iterator(include_vector=True)) == TOTAL_OBJECTS
+
+    benchmark.extra_info["objects"] = TOTAL_OBJECTS
+    benchmark.pedantic(scan, rounds=5)
+    _record_allocations(benchmark, scan)
+
+
+def test_benchmark_delete_many(benchmark: Any, client: weaviate.WeaviateClient) -> None:
+    collection = client.collections.get("Bench")
+    benchmark(collection.data.delete_many, where=wvc.query.Filter.by_property("count").less_than(5))
+
+
+def test_benchmark_tenants_get(benchmark: Any, client: weaviate.WeaviateClient) -> None:
+    collection = client.collections.get("Bench")
+    benchmark(collection.tenants.get)
+
+
+@pytest.mark.parametrize("operands", [1, 10, 100])
+def test_benchmark_filter_conversion(benchmark: Any, operands: int) -> None:
+    f = wvc.query.Filter
+    filters = f.all_of(
+        [
+            f.any_of(
+                [
+                    f.by_property("name").like(f"object {i}*"),
+                    f.by_property("count").greater_or_equal(i),
+                    f.by_property("tags").contains_any(["a", "b", str(i)]),
+                    f.by_ref("ref").by_property("count").equal(i),
+                ]
+            )
+            for i in range(operands)
+        ]
+    )
+
+    benchmark(_FilterToGRPC.convert, filters)
+    _record_allocations(benchmark, lambda: _FilterToGRPC.convert(filters))
@@ -0,0 +1,25 @@
+# run:
+# - benchmark: pytest profiling/test_import_time.py --benchmark-only
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import weaviate",
+        "import weaviate; weaviate.connect_to_custom",
+        "import weaviate; import weaviate.classes as wvc; wvc.config.Configure",
+        "import weaviate; weaviate.Client",
+    ],
+    ids=["import", "connect_to_custom", "classes", "v3_client"],
+)
+def test_benchmark_import_time(benchmark: Any, code: str) -> None:
+    benchmark(_run, code)
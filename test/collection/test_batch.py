@@ -1,5 +1,12 @@
+import time
 import uuid
-from weaviate.collections.classes.batch import BatchObjectReturn, MAX_STORED_RESULTS
+from typing import Optional
+
+from weaviate.collections.batch.base import (
+    ObjectsBatchRequest,
+    TenantGroupedObjectsBatchRequest,
+)
+from weaviate.collections.classes.batch import BatchObjectReturn, MAX_STORED_RESULTS, _BatchObject
 
 
 def test_batch_object_return_add() -> None:
@@ -29,3 +36,125 @@ def test_batch_object_return_add() -> None:
         idx + len(rhs_uuids): v
         for idx, v in enumerate(lhs_uuids[len(rhs_uuids) : MAX_STORED_RESULTS] + rhs_uuids)
     }
+
+
+def _obj(tenant: str, index: int, uuid_: Optional[str] = None) -> _BatchObject:
+    return _BatchObject(
+        collection="Test",
+        vector=None,
+        uuid=uuid_ or str(uuid.uuid4()),
+        properties=None,
+        tenant=tenant,
+        references=None,
+        index=index,
+    )
+
+
+def test_tenant_grouped_request_sends_full_buckets_first() -> None:
+    request = TenantGroupedObjectsBatchRequest(max_wait_seconds=60, max_queue_size=8)
+    for i in range(6):
+        request.add(_obj(f"tenant{i % 3}", i))
+    request.add(_obj("tenant1", 6))
+
+    assert request.pop_items(8) == []  # no bucket is full, nothing waited long enough
+    assert [obj.index for obj in request.pop_items(3)] == [1, 4, 6]
+    assert len(request) == 4
+    assert request.pop_items(3) == []
+
+    # the queue is full, send whole buckets oldest first
+    for i in range(7, 11):
+        request.add(_obj(f"tenant{i}", i))
+    assert [obj.index for obj in request.pop_items(3)] == [0, 3, 2]
+    assert request.pop_items(3) == []
+
+    # retried objects are sent right away
+    request.prepend([_obj("tenant1", 11)])
+    assert [obj.index for obj in request.pop_items(3)] == [11, 5, 7]
+    assert len(request) == 3
+
+
+def test_tenant_grouped_request_max_wait_and_flush() -> None:
+    request = TenantGroupedObjectsBatchRequest(max_wait_seconds=0.05, max_queue_size=100)
+    request.add(_obj("tenant0", 0))
+    assert request.pop_items(10) == []
+    time.sleep(0.06)
+    assert len(request.pop_items(10)) == 1
+
+    request = TenantGroupedObjectsBatchRequest(max_wait_seconds=60, max_queue_size=4)
+    request.add(_obj("tenant0", 0))
+    request.add(_obj("tenant1", 1))
+    request.flush()
+    assert len(request.pop_items(1)) == 1
+    assert len(request.pop_items(1)) == 1
+    # the flush ends once the queue is empty, later objects wait again
+    request.add(_obj("tenant2", 2))
+    request.add(_obj("tenant3", 3))
+    assert request.pop_items(5) == []
+
+
+def test_deduplicating_request_keeps_the_last_added_object() -> None:
+    id1, id2 = str(uuid.uuid4()), str(uuid.uuid4())
+    request = ObjectsBatchRequest(deduplicate=True)
+    request.add(_obj("tenant0", 0, id1))
+    request.add(_obj("tenant0", 1, id2))
+    request.add(_obj("tenant0", 2, id1))
+    request.add(_obj("tenant1", 3, id1))  # another tenant is another object
+    request.add(_obj("tenant0", 4, id1))
+
+    assert len(request) == 3
+    assert request.duplicates == 2
+    first = request.pop_items(2)
+    assert [obj.index for obj in first] == [4, 1]
+
+    # the object was sent, adding it again queues it again
+    request.add(_obj("tenant0", 5, id1))
+    sent = request.pop_items(5)
+    assert [obj.index for obj in sent] == [3, 5]
+    # a retried object that was added again meanwhile is outdated
+    request.add(_obj("tenant0", 6, id2))
+    request.prepend([first[1], sent[1]])
+    assert [obj.index for obj in request.pop_items(5)] == [5, 6]
+    assert request.duplicates == 3
+
+    request = ObjectsBatchRequest()
+    request.add(_obj("tenant0", 0, id1))
+    request.add(_obj("tenant0", 1, id1))
+    assert len(request.pop_items(5)) == 2
+    assert request.duplicates == 0
+
+
+def test_deduplicating_request_drops_retries_of_outdated_objects() -> None:
+    id1 = str(uuid.uuid4())
+    request = ObjectsBatchRequest(deduplicate=True)
+    request.add(_obj("tenant0", 0, id1))
+    (old,) = request.pop_items(5)
+    request.add(_obj("tenant0", 1, id1))
+    (new,) = request.pop_items(5)
+
+    # the old version fails after the new one was sent, it must not overwrite it
+    request.prepend([old])
+    assert len(request) == 0
+    assert request.duplicates == 1
+
+    # once every version was sent, nothing is tracked anymore
+    request.finish([new])
+    assert request._versions == {}
+    request.add(_obj("tenant0", 2, id1))
+    (retried,) = request.pop_items(5)
+    request.prepend([retried])
+    assert [obj.index for obj in request.pop_items(5)] == [2]
+
+
+def test_deduplicating_tenant_grouped_request() -> None:
+    id1 = str(uuid.uuid4())
+    request = TenantGroupedObjectsBatchRequest(
+        max_wait_seconds=60, max_queue_size=100, deduplicate=True
+    )
+    request.add(_obj("tenant0", 0, id1))
+    request.add(_obj("tenant1", 1))
+    request.add(_obj("tenant0", 2, id1))
+    request.add(_obj("tenant0", 3))
+
+    assert len(request) == 3
+    assert request.duplicates == 1
+    assert [obj.index for obj in request.pop_items(2)] == [2, 3]
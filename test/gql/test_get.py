@@ -1,3 +1,4 @@
+import struct
 import unittest
 from typing import List, Optional, Callable, Tuple
 from unittest.mock import patch, Mock
@@ -6,6 +7,7 @@ import pytest
 
 from test.util import check_error_message
 from weaviate.data.replication import ConsistencyLevel
+from weaviate.gql.filter import GraphQL
 from weaviate.gql.get import (
     GetBuilder,
     BM25,
@@ -15,6 +17,7 @@ from weaviate.gql.get import (
     AdditionalProperties,
     HybridFusion,
 )
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
 
 mock_connection_v117 = Mock()
 mock_connection_v117.server_version = "1.17.4"
@@ -881,3 +884,143 @@ class TestGetBuilder(unittest.TestCase):
 
         get = GetBuilder("test", ["prop"], None)
         self.assertEqual(get._class_name, "Test")
+
+
+def test_grpc_request_with_filters_sort_and_cursor():
+    where = {
+        "operator": "And",
+        "operands": [
+            {"path": ["name"], "operator": "Like", "valueText": "Alan*"},
+            {"path": ["age"], "operator": "GreaterThan", "valueNumber": 30},
+            {"path": ["id"], "operator": "ContainsAny", "valueTextArray": ["a", "b"]},
+        ],
+    }
+    request = (
+        GetBuilder("Person", ["name"], None)
+        .with_where(where)
+        .with_sort({"path": ["name"], "order": "desc"})
+        .with_near_vector({"vector": [1.0, 2.0]})
+        .with_additional(["id", "distance"])
+        .with_limit(5)
+        .with_offset(10)
+        .with_tenant("tenant1")
+        .with_consistency_level(ConsistencyLevel.QUORUM)
+        ._to_grpc_request()
+    )
+
+    assert request is not None
+    assert (request.limit, request.offset, request.tenant) == (5, 10, "tenant1")
+    assert [operand.target.property for operand in request.filters.filters] == [
+        "name",
+        "age",
+        "_id",
+    ]
+    assert request.filters.filters[1].value_number == 30.0
+    assert list(request.filters.filters[2].value_text_array.values) == ["a", "b"]
+    assert list(request.sort_by[0].path) == ["name"]
+    assert not request.sort_by[0].ascending
+    assert struct.unpack("2f", request.near_vector.vector_bytes) == (1.0, 2.0)
+    assert request.metadata.uuid and request.metadata.distance and not request.metadata.vector
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [
+        GetBuilder("Person", ["name"], None).with_where(
+            {"path": ["friend", "Person", "name"], "operator": "Equal", "valueText": "Alan"}
+        ),
+        GetBuilder("Person", ["name"], None).with_where(
+            {"path": ["age"], "operator": "Equal", "valueInt": 30.5}
+        ),
+        GetBuilder("Person", ["name"], None).with_where(
+            {"path": ["age"], "operator": "ContainsAny", "valueIntArray": [1, 2.5]}
+        ),
+        GetBuilder("Person", ["name"], None).with_near_text({"concepts": ["computer"]}),
+        GetBuilder("Person", ["name"], None).with_additional("classification"),
+        GetBuilder("Person", ["name"], mock_connection_v117).with_generate(
+            single_prompt="Describe {name}"
+        ),
+    ],
+)
+def test_grpc_request_falls_back_to_graphql(builder: GetBuilder):
+    assert builder._to_grpc_request() is None
+
+
+def test_grpc_request_is_sent_with_timeout_and_headers():
+    connection = Mock()
+    connection.grpc_metadata.return_value = (("x-openai-api-key", "key"), ("authorization", "t"))
+    connection.timeout_config = (10, 42)
+    connection.server_version = "1.24.0"
+    connection.grpc_stub.Search.with_call.return_value = (Mock(results=[]), None)
+
+    result = GetBuilder("Person", ["name"], connection).with_limit(1).do()
+
+    assert result == {"data": {"Get": {"Person": []}}}
+    _, kwargs = connection.grpc_stub.Search.with_call.call_args
+    assert kwargs["metadata"] == (("x-openai-api-key", "key"), ("authorization", "t"))
+    assert kwargs["timeout"] == 42
+
+
+def test_grpc_result_keeps_the_property_types():
+    connection = Mock()
+    connection.timeout_config = (10, 42)
+    connection.server_version = "1.24.0"
+    friend = search_get_pb2.PropertiesResult(
+        non_ref_props=properties_pb2.Properties(
+            fields={"name": properties_pb2.Value(text_value="Ada")}
+        )
+    )
+    properties = search_get_pb2.PropertiesResult(
+        non_ref_props=properties_pb2.Properties(
+            fields={
+                "age": properties_pb2.Value(int_value=36),
+                "score": properties_pb2.Value(number_value=1.0),
+                "lucky": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        values=[
+                            properties_pb2.Value(int_value=7),
+                            properties_pb2.Value(int_value=9),
+                        ]
+                    )
+                ),
+                "home": properties_pb2.Value(
+                    geo_value=properties_pb2.GeoCoordinate(latitude=51.5, longitude=-0.25)
+                ),
+                "address": properties_pb2.Value(
+                    object_value=properties_pb2.Properties(
+                        fields={"number": properties_pb2.Value(int_value=12)}
+                    )
+                ),
+            }
+        ),
+        ref_props=[search_get_pb2.RefPropertiesResult(prop_name="friends", properties=[friend])],
+    )
+    connection.grpc_stub.Search.with_call.return_value = (
+        search_get_pb2.SearchReply(results=[search_get_pb2.SearchResult(properties=properties)]),
+        None,
+    )
+
+    result = GetBuilder("Person", ["age", "score", "lucky", "home", "address"], connection).do()
+
+    person = result["data"]["Get"]["Person"][0]
+    assert person == {
+        "age": 36,
+        "score": 1.0,
+        "lucky": [7, 9],
+        "home": {"latitude": 51.5, "longitude": -0.25},
+        "address": {"number": 12},
+        "friends": [{"name": "Ada"}],
+    }
+    assert isinstance(person["age"], int) and isinstance(person["lucky"][0], int)
+    assert isinstance(person["address"]["number"], int)
+    request, _ = connection.grpc_stub.Search.with_call.call_args
+    assert request[0].uses_123_api
+
+
+def test_grpc_is_only_used_with_typed_properties():
+    connection = Mock()
+    connection.server_version = "1.22.5"
+    with patch.object(GraphQL, "do", return_value={"data": {}}) as graphql:
+        assert GetBuilder("Person", ["age"], connection).do() == {"data": {}}
+    graphql.assert_called_once()
+    connection.grpc_stub.Search.with_call.assert_not_called()
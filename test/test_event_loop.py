@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+
+from weaviate.config import ConnectionConfig
+from weaviate.event_loop import (
+    EventLoopStats,
+    _EventLoop,
+    _EventLoopSingleton,
+    get_event_loop_stats,
+)
+
+
+async def _current_thread() -> threading.Thread:
+    return threading.current_thread()
+
+
+async def _sleep() -> None:
+    await asyncio.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def no_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    _EventLoopSingleton.get_shard(4)
+    for shard in _EventLoopSingleton._shards:
+        monkeypatch.setattr(shard, "clients", 0)
+
+
+def test_event_loop_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WEAVIATE_EVENT_LOOP_SHARDS", "3")
+    shards = [_EventLoopSingleton.get_shard() for _ in range(6)]
+
+    assert len({id(shard) for shard in shards}) == 3
+    assert shards[:3] == shards[3:]
+    assert _EventLoopSingleton.get_instance() in shards
+
+    threads = {shard.run_until_complete(_current_thread) for shard in shards}
+    assert len(threads) == 3
+    assert threading.current_thread() not in threads
+
+
+def test_event_loop_shards_pin_clients_to_the_least_used_event_loop() -> None:
+    shards = [_EventLoopSingleton.get_shard(4) for _ in range(4)]
+    assert [shard.clients for shard in shards] == [1, 1, 1, 1]
+
+    _EventLoopSingleton.release(shards[2])
+    assert shards[2].clients == 0
+    assert _EventLoopSingleton.get_shard(4) is shards[2]
+    assert shards[2].clients == 1
+
+
+def test_event_loop_shards_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WEAVIATE_EVENT_LOOP_SHARDS", "many")
+    with pytest.raises(ValueError):
+        _EventLoopSingleton.get_shard()
+
+
+def test_event_loop_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WEAVIATE_EVENT_LOOP_INSTRUMENTATION", "1")
+    event_loop = _EventLoop()
+    event_loop.start()
+    event_loop.run_until_complete(_sleep)
+    event_loop.schedule(_sleep).result()
+
+    stats = event_loop.get_stats()
+    assert stats.submitted == 2
+    assert stats.in_flight == 0
+    assert stats.lag_seconds is not None
+    assert stats.busy_seconds is not None and stats.idle_seconds is not None
+    assert stats.idle_seconds > 0
+    assert stats.utilization is not None and 0 <= stats.utilization <= 1
+    event_loop.shutdown()
+
+    assert all(isinstance(s, EventLoopStats) for s in get_event_loop_stats())
+
+
+def test_run_in_caller_thread() -> None:
+    assert _EventLoop.run_in_caller_thread(_current_thread) is threading.current_thread()
+
+
+def test_event_loop_stats_busy_time_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("WEAVIATE_EVENT_LOOP_INSTRUMENTATION", raising=False)
+    event_loop = _EventLoop()
+    event_loop.start()
+    assert event_loop.loop is not None
+    selector = getattr(event_loop.loop, "_selector", None)
+    assert selector is None or "select" not in vars(selector)
+    event_loop.run_until_complete(_sleep)
+
+    stats = event_loop.get_stats()
+    assert stats.busy_seconds is None and stats.idle_seconds is None
+    assert stats.utilization is None
+    assert stats.lag_seconds is not None
+    event_loop.shutdown()
+
+
+@pytest.mark.parametrize("shards", [0, -1])
+def test_event_loop_shards_config_invalid(shards: int) -> None:
+    with pytest.raises(ValueError):
+        ConnectionConfig(event_loop_shards=shards)
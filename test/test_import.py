@@ -0,0 +1,84 @@
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+import weaviate
+
+
+def _modules_after(code: str) -> List[str]:
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            code
+            + "\nimport sys\nprint('\\n'.join(m for m in sys.modules if m.startswith('weaviate')))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return out.stdout.split()
+
+
+V3_MODULES = [
+    "weaviate.batch",
+    "weaviate.classification",
+    "weaviate.contextionary",
+    "weaviate.data",
+    "weaviate.gql.get",
+    "weaviate.gql.query",
+    "weaviate.schema",
+]
+
+
+def test_import_is_lazy() -> None:
+    modules = _modules_after("import weaviate")
+    assert "weaviate.client" not in modules
+    assert "weaviate.collections" not in modules
+    assert "weaviate.proto.v1.search_get_pb2" not in modules
+
+
+def test_v4_client_does_not_import_v3() -> None:
+    modules = _modules_after(
+        "import weaviate\n"
+        "c = weaviate.WeaviateClient(weaviate.connect.ConnectionParams.from_url('http://localhost:8080', 50051), skip_init_checks=True)\n"
+        "c.collections.get('Test').query.near_vector"
+    )
+    assert "weaviate.collections.queries.near_vector.query" in modules
+    for module in V3_MODULES + ["weaviate.classes", "weaviate.outputs"]:
+        assert module not in modules
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "Client",
+        "WeaviateClient",
+        "WeaviateAsyncClient",
+        "BatchClient",
+        "connect_to_local",
+        "classes",
+    ],
+)
+def test_lazy_attributes(name: str) -> None:
+    assert getattr(weaviate, name) is not None
+    assert name in dir(weaviate)
+
+
+def test_deprecated_root_import() -> None:
+    with pytest.warns(DeprecationWarning, match="Dep010"):
+        assert weaviate.AuthApiKey is weaviate.auth.AuthApiKey
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError):
+        weaviate.DoesNotExist  # noqa: B018
+
+
+def test_classes_lazy() -> None:
+    import weaviate.classes as wvc
+
+    assert wvc.ConsistencyLevel is wvc.config.ConsistencyLevel
+    assert wvc.query.Filter is not None
@@ -0,0 +1,79 @@
+import datetime
+import json
+import math
+import uuid as uuid_lib
+
+import pytest
+
+from weaviate import json_codec
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+def test_codecs_encode_and_decode_like_the_standard_library(name: str) -> None:
+    pytest.importorskip(name)
+    codec, dumps, loads = json_codec._load_codec(name)
+    payload = {"class": "Test", "properties": {"text": "ü", "count": 3, "score": 0.5}, "list": [1]}
+
+    assert codec == name
+    assert json.loads(dumps(payload)) == payload
+    assert loads(json.dumps(payload).encode()) == payload
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(ValueError):
+        json_codec._load_codec("simplejson")
+
+
+def test_falls_back_to_the_standard_library() -> None:
+    big = {"value": 2**70}
+    assert json_codec.loads(json_codec.dumps(big)) == big
+
+
+def test_invalid_json_raises_json_decode_error() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"{not json")
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"")
+
+
+@pytest.fixture(params=["orjson", "msgspec", "json"])
+def codec(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    pytest.importorskip(request.param)
+    name, dumps, loads = json_codec._load_codec(request.param)
+    monkeypatch.setattr(json_codec, "_dumps", dumps)
+    monkeypatch.setattr(json_codec, "_loads", loads)
+    return name
+
+
+def test_non_finite_floats(codec: str) -> None:
+    encoded = json_codec.dumps([float("nan"), float("inf")])
+    assert encoded == (b"[NaN, Infinity]" if codec == "json" else b"[null,null]")
+    # the non-standard literals are always decoded like the standard library does
+    decoded = json_codec.loads(b"[NaN, Infinity]")
+    assert math.isnan(decoded[0]) and decoded[1] == math.inf
+
+
+def test_objects_rejected_by_the_standard_library(codec: str) -> None:
+    uuid = uuid_lib.UUID(int=1)
+    if codec == "json":
+        with pytest.raises(TypeError):
+            json_codec.dumps(uuid)
+    else:
+        assert json_codec.dumps(uuid) == b'"00000000-0000-0000-0000-000000000001"'
+
+    date = datetime.datetime(2024, 1, 1)
+    if codec == "msgspec":
+        assert json_codec.dumps(date) == b'"2024-01-01T00:00:00"'
+    else:
+        with pytest.raises(TypeError):
+            json_codec.dumps(date)
+
+
+def test_large_integers(codec: str) -> None:
+    big = 2**70
+    assert json_codec.dumps({"value": big}) in (b'{"value": %d}' % big, b'{"value":%d}' % big)
+    decoded = json_codec.loads(b"%d" % big)
+    if codec == "orjson":
+        assert decoded == float(big)
+    else:
+        assert decoded == big
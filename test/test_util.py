@@ -1,6 +1,10 @@
+import base64
+import mmap
+import os
 import unittest
 import uuid as uuid_lib
 from copy import deepcopy
+from typing import Any
 from unittest.mock import patch, Mock
 import pytest
 
@@ -23,6 +27,10 @@ from weaviate.util import (
     is_weaviate_client_too_old,
     MINIMUM_NO_WARNING_VERSION,
     _sanitize_str,
+    _parse_media,
+    _read_cached_pypi_version,
+    _write_cached_pypi_version,
+    file_encoder_b64,
 )
 
 schema_set = {
@@ -592,3 +600,78 @@ def test_is_weaviate_client_too_old(current_version: str, latest_version: str, t
 )
 def test_sanitize_str(in_str: str, out_str: str) -> None:
     assert _sanitize_str(in_str) == f'"{out_str}"'
+
+
+def test_file_encoder_b64_accepts_binary_content(tmp_path) -> None:
+    content = os.urandom(100_000)
+    expected = base64.b64encode(content).decode()
+    path = tmp_path / "media.bin"
+    path.write_bytes(content)
+
+    assert file_encoder_b64(content) == expected
+    assert file_encoder_b64(bytearray(content)) == expected
+    assert file_encoder_b64(memoryview(content)) == expected
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert file_encoder_b64(mapped) == expected
+    assert file_encoder_b64(path) == expected
+    assert file_encoder_b64(str(path)) == expected
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert file_encoder_b64(empty) == ""
+
+
+def test_file_encoder_b64_caches_by_modification_time(tmp_path) -> None:
+    path = tmp_path / "media.bin"
+    path.write_bytes(b"first")
+    assert file_encoder_b64(path) == base64.b64encode(b"first").decode()
+
+    path.write_bytes(b"second")
+    os.utime(path, ns=(0, 0))
+    assert file_encoder_b64(path) == base64.b64encode(b"second").decode()
+
+
+def test_parse_media_does_not_look_up_encoded_media(tmp_path) -> None:
+    encoded = base64.b64encode(os.urandom(10_000)).decode()
+    with patch("os.path.isfile") as isfile:
+        assert _parse_media(encoded) == encoded
+    isfile.assert_not_called()
+
+    path = tmp_path / "media.bin"
+    path.write_bytes(b"media")
+    assert _parse_media(str(path)) == base64.b64encode(b"media").decode()
+    assert _parse_media("bWVkaWE=") == "bWVkaWE="
+
+
+def test_pypi_version_cache(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert _read_cached_pypi_version() == (False, None)
+
+    _write_cached_pypi_version("4.7.1")
+    assert _read_cached_pypi_version() == (True, "4.7.1")
+    _write_cached_pypi_version(None)  # the lookup failed, do not retry it on every connect
+    assert _read_cached_pypi_version() == (True, None)
+
+    monkeypatch.setattr("weaviate.util.PYPI_VERSION_CACHE_TTL", 0)
+    assert _read_cached_pypi_version() == (False, None)
+
+
+def test_pypi_version_cache_disabled(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("WEAVIATE_DISABLE_VERSION_CACHE", "1")
+    _write_cached_pypi_version("4.7.1")
+    assert list(tmp_path.iterdir()) == []
+    assert _read_cached_pypi_version() == (False, None)
+
+
+def test_pypi_version_cache_write_failure_removes_the_temporary_file(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def failing_dump(*args: Any, **kwargs: Any) -> None:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr("weaviate.util.json.dump", failing_dump)
+    _write_cached_pypi_version("4.7.1")
+    assert list((tmp_path / "weaviate-python-client").iterdir()) == []
@@ -1,3 +1,4 @@
+import json
 from typing import Union, Callable, Optional
 from unittest.mock import Mock
 
@@ -20,8 +21,8 @@ def mock_connection_func(
         The REST method to mock, accepted values: 'delete', 'post', 'put', 'patch' and 'get'.
         NOTE: It is case insensitive.
     return_json : [Union[list, dict, None], optional
-        The return value of the `.json()` method on the response of the `rest_method` method.
-        By default None.
+        The return value of the `.json()` method on the response of the `rest_method` method, also
+        used as encoded `.content`. By default None.
     status_code : int, optional
         The code the `rest_method` should return, by default 200.
     side_effect : Union[Exception, Callable, None], optional
@@ -69,6 +70,7 @@ def mock_connection_func(
             rest_method_return_mock = Mock()
             # mock the json() method and set its return value
             rest_method_return_mock.json.return_value = return_json
+            rest_method_return_mock.content = json.dumps(return_json).encode()
             # Set status code
             rest_method_return_mock.configure_mock(status_code=status_code)
             # set the return value of the given REST method
@@ -4,44 +4,47 @@ Weaviate Python Client Library used to interact with a Weaviate instance.
 
 import os
 import sys
+import importlib
 from importlib.metadata import version, PackageNotFoundError
-from typing import Any
+from typing import TYPE_CHECKING, Any, List
 
 try:
     __version__ = version("weaviate-client")
 except PackageNotFoundError:
     __version__ = "unknown version"
 
-from .client import Client, WeaviateAsyncClient, WeaviateClient
-from .collections.batch.client import BatchClient, ClientBatchingContextManager
-from .connect.helpers import (
-    connect_to_custom,
-    connect_to_embedded,
-    connect_to_local,
-    connect_to_wcs,
-    connect_to_weaviate_cloud,
-    use_async_with_custom,
-    use_async_with_embedded,
-    use_async_with_local,
-    use_async_with_weaviate_cloud,
-)
-from . import (
-    auth,
-    backup,
-    batch,
-    classes,
-    cluster,
-    collections,
-    config,
-    connect,
-    data,
-    embedded,
-    exceptions,
-    gql,
-    outputs,
-    schema,
-    types,
-)
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import Client, WeaviateAsyncClient, WeaviateClient
+    from .collections.batch.client import BatchClient, ClientBatchingContextManager
+    from .connect.helpers import (
+        connect_to_custom,
+        connect_to_embedded,
+        connect_to_local,
+        connect_to_wcs,
+        connect_to_weaviate_cloud,
+        use_async_with_custom,
+        use_async_with_embedded,
+        use_async_with_local,
+        use_async_with_weaviate_cloud,
+    )
+    from . import (
+        auth,
+        backup,
+        batch,
+        classes,
+        cluster,
+        collections,
+        config,
+        connect,
+        data,
+        embedded,
+        exceptions,
+        gql,
+        instrumentation,
+        outputs,
+        schema,
+        types,
+    )
 
 if not sys.warnoptions:
     from warnings import simplefilter
@@ -75,6 +78,7 @@ __all__ = [
     "embedded",
     "exceptions",
     "gql",
+    "instrumentation",
     "outputs",
     "schema",
     "types",
@@ -139,8 +143,57 @@ map_ = {
 }
 
 
+# The public attributes of this module are resolved lazily (PEP 562) so that `import weaviate` does not pull
+# in the v3 client, all collection namespaces and the generated protobuf modules until they are actually used.
+_lazy_attrs = {
+    "Client": "client",
+    "WeaviateAsyncClient": "client",
+    "WeaviateClient": "client",
+    "BatchClient": "collections.batch.client",
+    "ClientBatchingContextManager": "collections.batch.client",
+    "connect_to_custom": "connect.helpers",
+    "connect_to_embedded": "connect.helpers",
+    "connect_to_local": "connect.helpers",
+    "connect_to_wcs": "connect.helpers",
+    "connect_to_weaviate_cloud": "connect.helpers",
+    "use_async_with_custom": "connect.helpers",
+    "use_async_with_embedded": "connect.helpers",
+    "use_async_with_local": "connect.helpers",
+    "use_async_with_weaviate_cloud": "connect.helpers",
+}
+
+_lazy_submodules = [
+    "auth",
+    "backup",
+    "batch",
+    "classes",
+    "cluster",
+    "collections",
+    "config",
+    "connect",
+    "data",
+    "embedded",
+    "exceptions",
+    "gql",
+    "instrumentation",
+    "outputs",
+    "schema",
+    "types",
+]
+
+
 def __getattr__(name: str) -> Any:
+    if name in _lazy_attrs:
+        attr = getattr(importlib.import_module(f"{__name__}.{_lazy_attrs[name]}"), name)
+        globals()[name] = attr
+        return attr
+    if name in _lazy_submodules:
+        return importlib.import_module(f"{__name__}.{name}")
     if name in deprs:
         _Warnings.root_module_import(name, map_[name])
-        return getattr(sys.modules[f"{__name__}.{map_[name]}"], name)
+        return getattr(importlib.import_module(f"{__name__}.{map_[name]}"), name)
     raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,9 +2,10 @@
 Backup class definition.
 """
 
+import asyncio
 from enum import Enum
 from time import sleep
-from typing import Optional, Union, List, Tuple, Any, Dict
+from typing import Optional, Union, List, Tuple, Any, Dict, cast
 from pydantic import BaseModel, Field
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
@@ -18,6 +19,13 @@ from weaviate.exceptions import (
 )
 from weaviate.util import _capitalize_first_letter, _decode_json_response_dict
 
+BACKUP_POLL_INITIAL_INTERVAL = (
+    0.5  # seconds until the status of a backup is checked for the first time
+)
+BACKUP_POLL_MAX_INTERVAL = (
+    10  # the interval between the status checks doubles up to this many seconds
+)
+
 STORAGE_NAMES = {
     "filesystem",
     "s3",
@@ -78,10 +86,20 @@ class BackupStatusReturn(BaseModel):
     path: str
 
 
+class BackupHandle(BaseModel):
+    """Identifies a started backup creation or restore so that it can be waited for with `backup.wait`."""
+
+    backup_id: str
+    backend: BackupStorage
+    restore: bool = False
+
+
 class BackupReturn(BackupStatusReturn):
     """Return type of the backup creation and restore methods."""
 
     collections: List[str] = Field(default_factory=list, alias="classes")
+    handle: Optional[BackupHandle] = Field(default=None)
+    """The handle to wait for the backup with `backup.wait`, set if the creation or restore was not waited for."""
 
 
 class _BackupAsync:
@@ -121,7 +139,8 @@ class _BackupAsync:
 
         Returns
         -------
-         A `_BackupReturn` object that contains the backup creation response.
+         A `BackupReturn` object that contains the backup creation response. If `wait_for_completion` is False, its
+         `handle` can be passed to `wait` to wait for the backup later.
 
         Raises
         ------
@@ -173,20 +192,16 @@ class _BackupAsync:
         create_status = _decode_json_response_dict(response, "Backup creation")
         assert create_status is not None
         if wait_for_completion:
-            while True:
-                status = await self.__get_create_status(
-                    backup_id=backup_id,
-                    backend=backend,
+            status = await self.__wait_until_done(backup_id, backend, restore=False)
+            create_status["status"] = status.status
+            if status.status == BackupStatus.FAILED:
+                raise BackupFailedException(
+                    f"Backup failed: {create_status} with error: {status.error}"
                 )
-                create_status["status"] = status.status
-                if status.status == BackupStatus.SUCCESS:
-                    break
-                if status.status == BackupStatus.FAILED:
-                    raise BackupFailedException(
-                        f"Backup failed: {create_status} with error: {status.error}"
-                    )
-                sleep(1)
-        return BackupReturn(**create_status)
+            return BackupReturn(**create_status)
+        return BackupReturn(
+            **create_status, handle=BackupHandle(backup_id=backup_id, backend=backend)
+        )
 
     async def __get_create_status(
         self, backup_id: str, backend: BackupStorage
@@ -258,7 +273,8 @@ class _BackupAsync:
 
         Returns
         -------
-         A `BackupReturn` object that contains the backup restore response.
+         A `BackupReturn` object that contains the backup restore response. If `wait_for_completion` is False, its
+         `handle` can be passed to `wait` to wait for the restore later.
 
         Raises
         ------
@@ -305,20 +321,17 @@ class _BackupAsync:
         restore_status = _decode_json_response_dict(response, "Backup restore")
         assert restore_status is not None
         if wait_for_completion:
-            while True:
-                status = await self.__get_restore_status(
-                    backup_id=backup_id,
-                    backend=backend,
+            status = await self.__wait_until_done(backup_id, backend, restore=True)
+            restore_status["status"] = status.status
+            if status.status == BackupStatus.FAILED:
+                raise BackupFailedException(
+                    f"Backup restore failed: {restore_status} with error: {status.error}"
                 )
-                restore_status["status"] = status.status
-                if status.status == BackupStatus.SUCCESS:
-                    break
-                if status.status == BackupStatus.FAILED:
-                    raise BackupFailedException(
-                        f"Backup restore failed: {restore_status} with error: {status.error}"
-                    )
-                sleep(1)
-        return BackupReturn(**restore_status)
+            return BackupReturn(**restore_status)
+        return BackupReturn(
+            **restore_status,
+            handle=BackupHandle(backup_id=backup_id, backend=backend, restore=True),
+        )
 
     async def __get_restore_status(
         self, backup_id: str, backend: BackupStorage
@@ -357,6 +370,73 @@ class _BackupAsync:
         """
         return await self.__get_restore_status(backup_id, backend)
 
+    async def wait(self, backups: List[BackupHandle]) -> List[BackupStatusReturn]:
+        """
+        Wait until all the given backup creations and restores are done.
+
+        The status of all backups is checked concurrently, with intervals that grow from half a second up to
+        ten seconds the longer the backups take.
+
+        Parameters
+        ----------
+        backups : List[BackupHandle]
+            The started backup creations and restores to wait for.
+
+        Returns
+        -------
+         A list of `BackupStatusReturn` objects with the final status of each backup, in the given order.
+
+        Raises
+        ------
+        weaviate.BackupFailedException
+            If any of the backups failed, in which case the status of the other backups is no longer checked.
+        """
+        if not isinstance(backups, list) or not all(
+            isinstance(backup, BackupHandle) for backup in backups
+        ):
+            raise WeaviateInvalidInputError(
+                f"Expected 'backups' to be a list of 'BackupHandle', but got {backups}."
+            )
+
+        async def wait_for(backup: BackupHandle) -> BackupStatusReturn:
+            status = await self.__wait_until_done(
+                backup.backup_id, backup.backend, restore=backup.restore
+            )
+            if status.status == BackupStatus.FAILED:
+                operation = "restore" if backup.restore else "creation"
+                raise BackupFailedException(
+                    f"Backup {operation} of {backup.backup_id} failed with error: {status.error}"
+                )
+            return status
+
+        if len(backups) == 0:
+            return []
+        tasks = [asyncio.ensure_future(wait_for(backup)) for backup in backups]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # stop polling the other backups once one of them failed or the wait was cancelled
+            for task in tasks:
+                task.cancel()
+        for task in tasks:
+            if task in done and task.exception() is not None:
+                raise cast(BaseException, task.exception())
+        return [task.result() for task in tasks]
+
+    async def __wait_until_done(
+        self, backup_id: str, backend: BackupStorage, restore: bool
+    ) -> BackupStatusReturn:
+        interval = BACKUP_POLL_INITIAL_INTERVAL
+        while True:
+            if restore:
+                status = await self.__get_restore_status(backup_id, backend)
+            else:
+                status = await self.__get_create_status(backup_id, backend)
+            if status.status in (BackupStatus.SUCCESS, BackupStatus.FAILED):
+                return status
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, BACKUP_POLL_MAX_INTERVAL)
+
 
 class Backup:
     """
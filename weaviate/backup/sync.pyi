@@ -1,7 +1,7 @@
 from typing import Optional, Union, List
 
 from weaviate.connect import ConnectionV4
-from weaviate.backup.backup import BackupStorage, BackupReturn, BackupStatusReturn
+from weaviate.backup.backup import BackupHandle, BackupStorage, BackupReturn, BackupStatusReturn
 
 class _Backup:
     """Backup class used to schedule and/or check the status of a backup process of Weaviate objects."""
@@ -27,3 +27,4 @@ class _Backup:
         wait_for_completion: bool = False,
     ) -> BackupReturn: ...
     def get_restore_status(self, backup_id: str, backend: BackupStorage) -> BackupStatusReturn: ...
+    def wait(self, backups: List[BackupHandle]) -> List[BackupStatusReturn]: ...
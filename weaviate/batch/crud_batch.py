@@ -8,7 +8,7 @@ import threading
 import time
 import warnings
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, Future, wait
 from dataclasses import dataclass, field
 from numbers import Real
 from typing import (
@@ -27,22 +27,30 @@ from typing import (
     cast,
 )
 
+import grpc  # type: ignore
 from requests import ReadTimeout, Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import HTTPError as RequestsHTTPError
 
 from weaviate.connect import Connection
 from weaviate.data.replication import ConsistencyLevel
+from weaviate.proto.v1 import batch_pb2
 from weaviate.gql.filter import _find_value_type, VALUE_ARRAY_TYPES, WHERE_OPERATORS
 from weaviate.types import UUID
-from .requests import BatchRequest, ObjectsBatchRequest, ReferenceBatchRequest, BatchResponse
+from .requests import (
+    BatchRequest,
+    BatchResponse,
+    ObjectsBatchRequest,
+    ObjectsGrpcBatchRequest,
+    ReferenceBatchRequest,
+)
 from ..cluster import Cluster
 from ..error_msgs import (
     BATCH_REF_DEPRECATION_NEW_V14_CLS_NS_W,
     BATCH_REF_DEPRECATION_OLD_V14_CLS_NS_W,
     BATCH_EXECUTOR_SHUTDOWN_W,
 )
-from ..exceptions import UnexpectedStatusCodeException
+from ..exceptions import UnexpectedStatusCodeException, WeaviateBatchError
 from ..util import (
     _capitalize_first_letter,
     check_batch_result,
@@ -111,6 +119,28 @@ class WeaviateErrorRetryConf:
             raise ValueError("errors_to_include has 0 entries and no error will be retried.")
 
 
+class _GrpcBatchResponse(Response):
+    """
+    A `requests.Response` holding the already decoded results of a gRPC batch request, so that
+    they are handled exactly like the results of the REST endpoint.
+    """
+
+    def __init__(self, results: BatchResponse, elapsed_seconds: float):
+        super().__init__()
+        self.status_code = 200
+        self.elapsed = datetime.timedelta(seconds=elapsed_seconds)
+        self.__results = results
+
+    def json(self, **kwargs: Any) -> BatchResponse:
+        return self.__results
+
+
+def _decode_batch_response(response: Response, location: str) -> Optional[BatchResponse]:
+    if isinstance(response, _GrpcBatchResponse):
+        return response.json()
+    return _decode_json_response_list(response, location)
+
+
 class BatchExecutor(ThreadPoolExecutor):
     """
     Weaviate Batch Executor to run batch requests in separate thread.
@@ -278,13 +308,18 @@ class Batch:
         self._shutdown_background_event: Optional[threading.Event] = None
         self._new_dynamic_batching = True
         self._connection = connection
-        self._objects_batch = ObjectsBatchRequest()
+        self._use_grpc = False
+        self._objects_batch = self._new_objects_batch()
         self._reference_batch = ReferenceBatchRequest()
         # do not keep too many past values, so it is a better estimation of the throughput is computed for 1 second
         self._objects_throughput_frame: Deque[float] = deque(maxlen=5)
         self._references_throughput_frame: Deque[float] = deque(maxlen=5)
         self._future_pool: List[Future[Tuple[Union[Response, None], int]]] = []
-        self._reference_batch_queue: List[ReferenceBatchRequest] = []
+        self._reference_future_pool: List[Future[Tuple[Union[Response, None], int]]] = []
+        # reference batches waiting for the object batches that were in flight when they were queued
+        self._reference_batch_queue: List[
+            Tuple[ReferenceBatchRequest, Set[Future[Tuple[Union[Response, None], int]]]]
+        ] = []
         self._callback_lock = threading.Lock()
 
         # user configurable, need to be public should implement a setter/getter
@@ -337,6 +372,11 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        use_grpc : bool, optional
+            Whether to send the objects through the gRPC `BatchObjects` API instead of REST. The objects
+            are serialized when they are added, vectors are sent as packed floats and the callback
+            receives the same results as for REST. References are always sent through REST.
+            Requires `grpc_port_experimental` to be set in the `weaviate.Config`, by default False
 
         Returns
         -------
@@ -364,6 +404,7 @@ class Batch:
         dynamic: bool = True,
         num_workers: int = 1,
         consistency_level: Optional[ConsistencyLevel] = None,
+        use_grpc: bool = False,
     ) -> "Batch":
         """
         Warnings
@@ -401,6 +442,11 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        use_grpc : bool, optional
+            Whether to send the objects through the gRPC `BatchObjects` API instead of REST. The objects
+            are serialized when they are added, vectors are sent as packed floats and the callback
+            receives the same results as for REST. References are always sent through REST.
+            Requires `grpc_port_experimental` to be set in the `weaviate.Config`, by default False
 
         Returns
         -------
@@ -429,6 +475,7 @@ class Batch:
         self._timeout_retries = timeout_retries
         self._connection_error_retries = connection_error_retries
         self._weaviate_error_retry = weaviate_error_retries
+        self.use_grpc = use_grpc
         # set Batch to manual import
         if batch_size is None and not dynamic:
             self._batch_size = None
@@ -691,11 +738,14 @@ class Batch:
             timeout_count = connection_count = batch_error_count = 0
             while True:
                 try:
-                    response = self._connection.post(
-                        path="/batch/" + data_type,
-                        weaviate_object=batch_request.get_request_body(),
-                        params=params,
-                    )
+                    if isinstance(batch_request, ObjectsGrpcBatchRequest):
+                        response = self._create_objects_grpc(batch_request, params)
+                    else:
+                        response = self._connection.post(
+                            path="/batch/" + data_type,
+                            weaviate_object=batch_request.get_request_body(),
+                            params=params,
+                        )
                 except ReadTimeout as error:
                     _batch_create_error_handler(
                         retry=timeout_count,
@@ -721,7 +771,7 @@ class Batch:
                     )
                     connection_count += 1
                 else:
-                    response_json = _decode_json_response_list(response, "batch response")
+                    response_json = _decode_batch_response(response, "batch response")
                     assert response_json is not None
                     if (
                         self._weaviate_error_retry is not None
@@ -753,6 +803,81 @@ class Batch:
             return response
         raise UnexpectedStatusCodeException(f"Create {data_type} in batch", response)
 
+    def _new_objects_batch(self) -> ObjectsBatchRequest:
+        return ObjectsGrpcBatchRequest() if self._use_grpc else ObjectsBatchRequest()
+
+    def _create_objects_grpc(
+        self, batch_request: ObjectsGrpcBatchRequest, params: Dict[str, str]
+    ) -> Response:
+        """
+        Create the objects through the gRPC `BatchObjects` API and return the results in the same
+        format as the REST endpoint. The objects that cannot be sent with gRPC are sent to the REST
+        endpoint in the same call.
+
+        Raises
+        ------
+        requests.ReadTimeout
+            If the request time-outed.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.WeaviateBatchError
+            If the gRPC request failed for any other reason.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status for the objects sent with REST.
+        """
+        assert self._connection.grpc_stub is not None
+        objects = batch_request.get_request_body()["objects"]
+        grpc_objects = batch_request.get_grpc_objects()
+        grpc_indexes = [idx for idx, obj in enumerate(grpc_objects) if obj is not None]
+        rest_indexes = [idx for idx, obj in enumerate(grpc_objects) if obj is None]
+        to_send = [obj for obj in grpc_objects if obj is not None]
+        results: List[Dict[str, Any]] = [{} for _ in objects]
+
+        start = time.perf_counter()
+        if len(grpc_indexes) > 0:
+            request = batch_pb2.BatchObjectsRequest(
+                objects=to_send,
+                consistency_level=(
+                    self._consistency_level._to_grpc()
+                    if self._consistency_level is not None
+                    else None
+                ),
+            )
+            try:
+                reply = self._connection.grpc_stub.BatchObjects(
+                    request,
+                    metadata=self._connection.grpc_metadata(),
+                    timeout=self._connection.timeout_config[1],
+                )
+            except grpc.RpcError as error:
+                if error.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    raise ReadTimeout(error.details()) from error
+                if error.code() == grpc.StatusCode.UNAVAILABLE:
+                    raise RequestsConnectionError(error.details()) from error
+                raise WeaviateBatchError(str(error)) from error
+
+            errors = {grpc_indexes[result.index]: result.error for result in reply.errors}
+            for idx in grpc_indexes:
+                results[idx] = {
+                    **objects[idx],
+                    "result": (
+                        {"errors": {"error": [{"message": errors[idx]}]}} if idx in errors else {}
+                    ),
+                }
+
+        if len(rest_indexes) > 0:
+            response = self._connection.post(
+                path="/batch/objects",
+                weaviate_object={"fields": ["ALL"], "objects": [objects[i] for i in rest_indexes]},
+                params=params,
+            )
+            rest_results = _decode_json_response_list(response, "batch response")
+            assert rest_results is not None
+            for idx, result in zip(rest_indexes, rest_results):
+                results[idx] = result
+
+        return _GrpcBatchResponse(results, time.perf_counter() - start)
+
     def _run_callback(self, response: BatchResponse) -> None:
         if self._callback is None:
             return
@@ -803,7 +928,7 @@ class Batch:
             New ObjectsBatchRequest with only the objects that were not created or updated.
         """
 
-        new_batch = ObjectsBatchRequest()
+        new_batch = self._new_objects_batch()
         for obj in batch_request.get_request_body()["objects"]:
             class_name = obj["class"]
             tenant = obj.get("tenant", None)
@@ -965,7 +1090,7 @@ class Batch:
                 data_type="objects",
                 batch_request=self._objects_batch,
             )
-            self._objects_batch = ObjectsBatchRequest()
+            self._objects_batch = self._new_objects_batch()
 
             self._objects_throughput_frame.append(
                 len(self._objects_batch) / response.elapsed.total_seconds()
@@ -978,7 +1103,7 @@ class Batch:
                 round(obj_per_second * float(self._creation_time)), 1
             )
 
-            res = _decode_json_response_list(response, "batch add objects")
+            res = _decode_batch_response(response, "batch add objects")
             assert res is not None
             return res
         return []
@@ -1114,15 +1239,15 @@ class Batch:
 
     def _send_batch_requests(self, force_wait: bool) -> None:
         """
-        Send BatchRequest in a separate thread/process. This methods submits a task to create only
-        the ObjectsBatchRequests to the BatchExecutor and adds the ReferencesBatchRequests to a
-        queue, then it carries on in the main thread until `num_workers` tasks have been submitted.
-        When we have reached number of tasks to be equal to `num_workers` it waits for all the
-        tasks to finish and handles the responses. After all ObjectsBatchRequests have been handled
-        it created separate tasks for each ReferencesBatchRequests, then it handles their responses
-        as well. This mechanism of creating References after Objects is constructed in this manner
-        to eliminate potential error when creating references from a object that does not yet
-        exists (object that is part of another task).
+        Send BatchRequest in a separate thread/process. This methods submits a task to create the
+        ObjectsBatchRequest to the BatchExecutor and queues the ReferencesBatchRequest until all the
+        ObjectsBatchRequests that were in flight when it was queued have been handled, so that no
+        reference is created from an object that does not yet exist (object that is part of another
+        task). Queued references are submitted as soon as their objects are acknowledged.
+
+        At most `num_workers` tasks are in flight at any time. When the window is full it waits only
+        until the first task finishes, handles its response and returns, so that the other workers
+        keep on sending while the next batch is being filled.
 
         Parameters
         ----------
@@ -1140,41 +1265,77 @@ class Batch:
             self.start()
 
         assert self._executor is not None
-        future = self._executor.submit(
-            self._flush_in_thread,
-            data_type="objects",
-            batch_request=self._objects_batch,
-        )
-
-        self._future_pool.append(future)
+        if len(self._objects_batch) > 0:
+            future = self._executor.submit(
+                self._flush_in_thread,
+                data_type="objects",
+                batch_request=self._objects_batch,
+            )
+            self._future_pool.append(future)
         if len(self._reference_batch) > 0:
-            self._reference_batch_queue.append(self._reference_batch)
+            self._reference_batch_queue.append((self._reference_batch, set(self._future_pool)))
 
-        self._objects_batch = ObjectsBatchRequest()
+        self._objects_batch = self._new_objects_batch()
         self._reference_batch = ReferenceBatchRequest()
 
-        if not force_wait and self._num_workers > 1 and len(self._future_pool) < self._num_workers:
+        self._submit_ready_references()
+        if force_wait:
+            while len(self._future_pool) + len(self._reference_future_pool) > 0:
+                self._handle_completed_requests()
             return
-        timeout_occurred = False
-        for done_future in as_completed(self._future_pool):
-            response_objects, nr_objects = done_future.result()
+        while len(self._future_pool) + len(self._reference_future_pool) >= self._num_workers:
+            self._handle_completed_requests()
 
-            # handle objects response
-            if response_objects is not None:
-                self._objects_throughput_frame.append(
-                    nr_objects / response_objects.elapsed.total_seconds()
-                )
+    def _submit_ready_references(self) -> None:
+        """
+        Submit the queued ReferencesBatchRequests whose objects have all been handled.
+        """
+        assert self._executor is not None
+        waiting = []
+        for reference_batch, object_futures in self._reference_batch_queue:
+            if any(future in self._future_pool for future in object_futures):
+                waiting.append((reference_batch, object_futures))
+                continue
+            future = self._executor.submit(
+                self._flush_in_thread,
+                data_type="references",
+                batch_request=reference_batch,
+            )
+            self._reference_future_pool.append(future)
+        self._reference_batch_queue = waiting
 
-            else:
-                timeout_occurred = True
+    def _handle_completed_requests(self) -> None:
+        """
+        Wait until at least one of the in-flight tasks has finished, handle the responses of all the
+        finished tasks and submit the references that became ready.
+        """
+        done, _ = wait(self._future_pool + self._reference_future_pool, return_when=FIRST_COMPLETED)
+        done_objects = [future for future in self._future_pool if future in done]
+        done_references = [future for future in self._reference_future_pool if future in done]
+        self._future_pool = [future for future in self._future_pool if future not in done]
+        self._reference_future_pool = [
+            future for future in self._reference_future_pool if future not in done
+        ]
+        for done_future in done_objects:
+            response_objects, nr_objects = done_future.result()
+            if response_objects is None:
+                # the batch failed and was split, slow down
+                if self._recommended_num_objects is not None:
+                    self._recommended_num_objects = max(self._recommended_num_objects // 2, 1)
+                continue
+            self._update_recommended_num_objects(response_objects, nr_objects)
+        for done_future in done_references:
+            response_references, nr_references = done_future.result()
+            if response_references is None:
+                if self._recommended_num_references is not None:
+                    self._recommended_num_references = max(self._recommended_num_references // 2, 1)
+                continue
+            self._update_recommended_num_references(response_references, nr_references)
+        self._submit_ready_references()
 
-        if timeout_occurred and self._recommended_num_objects is not None:
-            self._recommended_num_objects = max(self._recommended_num_objects // 2, 1)
-        elif (
-            len(self._objects_throughput_frame) != 0
-            and self._recommended_num_objects is not None
-            and not self._new_dynamic_batching
-        ):
+    def _update_recommended_num_objects(self, response: Response, nr_objects: int) -> None:
+        self._objects_throughput_frame.append(nr_objects / response.elapsed.total_seconds())
+        if self._recommended_num_objects is not None and not self._new_dynamic_batching:
             obj_per_second = (
                 sum(self._objects_throughput_frame) / len(self._objects_throughput_frame) * 0.75
             )
@@ -1186,34 +1347,9 @@ class Batch:
                 1,
             )
 
-        # Create references after all the objects have been created
-        reference_future_pool = []
-        for reference_batch in self._reference_batch_queue:
-            future = self._executor.submit(
-                self._flush_in_thread,
-                data_type="references",
-                batch_request=reference_batch,
-            )
-            reference_future_pool.append(future)
-
-        timeout_occurred = False
-        for done_future in as_completed(reference_future_pool):
-            response_references, nr_references = done_future.result()
-
-            # handle references response
-            if response_references is not None:
-                self._references_throughput_frame.append(
-                    nr_references / response_references.elapsed.total_seconds()
-                )
-            else:
-                timeout_occurred = True
-
-        if timeout_occurred and self._recommended_num_references is not None:
-            self._recommended_num_references = max(self._recommended_num_references // 2, 1)
-        elif (
-            len(self._references_throughput_frame) != 0
-            and self._recommended_num_references is not None
-        ):
+    def _update_recommended_num_references(self, response: Response, nr_references: int) -> None:
+        self._references_throughput_frame.append(nr_references / response.elapsed.total_seconds())
+        if self._recommended_num_references is not None:
             ref_per_sec = sum(self._references_throughput_frame) / len(
                 self._references_throughput_frame
             )
@@ -1222,10 +1358,6 @@ class Batch:
                 self._recommended_num_references * 2,
             )
 
-        self._future_pool = []
-        self._reference_batch_queue = []
-        return
-
     def _auto_create(self) -> None:
         """
         Auto create both objects and references in the batch. This protected method works with a
@@ -1592,6 +1724,57 @@ class Batch:
     def consistency_level(self, x: Optional[Union[ConsistencyLevel, str]]) -> None:
         self._consistency_level = ConsistencyLevel(x) if x is not None else None
 
+    @property
+    def use_grpc(self) -> bool:
+        """
+        Whether the objects are sent through the gRPC `BatchObjects` API instead of REST.
+
+        Returns
+        -------
+        bool
+            Whether gRPC is used for the objects.
+        """
+
+        return self._use_grpc
+
+    @use_grpc.setter
+    def use_grpc(self, value: bool) -> None:
+        """
+        Setter for `use_grpc`. Objects that were already added are moved to a batch of the new kind.
+
+        Parameters
+        ----------
+        value : bool
+            Whether to send the objects through the gRPC `BatchObjects` API instead of REST.
+
+        Raises
+        ------
+        TypeError
+            If `value` is not of type bool.
+        ValueError
+            If `value` is True but the client has no gRPC connection.
+        """
+
+        _check_bool(value, "use_grpc")
+        if value and self._connection.grpc_stub is None:
+            raise ValueError(
+                "'use_grpc' requires a gRPC connection, set 'grpc_port_experimental' in the "
+                "weaviate.Config of the client."
+            )
+        if value == self._use_grpc:
+            return
+        self._use_grpc = value
+        added_objects = self._objects_batch.get_request_body()["objects"]
+        self._objects_batch = self._new_objects_batch()
+        for obj in added_objects:
+            self._objects_batch.add(
+                data_object=obj["properties"],
+                class_name=obj["class"],
+                uuid=obj["id"],
+                vector=obj.get("vector", None),
+                tenant=obj.get("tenant", None),
+            )
+
     @property
     def recommended_num_objects(self) -> Optional[int]:
         """
@@ -1824,7 +2007,7 @@ class Batch:
         self, response: BatchResponse, data_type: str
     ) -> Tuple[BatchRequestType, BatchResponse]:
         if data_type == "objects":
-            new_batch: Union[ObjectsBatchRequest, ReferenceBatchRequest] = ObjectsBatchRequest()
+            new_batch: Union[ObjectsBatchRequest, ReferenceBatchRequest] = self._new_objects_batch()
         else:
             new_batch = ReferenceBatchRequest()
         assert self._weaviate_error_retry is not None
@@ -3,15 +3,20 @@ BatchRequest class definitions.
 """
 
 import copy
+import struct
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Optional, Dict, Any, Union
+from typing import List, Sequence, Optional, Dict, Any, Tuple, Union
 from uuid import uuid4
 
+from weaviate.proto.v1 import batch_pb2
 from weaviate.util import get_valid_uuid, get_vector
 from weaviate.types import UUID
 
 BatchResponse = List[Dict[str, Any]]
 
+# keys of the JSON of geo-coordinates and phone numbers
+_GEO_OR_PHONE_KEYS = {"latitude", "longitude", "input"}
+
 
 class BatchRequest(ABC):
     """
@@ -334,3 +339,149 @@ class ObjectsBatchRequest(BatchRequest):
                 tenant=obj.get("tenant", None),
             )
         return successful_responses
+
+
+class ObjectsGrpcBatchRequest(ObjectsBatchRequest):
+    """
+    Collect objects for one gRPC batch request to weaviate.
+    The objects are serialized to protobuf when they are added, so the data objects are not deep
+    copied and the vectors are sent as packed floats instead of JSON.
+    Caution this batch will not be validated through weaviate.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # `None` for the objects that have to be sent with REST
+        self._grpc_items: List[Optional[batch_pb2.BatchObject]] = []
+
+    def empty(self) -> None:
+        super().empty()
+        self._grpc_items = []
+
+    def pop(self, index: int = -1) -> dict:
+        self._grpc_items.pop(index)
+        return super().pop(index)
+
+    def add(  # pyright: ignore reportIncompatibleMethodOverride
+        self,
+        data_object: dict,
+        class_name: str,
+        uuid: Optional[UUID] = None,
+        vector: Optional[Sequence] = None,
+        tenant: Optional[str] = None,
+    ) -> str:
+        """
+        Add one object to this batch. See `ObjectsBatchRequest.add` for the parameters.
+
+        Cross-references given as beacons, e.g. `[{"beacon": "weaviate://localhost/Class/<uuid>"}]`,
+        are converted to their gRPC representation. Objects with geo-coordinates or phone numbers,
+        which cannot be told apart from object properties without the schema, and objects that
+        reference several collections in one property are sent with REST instead.
+
+        Returns
+        -------
+        str
+            The UUID of the added object. If one was not provided a UUIDv4 will be generated.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If 'uuid' is not of a proper form.
+        """
+
+        if not isinstance(data_object, dict):
+            raise TypeError("Object must be of type dict")
+        if not isinstance(class_name, str):
+            raise TypeError("Class name must be of type str")
+
+        valid_uuid = get_valid_uuid(uuid if uuid is not None else uuid4())
+        batch_item: Dict[str, Any] = {
+            "class": class_name,
+            "properties": data_object,
+            "id": valid_uuid,
+        }
+
+        vector_bytes: Optional[bytes] = None
+        if vector is not None:
+            vector_list = get_vector(vector)
+            vector_bytes = struct.pack("{}f".format(len(vector_list)), *vector_list)
+            batch_item["vector"] = vector_list
+        if tenant is not None:
+            batch_item["tenant"] = tenant
+
+        properties = _v3_properties_to_grpc(data_object)
+        self._grpc_items.append(
+            batch_pb2.BatchObject(
+                collection=class_name,
+                uuid=valid_uuid,
+                vector_bytes=vector_bytes,
+                properties=properties,
+                tenant=tenant,
+            )
+            if properties is not None
+            else None
+        )
+        self._items.append(batch_item)
+
+        return valid_uuid
+
+    def get_grpc_objects(self) -> List[Optional[batch_pb2.BatchObject]]:
+        """
+        Get the serialized objects as they are needed for the gRPC `BatchObjects` request.
+
+        Returns
+        -------
+        List[Optional[batch_pb2.BatchObject]]
+            The objects of this batch, in the same order as in `get_request_body`. `None` for the
+            objects that have to be sent with REST, see `_v3_properties_to_grpc`.
+        """
+
+        return self._grpc_items
+
+
+def _v3_beacon_target(beacon: str) -> Tuple[Optional[str], str]:
+    # weaviate://localhost/<uuid> or weaviate://localhost/<class>/<uuid>
+    path = beacon.split("://", 1)[-1].split("/")[1:]
+    if len(path) >= 2:
+        return path[-2], path[-1]
+    return None, path[-1]
+
+
+def _v3_properties_to_grpc(
+    data_object: Dict[str, Any]
+) -> Optional[batch_pb2.BatchObject.Properties]:
+    """
+    Convert the properties of a v3 data object to gRPC, `None` if they cannot be converted without knowing the data
+    types of the properties.
+
+    Geo-coordinates and phone numbers cannot be told apart from object properties with the same keys, and references
+    to several collections cannot be sent in a single gRPC reference property, so these objects are sent with REST.
+    """
+    # imported here so that v3 batches only load the v4 collections when they are sent with gRPC
+    from weaviate.collections.batch.grpc_batch_objects import _properties_to_grpc
+    from weaviate.collections.classes.internal import ReferenceToMulti
+
+    references: Dict[str, Union[List[str], ReferenceToMulti]] = {}
+    for key, value in data_object.items():
+        if (
+            isinstance(value, list)
+            and len(value) > 0
+            and all(isinstance(ref, dict) and "beacon" in ref for ref in value)
+        ):
+            targets = [_v3_beacon_target(ref["beacon"]) for ref in value]
+            collections = {collection for collection, _ in targets}
+            if len(collections) > 1:
+                return None
+            collection = collections.pop()
+            uuids = [uuid for _, uuid in targets]
+            references[key] = (
+                uuids
+                if collection is None
+                else ReferenceToMulti(target_collection=collection, uuids=uuids)
+            )
+        elif isinstance(value, dict) and len(value.keys() & _GEO_OR_PHONE_KEYS) > 0:
+            return None
+    properties = {key: value for key, value in data_object.items() if key not in references}
+    return _properties_to_grpc(properties, references)
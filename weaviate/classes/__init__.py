@@ -1,7 +1,9 @@
-from .config import ConsistencyLevel
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-# make sure to import all classes that should be available in the weaviate module
-from . import aggregate, batch, config, data, generics, init, query, tenants  # noqa: F401
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import ConsistencyLevel
+    from . import aggregate, batch, config, data, generics, init, query, tenants  # noqa: F401
 
 __all__ = [
     "aggregate",
@@ -14,3 +16,17 @@ __all__ = [
     "query",
     "tenants",
 ]
+
+
+# the submodules are imported on first access so that e.g. `weaviate.classes.query` does not also load
+# all the pydantic models for collection configuration
+def __getattr__(name: str) -> Any:
+    if name == "ConsistencyLevel":
+        return importlib.import_module(f"{__name__}.config").ConsistencyLevel
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,3 @@
-from weaviate.collections.classes.aggregate import GroupByAggregate, Metrics
+from weaviate.collections.classes.aggregate import AggregateQuery, GroupByAggregate, Metrics
 
-__all__ = ["GroupByAggregate", "Metrics"]
+__all__ = ["AggregateQuery", "GroupByAggregate", "Metrics"]
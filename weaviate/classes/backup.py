@@ -2,6 +2,7 @@ from weaviate.backup.backup import (
     BackupCompressionLevel,
     BackupConfigCreate,
     BackupConfigRestore,
+    BackupHandle,
     BackupStorage,
 )
 
@@ -9,5 +10,6 @@ __all__ = [
     "BackupCompressionLevel",
     "BackupConfigCreate",
     "BackupConfigRestore",
+    "BackupHandle",
     "BackupStorage",
 ]
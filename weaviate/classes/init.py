@@ -1,4 +1,4 @@
 from weaviate.auth import Auth
-from weaviate.config import AdditionalConfig, Proxies, Timeout
+from weaviate.config import AdditionalConfig, Proxies, SchemaCache, TenantActivation, Timeout
 
-__all__ = ["Auth", "AdditionalConfig", "Proxies", "Timeout"]
+__all__ = ["Auth", "AdditionalConfig", "Proxies", "SchemaCache", "TenantActivation", "Timeout"]
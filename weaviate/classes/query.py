@@ -1,3 +1,4 @@
+from weaviate.collections.changes import ChangesCheckpoint
 from weaviate.collections.classes.aggregate import Metrics
 from weaviate.collections.classes.filters import Filter
 from weaviate.collections.classes.grpc import (
@@ -16,6 +17,7 @@ from weaviate.collections.classes.grpc import (
 from weaviate.collections.classes.types import GeoCoordinate
 
 __all__ = [
+    "ChangesCheckpoint",
     "Filter",
     "GeoCoordinate",
     "GroupBy",
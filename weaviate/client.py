@@ -15,8 +15,6 @@ from weaviate.backup.sync import _Backup
 from weaviate import syncify
 from .auth import AuthCredentials
 from .backup import Backup
-from .batch import Batch
-from .classification import Classification
 
 from .client_base import _WeaviateClientBase
 from .cluster import Cluster
@@ -30,16 +28,12 @@ from .connect.base import (
     ConnectionParams,
     TIMEOUT_TYPE_RETURN,
 )
-from .contextionary import Contextionary
-from .data import DataObject
 from .embedded import EmbeddedOptions, EmbeddedV3
 from .exceptions import (
     UnexpectedStatusCodeError,
     WeaviateClosedClientError,
     WeaviateConnectionError,
 )
-from .gql import Query
-from .schema import Schema
 from weaviate.event_loop import _EventLoopSingleton, _EventLoop
 from .types import NUMBER
 from .util import _get_valid_timeout_config, _type_request_response
@@ -81,7 +75,10 @@ class WeaviateClient(_WeaviateClientBase):
         additional_config: Optional[AdditionalConfig] = None,
         skip_init_checks: bool = False,
     ) -> None:
-        self._event_loop = _EventLoopSingleton.get_instance()
+        self._event_loop = _EventLoopSingleton.get_shard(
+            additional_config.connection.event_loop_shards if additional_config else None
+        )
+        self._holds_event_loop = True
         assert self._event_loop.loop is not None
         self._loop = self._event_loop.loop
         _EventLoop.patch_exception_handler(self._loop)
@@ -265,6 +262,14 @@ class Client:
         """
         _Warnings.weaviate_v3_client_is_deprecated()
 
+        # the v3 namespaces are only imported when a v3 client is created to keep `import weaviate` fast
+        from .batch import Batch
+        from .classification import Classification
+        from .contextionary import Contextionary
+        from .data import DataObject
+        from .gql import Query
+        from .schema import Schema
+
         config = Config() if additional_config is None else additional_config
         url, embedded_db = self.__parse_url_and_embedded_db(url, embedded_options)
 
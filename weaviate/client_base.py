@@ -7,6 +7,8 @@ from typing import Optional, Tuple, Union, Dict, Any
 
 
 from weaviate.collections.classes.internal import _GQLEntryReturnType, _RawGQLReturn
+from weaviate.collections.config.cache import _SchemaCache
+from weaviate.collections.tenants.activation import _TenantActivationCache
 
 from weaviate.integrations import _Integrations
 
@@ -19,6 +21,7 @@ from .connect.base import (
 )
 from .connect.v4 import _ExpectedStatusCodes
 from .embedded import EmbeddedOptions, EmbeddedV4
+from .event_loop import _EventLoop, _EventLoopSingleton
 from .types import NUMBER
 from .util import _decode_json_response_dict
 from .validator import _validate_input, _ValidateArgument
@@ -28,6 +31,9 @@ TIMEOUT_TYPE = Union[Tuple[NUMBER, NUMBER], NUMBER]
 
 class _WeaviateClientInit:
     _loop: Optional[asyncio.AbstractEventLoop]
+    _event_loop: Optional[_EventLoop] = None
+    # whether the client is counted as one of the clients pinned to `_event_loop`
+    _holds_event_loop: bool = False
 
     def __init__(
         self,
@@ -82,9 +88,18 @@ class _WeaviateClientInit:
             connection_config=config.connection,
             proxies=config.proxies,
             trust_env=config.trust_env,
+            instrumentation=config.instrumentation,
             loop=self._loop,
+            event_loop=self._event_loop,
         )
 
+        if config.schema_cache is not None:
+            self._connection._schema_cache = _SchemaCache(config.schema_cache.ttl)
+        if config.tenant_activation is not None:
+            self._connection._tenant_activation = _TenantActivationCache(
+                self._connection, config.tenant_activation.ttl
+            )
+
         self.integrations = _Integrations(self._connection)
 
     def __parse_connection_params_and_embedded_db(
@@ -133,6 +148,9 @@ class _WeaviateClientBase(_WeaviateClientInit):
         If you do not do this, memory leaks may occur due to stale connections.
         This method also closes the embedded database if one was started."""
         await self._connection.close()
+        if self._event_loop is not None and self._holds_event_loop:
+            _EventLoopSingleton.release(self._event_loop)
+            self._holds_event_loop = False
 
     async def connect(self) -> None:
         """Connect to the Weaviate instance performing all the necessary checks.
@@ -150,6 +168,9 @@ class _WeaviateClientBase(_WeaviateClientInit):
         """
         if self._connection.is_connected():
             return
+        if self._event_loop is not None and not self._holds_event_loop:
+            _EventLoopSingleton.retain(self._event_loop)
+            self._holds_event_loop = True
         await self._connection.connect(self._skip_init_checks)
 
     def is_connected(self) -> bool:
@@ -1,9 +1,9 @@
 import io
 import json
-import os
+import mmap
 import pathlib
 
-from typing import List, Optional, TypeVar, Union, cast
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union, cast
 from typing_extensions import ParamSpec
 
 from httpx import ConnectError
@@ -24,6 +24,7 @@ from weaviate.collections.classes.aggregate import (
     _Metrics,
     _MetricsBoolean,
     _MetricsDate,
+    _MetricsNum,
     _MetricsNumber,
     _MetricsInteger,
     # _MetricsReference, # Aggregate references currently bugged on Weaviate's side
@@ -34,13 +35,16 @@ from weaviate.collections.classes.aggregate import (
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.filters import _Filters
 from weaviate.collections.classes.grpc import Move
+from weaviate.collections.classes.internal import QueryReturn
+from weaviate.collections.aggregations.local import LOCAL_AGGREGATION_PAGE_SIZE, _LocalAggregation
+from weaviate.collections.query import _QueryCollectionAsync
 from weaviate.connect import ConnectionV4
 from weaviate.collections.filters import _FilterToREST
 from weaviate.exceptions import WeaviateInvalidInputError, WeaviateQueryError
 from weaviate.gql.aggregate import AggregateBuilder
-from weaviate.util import file_encoder_b64, _decode_json_response_dict
+from weaviate.util import _decode_json_response_dict, _parse_media
 from weaviate.validator import _ValidateArgument, _validate_input
-from weaviate.types import NUMBER, UUID
+from weaviate.types import BLOB_INPUT, NUMBER, UUID
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -66,10 +70,10 @@ class _AggregateAsync:
         )
 
     def _to_aggregate_result(
-        self, response: dict, metrics: Optional[List[_Metrics]]
+        self, response: dict, metrics: Optional[List[_Metrics]], alias: Optional[str] = None
     ) -> AggregateReturn:
         try:
-            result: dict = response["data"]["Aggregate"][self.__name][0]
+            result: dict = response["data"]["Aggregate"][alias or self.__name][0]
             return AggregateReturn(
                 properties=self.__parse_properties(result, metrics) if metrics is not None else {},
                 total_count=result["meta"]["count"] if result.get("meta") is not None else None,
@@ -80,10 +84,10 @@ class _AggregateAsync:
             )
 
     def _to_group_by_result(
-        self, response: dict, metrics: Optional[List[_Metrics]]
+        self, response: dict, metrics: Optional[List[_Metrics]], alias: Optional[str] = None
     ) -> AggregateGroupByReturn:
         try:
-            results: dict = response["data"]["Aggregate"][self.__name]
+            results: dict = response["data"]["Aggregate"][alias or self.__name]
             return AggregateGroupByReturn(
                 groups=[
                     AggregateGroup(
@@ -199,6 +203,13 @@ class _AggregateAsync:
                 _ValidateArgument([bool], "total_count", total_count),
             ]
         )
+        if return_metrics is not None and any(
+            isinstance(metric, _MetricsNum) and metric.percentiles is not None
+            for metric in return_metrics
+        ):
+            raise WeaviateInvalidInputError(
+                "Percentiles are only supported by local aggregations, set `local=True` to compute them."
+            )
         builder = self._query()
         if return_metrics is not None:
             builder = builder.with_fields(" ".join([metric.to_gql() for metric in return_metrics]))
@@ -210,10 +221,77 @@ class _AggregateAsync:
             builder = builder.with_tenant(self._tenant)
         return builder
 
+    async def _aggregate_locally(
+        self,
+        search: Callable[..., Awaitable[QueryReturn[Any, Any]]],
+        return_metrics: Optional[List[_Metrics]],
+        filters: Optional[_Filters],
+        group_by: Union[str, GroupByAggregate, None],
+        total_count: bool,
+        object_limit: Optional[int] = None,
+        cursor: bool = False,
+    ) -> Union[AggregateReturn, AggregateGroupByReturn]:
+        """Aggregate the objects returned by `search` on the client, fetching them page by page.
+
+        The pages are fetched with the cursor API if `cursor` is set, which is only possible without filters and a
+        search. Otherwise they are fetched with an offset, which is limited to the server's `QUERY_MAXIMUM_RESULTS`:
+        a `WeaviateInvalidInputError` is raised once the next page would exceed it.
+        """
+        _validate_input(
+            [
+                _ValidateArgument([List[_Metrics], None], "return_metrics", return_metrics),
+                _ValidateArgument([_Filters, None], "filters", filters),
+                _ValidateArgument([str, GroupByAggregate, None], "group_by", group_by),
+                _ValidateArgument([bool], "total_count", total_count),
+                _ValidateArgument([int, None], "object_limit", object_limit),
+            ]
+        )
+        if isinstance(group_by, str):
+            group_by = GroupByAggregate(prop=group_by)
+        aggregation = _LocalAggregation(return_metrics, group_by)
+
+        fetched = 0
+        after: Optional[UUID] = None
+        while object_limit is None or fetched < object_limit:
+            limit = LOCAL_AGGREGATION_PAGE_SIZE
+            if object_limit is not None:
+                limit = min(limit, object_limit - fetched)
+            paging: Dict[str, Any] = {"after": after} if cursor else {"offset": fetched}
+            try:
+                res = await search(
+                    limit=limit,
+                    filters=filters,
+                    return_properties=aggregation.return_properties,
+                    **paging,
+                )
+            except WeaviateQueryError as e:
+                if cursor or fetched == 0 or "query maximum results" not in e.message.lower():
+                    raise
+                raise WeaviateInvalidInputError(
+                    f"a local aggregation of a filtered query or a search cannot page beyond the server's QUERY_MAXIMUM_RESULTS, which was reached after {fetched} objects. Set an `object_limit`, narrow the `filters` or raise QUERY_MAXIMUM_RESULTS on the server"
+                ) from e
+            aggregation.add([obj.properties for obj in res.objects])
+            fetched += len(res.objects)
+            if len(res.objects) < limit:
+                break
+            after = res.objects[-1].uuid
+
+        if group_by is None:
+            return aggregation.to_aggregate_result(total_count)
+        return aggregation.to_group_by_result(total_count)
+
+    def _local_query(self) -> _QueryCollectionAsync[Any, Any]:
+        return _QueryCollectionAsync(
+            self._connection, self.__name, self._consistency_level, self._tenant, None, None, True
+        )
+
     async def _do(self, query: AggregateBuilder) -> dict:
+        return await self._do_query(query.build())
+
+    async def _do_query(self, query: str) -> dict:
         try:
             response = await self._connection.post(
-                path="/graphql", weaviate_object={"query": query.build()}
+                path="/graphql", weaviate_object={"query": query}
             )
         except ConnectError as conn_err:
             raise ConnectError("Query was not successful.") from conn_err
@@ -227,7 +305,7 @@ class _AggregateAsync:
                     "GQL Aggregate",
                 )
             raise WeaviateQueryError(
-                f"Error in GraphQL response: {json.dumps(errs, indent=2)}, for the following query: {query.build()}",
+                f"Error in GraphQL response: {json.dumps(errs, indent=2)}, for the following query: {query}",
                 "GQL Aggregate",
             )
         return res
@@ -275,7 +353,7 @@ class _AggregateAsync:
     @staticmethod
     def _add_near_image_to_builder(
         builder: AggregateBuilder,
-        near_image: Union[str, pathlib.Path, io.BufferedReader],
+        near_image: BLOB_INPUT,
         certainty: Optional[NUMBER],
         distance: Optional[NUMBER],
         object_limit: Optional[int],
@@ -286,7 +364,11 @@ class _AggregateAsync:
                 "You must provide at least one of the following arguments: certainty, distance, object_limit when vector searching"
             )
         _validate_input(
-            _ValidateArgument([str, pathlib.Path, io.BufferedReader], "near_image", near_image)
+            _ValidateArgument(
+                [str, pathlib.Path, io.BufferedReader, bytes, bytearray, memoryview, mmap.mmap],
+                "near_image",
+                near_image,
+            )
         )
         _AggregateAsync._parse_near_options(certainty, distance, object_limit)
         payload: dict = {}
@@ -398,13 +480,3 @@ class _AggregateAsync:
         if object_limit is not None:
             builder = builder.with_object_limit(object_limit)
         return builder
-
-
-def _parse_media(media: Union[str, pathlib.Path, io.BufferedReader]) -> str:
-    if isinstance(media, str):  # if already encoded by user or string to path
-        if os.path.isfile(media):
-            return file_encoder_b64(media)
-        else:
-            return media
-    else:
-        return file_encoder_b64(media)
@@ -1,3 +1,4 @@
+import functools
 from typing import List, Optional, Union
 
 from weaviate import syncify
@@ -27,6 +28,7 @@ class _HybridAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]:
         """Aggregate metrics over all the objects in this collection using the hybrid algorithm blending keyword-based BM25 and vector-based similarity.
 
@@ -49,6 +51,8 @@ class _HybridAsync(_AggregateAsync):
                 Whether to include the total number of objects that match the query in the response.
             `return_metrics`
                 A list of property metrics to aggregate together after the text search.
+            `local`
+                Whether to compute the aggregation on the client from the objects returned by the search, fetched page by page, instead of on Weaviate. This is required for the `percentiles` of numeric metrics and requires `numpy`. At most the server's `QUERY_MAXIMUM_RESULTS` objects (10,000 by default) can be aggregated locally, set `object_limit` to stay below it.
 
         Returns:
             Depending on the presence of the `group_by` argument, either a `AggregateReturn` object or a `AggregateGroupByReturn that includes the aggregation objects.
@@ -68,6 +72,22 @@ class _HybridAsync(_AggregateAsync):
             if (return_metrics is None or isinstance(return_metrics, list))
             else [return_metrics]
         )
+        if local:
+            return await self._aggregate_locally(
+                functools.partial(
+                    self._local_query().hybrid,
+                    query,
+                    alpha=alpha,
+                    vector=vector,
+                    query_properties=query_properties,
+                    target_vector=target_vector,
+                ),
+                return_metrics,
+                filters,
+                group_by,
+                total_count,
+                object_limit=object_limit,
+            )
         builder = self._base(return_metrics, filters, total_count)
         builder = self._add_hybrid_to_builder(
             builder, query, alpha, vector, query_properties, object_limit, target_vector
@@ -25,6 +25,7 @@ class _HybridAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     async def hybrid(
@@ -40,6 +41,7 @@ class _HybridAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     async def hybrid(
@@ -55,6 +57,7 @@ class _HybridAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
 
 class _Hybrid(_AggregateAsync):
@@ -72,6 +75,7 @@ class _Hybrid(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     def hybrid(
@@ -87,6 +91,7 @@ class _Hybrid(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     def hybrid(
@@ -102,4 +107,5 @@ class _Hybrid(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
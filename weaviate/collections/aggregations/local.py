@@ -0,0 +1,335 @@
+"""
+Client-side computation of aggregations over the objects streamed from a query.
+
+The aggregations are updated page by page with NumPy, so that the memory used only depends on the number of groups and
+not on the number of objects: the median and percentiles are computed from a uniform sample of at most
+`LOCAL_AGGREGATION_SAMPLE_SIZE` values and modes and top occurrences are counted over at most
+`LOCAL_AGGREGATION_MAX_DISTINCT_VALUES` distinct values per group and property. Below these sizes all results are
+exact.
+"""
+
+import datetime
+from collections import Counter
+from types import ModuleType
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union, cast
+
+from weaviate.collections.classes.aggregate import (
+    AggregateBoolean,
+    AggregateDate,
+    AggregateGroup,
+    AggregateGroupByReturn,
+    AggregateInteger,
+    AggregateNumber,
+    AggregateResult,
+    AggregateReturn,
+    AggregateText,
+    GroupByAggregate,
+    GroupedBy,
+    TopOccurrence,
+    _Metrics,
+    _MetricsBoolean,
+    _MetricsDate,
+    _MetricsInteger,
+    _MetricsNum,
+    _MetricsText,
+)
+from weaviate.util import _datetime_to_string
+
+LOCAL_AGGREGATION_PAGE_SIZE = 1000  # objects fetched per request
+LOCAL_AGGREGATION_SAMPLE_SIZE = 10_000  # values sampled per group and property for percentiles
+LOCAL_AGGREGATION_MAX_DISTINCT_VALUES = 10_000  # distinct values counted per group and property
+DEFAULT_TOP_OCCURRENCES = 5  # the number of top occurrences Weaviate returns by default
+
+_Group = Optional[str]
+
+
+def _numpy() -> ModuleType:
+    try:
+        import numpy
+
+        return numpy
+    except ImportError as e:
+        raise ImportError(
+            "Local aggregations require numpy, install it with `pip install numpy`."
+        ) from e
+
+
+class _BoundedCounter:
+    """Counts values, keeping only the most common ones once there are too many distinct values."""
+
+    def __init__(self, capacity: int) -> None:
+        self.__capacity = capacity
+        self.__counts: "Counter[Hashable]" = Counter()
+
+    def update(self, values: Sequence[Hashable]) -> None:
+        self.__counts.update(values)
+        if len(self.__counts) > 2 * self.__capacity:
+            self.__counts = Counter(dict(self.__counts.most_common(self.__capacity)))
+
+    def most_common(self, n: int) -> List[Tuple[Any, int]]:
+        return self.__counts.most_common(n)
+
+
+class _NumericValues:
+    """Aggregates the values of an int, number or date property within a group."""
+
+    def __init__(self, metric: Union[_MetricsNum, _MetricsDate]) -> None:
+        self.__np = _numpy()
+        self.count = 0
+        self.sum: Union[int, float] = 0
+        self.minimum: Optional[Union[int, float]] = None
+        self.maximum: Optional[Union[int, float]] = None
+        percentiles = metric.percentiles if isinstance(metric, _MetricsNum) else None
+        self.__sample: Optional[Any] = self.__np.empty(0) if metric.median or percentiles else None
+        self.__counts = (
+            _BoundedCounter(LOCAL_AGGREGATION_MAX_DISTINCT_VALUES) if metric.mode else None
+        )
+        self.__rng = self.__np.random.default_rng()
+
+    def add(self, values: List[Union[int, float]]) -> None:
+        np = self.__np
+        array = np.asarray(values)
+        seen = self.count
+        self.count += len(array)
+        self.sum += array.sum().item()
+        minimum, maximum = array.min().item(), array.max().item()
+        self.minimum = minimum if self.minimum is None else min(self.minimum, minimum)
+        self.maximum = maximum if self.maximum is None else max(self.maximum, maximum)
+        if self.__counts is not None:
+            self.__counts.update(values)
+        if self.__sample is not None:
+            self.__add_to_sample(array, seen)
+
+    def __add_to_sample(self, array: Any, seen: int) -> None:
+        np = self.__np
+        assert self.__sample is not None
+        free = max(LOCAL_AGGREGATION_SAMPLE_SIZE - len(self.__sample), 0)
+        self.__sample = np.concatenate([self.__sample, array[:free]])
+        rest = array[free:]
+        if len(rest) == 0:
+            return
+        # reservoir sampling: the i-th value replaces a random sampled one with probability size / (i + 1)
+        indexes = self.__rng.integers(0, np.arange(seen + free, seen + len(array)) + 1)
+        replace = indexes < LOCAL_AGGREGATION_SAMPLE_SIZE
+        self.__sample[indexes[replace]] = rest[replace]
+
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count > 0 else None
+
+    def percentiles(self, ranks: List[float]) -> List[Optional[float]]:
+        if self.__sample is None or len(self.__sample) == 0:
+            return [None for _ in ranks]
+        return [value.item() for value in self.__np.percentile(self.__sample, ranks)]
+
+    def mode(self) -> Optional[Union[int, float]]:
+        assert self.__counts is not None
+        most_common = self.__counts.most_common(1)
+        return most_common[0][0] if len(most_common) > 0 else None
+
+
+class _TextValues:
+    def __init__(self, metric: _MetricsText) -> None:
+        self.count = 0
+        self.__counts = (
+            _BoundedCounter(LOCAL_AGGREGATION_MAX_DISTINCT_VALUES)
+            if metric.top_occurrences_count or metric.top_occurrences_value
+            else None
+        )
+
+    def add(self, values: List[str]) -> None:
+        self.count += len(values)
+        if self.__counts is not None:
+            self.__counts.update(values)
+
+    def top_occurrences(self, n: int) -> List[Tuple[str, int]]:
+        return self.__counts.most_common(n) if self.__counts is not None else []
+
+
+class _BooleanValues:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_true = 0
+
+    def add(self, values: List[bool]) -> None:
+        self.count += len(values)
+        self.total_true += int(_numpy().count_nonzero(values))
+
+
+_Values = Union[_NumericValues, _TextValues, _BooleanValues]
+
+
+def _date_to_number(value: datetime.datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return int(value.timestamp() * 1_000_000)
+
+
+def _number_to_date(value: Optional[Union[int, float]]) -> Optional[str]:
+    if value is None:
+        return None
+    return _datetime_to_string(
+        datetime.datetime.fromtimestamp(value / 1_000_000, tz=datetime.timezone.utc)
+    )
+
+
+def _group_value(value: Any) -> str:
+    # the values of the groups are returned as strings, as by Weaviate
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.datetime):
+        return _datetime_to_string(value)
+    return str(value)
+
+
+class _LocalAggregation:
+    """Aggregates the properties of the objects returned by a query, one page of objects at a time."""
+
+    def __init__(
+        self, metrics: Optional[List[_Metrics]], group_by: Optional[GroupByAggregate]
+    ) -> None:
+        self.__metrics = metrics or []
+        self.__group_by = group_by
+        self.__total_counts: "Counter[_Group]" = Counter()
+        self.__values: Dict[Tuple[_Group, str], _Values] = {}
+
+    @property
+    def return_properties(self) -> List[str]:
+        properties = [metric.property_name for metric in self.__metrics]
+        if self.__group_by is not None:
+            properties.append(self.__group_by.prop)
+        return list(dict.fromkeys(properties))
+
+    def add(self, objects: Sequence[Dict[str, Any]]) -> None:
+        """Add the properties of a page of objects to the aggregations."""
+        pending: Dict[Tuple[_Group, str], List[Any]] = {}
+        for properties in objects:
+            for group in self.__groups(properties):
+                self.__total_counts[group] += 1
+                for metric in self.__metrics:
+                    value = properties.get(metric.property_name)
+                    if value is None:
+                        continue
+                    values = value if isinstance(value, list) else [value]
+                    if isinstance(metric, _MetricsDate):
+                        values = [_date_to_number(v) for v in values]
+                    pending.setdefault((group, metric.property_name), []).extend(values)
+
+        metrics = {metric.property_name: metric for metric in self.__metrics}
+        for key, values in pending.items():
+            if len(values) == 0:
+                continue
+            if key not in self.__values:
+                self.__values[key] = self.__new_values(metrics[key[1]])
+            self.__values[key].add(values)
+
+    def __groups(self, properties: Dict[str, Any]) -> List[_Group]:
+        if self.__group_by is None:
+            return [None]
+        value = properties.get(self.__group_by.prop)
+        if value is None:
+            return []  # objects without the property are not part of any group
+        values = value if isinstance(value, list) else [value]
+        return list(dict.fromkeys(_group_value(v) for v in values))
+
+    @staticmethod
+    def __new_values(metric: _Metrics) -> _Values:
+        if isinstance(metric, _MetricsText):
+            return _TextValues(metric)
+        if isinstance(metric, _MetricsBoolean):
+            return _BooleanValues()
+        return _NumericValues(metric)
+
+    def to_aggregate_result(self, total_count: bool) -> AggregateReturn:
+        return AggregateReturn(
+            properties=self.__properties(None),
+            total_count=self.__total_counts[None] if total_count else None,
+        )
+
+    def to_group_by_result(self, total_count: bool) -> AggregateGroupByReturn:
+        assert self.__group_by is not None
+        groups = self.__total_counts.most_common(self.__group_by.limit)
+        return AggregateGroupByReturn(
+            groups=[
+                AggregateGroup(
+                    grouped_by=GroupedBy(prop=self.__group_by.prop, value=cast(str, group)),
+                    properties=self.__properties(group),
+                    total_count=count if total_count else None,
+                )
+                for group, count in groups
+            ]
+        )
+
+    def __properties(self, group: _Group) -> Dict[str, AggregateResult]:
+        return {
+            metric.property_name: self.__result(
+                metric, self.__values.get((group, metric.property_name))
+            )
+            for metric in self.__metrics
+        }
+
+    @staticmethod
+    def __result(metric: _Metrics, values: Optional[_Values]) -> AggregateResult:
+        count = values.count if values is not None else 0
+        if isinstance(metric, _MetricsText):
+            assert values is None or isinstance(values, _TextValues)
+            limit = metric.min_occurrences or DEFAULT_TOP_OCCURRENCES
+            return AggregateText(
+                count=count if metric.count else None,
+                top_occurrences=[
+                    TopOccurrence(
+                        count=occurs if metric.top_occurrences_count else None,
+                        value=value if metric.top_occurrences_value else None,
+                    )
+                    for value, occurs in (values.top_occurrences(limit) if values else [])
+                ],
+            )
+        if isinstance(metric, _MetricsBoolean):
+            assert values is None or isinstance(values, _BooleanValues)
+            total_true = values.total_true if values is not None else 0
+            return AggregateBoolean(
+                count=count if metric.count else None,
+                percentage_false=(
+                    (count - total_true) / count if metric.percentage_false and count else None
+                ),
+                percentage_true=total_true / count if metric.percentage_true and count else None,
+                total_false=count - total_true if metric.total_false else None,
+                total_true=total_true if metric.total_true else None,
+            )
+
+        assert values is None or isinstance(values, _NumericValues)
+        ranks = metric.percentiles if isinstance(metric, _MetricsNum) else None
+        percentiles = (
+            values.percentiles([50.0] + (ranks or []))
+            if values is not None and (metric.median or ranks)
+            else [None] * (1 + len(ranks or []))
+        )
+        mode = values.mode() if values is not None and metric.mode else None
+        minimum = values.minimum if values is not None and metric.minimum else None
+        maximum = values.maximum if values is not None and metric.maximum else None
+        median = percentiles[0] if metric.median else None
+        if isinstance(metric, _MetricsDate):
+            return AggregateDate(
+                count=count if metric.count else None,
+                maximum=_number_to_date(maximum),
+                median=_number_to_date(median),
+                minimum=_number_to_date(minimum),
+                mode=_number_to_date(mode),
+            )
+
+        numbers: Dict[str, Any] = {
+            "count": count if metric.count else None,
+            "maximum": maximum,
+            "mean": values.mean() if values is not None and metric.mean else None,
+            "median": median,
+            "minimum": minimum,
+            "mode": mode,
+            "sum_": (values.sum if values is not None else 0) if metric.sum_ else None,
+            "percentiles": (
+                {rank: value for rank, value in zip(ranks, percentiles[1:]) if value is not None}
+                if ranks is not None
+                else None
+            ),
+        }
+        if isinstance(metric, _MetricsInteger):
+            return AggregateInteger(**numbers)
+        return AggregateNumber(**numbers)
@@ -0,0 +1,119 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Union
+
+from weaviate import syncify
+from weaviate.collections.aggregations.aggregate import _AggregateAsync
+from weaviate.collections.classes.aggregate import (
+    AggregateGroupByReturn,
+    AggregateReturn,
+    _AggregateQuery,
+)
+from weaviate.exceptions import WeaviateInvalidInputError, WeaviateUnsupportedFeatureError
+from weaviate.gql.aggregate import AggregateBuilder
+from weaviate.validator import _ValidateArgument, _validate_input
+
+MANY_MAX_CONCURRENCY = 8
+
+
+class _ManyAsync(_AggregateAsync):
+    async def many(
+        self,
+        queries: List[_AggregateQuery],
+        *,
+        merge: bool = True,
+        max_concurrency: int = MANY_MAX_CONCURRENCY,
+    ) -> List[Union[AggregateReturn, AggregateGroupByReturn]]:
+        """Run several aggregations on this collection at once.
+
+        Arguments:
+            `queries`
+                The aggregations to run, defined with the methods of `weaviate.classes.aggregate.AggregateQuery`.
+            `merge`
+                Whether to send all aggregations in a single GraphQL request, using an alias for each of them. If an
+                error occurs, none of the results are returned. If `False`, each aggregation is sent as its own
+                request, concurrently.
+            `max_concurrency`
+                The maximum number of requests sent at the same time if `merge` is `False`.
+
+        Returns:
+            The results of the aggregations, in the order of `queries`. Each result is an `AggregateReturn` object or
+            an `AggregateGroupByReturn` object, depending on the presence of the `group_by` argument of the
+            aggregation.
+
+        Raises:
+            `weaviate.exceptions.WeaviateQueryError`:
+                If an error occurs while performing the query against Weaviate.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If any of the input arguments are of the wrong type.
+        """
+        _validate_input(
+            [
+                _ValidateArgument([List[_AggregateQuery]], "queries", queries),
+                _ValidateArgument([bool], "merge", merge),
+                _ValidateArgument([int], "max_concurrency", max_concurrency),
+            ]
+        )
+        if max_concurrency < 1:
+            raise WeaviateInvalidInputError(
+                f"max_concurrency must be at least 1, but was {max_concurrency}"
+            )
+        if len(queries) == 0:
+            return []
+        builders = [self.__builder(query) for query in queries]
+
+        if merge:
+            aliases = [f"aggregate{i}" for i in range(len(builders))]
+            response = await self._do_query(
+                "{Aggregate{"
+                + " ".join(
+                    builder.with_alias(alias).build(wrap_aggregate=False)
+                    for builder, alias in zip(builders, aliases)
+                )
+                + "}}"
+            )
+            return [
+                self.__to_result(query, response, alias) for query, alias in zip(queries, aliases)
+            ]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def do(builder: AggregateBuilder) -> dict:
+            async with semaphore:
+                return await self._do(builder)
+
+        responses = await asyncio.gather(*[do(builder) for builder in builders])
+        return [self.__to_result(query, response) for query, response in zip(queries, responses)]
+
+    def __builder(self, query: _AggregateQuery) -> AggregateBuilder:
+        if (
+            query.search == "hybrid"
+            and query.group_by is not None
+            and self._connection._weaviate_version.is_lower_than(1, 25, 0)
+        ):
+            raise WeaviateUnsupportedFeatureError(
+                "Hybrid aggregation", self._connection.server_version, "1.25.0"
+            )
+        builder = self._base(query.return_metrics, query.filters, query.total_count)
+        builder = self._add_groupby_to_builder(builder, query.group_by)
+        searches: Dict[str, Callable[..., AggregateBuilder]] = {
+            "hybrid": self._add_hybrid_to_builder,
+            "near_image": self._add_near_image_to_builder,
+            "near_object": self._add_near_object_to_builder,
+            "near_text": self._add_near_text_to_builder,
+            "near_vector": self._add_near_vector_to_builder,
+        }
+        if query.search in searches:
+            builder = searches[query.search](builder, **query.search_arguments)
+        return builder
+
+    def __to_result(
+        self, query: _AggregateQuery, response: dict, alias: Optional[str] = None
+    ) -> Union[AggregateReturn, AggregateGroupByReturn]:
+        if query.group_by is None:
+            return self._to_aggregate_result(response, query.return_metrics, alias)
+        return self._to_group_by_result(response, query.return_metrics, alias)
+
+
+@syncify.convert
+class _Many(_ManyAsync):
+    pass
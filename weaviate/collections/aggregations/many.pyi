@@ -0,0 +1,28 @@
+from typing import List, Union
+
+from weaviate.collections.aggregations.aggregate import _AggregateAsync
+from weaviate.collections.classes.aggregate import (
+    AggregateGroupByReturn,
+    AggregateReturn,
+    _AggregateQuery,
+)
+
+MANY_MAX_CONCURRENCY: int
+
+class _ManyAsync(_AggregateAsync):
+    async def many(
+        self,
+        queries: List[_AggregateQuery],
+        *,
+        merge: bool = True,
+        max_concurrency: int = MANY_MAX_CONCURRENCY,
+    ) -> List[Union[AggregateReturn, AggregateGroupByReturn]]: ...
+
+class _Many(_AggregateAsync):
+    def many(
+        self,
+        queries: List[_AggregateQuery],
+        *,
+        merge: bool = True,
+        max_concurrency: int = MANY_MAX_CONCURRENCY,
+    ) -> List[Union[AggregateReturn, AggregateGroupByReturn]]: ...
@@ -1,5 +1,4 @@
-from io import BufferedReader
-from pathlib import Path
+import functools
 from typing import Optional, Union
 
 from weaviate import syncify
@@ -11,13 +10,13 @@ from weaviate.collections.classes.aggregate import (
     GroupByAggregate,
 )
 from weaviate.collections.classes.filters import _Filters
-from weaviate.types import NUMBER
+from weaviate.types import BLOB_INPUT, NUMBER
 
 
 class _NearImageAsync(_AggregateAsync):
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         certainty: Optional[NUMBER] = None,
         distance: Optional[NUMBER] = None,
@@ -27,6 +26,7 @@ class _NearImageAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]:
         """Aggregate metrics over the objects returned by a near image vector search on this collection.
 
@@ -51,6 +51,8 @@ class _NearImageAsync(_AggregateAsync):
                 Whether to include the total number of objects that match the query in the response.
             `return_metrics`
                 A list of property metrics to aggregate together after the text search.
+            `local`
+                Whether to compute the aggregation on the client from the objects returned by the search, fetched page by page, instead of on Weaviate. This is required for the `percentiles` of numeric metrics and requires `numpy`. At most the server's `QUERY_MAXIMUM_RESULTS` objects (10,000 by default) can be aggregated locally, set `object_limit` to stay below it.
 
         Returns:
             Depending on the presence of the `group_by` argument, either a `AggregateReturn` object or a `AggregateGroupByReturn that includes the aggregation objects.
@@ -66,6 +68,21 @@ class _NearImageAsync(_AggregateAsync):
             if (return_metrics is None or isinstance(return_metrics, list))
             else [return_metrics]
         )
+        if local:
+            return await self._aggregate_locally(
+                functools.partial(
+                    self._local_query().near_image,
+                    near_image,
+                    certainty=certainty,
+                    distance=distance,
+                    target_vector=target_vector,
+                ),
+                return_metrics,
+                filters,
+                group_by,
+                total_count,
+                object_limit=object_limit,
+            )
         builder = self._base(return_metrics, filters, total_count)
         builder = self._add_groupby_to_builder(builder, group_by)
         builder = self._add_near_image_to_builder(
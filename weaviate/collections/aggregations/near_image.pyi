@@ -1,5 +1,3 @@
-from io import BufferedReader
-from pathlib import Path
 from typing import Literal, Optional, Union, overload
 
 from weaviate.collections.aggregations.aggregate import _AggregateAsync
@@ -10,13 +8,13 @@ from weaviate.collections.classes.aggregate import (
     GroupByAggregate,
 )
 from weaviate.collections.classes.filters import _Filters
-from weaviate.types import NUMBER
+from weaviate.types import BLOB_INPUT, NUMBER
 
 class _NearImageAsync(_AggregateAsync):
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         certainty: Optional[NUMBER] = None,
         distance: Optional[NUMBER] = None,
@@ -26,11 +24,12 @@ class _NearImageAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         certainty: Optional[NUMBER] = None,
         distance: Optional[NUMBER] = None,
@@ -40,11 +39,12 @@ class _NearImageAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         certainty: Optional[NUMBER] = None,
         distance: Optional[NUMBER] = None,
@@ -54,13 +54,14 @@ class _NearImageAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
 
 class _NearImage(_AggregateAsync):
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         certainty: Optional[NUMBER] = None,
         distance: Optional[NUMBER] = None,
@@ -70,11 +71,12 @@ class _NearImage(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         certainty: Optional[NUMBER] = None,
         distance: Optional[NUMBER] = None,
@@ -84,11 +86,12 @@ class _NearImage(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         certainty: Optional[NUMBER] = None,
         distance: Optional[NUMBER] = None,
@@ -98,4 +101,5 @@ class _NearImage(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
@@ -24,6 +24,7 @@ class _NearObjectAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     async def near_object(
@@ -38,6 +39,7 @@ class _NearObjectAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     async def near_object(
@@ -52,6 +54,7 @@ class _NearObjectAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
 
 class _NearObject(_AggregateAsync):
@@ -68,6 +71,7 @@ class _NearObject(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     def near_object(
@@ -82,6 +86,7 @@ class _NearObject(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     def near_object(
@@ -96,4 +101,5 @@ class _NearObject(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
@@ -1,3 +1,4 @@
+import functools
 from typing import List, Optional, Union
 
 from weaviate import syncify
@@ -28,6 +29,7 @@ class _NearTextAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]:
         """Aggregate metrics over the objects returned by a near text vector search on this collection.
 
@@ -56,6 +58,8 @@ class _NearTextAsync(_AggregateAsync):
                 Whether to include the total number of objects that match the query in the response.
             `return_metrics`
                 A list of property metrics to aggregate together after the text search.
+            `local`
+                Whether to compute the aggregation on the client from the objects returned by the search, fetched page by page, instead of on Weaviate. This is required for the `percentiles` of numeric metrics and requires `numpy`. At most the server's `QUERY_MAXIMUM_RESULTS` objects (10,000 by default) can be aggregated locally, set `object_limit` to stay below it.
 
         Returns:
             Depending on the presence of the `group_by` argument, either a `AggregateReturn` object or a `AggregateGroupByReturn that includes the aggregation objects.
@@ -71,6 +75,23 @@ class _NearTextAsync(_AggregateAsync):
             if (return_metrics is None or isinstance(return_metrics, list))
             else [return_metrics]
         )
+        if local:
+            return await self._aggregate_locally(
+                functools.partial(
+                    self._local_query().near_text,
+                    query,
+                    certainty=certainty,
+                    distance=distance,
+                    move_to=move_to,
+                    move_away=move_away,
+                    target_vector=target_vector,
+                ),
+                return_metrics,
+                filters,
+                group_by,
+                total_count,
+                object_limit=object_limit,
+            )
         builder = self._base(return_metrics, filters, total_count)
         builder = self._add_groupby_to_builder(builder, group_by)
         builder = self._add_near_text_to_builder(
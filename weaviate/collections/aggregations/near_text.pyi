@@ -27,6 +27,7 @@ class _NearTextAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     async def near_text(
@@ -43,6 +44,7 @@ class _NearTextAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     async def near_text(
@@ -59,6 +61,7 @@ class _NearTextAsync(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
 
 class _NearText(_AggregateAsync):
@@ -77,6 +80,7 @@ class _NearText(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     def near_text(
@@ -93,6 +97,7 @@ class _NearText(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     def near_text(
@@ -109,4 +114,5 @@ class _NearText(_AggregateAsync):
         target_vector: Optional[str] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
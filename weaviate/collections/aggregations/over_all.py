@@ -19,6 +19,7 @@ class _OverAllAsync(_AggregateAsync):
         group_by: Optional[Union[str, GroupByAggregate]] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]:
         """Aggregate metrics over all the objects in this collection without any vector search.
 
@@ -31,6 +32,8 @@ class _OverAllAsync(_AggregateAsync):
                 Whether to include the total number of objects that match the query in the response.
             `return_metrics`
                 A list of property metrics to aggregate together after the text search.
+            `local`
+                Whether to compute the aggregation on the client from the objects returned by the search, fetched page by page, instead of on Weaviate. This is required for the `percentiles` of numeric metrics and requires `numpy`. With `filters`, at most the server's `QUERY_MAXIMUM_RESULTS` objects (10,000 by default) can be aggregated locally.
 
         Returns:
             Depending on the presence of the `group_by` argument, either a `AggregateReturn` object or a `AggregateGroupByReturn that includes the aggregation objects.
@@ -46,6 +49,15 @@ class _OverAllAsync(_AggregateAsync):
             if (return_metrics is None or isinstance(return_metrics, list))
             else [return_metrics]
         )
+        if local:
+            return await self._aggregate_locally(
+                self._local_query().fetch_objects,
+                return_metrics,
+                filters,
+                group_by,
+                total_count,
+                cursor=filters is None,
+            )
         builder = self._base(return_metrics, filters, total_count)
         builder = self._add_groupby_to_builder(builder, group_by)
         res = await self._do(builder)
@@ -18,6 +18,7 @@ class _OverAllAsync(_AggregateAsync):
         group_by: Literal[None] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     async def over_all(
@@ -27,6 +28,7 @@ class _OverAllAsync(_AggregateAsync):
         group_by: Union[str, GroupByAggregate],
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     async def over_all(
@@ -36,6 +38,7 @@ class _OverAllAsync(_AggregateAsync):
         group_by: Optional[Union[str, GroupByAggregate]] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
 
 class _OverAll(_AggregateAsync):
@@ -47,6 +50,7 @@ class _OverAll(_AggregateAsync):
         group_by: Literal[None] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateReturn: ...
     @overload
     def over_all(
@@ -56,6 +60,7 @@ class _OverAll(_AggregateAsync):
         group_by: Union[str, GroupByAggregate],
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> AggregateGroupByReturn: ...
     @overload
     def over_all(
@@ -65,4 +70,5 @@ class _OverAll(_AggregateAsync):
         group_by: Optional[Union[str, GroupByAggregate]] = None,
         total_count: bool = True,
         return_metrics: Optional[PropertiesMetrics] = None,
+        local: bool = False,
     ) -> Union[AggregateReturn, AggregateGroupByReturn]: ...
@@ -6,7 +6,7 @@ from abc import ABC
 from collections import deque
 from copy import copy
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, List, Optional, Set, TypeVar, Union, cast
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, TypeVar, Union, cast
 
 from pydantic import ValidationError
 from typing_extensions import TypeAlias
@@ -38,6 +38,7 @@ from weaviate.collections.classes.types import WeaviateProperties
 from weaviate.connect import ConnectionV4
 from weaviate.event_loop import _EventLoop
 from weaviate.exceptions import WeaviateBatchValidationError, EmptyResponseException
+from weaviate.instrumentation import BatchSendEvent, BatchStateEvent, _call_hook
 from weaviate.logger import logger
 from weaviate.types import UUID, VECTORS
 from weaviate.util import _decode_json_response_dict
@@ -48,11 +49,14 @@ BatchResponse = List[Dict[str, Any]]
 
 TBatchInput = TypeVar("TBatchInput")
 TBatchReturn = TypeVar("TBatchReturn")
+_ObjectKey = Tuple[str, Optional[str], str]  # collection, tenant and uuid
 MAX_CONCURRENT_REQUESTS = 10
 DEFAULT_REQUEST_TIMEOUT = 180
 CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER = 2
 BATCH_TIME_TARGET = 10
 VECTORIZER_BATCHING_STEP_SIZE = 48  # cohere max batch size is 96
+# the error Weaviate reports for objects of an inactive or offloaded tenant
+_TENANT_NOT_ACTIVE = "tenant not active"
 
 
 class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
@@ -105,7 +109,40 @@ class ReferencesBatchRequest(BatchRequest[_BatchReference, BatchReferenceReturn]
 
 
 class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
-    """Collect objects for one batch request to weaviate."""
+    """Collect objects for one batch request to weaviate.
+
+    With `deduplicate`, an object is not queued again while an object with the same collection, tenant and UUID is
+    still waiting to be sent. The queued object is replaced by the last one added when it is sent instead, so that only
+    the latest version of each object is serialized, vectorized and written.
+    """
+
+    def __init__(self, deduplicate: bool = False) -> None:
+        super().__init__()
+        # the last object added for each queued (collection, tenant, uuid), if deduplicating
+        self._latest: Optional[Dict[_ObjectKey, _BatchObject]] = {} if deduplicate else None
+        # the sequence number of the last object added and the number of its versions that are queued or being sent
+        self._versions: Dict[_ObjectKey, Tuple[int, int]] = {}
+        self._sequence = 0
+        self._duplicates = 0
+
+    @property
+    def duplicates(self) -> int:
+        """The number of objects that were dropped because a newer object with the same UUID was added."""
+        return self._duplicates
+
+    def add(self, item: _BatchObject) -> None:
+        """Add an item to the BatchRequest, unless it replaces a queued one."""
+        with self._lock:
+            if self._queue_latest(item):
+                self._items.append(item)
+
+    def prepend(self, item: List[_BatchObject]) -> None:
+        """Add items to the front of the BatchRequest.
+
+        This is intended to be used when objects should be retries, eg. after a temporary error.
+        """
+        with self._lock:
+            self._items = self._queue_retried(item) + self._items
 
     def pop_items(self, pop_amount: int) -> List[_BatchObject]:
         """Pop the given number of items from the BatchRequest queue.
@@ -120,10 +157,169 @@ class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
         else:
             ret = copy(self._items[:pop_amount])
             self._items = self._items[pop_amount:]
+        ret = self._take_latest(ret)
 
         self._lock.release()
         return ret
 
+    def _queue_latest(self, item: _BatchObject) -> bool:
+        """Record `item` as the latest version of its object and return whether it has to be queued."""
+        if self._latest is None:
+            return True
+        key = (item.collection, item.tenant, item.uuid)
+        self._sequence += 1
+        item.sequence = self._sequence
+        queued = key in self._latest
+        self._latest[key] = item
+        _, pending = self._versions.get(key, (0, 0))
+        self._versions[key] = (item.sequence, pending if queued else pending + 1)
+        if queued:
+            self._duplicates += 1
+        return not queued
+
+    def _queue_retried(self, items: List[_BatchObject]) -> List[_BatchObject]:
+        """Return the retried items that have to be queued again, dropping those that were added again meanwhile.
+
+        A retried item is stale if a newer version of its object was added after it, no matter whether that version is
+        still queued or was sent already.
+        """
+        if self._latest is None:
+            return items
+        ret: List[_BatchObject] = []
+        for item in items:
+            key = (item.collection, item.tenant, item.uuid)
+            if item.sequence < self._versions.get(key, (0, 0))[0]:
+                self._duplicates += 1
+                self.__forget(key)
+                continue
+            self._latest[key] = item
+            ret.append(item)
+        return ret
+
+    def finish(self, items: List[_BatchObject]) -> None:
+        """Forget the sent items that are not retried, so that only the objects still in use are tracked."""
+        if self._latest is None:
+            return
+        with self._lock:
+            for item in items:
+                self.__forget((item.collection, item.tenant, item.uuid))
+
+    def __forget(self, key: _ObjectKey) -> None:
+        sequence, pending = self._versions.get(key, (0, 0))
+        if pending > 1:
+            self._versions[key] = (sequence, pending - 1)
+        else:
+            self._versions.pop(key, None)
+
+    def _take_latest(self, items: List[_BatchObject]) -> List[_BatchObject]:
+        """Replace the popped items by the latest versions of their objects."""
+        if self._latest is None:
+            return items
+        return [self._latest.pop((item.collection, item.tenant, item.uuid)) for item in items]
+
+
+class TenantGroupedObjectsBatchRequest(ObjectsBatchRequest):
+    """Collect objects in buckets per collection and tenant so that every batch request touches as few shards as possible.
+
+    A bucket is sent on its own once it holds enough objects for a full batch. Smaller buckets are sent, oldest first
+    and merged into one batch, once their first object waited for `max_wait_seconds`, once the queue holds
+    `max_queue_size` objects or when the batch is flushed.
+    """
+
+    def __init__(
+        self, max_wait_seconds: float, max_queue_size: int, deduplicate: bool = False
+    ) -> None:
+        super().__init__(deduplicate)
+        # dicts keep the insertion order, so the first bucket is always the one that has waited the longest
+        self._buckets: Dict[Tuple[str, Optional[str]], List[_BatchObject]] = {}
+        self._bucket_times: Dict[Tuple[str, Optional[str]], float] = {}
+        self._len = 0
+        self._flushing = False
+        self.__max_wait_seconds = max_wait_seconds
+        self.__max_queue_size = max_queue_size
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, item: _BatchObject) -> None:
+        """Add an item to the bucket of its collection and tenant."""
+        with self._lock:
+            if self._queue_latest(item):
+                self.__add(item, time.time())
+
+    def prepend(self, item: List[_BatchObject]) -> None:
+        """Add items to the front of their buckets and make them eligible to be sent right away."""
+        with self._lock:
+            item = self._queue_retried(item)
+            for obj in reversed(item):
+                self.__add(obj, 0, front=True)
+            # move the buckets of the retried objects to the front, retries are rare so rebuilding is fine
+            retried = {(obj.collection, obj.tenant) for obj in item}
+            order = [key for key in self._buckets if key in retried] + [
+                key for key in self._buckets if key not in retried
+            ]
+            self._buckets = {key: self._buckets[key] for key in order}
+            self._bucket_times = {key: self._bucket_times[key] for key in order}
+
+    def flush(self) -> None:
+        """Send all remaining objects without waiting for their buckets to fill up."""
+        with self._lock:
+            self._flushing = self._len > 0
+
+    def pop_items(self, pop_amount: int) -> List[_BatchObject]:
+        """Pop up to the given number of items, taken from as few buckets as possible.
+
+        Returns
+            `List[_BatchObject]` items from the BatchRequest, empty if no bucket is ready to be sent yet.
+        """
+        with self._lock:
+            if self._len == 0 or pop_amount <= 0:
+                return []
+
+            full = next(
+                (key for key, objs in self._buckets.items() if len(objs) >= pop_amount), None
+            )
+            if full is not None:
+                return self.__pop_bucket(full, pop_amount)
+
+            oldest = next(iter(self._bucket_times.values()))
+            if (
+                not self._flushing
+                and self._len < self.__max_queue_size
+                and time.time() - oldest < self.__max_wait_seconds
+            ):
+                return []
+
+            ret: List[_BatchObject] = []
+            while len(ret) < pop_amount and len(self._buckets) > 0:
+                ret.extend(self.__pop_bucket(next(iter(self._buckets)), pop_amount - len(ret)))
+            return ret
+
+    def __add(self, item: _BatchObject, added: float, front: bool = False) -> None:
+        key = (item.collection, item.tenant)
+        if key not in self._buckets:
+            self._buckets[key] = []
+            self._bucket_times[key] = added
+        elif front:
+            self._bucket_times[key] = added
+        if front:
+            self._buckets[key].insert(0, item)
+        else:
+            self._buckets[key].append(item)
+        self._len += 1
+
+    def __pop_bucket(self, key: Tuple[str, Optional[str]], pop_amount: int) -> List[_BatchObject]:
+        bucket = self._buckets[key]
+        ret = self._take_latest(bucket[:pop_amount])
+        del bucket[:pop_amount]
+        if len(bucket) == 0:
+            del self._buckets[key]
+            del self._bucket_times[key]
+        self._len -= len(ret)
+        if self._len == 0:
+            self._flushing = False
+        return ret
+
 
 @dataclass
 class _BatchDataWrapper:
@@ -149,6 +345,12 @@ class _RateLimitedBatching:
     requests_per_minute: int
 
 
+@dataclass
+class _TenantGroupedBatching(_FixedSizeBatching):
+    max_wait_seconds: float
+    max_queue_size: int
+
+
 _BatchMode: TypeAlias = Union[_DynamicBatching, _FixedSizeBatching, _RateLimitedBatching]
 
 
@@ -163,8 +365,17 @@ class _BatchBase:
         vectorizer_batching: bool,
         objects_: Optional[ObjectsBatchRequest] = None,
         references: Optional[ReferencesBatchRequest] = None,
+        deduplicate: bool = False,
     ) -> None:
-        self.__batch_objects = objects_ or ObjectsBatchRequest()
+        if objects_ is None:
+            objects_ = (
+                TenantGroupedObjectsBatchRequest(
+                    batch_mode.max_wait_seconds, batch_mode.max_queue_size, deduplicate
+                )
+                if isinstance(batch_mode, _TenantGroupedBatching)
+                else ObjectsBatchRequest(deduplicate)
+            )
+        self.__batch_objects = objects_
         self.__batch_references = references or ReferencesBatchRequest()
         self.__connection = connection
         self.__consistency_level: Optional[ConsistencyLevel] = consistency_level
@@ -243,9 +454,15 @@ class _BatchBase:
             self.__results_for_wrapper.failed_references
         )
 
+    @property
+    def number_duplicates(self) -> int:
+        """Return the number of objects that were not sent because the same object was added again to the batch."""
+        return self.__batch_objects.duplicates
+
     def _shutdown(self) -> None:
         """Shutdown the current batch and wait for all requests to be finished."""
         self.flush()
+        self.__results_for_wrapper.results.duplicates = self.__batch_objects.duplicates
 
         # we are done, shut bg threads down and end the event loop
         self.__shut_background_thread_down.set()
@@ -264,10 +481,28 @@ class _BatchBase:
 
     def __batch_send(self) -> None:
         refresh_time: float = 0.01
+        last_state_report: float = 0
         while (
             self.__shut_background_thread_down is not None
             and not self.__shut_background_thread_down.is_set()
         ):
+            if (
+                self.__connection._instrumentation is not None
+                and time.time() - last_state_report >= 1
+            ):
+                last_state_report = time.time()
+                _call_hook(
+                    self.__connection._instrumentation,
+                    "on_batch_state",
+                    BatchStateEvent(
+                        queued_objects=len(self.__batch_objects),
+                        queued_references=len(self.__batch_references),
+                        recommended_num_objects=self.__recommended_num_objects,
+                        concurrent_requests=self.__concurrent_requests,
+                        active_requests=self.__active_requests,
+                    ),
+                )
+
             if isinstance(self.__batching_mode, _RateLimitedBatching):
                 if (
                     time.time() - self.__time_stamp_last_request
@@ -302,6 +537,13 @@ class _BatchBase:
                     self.__recommended_num_refs, uuid_lookup=self.__uuid_lookup
                 )
                 self.__uuid_lookup_lock.release()
+                if len(objs) == 0 and len(refs) == 0:
+                    # tenant grouped batching waits for its buckets to fill up
+                    self.__active_requests_lock.acquire()
+                    self.__active_requests -= 1
+                    self.__active_requests_lock.release()
+                    time.sleep(refresh_time)
+                    continue
                 # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
                 self.__loop.schedule(
                     self.__send_batch,
@@ -453,9 +695,19 @@ class _BatchBase:
     async def __send_batch(
         self, objs: List[_BatchObject], refs: List[_BatchReference], readd_rate_limit: bool
     ) -> None:
+        batch_start = time.perf_counter()
+        n_obj_errs = n_ref_errs = n_readded = 0
         if (n_objs := len(objs)) > 0:
             start = time.time()
+            activation = self.__connection._tenant_activation
             try:
+                if activation is not None:
+                    tenants: Dict[str, Set[str]] = {}
+                    for obj in objs:
+                        if obj.tenant is not None:
+                            tenants.setdefault(obj.collection, set()).add(obj.tenant)
+                    for collection, names in tenants.items():
+                        await activation.activate(collection, names)
                 response_obj = await self.__batch_grpc.objects(
                     objects=objs, timeout=DEFAULT_REQUEST_TIMEOUT
                 )
@@ -470,6 +722,12 @@ class _BatchBase:
                     has_errors=True,
                 )
 
+            if activation is not None:
+                for err in response_obj.errors.values():
+                    if err.object_.tenant is not None and _TENANT_NOT_ACTIVE in err.message:
+                        # the tenant might have been deactivated in the meantime
+                        activation.invalidate(err.object_.collection, err.object_.tenant)
+
             readded_uuids = set()
             readded_objects = []
             highest_retry_count = 0
@@ -502,7 +760,9 @@ class _BatchBase:
                     err.object_.retry_count += 1
                     readded_objects.append(i)
 
-            if len(readded_objects) > 0:
+            retried = {id(response_obj.errors[i].object_) for i in readded_objects}
+            self.__batch_objects.finish([obj for obj in objs if id(obj) not in retried])
+            if (n_readded := len(readded_objects)) > 0:
                 _Warnings.batch_rate_limit_reached(
                     response_obj.errors[readded_objects[0]].message,
                     self.__fix_rate_batching_base_time * (highest_retry_count + 1),
@@ -604,9 +864,24 @@ class _BatchBase:
         self.__active_requests -= 1
         self.__active_requests_lock.release()
 
+        _call_hook(
+            self.__connection._instrumentation,
+            "on_batch_send",
+            BatchSendEvent(
+                objects=len(objs),
+                references=len(refs),
+                failed_objects=n_obj_errs,
+                failed_references=n_ref_errs,
+                retried_objects=n_readded,
+                duration_seconds=time.perf_counter() - batch_start,
+            ),
+        )
+
     def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
         # bg thread is sending objs+refs automatically, so simply wait for everything to be done
+        if isinstance(self.__batch_objects, TenantGroupedObjectsBatchRequest):
+            self.__batch_objects.flush()
         while (
             self.__active_requests > 0
             or len(self.__batch_objects) > 0
@@ -647,11 +922,13 @@ class _BatchBase:
         self.__batch_objects.add(batch_object._to_internal())
 
         # block if queue gets too long or weaviate is overloaded - reading files is faster them sending them so we do
-        # not need a long queue
-        while (
-            self.__recommended_num_objects == 0
-            or len(self.__batch_objects) >= self.__recommended_num_objects * 2
-        ):
+        # not need a long queue, except when grouping by tenant where the objects of each tenant need to accumulate
+        max_queued = (
+            self.__batching_mode.max_queue_size
+            if isinstance(self.__batching_mode, _TenantGroupedBatching)
+            else self.__recommended_num_objects * 2
+        )
+        while self.__recommended_num_objects == 0 or len(self.__batch_objects) >= max_queued:
             self.__check_bg_thread_alive()
             time.sleep(0.01)
 
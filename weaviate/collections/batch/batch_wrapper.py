@@ -1,6 +1,5 @@
 import asyncio
-import time
-from typing import Generic, List, Optional, Any, TypeVar, cast
+from typing import Generic, List, Optional, Any, Set, Tuple, TypeVar, cast
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -13,7 +12,11 @@ from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.connect import ConnectionV4
 from weaviate.event_loop import _EventLoopSingleton
 from weaviate.logger import logger
-from weaviate.util import _capitalize_first_letter, _decode_json_response_list
+from weaviate.util import (
+    _capitalize_first_letter,
+    _decode_json_response_dict,
+    _decode_json_response_list,
+)
 
 
 class _BatchWrapper:
@@ -27,18 +30,24 @@ class _BatchWrapper:
         self._current_batch: Optional[_BatchBase] = None
         # config options
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._deduplicate = False
 
         self._batch_data = _BatchDataWrapper()
 
-        self._event_loop = _EventLoopSingleton.get_instance()
+        self._event_loop = connection._event_loop or _EventLoopSingleton.get_instance()
 
     def wait_for_vector_indexing(
-        self, shards: Optional[List[Shard]] = None, how_many_failures: int = 5
+        self,
+        shards: Optional[List[Shard]] = None,
+        how_many_failures: int = 5,
+        max_concurrent_requests: int = 50,
+        use_nodes_status: bool = False,
     ) -> None:
         """Wait for the all the vectors of the batch imported objects to be indexed.
 
+        The shards are polled every 250ms and dropped from the polling as soon as they are indexed.
         Upon network error, it will retry to get the shards' status for `how_many_failures` times
-        with exponential backoff (2**n seconds with n=0,1,2,...,how_many_failures).
+        in a row with exponential backoff (2**n seconds with n=0,1,2,...,how_many_failures).
 
         Arguments:
             `shards`
@@ -47,38 +56,99 @@ class _BatchWrapper:
             `how_many_failures`
                 How many times to try to get the shards' status before
                 raising an exception. Default 5.
+            `max_concurrent_requests`
+                How many shards' statuses are requested at the same time. Default 50.
+            `use_nodes_status`
+                Check all the shards with a single verbose nodes status request per poll instead of one request
+                per shard, recommended after importing into many tenants. Shards that are not loaded on any node,
+                e.g. those of inactive tenants, are considered to be indexed. Default False.
         """
         if shards is not None and not isinstance(shards, list):
             raise TypeError(f"'shards' must be of type List[Shard]. Given type: {type(shards)}.")
         if shards is not None and not isinstance(shards[0], Shard):
             raise TypeError(f"'shards' must be of type List[Shard]. Given type: {type(shards)}.")
-
-        async def is_ready(how_many: int) -> bool:
+        if not isinstance(max_concurrent_requests, int) or max_concurrent_requests < 1:
+            raise ValueError(
+                f"'max_concurrent_requests' must be a positive int. Given: {max_concurrent_requests}."
+            )
+
+        self._event_loop.run_until_complete(
+            self.__wait_for_vector_indexing,
+            set(shards or self._batch_data.imported_shards),
+            how_many_failures,
+            max_concurrent_requests,
+            use_nodes_status,
+        )
+
+    async def __wait_for_vector_indexing(
+        self,
+        pending: Set[Shard],
+        how_many_failures: int,
+        max_concurrent_requests: int,
+        use_nodes_status: bool,
+    ) -> None:
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+        failures = count = 0
+        while len(pending) > 0:
             try:
-                readinesses = await asyncio.gather(
-                    *[
-                        self.__get_shards_readiness(shard)
-                        for shard in shards or self._batch_data.imported_shards
-                    ]
-                )
-                return all(all(readiness) for readiness in readinesses)
+                if use_nodes_status:
+                    ready = await self.__get_ready_shards_from_nodes(pending)
+                else:
+                    ready = await self.__get_ready_shards(pending, semaphore)
             except Exception as e:
                 logger.warning(
-                    f"Error while getting class shards statuses: {e}, trying again with 2**n={2**how_many}s exponential backoff with n={how_many}"
+                    f"Error while getting class shards statuses: {e}, trying again with 2**n={2**failures}s exponential backoff with n={failures}"
                 )
-                if how_many_failures == how_many:
+                if how_many_failures == failures:
                     raise e
-                time.sleep(2**how_many)
-                return await is_ready(how_many + 1)
-
-        count = 0
-        while not self._event_loop.run_until_complete(is_ready, count):
+                await asyncio.sleep(2**failures)
+                failures += 1
+                continue
+            failures = 0
+            pending -= ready
+            if len(pending) == 0:
+                break
             if count % 20 == 0:  # print every 5s
-                logger.debug("Waiting for async indexing to finish...")
-            time.sleep(0.25)
+                logger.debug(f"Waiting for async indexing of {len(pending)} shards to finish...")
+            await asyncio.sleep(0.25)
             count += 1
         logger.debug("Async indexing finished!")
 
+    async def __get_ready_shards(
+        self, pending: Set[Shard], semaphore: asyncio.Semaphore
+    ) -> Set[Shard]:
+        async def is_ready(shard: Shard) -> bool:
+            async with semaphore:
+                return all(await self.__get_shards_readiness(shard))
+
+        shards = list(pending)
+        readinesses = await asyncio.gather(*[is_ready(shard) for shard in shards])
+        return {shard for shard, ready in zip(shards, readinesses) if ready}
+
+    async def __get_ready_shards_from_nodes(self, pending: Set[Shard]) -> Set[Shard]:
+        response = await self._connection.get(path="/nodes", params={"output": "verbose"})
+        res = _decode_json_response_dict(response, "Get nodes status")
+        assert res is not None
+
+        # (collection, shard name) of all the shards that are still indexing
+        indexing: Set[Tuple[str, str]] = {
+            (shard["class"], shard["name"])
+            for node in res["nodes"]
+            for shard in node.get("shards") or []
+            if shard.get("vectorIndexingStatus") != "READY"
+            or shard.get("vectorQueueLength", 0) != 0
+        }
+        indexing_collections = {collection for collection, _ in indexing}
+        return {
+            shard
+            for shard in pending
+            if (
+                _capitalize_first_letter(shard.collection) not in indexing_collections
+                if shard.tenant is None
+                else (_capitalize_first_letter(shard.collection), shard.tenant) not in indexing
+            )
+        }
+
     async def __get_shards_readiness(self, shard: Shard) -> List[bool]:
         path = f"/schema/{_capitalize_first_letter(shard.collection)}/shards{'' if shard.tenant is None else f'?tenant={shard.tenant}'}"
         response = await self._connection.get(path=path)
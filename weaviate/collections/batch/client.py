@@ -6,6 +6,7 @@ from weaviate.collections.batch.base import (
     _DynamicBatching,
     _FixedSizeBatching,
     _RateLimitedBatching,
+    _TenantGroupedBatching,
 )
 from weaviate.collections.batch.batch_wrapper import (
     _BatchWrapper,
@@ -16,6 +17,7 @@ from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
 from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import WeaviateProperties
+from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.types import UUID, VECTORS
 
 from weaviate.connect.v4 import ConnectionV4
@@ -160,11 +162,12 @@ class _BatchClientWrapper(_BatchWrapper):
                 batch_mode=self._batch_mode,
                 event_loop=self._event_loop,
                 vectorizer_batching=self._vectorizer_batching,
+                deduplicate=self._deduplicate,
             )
         )
 
     def dynamic(
-        self, consistency_level: Optional[ConsistencyLevel] = None
+        self, consistency_level: Optional[ConsistencyLevel] = None, deduplicate: bool = False
     ) -> ClientBatchingContextManager:
         """Configure dynamic batching.
 
@@ -173,9 +176,13 @@ class _BatchClientWrapper(_BatchWrapper):
         Arguments:
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `deduplicate`
+                Whether to send only the last added version of objects that are added again, with the same collection,
+                tenant and UUID, while still waiting to be sent. If not provided, the default value is False.
         """
         self._batch_mode: _BatchMode = _DynamicBatching()
         self._consistency_level = consistency_level
+        self._deduplicate = deduplicate
         return self.__create_batch_and_reset()
 
     def fixed_size(
@@ -183,6 +190,7 @@ class _BatchClientWrapper(_BatchWrapper):
         batch_size: int = 100,
         concurrent_requests: int = 2,
         consistency_level: Optional[ConsistencyLevel] = None,
+        deduplicate: bool = False,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -196,14 +204,21 @@ class _BatchClientWrapper(_BatchWrapper):
                 made to Weaviate and not the speed of batch creation within Python.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `deduplicate`
+                Whether to send only the last added version of objects that are added again, with the same collection,
+                tenant and UUID, while still waiting to be sent. If not provided, the default value is False.
 
         """
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
         self._consistency_level = consistency_level
+        self._deduplicate = deduplicate
         return self.__create_batch_and_reset()
 
     def rate_limit(
-        self, requests_per_minute: int, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        requests_per_minute: int,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        deduplicate: bool = False,
     ) -> ClientBatchingContextManager:
         """Configure batches with a rate limited vectorizer.
 
@@ -214,7 +229,65 @@ class _BatchClientWrapper(_BatchWrapper):
                 The number of requests that the vectorizer can process per minute.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `deduplicate`
+                Whether to send only the last added version of objects that are added again, with the same collection,
+                tenant and UUID, while still waiting to be sent. If not provided, the default value is False.
         """
         self._batch_mode = _RateLimitedBatching(requests_per_minute)
         self._consistency_level = consistency_level
+        self._deduplicate = deduplicate
+        return self.__create_batch_and_reset()
+
+    def tenant_grouped(
+        self,
+        batch_size: int = 100,
+        concurrent_requests: int = 2,
+        max_wait_seconds: float = 1.0,
+        max_queue_size: int = 10_000,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        deduplicate: bool = False,
+    ) -> ClientBatchingContextManager:
+        """Configure fixed size batches that each contain the objects of as few tenants as possible.
+
+        Use this when importing objects of many tenants in an interleaved order. The objects are grouped by collection
+        and tenant before being sent, so that each batch request touches as few shards as possible in Weaviate.
+
+        When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `batch_size`
+                The number of objects/references to be sent in one batch. If not provided, the default value is 100.
+            `concurrent_requests`
+                The number of concurrent requests when sending batches. This controls the number of concurrent requests
+                made to Weaviate and not the speed of batch creation within Python.
+            `max_wait_seconds`
+                How long the objects of a tenant wait for more objects of the same tenant before they are sent in a
+                batch together with the objects of other tenants. If not provided, the default value is 1 second.
+            `max_queue_size`
+                The number of objects that are held in memory to be grouped. When it is reached, the tenants that
+                waited the longest are sent right away and adding objects blocks until there is space again. If not
+                provided, the default value is 10,000.
+            `consistency_level`
+                The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `deduplicate`
+                Whether to send only the last added version of objects that are added again, with the same collection,
+                tenant and UUID, while still waiting to be sent. If not provided, the default value is False.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `max_wait_seconds` is not positive or `max_queue_size` is smaller than `batch_size`.
+        """
+        if max_wait_seconds <= 0:
+            raise WeaviateInvalidInputError(
+                f"max_wait_seconds must be positive, but was {max_wait_seconds}"
+            )
+        if max_queue_size < batch_size:
+            raise WeaviateInvalidInputError(
+                f"max_queue_size must be at least batch_size ({batch_size}), but was {max_queue_size}"
+            )
+        self._batch_mode = _TenantGroupedBatching(
+            batch_size, concurrent_requests, max_wait_seconds, max_queue_size
+        )
+        self._consistency_level = consistency_level
+        self._deduplicate = deduplicate
         return self.__create_batch_and_reset()
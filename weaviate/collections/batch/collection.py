@@ -32,6 +32,7 @@ class _BatchCollection(Generic[Properties], _BatchBase):
         name: str,
         tenant: Optional[str],
         vectorizer_batching: bool,
+        deduplicate: bool = False,
     ) -> None:
         super().__init__(
             connection=connection,
@@ -40,6 +41,7 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             batch_mode=batch_mode,
             event_loop=event_loop,
             vectorizer_batching=vectorizer_batching,
+            deduplicate=deduplicate,
         )
         self.__name = name
         self.__tenant = tenant
@@ -163,19 +165,26 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
                 name=self.__name,
                 tenant=self.__tenant,
                 vectorizer_batching=self._vectorizer_batching,
+                deduplicate=self._deduplicate,
             )
         )
 
-    def dynamic(self) -> CollectionBatchingContextManager[Properties]:
+    def dynamic(self, deduplicate: bool = False) -> CollectionBatchingContextManager[Properties]:
         """Configure dynamic batching.
 
         When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `deduplicate`
+                Whether to send only the last added version of objects that are added again, with the same collection,
+                tenant and UUID, while still waiting to be sent. If not provided, the default value is False.
         """
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._deduplicate = deduplicate
         return self.__create_batch_and_reset()
 
     def fixed_size(
-        self, batch_size: int = 100, concurrent_requests: int = 2
+        self, batch_size: int = 100, concurrent_requests: int = 2, deduplicate: bool = False
     ) -> CollectionBatchingContextManager[Properties]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -187,11 +196,17 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
             `concurrent_requests`
                 The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate and not the speed of batch creation within Python.
+            `deduplicate`
+                Whether to send only the last added version of objects that are added again, with the same collection,
+                tenant and UUID, while still waiting to be sent. If not provided, the default value is False.
         """
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
+        self._deduplicate = deduplicate
         return self.__create_batch_and_reset()
 
-    def rate_limit(self, requests_per_minute: int) -> CollectionBatchingContextManager[Properties]:
+    def rate_limit(
+        self, requests_per_minute: int, deduplicate: bool = False
+    ) -> CollectionBatchingContextManager[Properties]:
         """Configure batches with a rate limited vectorizer.
 
         When you exit the context manager, the final batch will be sent automatically.
@@ -199,6 +214,10 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         Arguments:
             `requests_per_minute`
                 The number of requests that the vectorizer can process per minute.
+            `deduplicate`
+                Whether to send only the last added version of objects that are added again, with the same collection,
+                tenant and UUID, while still waiting to be sent. If not provided, the default value is False.
         """
         self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._deduplicate = deduplicate
         return self.__create_batch_and_reset()
@@ -1,6 +1,7 @@
+import time
 from typing import List, Optional, Union, cast
 
-from grpc.aio import AioRpcError  # type: ignore
+from grpc import RpcError  # type: ignore
 
 
 from weaviate.collections.classes.batch import (
@@ -27,41 +28,48 @@ class _BatchDeleteGRPC(_BaseGRPC):
         self, name: str, filters: _Filters, verbose: bool, dry_run: bool, tenant: Optional[str]
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
         metadata = self._get_metadata()
-        try:
-            assert self._connection.grpc_stub is not None
-            res = await self._connection.grpc_stub.BatchDelete(
-                batch_delete_pb2.BatchDeleteRequest(
-                    collection=name,
-                    consistency_level=self._consistency_level,
-                    verbose=verbose,
-                    dry_run=dry_run,
-                    tenant=tenant,
-                    filters=_FilterToGRPC.convert(filters),
-                ),
-                metadata=metadata,
-                timeout=self._connection.timeout_config.insert,
-            )
-            res = cast(batch_delete_pb2.BatchDeleteReply, res)
-
-            if verbose:
-                objects: List[DeleteManyObject] = [
-                    DeleteManyObject(
-                        uuid=_WeaviateUUIDInt(int.from_bytes(obj.uuid, byteorder="big")),
-                        successful=obj.successful,
-                        error=obj.error if obj.error != "" else None,
+        request = batch_delete_pb2.BatchDeleteRequest(
+            collection=name,
+            consistency_level=self._consistency_level,
+            verbose=verbose,
+            dry_run=dry_run,
+            tenant=tenant,
+            filters=_FilterToGRPC.convert(filters),
+        )
+        start = time.perf_counter()
+        with self._connection._grpc_span("BatchDelete", name):
+            try:
+                if (stub := self._connection.grpc_stub_sync) is not None:
+                    res = stub.BatchDelete(
+                        request, metadata=metadata, timeout=self._connection.timeout_config.insert
                     )
-                    for obj in res.objects
-                ]
-                return DeleteManyReturn(
-                    failed=res.failed,
-                    successful=res.successful,
-                    matches=res.matches,
-                    objects=objects,
-                )
-            else:
-                return DeleteManyReturn(
-                    failed=res.failed, successful=res.successful, matches=res.matches, objects=None
-                )
+                else:
+                    assert self._connection.grpc_stub is not None
+                    res = await self._connection.grpc_stub.BatchDelete(
+                        request, metadata=metadata, timeout=self._connection.timeout_config.insert
+                    )
+                res = cast(batch_delete_pb2.BatchDeleteReply, res)
+            except RpcError as e:
+                self._connection._record_grpc_request("BatchDelete", name, start, request, None, e)
+                raise WeaviateDeleteManyError(str(e))
+            self._connection._record_grpc_request("BatchDelete", name, start, request, res)
 
-        except AioRpcError as e:
-            raise WeaviateDeleteManyError(str(e))
+        if verbose:
+            objects: List[DeleteManyObject] = [
+                DeleteManyObject(
+                    uuid=_WeaviateUUIDInt(int.from_bytes(obj.uuid, byteorder="big")),
+                    successful=obj.successful,
+                    error=obj.error if obj.error != "" else None,
+                )
+                for obj in res.objects
+            ]
+            return DeleteManyReturn(
+                failed=res.failed,
+                successful=res.successful,
+                matches=res.matches,
+                objects=objects,
+            )
+        else:
+            return DeleteManyReturn(
+                failed=res.failed, successful=res.successful, matches=res.matches, objects=None
+            )
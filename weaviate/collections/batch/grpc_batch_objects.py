@@ -4,7 +4,7 @@ import time
 import uuid as uuid_package
 from typing import Any, Dict, List, Optional, Union, cast
 
-from grpc.aio import AioRpcError  # type: ignore
+from grpc import RpcError  # type: ignore
 from google.protobuf.struct_pb2 import Struct
 
 from weaviate.collections.classes.batch import (
@@ -62,7 +62,7 @@ class _BatchGRPC(_BaseGRPC):
                 ),
                 uuid=str(obj.uuid) if obj.uuid is not None else str(uuid_package.uuid4()),
                 properties=(
-                    self.__translate_properties_from_python_to_grpc(
+                    _properties_to_grpc(
                         obj.properties,
                         obj.references if obj.references is not None else {},
                     )
@@ -93,10 +93,14 @@ class _BatchGRPC(_BaseGRPC):
             `tenant`
                 The tenant to be used for this batch operation
         """
+        serialization_start = time.perf_counter()
         weaviate_objs = self.__grpc_objects(objects)
+        serialization_seconds = time.perf_counter() - serialization_start
 
         start = time.time()
-        errors = await self.__send_batch(weaviate_objs, timeout=timeout)
+        errors = await self.__send_batch(
+            weaviate_objs, timeout=timeout, serialization_seconds=serialization_seconds
+        )
         elapsed_time = time.time() - start
 
         if len(errors) == len(weaviate_objs):
@@ -133,71 +137,104 @@ class _BatchGRPC(_BaseGRPC):
         )
 
     async def __send_batch(
-        self, batch: List[batch_pb2.BatchObject], timeout: Union[int, float]
+        self,
+        batch: List[batch_pb2.BatchObject],
+        timeout: Union[int, float],
+        serialization_seconds: Optional[float] = None,
     ) -> Dict[int, str]:
         metadata = self._get_metadata()
-        try:
-            assert self._connection.grpc_stub is not None
-            res = await self._connection.grpc_stub.BatchObjects(
-                batch_pb2.BatchObjectsRequest(
-                    objects=batch,
-                    consistency_level=self._consistency_level,
-                ),
-                metadata=metadata,
-                timeout=timeout,
+        request = batch_pb2.BatchObjectsRequest(
+            objects=batch,
+            consistency_level=self._consistency_level,
+        )
+        start = time.perf_counter()
+        with self._connection._grpc_span("BatchObjects", None):
+            try:
+                if (stub := self._connection.grpc_stub_sync) is not None:
+                    res = stub.BatchObjects(request, metadata=metadata, timeout=timeout)
+                else:
+                    assert self._connection.grpc_stub is not None
+                    res = await self._connection.grpc_stub.BatchObjects(
+                        request, metadata=metadata, timeout=timeout
+                    )
+                res = cast(batch_pb2.BatchObjectsReply, res)
+            except RpcError as e:
+                self._connection._record_grpc_request(
+                    "BatchObjects", None, start, request, None, e, serialization_seconds
+                )
+                raise WeaviateBatchError(str(e)) from e
+            self._connection._record_grpc_request(
+                "BatchObjects", None, start, request, res, None, serialization_seconds
             )
-            res = cast(batch_pb2.BatchObjectsReply, res)
 
-            objects: Dict[int, str] = {}
-            for result in res.errors:
-                objects[result.index] = result.error
-            return objects
-        except AioRpcError as e:
-            raise WeaviateBatchError(str(e)) from e
+        objects: Dict[int, str] = {}
+        for result in res.errors:
+            objects[result.index] = result.error
+        return objects
 
-    def __translate_properties_from_python_to_grpc(
-        self, data: Dict[str, Any], refs: ReferenceInputs
-    ) -> batch_pb2.BatchObject.Properties:
-        _validate_props(data)
 
-        multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
-        single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
-        non_ref_properties: Struct = Struct()
-        bool_arrays: List[base_pb2.BooleanArrayProperties] = []
-        text_arrays: List[base_pb2.TextArrayProperties] = []
-        int_arrays: List[base_pb2.IntArrayProperties] = []
-        float_arrays: List[base_pb2.NumberArrayProperties] = []
-        object_properties: List[base_pb2.ObjectProperties] = []
-        object_array_properties: List[base_pb2.ObjectArrayProperties] = []
-        empty_lists: List[str] = []
+def _properties_to_grpc(
+    data: Dict[str, Any], refs: ReferenceInputs
+) -> batch_pb2.BatchObject.Properties:
+    _validate_props(data)
 
-        for key, ref in refs.items():
-            if isinstance(ref, ReferenceToMulti):
-                multi_target.append(
-                    batch_pb2.BatchObject.MultiTargetRefProps(
-                        uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
-                    )
-                )
-            elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(uuids=[str(ref)], prop_name=key)
+    multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
+    single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
+    non_ref_properties: Struct = Struct()
+    bool_arrays: List[base_pb2.BooleanArrayProperties] = []
+    text_arrays: List[base_pb2.TextArrayProperties] = []
+    int_arrays: List[base_pb2.IntArrayProperties] = []
+    float_arrays: List[base_pb2.NumberArrayProperties] = []
+    object_properties: List[base_pb2.ObjectProperties] = []
+    object_array_properties: List[base_pb2.ObjectArrayProperties] = []
+    empty_lists: List[str] = []
+
+    for key, ref in refs.items():
+        if isinstance(ref, ReferenceToMulti):
+            multi_target.append(
+                batch_pb2.BatchObject.MultiTargetRefProps(
+                    uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
                 )
-            elif isinstance(ref, list):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(
-                        uuids=[str(v) for v in ref], prop_name=key
-                    )
+            )
+        elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
+            single_target.append(
+                batch_pb2.BatchObject.SingleTargetRefProps(uuids=[str(ref)], prop_name=key)
+            )
+        elif isinstance(ref, list):
+            single_target.append(
+                batch_pb2.BatchObject.SingleTargetRefProps(
+                    uuids=[str(v) for v in ref], prop_name=key
                 )
-            else:
-                raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
+            )
+        else:
+            raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
 
-        for key, entry in data.items():
-            if isinstance(entry, dict):
-                parsed = self.__translate_properties_from_python_to_grpc(entry, {})
-                object_properties.append(
-                    base_pb2.ObjectProperties(
-                        prop_name=key,
-                        value=base_pb2.ObjectPropertiesValue(
+    for key, entry in data.items():
+        if isinstance(entry, dict):
+            parsed = _properties_to_grpc(entry, {})
+            object_properties.append(
+                base_pb2.ObjectProperties(
+                    prop_name=key,
+                    value=base_pb2.ObjectPropertiesValue(
+                        non_ref_properties=parsed.non_ref_properties,
+                        int_array_properties=parsed.int_array_properties,
+                        text_array_properties=parsed.text_array_properties,
+                        number_array_properties=parsed.number_array_properties,
+                        boolean_array_properties=parsed.boolean_array_properties,
+                        object_properties=parsed.object_properties,
+                        object_array_properties=parsed.object_array_properties,
+                        empty_list_props=parsed.empty_list_props,
+                    ),
+                )
+            )
+        elif isinstance(entry, list) and len(entry) == 0:
+            empty_lists.append(key)
+        elif isinstance(entry, list) and isinstance(entry[0], dict):
+            entry = cast(List[Dict[str, Any]], entry)
+            object_array_properties.append(
+                base_pb2.ObjectArrayProperties(
+                    values=[
+                        base_pb2.ObjectPropertiesValue(
                             non_ref_properties=parsed.non_ref_properties,
                             int_array_properties=parsed.int_array_properties,
                             text_array_properties=parsed.text_array_properties,
@@ -206,72 +243,53 @@ class _BatchGRPC(_BaseGRPC):
                             object_properties=parsed.object_properties,
                             object_array_properties=parsed.object_array_properties,
                             empty_list_props=parsed.empty_list_props,
-                        ),
-                    )
-                )
-            elif isinstance(entry, list) and len(entry) == 0:
-                empty_lists.append(key)
-            elif isinstance(entry, list) and isinstance(entry[0], dict):
-                entry = cast(List[Dict[str, Any]], entry)
-                object_array_properties.append(
-                    base_pb2.ObjectArrayProperties(
-                        values=[
-                            base_pb2.ObjectPropertiesValue(
-                                non_ref_properties=parsed.non_ref_properties,
-                                int_array_properties=parsed.int_array_properties,
-                                text_array_properties=parsed.text_array_properties,
-                                number_array_properties=parsed.number_array_properties,
-                                boolean_array_properties=parsed.boolean_array_properties,
-                                object_properties=parsed.object_properties,
-                                object_array_properties=parsed.object_array_properties,
-                                empty_list_props=parsed.empty_list_props,
-                            )
-                            for v in entry
-                            if (parsed := self.__translate_properties_from_python_to_grpc(v, {}))
-                        ],
-                        prop_name=key,
-                    )
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], bool):
-                bool_arrays.append(base_pb2.BooleanArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], str):
-                text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(
-                        prop_name=key, values=[_datetime_to_string(x) for x in entry]
-                    )
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(prop_name=key, values=[str(x) for x in entry])
+                        )
+                        for v in entry
+                        if (parsed := _properties_to_grpc(v, {}))
+                    ],
+                    prop_name=key,
                 )
-            elif isinstance(entry, list) and isinstance(entry[0], int):
-                int_arrays.append(base_pb2.IntArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], float):
-                values_bytes = struct.pack("{}d".format(len(entry)), *entry)
-                float_arrays.append(
-                    base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
+            )
+        elif isinstance(entry, list) and isinstance(entry[0], bool):
+            bool_arrays.append(base_pb2.BooleanArrayProperties(prop_name=key, values=entry))
+        elif isinstance(entry, list) and isinstance(entry[0], str):
+            text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=entry))
+        elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
+            text_arrays.append(
+                base_pb2.TextArrayProperties(
+                    prop_name=key, values=[_datetime_to_string(x) for x in entry]
                 )
-            elif isinstance(entry, GeoCoordinate):
-                non_ref_properties.update({key: entry._to_dict()})
-            elif isinstance(entry, PhoneNumber):
-                non_ref_properties.update({key: entry._to_dict()})
-            else:
-                non_ref_properties.update({key: _serialize_primitive(entry)})
+            )
+        elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
+            text_arrays.append(
+                base_pb2.TextArrayProperties(prop_name=key, values=[str(x) for x in entry])
+            )
+        elif isinstance(entry, list) and isinstance(entry[0], int):
+            int_arrays.append(base_pb2.IntArrayProperties(prop_name=key, values=entry))
+        elif isinstance(entry, list) and isinstance(entry[0], float):
+            values_bytes = struct.pack("{}d".format(len(entry)), *entry)
+            float_arrays.append(
+                base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
+            )
+        elif isinstance(entry, GeoCoordinate):
+            non_ref_properties.update({key: entry._to_dict()})
+        elif isinstance(entry, PhoneNumber):
+            non_ref_properties.update({key: entry._to_dict()})
+        else:
+            non_ref_properties.update({key: _serialize_primitive(entry)})
 
-        return batch_pb2.BatchObject.Properties(
-            non_ref_properties=non_ref_properties,
-            multi_target_ref_props=multi_target,
-            single_target_ref_props=single_target,
-            text_array_properties=text_arrays,
-            number_array_properties=float_arrays,
-            int_array_properties=int_arrays,
-            boolean_array_properties=bool_arrays,
-            object_properties=object_properties,
-            object_array_properties=object_array_properties,
-            empty_list_props=empty_lists,
-        )
+    return batch_pb2.BatchObject.Properties(
+        non_ref_properties=non_ref_properties,
+        multi_target_ref_props=multi_target,
+        single_target_ref_props=single_target,
+        text_array_properties=text_arrays,
+        number_array_properties=float_arrays,
+        int_array_properties=int_arrays,
+        boolean_array_properties=bool_arrays,
+        object_properties=object_properties,
+        object_array_properties=object_array_properties,
+        empty_list_props=empty_lists,
+    )
 
 
 def _validate_props(props: Dict[str, Any]) -> None:
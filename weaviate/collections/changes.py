@@ -0,0 +1,302 @@
+import asyncio
+import datetime
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+from uuid import UUID
+
+from weaviate.collections.classes.filters import Filter, _Filters
+from weaviate.collections.classes.grpc import METADATA, MetadataQuery, Sort
+from weaviate.collections.classes.internal import (
+    TReferences,
+    TProperties,
+    ReturnProperties,
+    ReturnReferences,
+    Object,
+)
+from weaviate.collections.queries.fetch_objects import _FetchObjectsQuery, _FetchObjectsQueryAsync
+
+CHANGES_PAGE_SIZE = 100
+CHANGES_LAG = 1.0  # seconds before the checkpoint that are read again, for updates committed late
+CHANGES_MAX_SEEN = (
+    1_000  # the most objects that are read again, the older ones are dropped from the lag window
+)
+
+
+@dataclass(frozen=True)
+class ChangesCheckpoint:
+    """The position of a `collection.changes` stream, to resume it from later on.
+
+    `update_time` and `uuid` belong to the last returned object. A resumed stream reads the objects updated during the
+    lag window before `update_time` again and skips the ones in `seen`, the objects that were already returned during
+    that window. At most `CHANGES_MAX_SEEN` of them are kept, the objects updated at or before `dropped_until` did not
+    fit into the window and are not read again.
+    """
+
+    update_time: datetime.datetime
+    uuid: Optional[UUID] = None
+    seen: FrozenSet[Tuple[UUID, datetime.datetime]] = field(default_factory=frozenset)
+    dropped_until: Optional[datetime.datetime] = None
+
+
+@dataclass
+class _ChangesInputs(Generic[TProperties, TReferences]):
+    include_vector: bool
+    return_metadata: Optional[METADATA]
+    return_properties: Optional[ReturnProperties[TProperties]]
+    return_references: Optional[ReturnReferences[TReferences]]
+    since: Optional[Union[datetime.datetime, ChangesCheckpoint]]
+    poll_interval: Optional[float]
+    lag: float = CHANGES_LAG
+
+
+def _with_last_update_time(metadata: Optional[METADATA]) -> METADATA:
+    if metadata is None:
+        return MetadataQuery(last_update_time=True)
+    if isinstance(metadata, MetadataQuery):
+        return metadata.model_copy(update={"last_update_time": True})
+    if "last_update_time" in metadata:
+        return metadata
+    return cast(METADATA, [*metadata, "last_update_time"])
+
+
+class _ChangesCursor:
+    """Pages through the objects in the order of their update time, reading the recently returned ones again.
+
+    Every pass over the collection starts at the lag window, the objects updated during the last `lag` seconds but at
+    most the latest `CHANGES_MAX_SEEN` of them, and is paged with a keyset on the update time and UUID of the last object
+    read, so that no object is read twice within a pass. Only if more than a page of objects share an update time are
+    they paged with an offset. Objects that were already returned are skipped by their UUID and update time, and the
+    stream is done once a pass did not find any new object.
+    """
+
+    def __init__(
+        self, since: Optional[Union[datetime.datetime, ChangesCheckpoint]], lag: float
+    ) -> None:
+        self.__lag = datetime.timedelta(seconds=lag)
+        # objects updated before `since` are never returned, but the lag window before a checkpoint is
+        self.__floor = since if isinstance(since, datetime.datetime) else None
+        checkpoint = (
+            ChangesCheckpoint(update_time=since) if isinstance(since, datetime.datetime) else since
+        )
+        self.__update_time = checkpoint.update_time if checkpoint is not None else None
+        self.__uuid = checkpoint.uuid if checkpoint is not None else None
+        # the returned objects of the lag window by their update time, with a heap of these update times
+        self.__seen: Dict[datetime.datetime, Set[UUID]] = {}
+        self.__seen_times: List[datetime.datetime] = []
+        self.__seen_count = 0
+        self.__dropped_until = checkpoint.dropped_until if checkpoint is not None else None
+        for uuid, update_time in checkpoint.seen if checkpoint is not None else []:
+            self.__remember(uuid, update_time)
+        # the update time of the last object read in the current pass and the objects read with that update time
+        self.__position: Optional[Tuple[datetime.datetime, List[UUID]]] = None
+        self.__new_in_pass = False
+
+    @property
+    def checkpoint(self) -> Optional[ChangesCheckpoint]:
+        if self.__update_time is None:
+            return None
+        return ChangesCheckpoint(
+            update_time=self.__update_time,
+            uuid=self.__uuid,
+            seen=frozenset(
+                (uuid, update_time) for update_time, uuids in self.__seen.items() for uuid in uuids
+            ),
+            dropped_until=self.__dropped_until,
+        )
+
+    @property
+    def filters(self) -> Optional[_Filters]:
+        if self.__position is None:
+            return self.__window_filters()
+        update_time, uuids = self.__position
+        if len(uuids) > CHANGES_PAGE_SIZE:
+            return Filter.by_update_time().greater_or_equal(update_time)
+        return Filter.by_update_time().greater_than(update_time) | (
+            Filter.by_update_time().equal(update_time)
+            & Filter.all_of([Filter.by_id().not_equal(uuid) for uuid in uuids])
+        )
+
+    @property
+    def offset(self) -> int:
+        if self.__position is None or len(self.__position[1]) <= CHANGES_PAGE_SIZE:
+            return 0
+        return len(self.__position[1])
+
+    def __window_filters(self) -> Optional[_Filters]:
+        if self.__update_time is None:
+            return None
+        start = self.__update_time - self.__lag
+        if self.__floor is not None and self.__floor > start:
+            start = self.__floor
+        if self.__dropped_until is not None and self.__dropped_until >= start:
+            return Filter.by_update_time().greater_than(self.__dropped_until)
+        return Filter.by_update_time().greater_or_equal(start)
+
+    def read(
+        self, objects: List[Object[Any, Any]], limit: int
+    ) -> Tuple[List[Object[Any, Any]], bool]:
+        """Return the objects of a page that were not returned yet and whether all changes were returned."""
+        new = [
+            obj
+            for obj in objects
+            if obj.uuid not in self.__seen.get(self.__update_time_of(obj), ())
+        ]
+        self.__new_in_pass = self.__new_in_pass or len(new) > 0
+        if len(objects) < limit:  # the end of the pass
+            done = not self.__new_in_pass
+            self.__position, self.__new_in_pass = None, False
+            return new, done
+
+        last = self.__update_time_of(objects[-1])
+        uuids = [obj.uuid for obj in objects if self.__update_time_of(obj) == last]
+        if self.__position is not None and self.__position[0] == last:
+            uuids = self.__position[1] + uuids
+        self.__position = (last, uuids)
+        return new, False
+
+    def returned(self, obj: Object[Any, Any]) -> None:
+        update_time = self.__update_time_of(obj)
+        if self.__update_time is None or update_time >= self.__update_time:
+            self.__update_time, self.__uuid = update_time, obj.uuid
+        self.__remember(obj.uuid, update_time)
+
+        window_start = self.__update_time - self.__lag
+        while len(self.__seen_times) > 0 and (
+            self.__seen_times[0] < window_start or self.__seen_count > CHANGES_MAX_SEEN
+        ):
+            oldest = heapq.heappop(self.__seen_times)
+            self.__seen_count -= len(self.__seen.pop(oldest))
+            if oldest >= window_start and (
+                self.__dropped_until is None or oldest > self.__dropped_until
+            ):
+                self.__dropped_until = oldest
+
+    def __remember(self, uuid: UUID, update_time: datetime.datetime) -> None:
+        uuids = self.__seen.get(update_time)
+        if uuids is None:
+            uuids = self.__seen[update_time] = set()
+            heapq.heappush(self.__seen_times, update_time)
+        if uuid not in uuids:
+            uuids.add(uuid)
+            self.__seen_count += 1
+
+    @staticmethod
+    def __update_time_of(obj: Object[Any, Any]) -> datetime.datetime:
+        update_time = obj.metadata.last_update_time
+        assert update_time is not None
+        return update_time
+
+
+class _ObjectChangesIterator(
+    Generic[TProperties, TReferences],
+    Iterable[Object[TProperties, TReferences]],
+):
+    def __init__(
+        self,
+        query: _FetchObjectsQuery[Any, Any],
+        inputs: _ChangesInputs[TProperties, TReferences],
+    ) -> None:
+        self.__query = query
+        self.__inputs = inputs
+
+        self.__cache: List[Object[TProperties, TReferences]] = []
+        self.__cursor = _ChangesCursor(self.__inputs.since, self.__inputs.lag)
+
+    @property
+    def checkpoint(self) -> Optional[ChangesCheckpoint]:
+        """The position after the last returned object, `None` if no object was returned and `since` was not set."""
+        return self.__cursor.checkpoint
+
+    def __iter__(
+        self,
+    ) -> Iterator[Object[TProperties, TReferences]]:
+        return self
+
+    def __next__(self) -> Object[TProperties, TReferences]:
+        while len(self.__cache) == 0:
+            res = self.__query.fetch_objects(
+                limit=CHANGES_PAGE_SIZE,
+                offset=self.__cursor.offset,
+                filters=self.__cursor.filters,
+                sort=Sort.by_update_time(ascending=True),
+                include_vector=self.__inputs.include_vector,
+                return_metadata=_with_last_update_time(self.__inputs.return_metadata),
+                return_properties=self.__inputs.return_properties,
+                return_references=self.__inputs.return_references,
+            )
+            self.__cache, done = self.__cursor.read(res.objects, CHANGES_PAGE_SIZE)
+            if done:
+                if self.__inputs.poll_interval is None:
+                    raise StopIteration
+                time.sleep(self.__inputs.poll_interval)
+
+        ret_object = self.__cache.pop(0)
+        self.__cursor.returned(ret_object)
+        return ret_object  # pyright: ignore
+
+
+class _ObjectChangesAIterator(
+    Generic[TProperties, TReferences],
+    AsyncIterable[Object[TProperties, TReferences]],
+):
+    def __init__(
+        self,
+        query: _FetchObjectsQueryAsync[Any, Any],
+        inputs: _ChangesInputs[TProperties, TReferences],
+    ) -> None:
+        self.__query = query
+        self.__inputs = inputs
+
+        self.__cache: List[Object[TProperties, TReferences]] = []
+        self.__cursor = _ChangesCursor(self.__inputs.since, self.__inputs.lag)
+
+    @property
+    def checkpoint(self) -> Optional[ChangesCheckpoint]:
+        """The position after the last returned object, `None` if no object was returned and `since` was not set."""
+        return self.__cursor.checkpoint
+
+    def __aiter__(
+        self,
+    ) -> AsyncIterator[Object[TProperties, TReferences]]:
+        return self
+
+    async def __anext__(
+        self,
+    ) -> Object[TProperties, TReferences]:
+        while len(self.__cache) == 0:
+            res = await self.__query.fetch_objects(
+                limit=CHANGES_PAGE_SIZE,
+                offset=self.__cursor.offset,
+                filters=self.__cursor.filters,
+                sort=Sort.by_update_time(ascending=True),
+                include_vector=self.__inputs.include_vector,
+                return_metadata=_with_last_update_time(self.__inputs.return_metadata),
+                return_properties=self.__inputs.return_properties,
+                return_references=self.__inputs.return_references,
+            )
+            self.__cache, done = self.__cursor.read(res.objects, CHANGES_PAGE_SIZE)
+            if done:
+                if self.__inputs.poll_interval is None:
+                    raise StopAsyncIteration
+                await asyncio.sleep(self.__inputs.poll_interval)
+
+        ret_object = self.__cache.pop(0)
+        self.__cursor.returned(ret_object)
+        return ret_object  # pyright: ignore
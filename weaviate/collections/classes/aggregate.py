@@ -1,15 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
+    Any,
     Dict,
     List,
+    Literal,
     Optional,
     Union,
 )
-from typing_extensions import TypeVar
+from typing_extensions import Annotated, TypeVar
 
 from pydantic import BaseModel, Field
 
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import Move
 from weaviate.collections.classes.types import _WeaviateInput
+from weaviate.types import BLOB_INPUT, NUMBER, UUID
 
 N = TypeVar("N", int, float)
 
@@ -25,6 +30,8 @@ class AggregateInteger:
     minimum: Optional[int]
     mode: Optional[int]
     sum_: Optional[int]
+    percentiles: Optional[Dict[float, float]] = None
+    """The requested percentiles by their rank, only computed by local aggregations."""
 
 
 @dataclass
@@ -38,6 +45,8 @@ class AggregateNumber:
     minimum: Optional[float]
     mode: Optional[float]
     sum_: Optional[float]
+    percentiles: Optional[Dict[float, float]] = None
+    """The requested percentiles by their rank, only computed by local aggregations."""
 
 
 @dataclass
@@ -165,6 +174,7 @@ class _MetricsNum(_MetricsBase):
     minimum: bool
     mode: bool
     sum_: bool
+    percentiles: Optional[List[Annotated[float, Field(ge=0, le=100)]]] = None
 
     def to_gql(self) -> str:
         body = " ".join(
@@ -317,6 +327,7 @@ class Metrics:
         minimum: bool = False,
         mode: bool = False,
         sum_: bool = False,
+        percentiles: Optional[List[NUMBER]] = None,
     ) -> _MetricsInteger:
         """Define the metrics to be returned for an INT or INT_ARRAY property when aggregating over a collection.
 
@@ -337,11 +348,13 @@ class Metrics:
                 Whether to include the mode value of this property.
             `sum_`
                 Whether to include the sum of this property.
+            `percentiles`
+                The percentiles of this property to include, between 0 and 100. Only supported by local aggregations.
 
         Returns:
             A `_MetricsInteger` object that includes the metrics to be returned.
         """
-        if not any([count, maximum, mean, median, minimum, mode, sum_]):
+        if not any([count, maximum, mean, median, minimum, mode, sum_]) and percentiles is None:
             count = True
             maximum = True
             mean = True
@@ -358,6 +371,7 @@ class Metrics:
             minimum=minimum,
             mode=mode,
             sum_=sum_,
+            percentiles=percentiles,
         )
 
     def number(
@@ -369,6 +383,7 @@ class Metrics:
         minimum: bool = False,
         mode: bool = False,
         sum_: bool = False,
+        percentiles: Optional[List[NUMBER]] = None,
     ) -> _MetricsNumber:
         """Define the metrics to be returned for a NUMBER or NUMBER_ARRAY property when aggregating over a collection.
 
@@ -389,11 +404,13 @@ class Metrics:
                 Whether to include the mode value of this property.
             `sum_`
                 Whether to include the sum of this property.
+            `percentiles`
+                The percentiles of this property to include, between 0 and 100. Only supported by local aggregations.
 
         Returns:
             A `_MetricsNumber` object that includes the metrics to be returned.
         """
-        if not any([count, maximum, mean, median, minimum, mode, sum_]):
+        if not any([count, maximum, mean, median, minimum, mode, sum_]) and percentiles is None:
             count = True
             maximum = True
             mean = True
@@ -410,6 +427,7 @@ class Metrics:
             minimum=minimum,
             mode=mode,
             sum_=sum_,
+            percentiles=percentiles,
         )
 
     def boolean(
@@ -518,3 +536,201 @@ class Metrics:
     #         property_name=self.__property,
     #         pointing_to=pointing_to,
     #     )
+
+
+_AggregateSearch = Literal[
+    "over_all", "hybrid", "near_image", "near_object", "near_text", "near_vector"
+]
+
+
+@dataclass
+class _AggregateQuery:
+    search: _AggregateSearch
+    filters: Optional[_Filters]
+    group_by: Optional[Union[str, GroupByAggregate]]
+    total_count: bool
+    return_metrics: Optional[List[_Metrics]]
+    search_arguments: Dict[str, Any] = field(default_factory=dict)
+
+
+def _to_metrics_list(return_metrics: Optional[PropertiesMetrics]) -> Optional[List[_Metrics]]:
+    return (
+        return_metrics
+        if (return_metrics is None or isinstance(return_metrics, list))
+        else [return_metrics]
+    )
+
+
+class AggregateQuery:
+    """Define the aggregations to run together with `collection.aggregate.many`.
+
+    Each method takes the same arguments as the aggregation method of the same name on `collection.aggregate`.
+    """
+
+    @staticmethod
+    def over_all(
+        *,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[Union[str, GroupByAggregate]] = None,
+        total_count: bool = True,
+        return_metrics: Optional[PropertiesMetrics] = None,
+    ) -> _AggregateQuery:
+        """Aggregate metrics over all the objects in the collection without any vector search."""
+        return _AggregateQuery(
+            search="over_all",
+            filters=filters,
+            group_by=group_by,
+            total_count=total_count,
+            return_metrics=_to_metrics_list(return_metrics),
+        )
+
+    @staticmethod
+    def hybrid(
+        query: Optional[str],
+        *,
+        alpha: NUMBER = 0.7,
+        vector: Optional[List[float]] = None,
+        query_properties: Optional[List[str]] = None,
+        object_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[Union[str, GroupByAggregate]] = None,
+        target_vector: Optional[str] = None,
+        total_count: bool = True,
+        return_metrics: Optional[PropertiesMetrics] = None,
+    ) -> _AggregateQuery:
+        """Aggregate metrics over the objects returned by a hybrid search on the collection."""
+        return _AggregateQuery(
+            search="hybrid",
+            filters=filters,
+            group_by=group_by,
+            total_count=total_count,
+            return_metrics=_to_metrics_list(return_metrics),
+            search_arguments={
+                "query": query,
+                "alpha": alpha,
+                "vector": vector,
+                "query_properties": query_properties,
+                "object_limit": object_limit,
+                "target_vector": target_vector,
+            },
+        )
+
+    @staticmethod
+    def near_image(
+        near_image: BLOB_INPUT,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        object_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[Union[str, GroupByAggregate]] = None,
+        target_vector: Optional[str] = None,
+        total_count: bool = True,
+        return_metrics: Optional[PropertiesMetrics] = None,
+    ) -> _AggregateQuery:
+        """Aggregate metrics over the objects returned by a near image vector search on the collection."""
+        return _AggregateQuery(
+            search="near_image",
+            filters=filters,
+            group_by=group_by,
+            total_count=total_count,
+            return_metrics=_to_metrics_list(return_metrics),
+            search_arguments={
+                "near_image": near_image,
+                "certainty": certainty,
+                "distance": distance,
+                "object_limit": object_limit,
+                "target_vector": target_vector,
+            },
+        )
+
+    @staticmethod
+    def near_object(
+        near_object: UUID,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        object_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[Union[str, GroupByAggregate]] = None,
+        target_vector: Optional[str] = None,
+        total_count: bool = True,
+        return_metrics: Optional[PropertiesMetrics] = None,
+    ) -> _AggregateQuery:
+        """Aggregate metrics over the objects returned by a near object search on the collection."""
+        return _AggregateQuery(
+            search="near_object",
+            filters=filters,
+            group_by=group_by,
+            total_count=total_count,
+            return_metrics=_to_metrics_list(return_metrics),
+            search_arguments={
+                "near_object": near_object,
+                "certainty": certainty,
+                "distance": distance,
+                "object_limit": object_limit,
+                "target_vector": target_vector,
+            },
+        )
+
+    @staticmethod
+    def near_text(
+        query: Union[List[str], str],
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        move_to: Optional[Move] = None,
+        move_away: Optional[Move] = None,
+        object_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[Union[str, GroupByAggregate]] = None,
+        target_vector: Optional[str] = None,
+        total_count: bool = True,
+        return_metrics: Optional[PropertiesMetrics] = None,
+    ) -> _AggregateQuery:
+        """Aggregate metrics over the objects returned by a near text vector search on the collection."""
+        return _AggregateQuery(
+            search="near_text",
+            filters=filters,
+            group_by=group_by,
+            total_count=total_count,
+            return_metrics=_to_metrics_list(return_metrics),
+            search_arguments={
+                "query": query,
+                "certainty": certainty,
+                "distance": distance,
+                "move_to": move_to,
+                "move_away": move_away,
+                "object_limit": object_limit,
+                "target_vector": target_vector,
+            },
+        )
+
+    @staticmethod
+    def near_vector(
+        near_vector: List[float],
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        object_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[Union[str, GroupByAggregate]] = None,
+        target_vector: Optional[str] = None,
+        total_count: bool = True,
+        return_metrics: Optional[PropertiesMetrics] = None,
+    ) -> _AggregateQuery:
+        """Aggregate metrics over the objects returned by a near vector search on the collection."""
+        return _AggregateQuery(
+            search="near_vector",
+            filters=filters,
+            group_by=group_by,
+            total_count=total_count,
+            return_metrics=_to_metrics_list(return_metrics),
+            search_arguments={
+                "near_vector": near_vector,
+                "certainty": certainty,
+                "distance": distance,
+                "object_limit": object_limit,
+                "target_vector": target_vector,
+            },
+        )
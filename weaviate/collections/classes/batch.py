@@ -23,6 +23,7 @@ class _BatchObject:
     references: Optional[ReferenceInputs]
     index: int
     retry_count: int = 0
+    sequence: int = 0  # the order in which the objects were added, when deduplicating
 
 
 @dataclass
@@ -254,11 +255,15 @@ class BatchResult:
             The results of the batch object operation.
         `refs`
             The results of the batch reference operation.
+        `duplicates`
+            The number of objects that were not sent because a newer object with the same UUID was added to a
+            deduplicating batch.
     """
 
     def __init__(self) -> None:
         self.objs: BatchObjectReturn = BatchObjectReturn()
         self.refs: BatchReferenceReturn = BatchReferenceReturn()
+        self.duplicates: int = 0
 
 
 @dataclass
@@ -1,3 +1,4 @@
+import datetime
 import json
 from dataclasses import asdict
 from typing import Generic, List, Literal, Optional, Type, Union, overload
@@ -5,6 +6,12 @@ from typing import Generic, List, Literal, Optional, Type, Union, overload
 from weaviate.collections.aggregate import _AggregateCollection
 from weaviate.collections.backups import _CollectionBackup
 from weaviate.collections.batch.collection import _BatchCollectionWrapper
+from weaviate.collections.changes import (
+    CHANGES_LAG,
+    ChangesCheckpoint,
+    _ChangesInputs,
+    _ObjectChangesIterator,
+)
 from weaviate.collections.classes.cluster import Shard
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES
@@ -296,3 +303,145 @@ class Collection(Generic[Properties, References], _CollectionBase[Properties, Re
                 after=after,
             ),
         )
+
+    @overload
+    def changes(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+        since: Optional[Union[datetime.datetime, ChangesCheckpoint]] = None,
+        poll_interval: Optional[float] = None,
+        lag: float = CHANGES_LAG,
+    ) -> _ObjectChangesIterator[Properties, References]: ...
+
+    @overload
+    def changes(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+        since: Optional[Union[datetime.datetime, ChangesCheckpoint]] = None,
+        poll_interval: Optional[float] = None,
+        lag: float = CHANGES_LAG,
+    ) -> _ObjectChangesIterator[Properties, CrossReferences]: ...
+
+    @overload
+    def changes(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+        since: Optional[Union[datetime.datetime, ChangesCheckpoint]] = None,
+        poll_interval: Optional[float] = None,
+        lag: float = CHANGES_LAG,
+    ) -> _ObjectChangesIterator[Properties, TReferences]: ...
+
+    @overload
+    def changes(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        since: Optional[Union[datetime.datetime, ChangesCheckpoint]] = None,
+        poll_interval: Optional[float] = None,
+        lag: float = CHANGES_LAG,
+    ) -> _ObjectChangesIterator[TProperties, References]: ...
+
+    @overload
+    def changes(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        since: Optional[Union[datetime.datetime, ChangesCheckpoint]] = None,
+        poll_interval: Optional[float] = None,
+        lag: float = CHANGES_LAG,
+    ) -> _ObjectChangesIterator[TProperties, CrossReferences]: ...
+
+    @overload
+    def changes(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        since: Optional[Union[datetime.datetime, ChangesCheckpoint]] = None,
+        poll_interval: Optional[float] = None,
+        lag: float = CHANGES_LAG,
+    ) -> _ObjectChangesIterator[TProperties, TReferences]: ...
+
+    def changes(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        since: Optional[Union[datetime.datetime, ChangesCheckpoint]] = None,
+        poll_interval: Optional[float] = None,
+        lag: float = CHANGES_LAG,
+    ) -> Union[
+        _ObjectChangesIterator[Properties, References],
+        _ObjectChangesIterator[Properties, CrossReferences],
+        _ObjectChangesIterator[Properties, TReferences],
+        _ObjectChangesIterator[TProperties, References],
+        _ObjectChangesIterator[TProperties, CrossReferences],
+        _ObjectChangesIterator[TProperties, TReferences],
+    ]:
+        """Use this method to return an iterator over the objects that were created or updated since a point in time.
+
+        The objects are returned in the order of their last update time, as a change data capture stream. The iterator
+        keeps a checkpoint of the last returned object in its `checkpoint` property, which can be passed as `since` to
+        resume the stream later on. The last `lag` seconds before the latest update time are read again, so that updates
+        that are committed after later ones are not skipped, and objects that were already returned are skipped. If `poll_interval` is set, the iterator waits for new changes instead of exiting once all of
+        them were returned.
+
+        The collection must be created with `index_timestamps=True` in its inverted index config. Deleted objects are not
+        returned and an object that was updated several times is returned once, with its latest state.
+
+        Arguments:
+            `include_vector`
+                Whether to include the vector in the metadata of the returned objects.
+            `return_metadata`
+                The metadata to return with each object, the last update time is always returned.
+            `return_properties`
+                The properties to return with each object.
+            `return_references`
+                The references to return with each object.
+            `since`
+                The update time or checkpoint to start from, all objects are returned if not set.
+            `poll_interval`
+                The number of seconds to wait before asking Weaviate for new changes once all of them were returned.
+                If not set, the iterator exits once all changes were returned.
+            `lag`
+                The number of seconds before the latest update time that are read again for updates committed late,
+                limited to the latest 1,000 returned objects. Default 1.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        return _ObjectChangesIterator(
+            self.query,
+            _ChangesInputs(
+                include_vector=include_vector,
+                return_metadata=return_metadata,
+                return_properties=return_properties,
+                return_references=return_references,
+                since=since,
+                poll_interval=poll_interval,
+                lag=lag,
+            ),
+        )
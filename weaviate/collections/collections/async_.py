@@ -222,6 +222,7 @@ class _CollectionsAsync(_CollectionsBase):
             `weaviate.UnexpectedStatusCodeError`
                 If Weaviate reports a non-OK status.
         """
+        self._invalidate_cache()  # make sure to delete the collections created elsewhere, too
         await asyncio.gather(*[self.delete(name) for name in (await self.list_all()).keys()])
 
     async def exists(self, name: str) -> bool:
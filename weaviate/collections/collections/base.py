@@ -1,4 +1,4 @@
-from typing import Dict, Union
+from typing import Any, Dict, Union
 
 from weaviate.collections.classes.config import (
     _CollectionConfig,
@@ -20,22 +20,34 @@ class _CollectionsBase:
     def __init__(self, connection: ConnectionV4):
         self._connection = connection
 
+    def _invalidate_cache(self) -> None:
+        if (cache := self._connection._schema_cache) is not None:
+            cache.invalidate()
+
     async def _create(
         self,
         config: dict,
     ) -> str:
-        response = await self._connection.post(
-            path="/schema",
-            weaviate_object=config,
-            error_msg="Collection may not have been created properly.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="Create collection"),
-        )
+        try:
+            response = await self._connection.post(
+                path="/schema",
+                weaviate_object=config,
+                error_msg="Collection may not have been created properly.",
+                status_codes=_ExpectedStatusCodes(ok_in=200, error="Create collection"),
+            )
+        finally:
+            self._invalidate_cache()
 
         collection_name = response.json()["class"]
         assert isinstance(collection_name, str)
         return collection_name
 
     async def _exists(self, name: str) -> bool:
+        if (cache := self._connection._schema_cache) is not None:
+            cached, config = cache.get(name)
+            if cached:
+                return config is not None
+            generation = cache.generation
         path = f"/schema/{name}"
         response = await self._connection.get(
             path=path,
@@ -44,34 +56,63 @@ class _CollectionsBase:
         )
 
         if response.status_code == 200:
+            if cache is not None:
+                cache.put(
+                    name, _decode_json_response_dict(response, "collection exists"), generation
+                )
             return True
         else:
             assert response.status_code == 404
+            if cache is not None:
+                cache.put(name, None, generation)
             return False
 
     async def _export(self, name: str) -> _CollectionConfig:
+        if (cache := self._connection._schema_cache) is not None:
+            cached, config = cache.get(name)
+            if cached and config is not None:
+                return cache.parsed(name, False, config, _collection_config_from_json)
+            generation = cache.generation
         path = f"/schema/{name}"
         response = await self._connection.get(
             path=path, error_msg="Could not export collection config"
         )
         res = _decode_json_response_dict(response, "Get schema export")
         assert res is not None
+        if cache is not None:
+            cache.put(name, res, generation)
+            return cache.parsed(name, False, res, _collection_config_from_json)
         return _collection_config_from_json(res)
 
     async def _delete(self, name: str) -> None:
         path = f"/schema/{name}"
-        await self._connection.delete(
-            path=path,
-            error_msg="Collection may not have been deleted properly.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="Delete collection"),
-        )
+        try:
+            await self._connection.delete(
+                path=path,
+                error_msg="Collection may not have been deleted properly.",
+                status_codes=_ExpectedStatusCodes(ok_in=200, error="Delete collection"),
+            )
+        finally:
+            self._invalidate_cache()
 
     async def _get_all(
         self, simple: bool
     ) -> Union[Dict[str, CollectionConfig], Dict[str, CollectionConfigSimple]]:
+        def parse(
+            schema: Dict[str, Any]
+        ) -> Union[Dict[str, CollectionConfig], Dict[str, CollectionConfigSimple]]:
+            if simple:
+                return _collection_configs_simple_from_json(schema)
+            return _collection_configs_from_json(schema)
+
+        if (cache := self._connection._schema_cache) is not None:
+            if (schema := cache.get_schema()) is not None:
+                return cache.parsed(None, simple, schema, parse)
+            generation = cache.generation
         response = await self._connection.get(path="/schema", error_msg="Get all collections")
         res = _decode_json_response_dict(response, "Get schema all")
         assert res is not None
-        if simple:
-            return _collection_configs_simple_from_json(res)
-        return _collection_configs_from_json(res)
+        if cache is not None:
+            cache.put_schema(res, generation)
+            return cache.parsed(None, simple, res, parse)
+        return parse(res)
@@ -0,0 +1,97 @@
+import threading
+import time
+from copy import deepcopy
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from weaviate.util import _capitalize_first_letter
+
+T = TypeVar("T")
+
+
+class _SchemaCache:
+    """Caches the collection configurations of a connection for `ttl` seconds.
+
+    Both the raw JSON returned by Weaviate and the configuration objects parsed from it are cached, so that repeated
+    `config.get`, `collections.exists` or `collections.list_all` calls neither send a request nor parse the schema
+    again. The whole cache is cleared whenever the schema is changed through the client.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        # `None` if the collection is known not to exist
+        self.__collections: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self.__schema: Optional[Tuple[float, Dict[str, Any]]] = None
+        self.__parsed: Dict[Tuple[Optional[str], bool], Tuple[Dict[str, Any], Any]] = {}
+        # responses to requests sent before the last invalidation must not be cached
+        self.__generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    def get(self, name: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Return whether the collection is cached and its configuration, `None` if it does not exist."""
+        name = _capitalize_first_letter(name)
+        with self.__lock:
+            entry = self.__collections.get(name)
+            if entry is not None and entry[0] > time.monotonic():
+                return True, entry[1]
+            if self.__schema is not None and self.__schema[0] > time.monotonic():
+                return True, None  # all existing collections were added with the schema
+        return False, None
+
+    def put(self, name: str, config: Optional[Dict[str, Any]], generation: int) -> None:
+        with self.__lock:
+            if generation != self.__generation:
+                return
+            self.__collections[_capitalize_first_letter(name)] = (
+                time.monotonic() + self.__ttl,
+                config,
+            )
+
+    def get_schema(self) -> Optional[Dict[str, Any]]:
+        with self.__lock:
+            if self.__schema is not None and self.__schema[0] > time.monotonic():
+                return self.__schema[1]
+        return None
+
+    def put_schema(self, schema: Dict[str, Any], generation: int) -> None:
+        expires = time.monotonic() + self.__ttl
+        with self.__lock:
+            if generation != self.__generation:
+                return
+            self.__schema = (expires, schema)
+            for config in schema.get("classes") or []:
+                self.__collections[config["class"]] = (expires, config)
+
+    def parsed(
+        self,
+        name: Optional[str],
+        simple: bool,
+        data: Dict[str, Any],
+        parse: Callable[[Dict[str, Any]], T],
+    ) -> T:
+        """Return the configuration parsed from `data`, parsing it only once.
+
+        `name` is `None` for the whole schema. The parsers modify their input, so they are given a copy of the cached
+        JSON. The parsed configuration is shared by all callers without copying it, since copying it costs more than
+        parsing it again, so it must be treated as read-only.
+        """
+        key = (None if name is None else _capitalize_first_letter(name), simple)
+        with self.__lock:
+            entry = self.__parsed.get(key)
+            if entry is not None and entry[0] is data:
+                return entry[1]  # type: ignore[no-any-return]
+        result = parse(deepcopy(data))
+        with self.__lock:
+            self.__parsed[key] = (data, result)
+        return result
+
+    def invalidate(self) -> None:
+        """Clear the cache after the schema was changed."""
+        with self.__lock:
+            self.__generation += 1
+            self.__collections.clear()
+            self.__schema = None
+            self.__parsed.clear()
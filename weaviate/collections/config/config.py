@@ -25,6 +25,7 @@ from weaviate.collections.classes.config_methods import (
     _collection_config_from_json,
     _collection_config_simple_from_json,
 )
+from weaviate import json_codec
 from weaviate.connect import ConnectionV4
 from weaviate.validator import _validate_input, _ValidateArgument
 from weaviate.exceptions import (
@@ -47,13 +48,36 @@ class _ConfigCollectionBase:
 
 class _ConfigCollectionAsync(_ConfigCollectionBase):
     async def __get(self) -> Dict[str, Any]:
+        if (cache := self._connection._schema_cache) is not None:
+            cached, config = cache.get(self._name)
+            if cached and config is not None:
+                return config
+            generation = cache.generation
         response = await self._connection.get(
             path=f"/schema/{self._name}",
             error_msg="Collection configuration could not be retrieved.",
             status_codes=_ExpectedStatusCodes(ok_in=200, error="Get collection configuration"),
         )
-        data = response.json()
-        return cast(Dict[str, Any], data)
+        data = cast(Dict[str, Any], json_codec.loads(response.content))
+        if cache is not None:
+            cache.put(self._name, data, generation)
+        return data
+
+    async def __get_parsed(self, simple: bool) -> Union[CollectionConfig, CollectionConfigSimple]:
+        data = await self.__get()
+
+        def parse(data: Dict[str, Any]) -> Union[CollectionConfig, CollectionConfigSimple]:
+            if simple:
+                return _collection_config_simple_from_json(data)
+            return _collection_config_from_json(data)
+
+        if (cache := self._connection._schema_cache) is not None:
+            return cache.parsed(self._name, simple, data, parse)
+        return parse(data)
+
+    def __invalidate_cache(self) -> None:
+        if (cache := self._connection._schema_cache) is not None:
+            cache.invalidate()
 
     @overload
     async def get(self, simple: Literal[False] = ...) -> CollectionConfig: ...
@@ -77,10 +101,7 @@ class _ConfigCollectionAsync(_ConfigCollectionBase):
                 If Weaviate reports a non-OK status.
         """
         _validate_input([_ValidateArgument(expected=[bool], name="simple", value=simple)])
-        if simple:
-            return _collection_config_simple_from_json(await self.__get())
-        conf = _collection_config_from_json(await self.__get())
-        return conf
+        return await self.__get_parsed(simple)
 
     async def update(
         self,
@@ -150,27 +171,36 @@ class _ConfigCollectionAsync(_ConfigCollectionBase):
             )
         except ValidationError as e:
             raise WeaviateInvalidInputError("Invalid collection config update parameters.") from e
-        schema = await self.__get()
-        schema = config.merge_with_existing(schema)
-        await self._connection.put(
-            path=f"/schema/{self._name}",
-            weaviate_object=schema,
-            error_msg="Collection configuration may not have been updated.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="Update collection configuration"),
-        )
+        self.__invalidate_cache()  # the update is merged with the current configuration
+        try:
+            schema = await self.__get()
+            schema = config.merge_with_existing(schema)
+            await self._connection.put(
+                path=f"/schema/{self._name}",
+                weaviate_object=schema,
+                error_msg="Collection configuration may not have been updated.",
+                status_codes=_ExpectedStatusCodes(
+                    ok_in=200, error="Update collection configuration"
+                ),
+            )
+        finally:
+            self.__invalidate_cache()
 
     async def _add_property(self, additional_property: PropertyType) -> None:
         path = f"/schema/{self._name}/properties"
         obj = additional_property._to_dict()
-        await self._connection.post(
-            path=path,
-            weaviate_object=obj,
-            error_msg="Property may not have been added properly.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="Add property to collection"),
-        )
+        try:
+            await self._connection.post(
+                path=path,
+                weaviate_object=obj,
+                error_msg="Property may not have been added properly.",
+                status_codes=_ExpectedStatusCodes(ok_in=200, error="Add property to collection"),
+            )
+        finally:
+            self.__invalidate_cache()
 
     async def _property_exists(self, property_name: str) -> bool:
-        conf = _collection_config_simple_from_json(await self.__get())
+        conf = cast(CollectionConfigSimple, await self.__get_parsed(simple=True))
         if len(conf.properties) == 0:
             return False
         for prop in conf.properties:
@@ -179,7 +209,7 @@ class _ConfigCollectionAsync(_ConfigCollectionBase):
         return False
 
     async def _reference_exists(self, reference_name: str) -> bool:
-        conf = _collection_config_simple_from_json(await self.__get())
+        conf = cast(CollectionConfigSimple, await self.__get_parsed(simple=True))
         if len(conf.references) == 0:
             return False
         for ref in conf.references:
@@ -1,7 +1,9 @@
 import asyncio
 import datetime
+import time
 import uuid as uuid_package
 from typing import (
+    Callable,
     Dict,
     Any,
     Optional,
@@ -9,6 +11,7 @@ from typing import (
     Literal,
     Mapping,
     Sequence,
+    Set,
     Generic,
     Tuple,
     Type,
@@ -17,8 +20,10 @@ from typing import (
     overload,
 )
 
+from weaviate import syncify
 from weaviate.collections.classes.batch import (
     DeleteManyObject,
+    ErrorObject,
     _BatchObject,
     _BatchReference,
     BatchObjectReturn,
@@ -28,6 +33,7 @@ from weaviate.collections.classes.batch import (
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.data import DataObject, DataReferences
 from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import _MetadataQuery
 from weaviate.collections.classes.internal import (
     _Reference,
     ReferenceToMulti,
@@ -52,9 +58,13 @@ from weaviate.util import _datetime_to_string, _get_vector_v4
 from weaviate.validator import _validate_input, _ValidateArgument
 
 from weaviate.collections.batch.grpc_batch_delete import _BatchDeleteGRPC
+from weaviate.collections.grpc.query import _QueryGRPC
 from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
 from weaviate.collections.batch.rest import _BatchREST
-from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.exceptions import WeaviateBaseError, WeaviateInvalidInputError
+
+UPDATE_MANY_MAX_CONCURRENCY = 20  # the default size of the connection pool
+REPLACE_MANY_CHUNK_SIZE = 1000  # objects sent per gRPC batch
 
 
 class _DataBase:
@@ -73,6 +83,14 @@ class _DataBase:
         self._validate_arguments = validate_arguments
         self._batch_grpc = _BatchGRPC(connection, consistency_level)
         self._batch_delete_grpc = _BatchDeleteGRPC(connection, consistency_level)
+        self._query_grpc = _QueryGRPC(
+            connection,
+            name,
+            tenant,
+            consistency_level,
+            validate_arguments=False,
+            uses_125_api=connection._weaviate_version.is_at_least(1, 25, 0),
+        )
         self._batch_rest = _BatchREST(connection, consistency_level)
 
 
@@ -339,6 +357,7 @@ class _DataCollectionAsync(Generic[Properties], _Data):
 
         return await self._insert(weaviate_obj)
 
+    @syncify.grpc_only
     async def insert_many(
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
@@ -359,6 +378,13 @@ class _DataCollectionAsync(Generic[Properties], _Data):
             `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
                 If every object in the batch fails to be inserted. The exception message contains details about the failure.
         """
+        return await self._insert_many(objects)
+
+    async def _insert_many(
+        self,
+        objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+        index_offset: int = 0,
+    ) -> BatchObjectReturn:
         objs = [
             (
                 _BatchObject(
@@ -368,7 +394,7 @@ class _DataCollectionAsync(Generic[Properties], _Data):
                     properties=cast(dict, obj.properties),
                     tenant=self._tenant,
                     references=obj.references,
-                    index=idx,
+                    index=index_offset + idx,
                 )
                 if isinstance(obj, DataObject)
                 else _BatchObject(
@@ -378,7 +404,7 @@ class _DataCollectionAsync(Generic[Properties], _Data):
                     properties=cast(dict, obj),
                     tenant=self._tenant,
                     references=None,
-                    index=idx,
+                    index=index_offset + idx,
                 )
             )
             for idx, obj in enumerate(objects)
@@ -486,13 +512,165 @@ class _DataCollectionAsync(Generic[Properties], _Data):
                     ),
                 ],
             )
+        await self._update(self.__to_update_object(properties, references, vector), uuid=uuid)
+
+    def __to_update_object(
+        self,
+        properties: Optional[Properties],
+        references: Optional[ReferenceInputs],
+        vector: Optional[VECTORS],
+    ) -> Dict[str, Any]:
         props = self._serialize_props(properties) if properties is not None else {}
         refs = self._serialize_refs(references) if references is not None else {}
         weaviate_obj: Dict[str, Any] = {"class": self.name, "properties": {**props, **refs}}
         if vector is not None:
             weaviate_obj = self.__parse_vector(weaviate_obj, vector)
+        return weaviate_obj
+
+    async def update_many(
+        self,
+        objects: Sequence[DataObject[Optional[Properties], Optional[ReferenceInputs]]],
+        *,
+        max_concurrency: int = UPDATE_MANY_MAX_CONCURRENCY,
+    ) -> BatchObjectReturn:
+        """Update multiple objects in the collection.
+
+        Every object is updated with its own PATCH request, as with `update`, but the requests are sent concurrently
+        over the connection pool. The update of one object failing does not stop the others.
+
+        Arguments:
+            `objects`
+                The objects to update. The `uuid` of every object is REQUIRED, all other fields are optional and only
+                the given properties, references and vectors are updated.
+            `max_concurrency`
+                The maximum number of requests sent at the same time.
+
+        Returns:
+            A `BatchObjectReturn` with the UUIDs of the updated objects and the errors of the failed updates, both keyed
+            by the index of the object in `objects`.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If any of the arguments are invalid.
+        """
+        self.__validate_objects_with_uuids(objects)
+        _validate_input(
+            _ValidateArgument(expected=[int], name="max_concurrency", value=max_concurrency)
+        )
+        if max_concurrency < 1:
+            raise WeaviateInvalidInputError(
+                f"max_concurrency must be at least 1, but was {max_concurrency}"
+            )
+
+        start = time.time()
+        results: List[Optional[str]] = [None] * len(objects)
+        pending = iter(enumerate(objects))
+
+        async def worker() -> None:
+            # a fixed number of workers share the iterator, so no coroutine is created per object
+            for idx, obj in pending:
+                assert obj.uuid is not None
+                try:
+                    await self._update(
+                        self.__to_update_object(obj.properties, obj.references, obj.vector),
+                        uuid=obj.uuid,
+                    )
+                except WeaviateBaseError as e:
+                    results[idx] = str(e)
+
+        await asyncio.gather(*[worker() for _ in range(min(max_concurrency, len(objects)))])
+
+        ret = BatchObjectReturn()
+        for idx, (obj, error) in enumerate(zip(objects, results)):
+            assert obj.uuid is not None
+            if error is None:
+                ret.uuids[idx] = uuid_package.UUID(str(obj.uuid))
+                ret._all_responses.append(ret.uuids[idx])
+                continue
+            ret.errors[idx] = ErrorObject(
+                message=error,
+                object_=_BatchObject(
+                    collection=self.name,
+                    vector=obj.vector,
+                    uuid=str(obj.uuid),
+                    properties=cast(Optional[dict], obj.properties),
+                    tenant=self._tenant,
+                    references=obj.references,
+                    index=idx,
+                ),
+                original_uuid=obj.uuid,
+            )
+            ret._all_responses.append(ret.errors[idx])
+        ret.has_errors = len(ret.errors) > 0
+        ret.elapsed_seconds = time.time() - start
+        if ret.has_errors:
+            logger.error(
+                {
+                    "message": f"Failed to update {len(ret.errors)} of {len(objects)} objects. Please inspect the errors variable of the returned object for more information.",
+                    "errors": ret.errors,
+                }
+            )
+        return ret
+
+    async def replace_many(
+        self,
+        objects: Sequence[DataObject[Properties, Optional[ReferenceInputs]]],
+        *,
+        chunk_size: int = REPLACE_MANY_CHUNK_SIZE,
+    ) -> BatchObjectReturn:
+        """Replace multiple objects in the collection.
+
+        The objects are sent with gRPC batches of `chunk_size` objects, one after the other, as with `insert_many`.
+        The batches have upsert semantics: an existing object is replaced entirely by the given one and an object that
+        does not exist yet is created.
 
-        await self._update(weaviate_obj, uuid=uuid)
+        Arguments:
+            `objects`
+                The full objects to replace the existing ones with. The `uuid` of every object is REQUIRED.
+            `chunk_size`
+                The maximum number of objects sent in a single batch.
+
+        Returns:
+            A `BatchObjectReturn` with the UUIDs of the replaced objects and the errors of the failed ones, both keyed
+            by the index of the object in `objects`.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If any object has no `uuid`.
+            `weaviate.exceptions.WeaviateGRPCBatchError`:
+                If any unexpected error occurs during the batch operation.
+            `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
+                If a property is invalid. I.e., has name `id` or `vector`, which are reserved.
+            `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
+                If every object in a batch fails to be replaced. The objects of the previous batches are replaced
+                nonetheless. The exception message contains details about the failure.
+        """
+        self.__validate_objects_with_uuids(objects)
+        _validate_input(_ValidateArgument(expected=[int], name="chunk_size", value=chunk_size))
+        if chunk_size < 1:
+            raise WeaviateInvalidInputError(f"chunk_size must be at least 1, but was {chunk_size}")
+
+        ret = BatchObjectReturn()
+        for i in range(0, len(objects), chunk_size):
+            res = await self._insert_many(objects[i : i + chunk_size], index_offset=i)
+            ret.uuids.update(res.uuids)
+            ret.errors.update(res.errors)
+            ret._all_responses.extend(res._all_responses)
+            ret.elapsed_seconds += res.elapsed_seconds
+        ret.has_errors = len(ret.errors) > 0
+        return ret
+
+    @staticmethod
+    def __validate_objects_with_uuids(objects: Sequence[DataObject[Any, Any]]) -> None:
+        _validate_input(
+            _ValidateArgument(expected=[Sequence[DataObject]], name="objects", value=objects)
+        )
+        if (
+            missing := next((i for i, obj in enumerate(objects) if obj.uuid is None), None)
+        ) is not None:
+            raise WeaviateInvalidInputError(
+                f"Every object needs a uuid to be updated or replaced, but the object at index {missing} has none"
+            )
 
     async def reference_add(
         self, from_uuid: UUID, from_property: str, to: SingleReferenceInput
@@ -631,6 +809,33 @@ class _DataCollectionAsync(Generic[Properties], _Data):
         _validate_input(_ValidateArgument(expected=[UUID], name="uuid", value=uuid))
         return await self._exists(str(uuid))
 
+    async def exists_many(self, uuids: Sequence[UUID]) -> Set[uuid_package.UUID]:
+        """Check for existence of many objects in the collection at once.
+
+        The UUIDs are looked up with concurrent gRPC searches of up to 1000 UUIDs each (`BY_IDS_CHUNK_SIZE`), instead of
+        one request per object as with `exists`.
+
+        Arguments:
+            `uuids`
+                The UUIDs of the objects.
+
+        Returns:
+            The UUIDs of the objects that exist.
+
+        Raises:
+            `weaviate.exceptions.WeaviateQueryError`:
+                If the network connection to Weaviate fails.
+        """
+        _validate_input(_ValidateArgument(expected=[Sequence[UUID]], name="uuids", value=uuids))
+        replies = await self._query_grpc.get_by_ids(
+            uuids, return_metadata=_MetadataQuery(vector=False), return_properties=[]
+        )
+        return {
+            uuid_package.UUID(bytes=result.metadata.id_as_bytes)
+            for reply in replies
+            for result in reply.results
+        }
+
     async def delete_by_id(self, uuid: UUID) -> bool:
         """Delete an object from the collection based on its UUID.
 
@@ -654,31 +859,74 @@ class _DataCollectionAsync(Generic[Properties], _Data):
 
     @overload
     async def delete_many(
-        self, where: _Filters, verbose: Literal[False] = ..., *, dry_run: bool = False
+        self,
+        where: _Filters,
+        verbose: Literal[False] = ...,
+        *,
+        dry_run: bool = False,
+        until_done: bool = False,
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
     ) -> DeleteManyReturn[None]: ...
 
     @overload
     async def delete_many(
-        self, where: _Filters, verbose: Literal[True], *, dry_run: bool = False
+        self,
+        where: _Filters,
+        verbose: Literal[True],
+        *,
+        dry_run: bool = False,
+        until_done: Literal[False] = ...,
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
     ) -> DeleteManyReturn[List[DeleteManyObject]]: ...
 
     @overload
     async def delete_many(
-        self, where: _Filters, verbose: bool = ..., *, dry_run: bool = False
+        self,
+        where: _Filters,
+        verbose: Literal[True],
+        *,
+        dry_run: bool = False,
+        until_done: Literal[True],
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
+    ) -> DeleteManyReturn[None]: ...
+
+    @overload
+    async def delete_many(
+        self,
+        where: _Filters,
+        verbose: bool = ...,
+        *,
+        dry_run: bool = False,
+        until_done: bool = False,
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]: ...
 
+    @syncify.grpc_only
     async def delete_many(
-        self, where: _Filters, verbose: bool = False, *, dry_run: bool = False
+        self,
+        where: _Filters,
+        verbose: bool = False,
+        *,
+        dry_run: bool = False,
+        until_done: bool = False,
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]:
         """Delete multiple objects from the collection based on a filter.
 
+        Weaviate deletes at most `QUERY_MAXIMUM_RESULTS` objects per request. Use `until_done` to delete all objects
+        that match the filter, no matter how many there are.
+
         Arguments:
             `where`
                 The filter to apply. This filter is the same that is used when performing queries and has the same syntax, REQUIRED.
             `verbose`
-                Whether to return the deleted objects in the response.
+                Whether to return the deleted objects in the response. If `until_done` is set, the deleted objects are only passed to `on_progress`, one request at a time, instead of being returned.
             `dry_run`
                 Whether to perform a dry run. If set to `True`, the objects will not be deleted, but the response will contain the objects that would have been deleted.
+            `until_done`
+                Whether to repeat the deletion until no objects match the filter anymore. The deletion also stops once a request deleted none of its matches, e.g. because all of them failed, and after a single request for a dry run. The returned counts are the sums over all requests.
+            `on_progress`
+                A function called with the result of every request, e.g. to report the progress of a large deletion.
 
         Raises:
             `weaviate.WeaviateConnectionError`:
@@ -686,7 +934,29 @@ class _DataCollectionAsync(Generic[Properties], _Data):
             `weaviate.UnexpectedStatusCodeError`:
                 If Weaviate reports a non-OK status.
         """
-        _ValidateArgument(expected=[_Filters], name="where", value=where)
-        return await self._batch_delete_grpc.batch_delete(
-            self.name, where, verbose, dry_run, self._tenant
+        _validate_input(
+            [
+                _ValidateArgument(expected=[_Filters], name="where", value=where),
+                _ValidateArgument(expected=[bool], name="until_done", value=until_done),
+            ]
         )
+        if not until_done:
+            res = await self._batch_delete_grpc.batch_delete(
+                self.name, where, verbose, dry_run, self._tenant
+            )
+            if on_progress is not None:
+                on_progress(res)
+            return res
+
+        total = DeleteManyReturn(failed=0, matches=0, objects=None, successful=0)
+        while True:
+            res = await self._batch_delete_grpc.batch_delete(
+                self.name, where, verbose, dry_run, self._tenant
+            )
+            total.failed += res.failed
+            total.matches += res.matches
+            total.successful += res.successful
+            if on_progress is not None:
+                on_progress(res)
+            if dry_run or res.matches == 0 or res.successful == 0:
+                return total
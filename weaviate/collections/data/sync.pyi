@@ -1,9 +1,12 @@
 import uuid as uuid_package
 from typing import (
+    Any,
+    Callable,
     Optional,
     List,
     Literal,
     Sequence,
+    Set,
     Generic,
     Type,
     Union,
@@ -27,7 +30,11 @@ from weaviate.collections.classes.internal import (
 from weaviate.collections.classes.types import (
     Properties,
 )
-from weaviate.collections.data.data import _DataBase
+from weaviate.collections.data.data import (
+    REPLACE_MANY_CHUNK_SIZE,
+    UPDATE_MANY_MAX_CONCURRENCY,
+    _DataBase,
+)
 from weaviate.types import UUID, VECTORS
 
 class _DataCollection(Generic[Properties], _DataBase):
@@ -57,6 +64,18 @@ class _DataCollection(Generic[Properties], _DataBase):
         references: Optional[ReferenceInputs] = None,
         vector: Optional[VECTORS] = None,
     ) -> None: ...
+    def update_many(
+        self,
+        objects: Sequence[DataObject[Optional[Properties], Optional[ReferenceInputs]]],
+        *,
+        max_concurrency: int = UPDATE_MANY_MAX_CONCURRENCY,
+    ) -> BatchObjectReturn: ...
+    def replace_many(
+        self,
+        objects: Sequence[DataObject[Properties, Optional[ReferenceInputs]]],
+        *,
+        chunk_size: int = REPLACE_MANY_CHUNK_SIZE,
+    ) -> BatchObjectReturn: ...
     def reference_add(
         self, from_uuid: UUID, from_property: str, to: SingleReferenceInput
     ) -> None: ...
@@ -68,16 +87,45 @@ class _DataCollection(Generic[Properties], _DataBase):
         self, from_uuid: UUID, from_property: str, to: ReferenceInput
     ) -> None: ...
     def exists(self, uuid: UUID) -> bool: ...
+    def exists_many(self, uuids: Sequence[UUID]) -> Set[uuid_package.UUID]: ...
     def delete_by_id(self, uuid: UUID) -> bool: ...
     @overload
     def delete_many(
-        self, where: _Filters, verbose: Literal[False] = ..., *, dry_run: bool = False
+        self,
+        where: _Filters,
+        verbose: Literal[False] = ...,
+        *,
+        dry_run: bool = False,
+        until_done: bool = False,
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
     ) -> DeleteManyReturn[None]: ...
     @overload
     def delete_many(
-        self, where: _Filters, verbose: Literal[True], *, dry_run: bool = False
+        self,
+        where: _Filters,
+        verbose: Literal[True],
+        *,
+        dry_run: bool = False,
+        until_done: Literal[False] = ...,
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
     ) -> DeleteManyReturn[List[DeleteManyObject]]: ...
     @overload
     def delete_many(
-        self, where: _Filters, verbose: bool = ..., *, dry_run: bool = False
+        self,
+        where: _Filters,
+        verbose: Literal[True],
+        *,
+        dry_run: bool = False,
+        until_done: Literal[True],
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
+    ) -> DeleteManyReturn[None]: ...
+    @overload
+    def delete_many(
+        self,
+        where: _Filters,
+        verbose: bool = ...,
+        *,
+        dry_run: bool = False,
+        until_done: bool = False,
+        on_progress: Optional[Callable[[DeleteManyReturn[Any]], None]] = None,
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]: ...
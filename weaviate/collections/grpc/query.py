@@ -1,4 +1,6 @@
+import asyncio
 import struct
+import time
 import uuid as uuid_lib
 from dataclasses import dataclass
 from typing import (
@@ -19,10 +21,10 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
-from grpc.aio import AioRpcError  # type: ignore
+from grpc import RpcError  # type: ignore
 
 from weaviate.collections.classes.config import ConsistencyLevel
-from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.filters import Filter, _Filters
 from weaviate.collections.classes.grpc import (
     _MultiTargetVectorJoin,
     HybridFusion,
@@ -85,6 +87,9 @@ class _Move:
 
 A = TypeVar("A")
 
+BY_IDS_CHUNK_SIZE = 1000  # UUIDs looked up per Search request
+BY_IDS_MAX_CONCURRENCY = 8  # Search requests in flight per lookup
+
 
 class _QueryGRPC(_BaseGRPC):
     def __init__(
@@ -158,6 +163,38 @@ class _QueryGRPC(_BaseGRPC):
 
         return self.__call(request)
 
+    async def get_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        return_metadata: Optional[_MetadataQuery] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Optional[REFERENCES] = None,
+    ) -> List[search_get_pb2.SearchReply]:
+        """Fetch the objects with the given UUIDs.
+
+        The UUIDs are looked up `BY_IDS_CHUNK_SIZE` at a time with a `contains_any` filter, sending at most
+        `BY_IDS_MAX_CONCURRENCY` requests at the same time.
+        """
+        unique = list(dict.fromkeys(str(uuid) for uuid in uuids))
+        semaphore = asyncio.Semaphore(BY_IDS_MAX_CONCURRENCY)
+
+        async def get(chunk: List[UUID]) -> search_get_pb2.SearchReply:
+            async with semaphore:
+                return await self.get(
+                    limit=len(chunk),
+                    filters=Filter.by_id().contains_any(chunk),
+                    return_metadata=return_metadata,
+                    return_properties=return_properties,
+                    return_references=return_references,
+                )
+
+        return await asyncio.gather(
+            *[
+                get(list(unique[i : i + BY_IDS_CHUNK_SIZE]))
+                for i in range(0, len(unique), BY_IDS_CHUNK_SIZE)
+            ]
+        )
+
     def hybrid(
         self,
         query: Optional[str],
@@ -757,16 +794,34 @@ class _QueryGRPC(_BaseGRPC):
         )
 
     async def __call(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
-        try:
-            assert self._connection.grpc_stub is not None
-            res = await self._connection.grpc_stub.Search(
-                request,
-                metadata=self._connection.grpc_headers(),
-                timeout=self._connection.timeout_config.query,
-            )
+        if (activation := self._connection._tenant_activation) is not None and request.tenant:
+            await activation.activate(request.collection, [request.tenant])
+        start = time.perf_counter()
+        with self._connection._grpc_span("Search", request.collection):
+            try:
+                if (stub := self._connection.grpc_stub_sync) is not None:
+                    res = stub.Search(
+                        request,
+                        metadata=self._connection.grpc_headers(),
+                        timeout=self._connection.timeout_config.query,
+                    )
+                else:
+                    assert self._connection.grpc_stub is not None
+                    res = await self._connection.grpc_stub.Search(
+                        request,
+                        metadata=self._connection.grpc_headers(),
+                        timeout=self._connection.timeout_config.query,
+                    )
+            except RpcError as e:
+                self._connection._record_grpc_request(
+                    "Search", request.collection, start, request, None, e
+                )
+                if activation is not None and request.tenant:
+                    # the tenant might have been deactivated in the meantime
+                    activation.invalidate(request.collection, request.tenant)
+                raise WeaviateQueryError(str(e), "GRPC search")  # pyright: ignore
+            self._connection._record_grpc_request("Search", request.collection, start, request, res)
             return cast(search_get_pb2.SearchReply, res)
-        except AioRpcError as e:
-            raise WeaviateQueryError(str(e), "GRPC search")  # pyright: ignore
 
     def _metadata_to_grpc(self, metadata: _MetadataQuery) -> search_get_pb2.MetadataRequest:
         return search_get_pb2.MetadataRequest(
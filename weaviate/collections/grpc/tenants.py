@@ -1,3 +1,4 @@
+import time
 from typing import Optional, Sequence, cast
 
 from weaviate.collections.classes.config import ConsistencyLevel
@@ -18,17 +19,32 @@ class _TenantsGRPC(_BaseGRPC):
         self._name: str = name
 
     async def get(self, names: Optional[Sequence[str]]) -> tenants_pb2.TenantsGetReply:
-        assert self._connection.grpc_stub is not None, "gRPC stub is not initialized"
-
         request = tenants_pb2.TenantsGetRequest(
             collection=self._name,
             names=tenants_pb2.TenantNames(values=names) if names is not None else None,
         )
-        res = await self._connection.grpc_stub.TenantsGet(
-            request,
-            metadata=self._connection.grpc_headers(),
-            timeout=self._connection.timeout_config.query,
-        )
+        start = time.perf_counter()
+        with self._connection._grpc_span("TenantsGet", self._name):
+            try:
+                if (stub := self._connection.grpc_stub_sync) is not None:
+                    res = stub.TenantsGet(
+                        request,
+                        metadata=self._connection.grpc_headers(),
+                        timeout=self._connection.timeout_config.query,
+                    )
+                else:
+                    assert self._connection.grpc_stub is not None, "gRPC stub is not initialized"
+                    res = await self._connection.grpc_stub.TenantsGet(
+                        request,
+                        metadata=self._connection.grpc_headers(),
+                        timeout=self._connection.timeout_config.query,
+                    )
+            except Exception as e:
+                self._connection._record_grpc_request(
+                    "TenantsGet", self._name, start, request, None, e
+                )
+                raise
+            self._connection._record_grpc_request("TenantsGet", self._name, start, request, res)
         return cast(tenants_pb2.TenantsGetReply, res)
 
     def map_activity_status(self, status: tenants_pb2.TenantActivityStatus) -> TenantActivityStatus:
@@ -1,7 +1,4 @@
 import datetime
-import io
-import os
-import pathlib
 import uuid as uuid_lib
 from typing import Any, Dict, Generic, List, Optional, Sequence, Type, Union, cast
 
@@ -53,10 +50,10 @@ from weaviate.collections.queries.byteops import _ByteOps
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.proto.v1 import search_get_pb2, properties_pb2
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import BLOB_INPUT, INCLUDE_VECTOR
 from weaviate.util import (
-    file_encoder_b64,
     _datetime_from_weaviate_str,
+    _parse_media,
 )
 from weaviate.validator import _validate_input, _ValidateArgument
 from weaviate.warnings import _Warnings
@@ -615,15 +612,10 @@ class _Base(Generic[Properties, References]):
             return _extract_references_from_data_model(return_references)
 
     @staticmethod
-    def _parse_media(media: Union[str, pathlib.Path, io.BufferedReader]) -> str:
-        if isinstance(media, str):  # if already encoded by user or string to path
-            if os.path.isfile(media):
-                return file_encoder_b64(media)
-            else:
-                return media
-        elif isinstance(media, pathlib.Path) or isinstance(media, io.BufferedReader):
-            return file_encoder_b64(media)
-        else:
+    def _parse_media(media: BLOB_INPUT) -> str:
+        try:
+            return _parse_media(media)
+        except TypeError:
             raise WeaviateInvalidInputError(
-                f"media must be a string, pathlib.Path, or io.BufferedReader but is {type(media)}"
+                f"media must be a string, pathlib.Path, io.BufferedReader or bytes but is {type(media)}"
             )
@@ -19,6 +19,7 @@ from weaviate.types import INCLUDE_VECTOR
 
 
 class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def bm25(
         self,
         query: Optional[str],
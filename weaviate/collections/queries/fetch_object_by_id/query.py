@@ -23,6 +23,7 @@ from weaviate.types import INCLUDE_VECTOR, UUID
 
 
 class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def fetch_object_by_id(
         self,
         uuid: UUID,
@@ -16,6 +16,7 @@ from weaviate.types import UUID, INCLUDE_VECTOR
 
 
 class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def fetch_objects(
         self,
         *,
@@ -15,6 +15,7 @@ from weaviate.types import UUID, INCLUDE_VECTOR
 
 
 class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def fetch_objects(
         self,
         *,
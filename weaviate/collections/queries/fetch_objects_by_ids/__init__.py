@@ -0,0 +1,6 @@
+from .query import _FetchObjectsByIDsQueryAsync, _FetchObjectsByIDsQuery
+
+__all__ = [
+    "_FetchObjectsByIDsQuery",
+    "_FetchObjectsByIDsQueryAsync",
+]
@@ -0,0 +1,115 @@
+import uuid as uuid_package
+from typing import (
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    cast,
+)
+
+from weaviate import syncify
+from weaviate.collections.classes.grpc import MetadataQuery
+from weaviate.collections.classes.internal import (
+    ObjectSingleReturn,
+    MetadataSingleObjectReturn,
+    QuerySingleReturn,
+    ReturnProperties,
+    ReturnReferences,
+    _QueryOptions,
+)
+from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
+from weaviate.collections.queries.base import _Base
+from weaviate.types import INCLUDE_VECTOR, UUID
+from weaviate.validator import _ValidateArgument, _validate_input
+
+
+class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+    ) -> Dict[
+        uuid_package.UUID, QuerySingleReturn[Properties, References, TProperties, TReferences]
+    ]:
+        """Retrieve many objects from the server by their UUIDs at once.
+
+        The UUIDs are looked up with concurrent searches of up to 1000 UUIDs each (`BY_IDS_CHUNK_SIZE`), instead of one
+        request per object as with `fetch_object_by_id`.
+
+        Arguments:
+            `uuids`
+                The UUIDs of the objects to retrieve, REQUIRED.
+            `include_vector`
+                Whether to include the vector in the returned objects.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+
+        Returns:
+            A dictionary of the objects that exist, keyed by their UUID.
+
+        NOTE:
+            - If `return_properties` is not provided then all properties are returned except for blob properties.
+            - If `return_references` is not provided then no references are provided.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the network connection to Weaviate fails.
+        """
+        if self._validate_arguments:
+            _validate_input(_ValidateArgument(expected=[Sequence[UUID]], name="uuids", value=uuids))
+        return_metadata = MetadataQuery(
+            creation_time=True, last_update_time=True, is_consistent=True
+        )
+        replies = await self._query.get_by_ids(
+            uuids,
+            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_properties=self._parse_return_properties(return_properties),
+            return_references=self._parse_return_references(return_references),
+        )
+        options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+        )
+
+        objects: Dict[uuid_package.UUID, ObjectSingleReturn] = {}
+        for reply in replies:
+            for obj in self._result_to_query_return(
+                reply, options, return_properties, None
+            ).objects:
+                assert obj.metadata is not None
+                assert obj.metadata.creation_time is not None
+                assert obj.metadata.last_update_time is not None
+                objects[obj.uuid] = ObjectSingleReturn(
+                    uuid=obj.uuid,
+                    vector=obj.vector,
+                    properties=obj.properties,
+                    metadata=MetadataSingleObjectReturn(
+                        creation_time=obj.metadata.creation_time,
+                        last_update_time=obj.metadata.last_update_time,
+                        is_consistent=obj.metadata.is_consistent,
+                    ),
+                    references=obj.references,
+                    collection=obj.collection,
+                )
+        return cast(
+            Dict[
+                uuid_package.UUID,
+                QuerySingleReturn[Properties, References, TProperties, TReferences],
+            ],
+            objects,
+        )
+
+
+@syncify.convert
+class _FetchObjectsByIDsQuery(
+    Generic[Properties, References], _FetchObjectsByIDsQueryAsync[Properties, References]
+):
+    pass
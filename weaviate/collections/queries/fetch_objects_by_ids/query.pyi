@@ -0,0 +1,156 @@
+import uuid as uuid_package
+from typing import (
+    Dict,
+    Generic,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    overload,
+)
+
+from weaviate.collections.classes.grpc import PROPERTIES, REFERENCES
+from weaviate.collections.classes.internal import (
+    ObjectSingleReturn,
+    CrossReferences,
+    ReturnProperties,
+    ReturnReferences,
+    QuerySingleReturn,
+)
+from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
+from weaviate.collections.queries.base import _Base
+from weaviate.types import INCLUDE_VECTOR, UUID
+
+class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[Properties, References]]: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[Properties, CrossReferences]]: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[Properties, TReferences]]: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[TProperties, References]]: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[TProperties, CrossReferences]]: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[TProperties, TReferences]]: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+    ) -> Dict[
+        uuid_package.UUID, QuerySingleReturn[Properties, References, TProperties, TReferences]
+    ]: ...
+
+class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties, References]):
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[Properties, References]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[Properties, CrossReferences]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[Properties, TReferences]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[TProperties, References]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[TProperties, CrossReferences]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+    ) -> Dict[uuid_package.UUID, ObjectSingleReturn[TProperties, TReferences]]: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        uuids: Sequence[UUID],
+        include_vector: INCLUDE_VECTOR = False,
+        *,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+    ) -> Dict[
+        uuid_package.UUID, QuerySingleReturn[Properties, References, TProperties, TReferences]
+    ]: ...
@@ -27,6 +27,7 @@ from weaviate.types import NUMBER, INCLUDE_VECTOR
 
 
 class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def hybrid(
         self,
         query: Optional[str],
@@ -27,6 +27,7 @@ from weaviate.types import NUMBER, INCLUDE_VECTOR
 
 
 class _HybridQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def hybrid(
         self,
         query: Optional[str],
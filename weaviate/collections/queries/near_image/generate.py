@@ -1,6 +1,4 @@
-from io import BufferedReader
-from pathlib import Path
-from typing import Generic, List, Optional, Union
+from typing import Generic, List, Optional
 
 from weaviate import syncify
 from weaviate.collections.classes.filters import (
@@ -17,13 +15,14 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
 
 class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -51,7 +50,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
 
         Arguments:
             `near_image`
-                The image file to search on, REQUIRED. This can be a base64 encoded string of the binary, a path to the file, or a file-like object.
+                The image file to search on, REQUIRED. This can be a base64 encoded string of the binary, a path to the file, a file-like object, or the binary content as `bytes`, `memoryview` or `mmap`.
             `certainty`
                 The minimum similarity score to return. If not specified, the default certainty specified by the server is used.
             `distance`
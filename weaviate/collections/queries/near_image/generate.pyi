@@ -1,6 +1,4 @@
-from io import BufferedReader
-from pathlib import Path
-from typing import Generic, List, Literal, Optional, Type, Union, overload
+from typing import Generic, List, Literal, Optional, Type, overload
 
 from weaviate.collections.classes.filters import (
     _Filters,
@@ -23,13 +21,13 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
 class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -51,7 +49,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -73,7 +71,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -95,7 +93,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -117,7 +115,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -139,7 +137,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -162,7 +160,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -184,7 +182,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -206,7 +204,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -228,7 +226,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -250,7 +248,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -272,7 +270,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -296,7 +294,7 @@ class _NearImageGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -320,7 +318,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -342,7 +340,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -364,7 +362,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -386,7 +384,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -408,7 +406,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -430,7 +428,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -453,7 +451,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -475,7 +473,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -497,7 +495,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -519,7 +517,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -541,7 +539,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -563,7 +561,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
@@ -586,7 +584,7 @@ class _NearImageGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_image(
         self,
-        near_image: Union[str, Path, BufferedReader],
+        near_image: BLOB_INPUT,
         *,
         single_prompt: Optional[str] = None,
         grouped_task: Optional[str] = None,
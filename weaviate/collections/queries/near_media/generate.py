@@ -1,6 +1,4 @@
-from io import BufferedReader
-from pathlib import Path
-from typing import Generic, List, Optional, Union
+from typing import Generic, List, Optional
 
 from weaviate import syncify
 from weaviate.collections.classes.filters import (
@@ -23,13 +21,14 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
 
 class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -58,7 +57,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
 
         Arguments:
             `near_media`
-                The media file to search on, REQUIRED. This can be a base64 encoded string of the binary, a path to the file, or a file-like object.
+                The media file to search on, REQUIRED. This can be a base64 encoded string of the binary, a path to the file, a file-like object, or the binary content as `bytes`, `memoryview` or `mmap`.
             `media_type`
                 The type of the provided media file, REQUIRED.
             `certainty`
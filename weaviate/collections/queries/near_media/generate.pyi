@@ -1,6 +1,4 @@
-from io import BufferedReader
-from pathlib import Path
-from typing import Generic, List, Literal, Optional, Type, Union, overload
+from typing import Generic, List, Literal, Optional, Type, overload
 
 from weaviate.collections.classes.filters import (
     _Filters,
@@ -24,13 +22,13 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
 class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -53,7 +51,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -76,7 +74,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -99,7 +97,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -122,7 +120,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -145,7 +143,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -169,7 +167,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -192,7 +190,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -215,7 +213,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -238,7 +236,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -261,7 +259,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -284,7 +282,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -309,7 +307,7 @@ class _NearMediaGenerateAsync(Generic[Properties, References], _Base[Properties,
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -334,7 +332,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -357,7 +355,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -380,7 +378,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -403,7 +401,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -426,7 +424,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -449,7 +447,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -473,7 +471,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -496,7 +494,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -519,7 +517,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -542,7 +540,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -565,7 +563,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -588,7 +586,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
@@ -613,7 +611,7 @@ class _NearMediaGenerate(Generic[Properties, References], _Base[Properties, Refe
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         single_prompt: Optional[str] = None,
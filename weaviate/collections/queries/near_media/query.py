@@ -1,6 +1,4 @@
-from io import BufferedReader
-from pathlib import Path
-from typing import Generic, Optional, Union
+from typing import Generic, Optional
 
 from weaviate import syncify
 from weaviate.collections.classes.filters import (
@@ -22,13 +20,14 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
 
 class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -54,7 +53,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
 
         Arguments:
             `media`
-                The media file to search on, REQUIRED. This can be a base64 encoded string of the binary, a path to the file, or a file-like object.
+                The media file to search on, REQUIRED. This can be a base64 encoded string of the binary, a path to the file, a file-like object, or the binary content as `bytes`, `memoryview` or `mmap`.
             `media_type`
                 The type of the provided media file, REQUIRED.
             `certainty`
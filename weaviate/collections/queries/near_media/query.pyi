@@ -1,6 +1,4 @@
-from io import BufferedReader
-from pathlib import Path
-from typing import Generic, Literal, Optional, Type, Union, overload
+from typing import Generic, Literal, Optional, Type, overload
 
 from weaviate.collections.classes.filters import (
     _Filters,
@@ -24,13 +22,13 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
 class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -50,7 +48,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -70,7 +68,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -90,7 +88,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -110,7 +108,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -130,7 +128,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -153,7 +151,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -173,7 +171,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -193,7 +191,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -213,7 +211,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -233,7 +231,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -253,7 +251,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -275,7 +273,7 @@ class _NearMediaQueryAsync(Generic[Properties, References], _Base[Properties, Re
     @overload
     async def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -297,7 +295,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -317,7 +315,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -337,7 +335,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -357,7 +355,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -377,7 +375,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -397,7 +395,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -420,7 +418,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -440,7 +438,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -460,7 +458,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -480,7 +478,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -500,7 +498,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -520,7 +518,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
@@ -542,7 +540,7 @@ class _NearMediaQuery(Generic[Properties, References], _Base[Properties, Referen
     @overload
     def near_media(
         self,
-        media: Union[str, Path, BufferedReader],
+        media: BLOB_INPUT,
         media_type: NearMediaType,
         *,
         certainty: Optional[NUMBER] = None,
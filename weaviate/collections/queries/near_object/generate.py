@@ -19,6 +19,7 @@ from weaviate.types import NUMBER, INCLUDE_VECTOR, UUID
 
 
 class _NearObjectGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def near_object(
         self,
         near_object: UUID,
@@ -18,6 +18,7 @@ from weaviate.types import NUMBER, INCLUDE_VECTOR, UUID
 
 
 class _NearObjectQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def near_object(
         self,
         near_object: UUID,
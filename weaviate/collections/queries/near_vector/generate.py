@@ -25,6 +25,7 @@ from weaviate.types import NUMBER, INCLUDE_VECTOR
 
 
 class _NearVectorGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def near_vector(
         self,
         near_vector: NearVectorInputType,
@@ -24,6 +24,7 @@ from weaviate.types import NUMBER, INCLUDE_VECTOR
 
 
 class _NearVectorQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @syncify.grpc_only
     async def near_vector(
         self,
         near_vector: NearVectorInputType,
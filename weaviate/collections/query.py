@@ -8,6 +8,10 @@ from weaviate.collections.queries.fetch_object_by_id import (
     _FetchObjectByIDQuery,
 )
 from weaviate.collections.queries.fetch_objects import _FetchObjectsQueryAsync, _FetchObjectsQuery
+from weaviate.collections.queries.fetch_objects_by_ids import (
+    _FetchObjectsByIDsQueryAsync,
+    _FetchObjectsByIDsQuery,
+)
 from weaviate.collections.queries.hybrid import _HybridQueryAsync, _HybridQuery
 from weaviate.collections.queries.near_image import _NearImageQueryAsync, _NearImageQuery
 from weaviate.collections.queries.near_media import _NearMediaQueryAsync, _NearMediaQuery
@@ -21,6 +25,7 @@ class _QueryCollectionAsync(
     _BM25QueryAsync[TProperties, References],
     _FetchObjectByIDQueryAsync[TProperties, References],
     _FetchObjectsQueryAsync[TProperties, References],
+    _FetchObjectsByIDsQueryAsync[TProperties, References],
     _HybridQueryAsync[TProperties, References],
     _NearImageQueryAsync[TProperties, References],
     _NearMediaQueryAsync[TProperties, References],
@@ -36,6 +41,7 @@ class _QueryCollection(
     _BM25Query[TProperties, References],
     _FetchObjectByIDQuery[TProperties, References],
     _FetchObjectsQuery[TProperties, References],
+    _FetchObjectsByIDsQuery[TProperties, References],
     _HybridQuery[TProperties, References],
     _NearImageQuery[TProperties, References],
     _NearMediaQuery[TProperties, References],
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from weaviate.collections.classes.tenants import (
+    TenantActivityStatus,
+    TenantUpdate,
+    TenantUpdateActivityStatus,
+)
+from weaviate.collections.grpc.tenants import _TenantsGRPC
+from weaviate.connect import ConnectionV4
+from weaviate.connect.v4 import _ExpectedStatusCodes
+from weaviate.event_loop import _CallerThreadUnsupportedError, _in_caller_thread
+from weaviate.logger import logger
+from weaviate.util import _capitalize_first_letter
+
+ACTIVATION_CHUNK_SIZE = 100
+_ACTIVATABLE = (TenantActivityStatus.INACTIVE, TenantActivityStatus.OFFLOADED)
+
+
+class _TenantActivationCache:
+    """Activates the tenants targeted by queries and batches ahead of time if they are inactive or offloaded.
+
+    Tenants that are known to be active are cached for `ttl` seconds. The status of all other tenants is fetched with a
+    single `TenantsGet` request per collection and the inactive ones are activated in bulk. Concurrent callers that need
+    the same tenant wait for the activation that is already in flight instead of sending their own.
+    """
+
+    def __init__(self, connection: ConnectionV4, ttl: float) -> None:
+        self.__connection = connection
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__active_until: Dict[Tuple[str, str], float] = {}
+        self.__in_flight: Dict[Tuple[str, str], "Future[None]"] = {}
+
+    def invalidate(self, collection: str, tenant: str) -> None:
+        """Forget that a tenant is active, e.g. because a request for it failed."""
+        with self.__lock:
+            self.__active_until.pop((_capitalize_first_letter(collection), tenant), None)
+
+    async def activate(self, collection: str, tenants: Iterable[str]) -> None:
+        """Make sure that the given tenants of the collection are active."""
+        collection = _capitalize_first_letter(collection)
+        now = time.monotonic()
+        owned: List[str] = []
+        waiting: List[Tuple[str, "Future[None]"]] = []
+        with self.__lock:
+            for tenant in set(tenants):
+                key = (collection, tenant)
+                if self.__active_until.get(key, 0) > now:
+                    continue
+                if (in_flight := self.__in_flight.get(key)) is not None:
+                    waiting.append((tenant, in_flight))
+                    continue
+                self.__in_flight[key] = Future()
+                owned.append(tenant)
+        if len(owned) == 0 and len(waiting) == 0:
+            return
+        if _in_caller_thread.get() is not None:
+            # activating sends REST requests, decide before sending the first request
+            self.__resolve(collection, owned, None, cancel=True)
+            raise _CallerThreadUnsupportedError()
+
+        try:
+            if len(owned) > 0:
+                await self.__activate(collection, owned)
+                self.__resolve(collection, owned, None)
+        except Exception as e:
+            self.__resolve(collection, owned, e)
+            raise
+        finally:
+            # e.g. cancelled or handed over to the event loop thread, the waiting callers will try themselves
+            self.__resolve(collection, owned, None, cancel=True)
+
+        retry: List[str] = []
+        for tenant, future in waiting:
+            try:
+                # shielded, cancelling this caller must not cancel the activation for the others
+                await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                retry.append(tenant)
+        if len(retry) > 0:
+            await self.activate(collection, retry)
+
+    def __resolve(
+        self,
+        collection: str,
+        tenants: List[str],
+        error: Optional[BaseException],
+        cancel: bool = False,
+    ) -> None:
+        with self.__lock:
+            for tenant in tenants:
+                future = self.__in_flight.pop((collection, tenant), None)
+                if future is None or future.done():
+                    continue
+                if cancel:
+                    future.cancel()
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(None)
+
+    async def __activate(self, collection: str, tenants: List[str]) -> None:
+        grpc = _TenantsGRPC(self.__connection, collection, None)
+        response = await grpc.get(names=tenants)
+
+        active: List[str] = []
+        to_activate: List[str] = []
+        for tenant in response.tenants:
+            status = grpc.map_activity_status(tenant.activity_status)
+            if status == TenantActivityStatus.ACTIVE:
+                active.append(tenant.name)
+            elif status in _ACTIVATABLE:
+                to_activate.append(tenant.name)
+
+        if len(to_activate) > 0:
+            logger.debug(f"Activating {len(to_activate)} tenants of {collection}")
+            path = "/schema/" + collection + "/tenants"
+            for i in range(0, len(to_activate), ACTIVATION_CHUNK_SIZE):
+                await self.__connection.put(
+                    path=path,
+                    weaviate_object=[
+                        TenantUpdate(
+                            name=name, activity_status=TenantUpdateActivityStatus.ACTIVE
+                        ).model_dump()
+                        for name in to_activate[i : i + ACTIVATION_CHUNK_SIZE]
+                    ],
+                    error_msg=f"Collection tenants may not have been activated for {collection}",
+                    status_codes=_ExpectedStatusCodes(
+                        ok_in=200, error=f"Activate collection tenants for {collection}"
+                    ),
+                )
+
+        expires = time.monotonic() + self.__ttl
+        with self.__lock:
+            for name in active + to_activate:
+                self.__active_until[(collection, name)] = expires
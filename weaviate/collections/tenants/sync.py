@@ -1,7 +1,31 @@
+from typing import Iterator, Optional, Sequence, Union
+
 from weaviate import syncify
-from weaviate.collections.tenants.tenants import _TenantsAsync
+from weaviate.collections.classes.tenants import Tenant
+from weaviate.collections.tenants.tenants import (
+    _TenantsAsync,
+    TenantOutputType,
+    TENANTS_PAGE_SIZE,
+)
+from weaviate.event_loop import _EventLoopSingleton
 
 
 @syncify.convert
 class _Tenants(_TenantsAsync):
-    pass
+    def iterator(  # type: ignore[override]
+        self,
+        tenants: Optional[Sequence[Union[str, Tenant]]] = None,
+        page_size: int = TENANTS_PAGE_SIZE,
+    ) -> Iterator[TenantOutputType]:
+        """Iterate over the tenants of a collection in Weaviate without building a dictionary of all of them.
+
+        See `_TenantsAsync.iterator` for the details.
+        """
+        if tenants is not None:
+            self._connection._weaviate_version.check_is_at_least_1_25_0("The 'iterator' method")
+        return self.__iterate(self._pages(tenants, page_size))
+
+    def __iterate(self, pages: Sequence[Optional[Sequence[str]]]) -> Iterator[TenantOutputType]:
+        event_loop = self._connection._event_loop or _EventLoopSingleton.get_instance()
+        for names in pages:
+            yield from event_loop.run_until_complete(self._get_page, names)
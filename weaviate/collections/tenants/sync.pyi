@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Sequence, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.tenants.tenants import (
     _TenantsBase,
@@ -9,15 +9,34 @@ from weaviate.collections.tenants.tenants import (
 
 class _Tenants(_TenantsBase):
     def create(
-        self, tenants: Union[TenantCreateInputType, Sequence[TenantCreateInputType]]
+        self,
+        tenants: Union[TenantCreateInputType, Sequence[TenantCreateInputType]],
+        *,
+        chunk_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> None: ...
+    def remove(
+        self,
+        tenants: Union[str, Tenant, Sequence[Union[str, Tenant]]],
+        *,
+        chunk_size: int = 100,
+        max_concurrency: int = 1,
     ) -> None: ...
-    def remove(self, tenants: Union[str, Tenant, Sequence[Union[str, Tenant]]]) -> None: ...
     def get(self) -> Dict[str, TenantOutputType]: ...
     def get_by_names(
         self, tenants: Sequence[Union[str, Tenant]]
     ) -> Dict[str, TenantOutputType]: ...
     def get_by_name(self, tenant: Union[str, Tenant]) -> Optional[TenantOutputType]: ...
+    def iterator(
+        self,
+        tenants: Optional[Sequence[Union[str, Tenant]]] = None,
+        page_size: int = 1000,
+    ) -> Iterator[TenantOutputType]: ...
     def update(
-        self, tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]]
+        self,
+        tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]],
+        *,
+        chunk_size: int = 100,
+        max_concurrency: int = 1,
     ) -> None: ...
     def exists(self, tenant: Union[str, Tenant]) -> bool: ...
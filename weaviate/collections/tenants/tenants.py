@@ -1,6 +1,20 @@
-from math import ceil
-from typing import Any, Dict, List, Optional, Sequence, Union
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
 
+from weaviate import syncify
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.tenants import (
     Tenant,
@@ -12,9 +26,12 @@ from weaviate.collections.classes.tenants import (
     TenantOutput,
 )
 from weaviate.collections.grpc.tenants import _TenantsGRPC
+from weaviate import json_codec
 from weaviate.connect import ConnectionV4
 from weaviate.connect.v4 import _ExpectedStatusCodes
 from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.logger import logger
+from weaviate.proto.v1 import tenants_pb2
 from weaviate.validator import _validate_input, _ValidateArgument
 
 TenantCreateInputType = Union[str, Tenant, TenantCreate]
@@ -22,6 +39,14 @@ TenantUpdateInputType = Union[Tenant, TenantUpdate]
 TenantOutputType = Tenant
 
 UPDATE_TENANT_BATCH_SIZE = 100
+TENANTS_CHUNK_SIZE = 100
+TENANTS_PAGE_SIZE = 1000
+
+T = TypeVar("T")
+
+
+def _chunks(items: Sequence[T], chunk_size: int) -> List[Sequence[T]]:
+    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
 class _TenantsBase:
@@ -41,6 +66,65 @@ class _TenantsBase:
         )
         self._validate_arguments = validate_arguments
 
+    def _validate_chunking(self, chunk_size: int, max_concurrency: int) -> None:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[int], name="chunk_size", value=chunk_size),
+                    _ValidateArgument(
+                        expected=[int], name="max_concurrency", value=max_concurrency
+                    ),
+                ]
+            )
+        if chunk_size < 1 or max_concurrency < 1:
+            raise WeaviateInvalidInputError(
+                f"'chunk_size' and 'max_concurrency' must be positive, got {chunk_size} and {max_concurrency}"
+            )
+
+    async def _send_in_chunks(
+        self,
+        send: Callable[[List[T]], Awaitable[Any]],
+        items: List[T],
+        chunk_size: int,
+        max_concurrency: int,
+    ) -> None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_chunk(chunk: Sequence[T]) -> None:
+            async with semaphore:
+                await send(list(chunk))
+
+        tasks = [asyncio.create_task(send_chunk(chunk)) for chunk in _chunks(items, chunk_size)]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # stop sending the remaining chunks as soon as one of them fails (or we are cancelled)
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        failed = [
+            idx for idx, task in enumerate(tasks) if not task.cancelled() and task.exception()
+        ]
+        if len(failed) == 0:
+            return
+        error = tasks[failed[0]].exception()
+        assert error is not None
+        completed = [
+            idx
+            for idx, task in enumerate(tasks)
+            if not task.cancelled() and task.exception() is None
+        ]
+        # the original error is raised so that existing handlers keep working, with the chunks attached to it
+        info = f"Chunk {failed[0]} of {len(tasks)} tenant chunks failed, the chunks {completed} were completed and the others were cancelled or not sent"
+        cast(Any, error).failed_chunk = failed[0]
+        cast(Any, error).completed_chunks = completed
+        if hasattr(error, "add_note"):  # Python 3.11+
+            error.add_note(info)
+        logger.error(info)
+        raise error
+
 
 class _TenantsAsync(_TenantsBase):
     """Represents all the CRUD methods available on a collection's multi-tenancy specification within Weaviate.
@@ -51,17 +135,28 @@ class _TenantsAsync(_TenantsBase):
     """
 
     async def create(
-        self, tenants: Union[TenantCreateInputType, Sequence[TenantCreateInputType]]
+        self,
+        tenants: Union[TenantCreateInputType, Sequence[TenantCreateInputType]],
+        *,
+        chunk_size: int = TENANTS_CHUNK_SIZE,
+        max_concurrency: int = 1,
     ) -> None:
         """Create the specified tenants for a collection in Weaviate.
 
-        The collection must have been created with multi-tenancy enabled.
+        The collection must have been created with multi-tenancy enabled. The tenants are sent in chunks of
+        `chunk_size` tenants so that creating a large number of them does not time out; if a chunk fails, the chunks
+        that were not sent yet are cancelled and the `completed_chunks` attribute of the raised error lists the chunks
+        whose tenants were created.
 
         Arguments:
             `tenants`
                 A tenant name, `wvc.config.tenants.Tenant`, `wvc.config.tenants.TenantCreateInput` object, or a list of tenants names
                 and/or `wvc.config.tenants.Tenant` objects to add to the given collection.
                 If a string is provided, the tenant will be added with the default activity status of `HOT`.
+            `chunk_size`
+                The maximum number of tenants sent in a single request. Default 100.
+            `max_concurrency`
+                The maximum number of requests sent at the same time. Default 1.
 
         Raises:
             `weaviate.WeaviateConnectionError`
@@ -87,25 +182,45 @@ class _TenantsAsync(_TenantsBase):
                 ]
             )
 
+        self._validate_chunking(chunk_size, max_concurrency)
+
         path = "/schema/" + self._name + "/tenants"
-        await self._connection.post(
-            path=path,
-            weaviate_object=self.__map_create_tenants(tenants),
-            error_msg=f"Collection tenants may not have been added properly for {self._name}",
-            status_codes=_ExpectedStatusCodes(
-                ok_in=200, error=f"Add collection tenants for {self._name}"
-            ),
+
+        async def send(chunk: List[dict]) -> None:
+            await self._connection.post(
+                path=path,
+                weaviate_object=chunk,
+                error_msg=f"Collection tenants may not have been added properly for {self._name}",
+                status_codes=_ExpectedStatusCodes(
+                    ok_in=200, error=f"Add collection tenants for {self._name}"
+                ),
+            )
+
+        await self._send_in_chunks(
+            send, self.__map_create_tenants(tenants), chunk_size, max_concurrency
         )
 
-    async def remove(self, tenants: Union[str, Tenant, Sequence[Union[str, Tenant]]]) -> None:
+    async def remove(
+        self,
+        tenants: Union[str, Tenant, Sequence[Union[str, Tenant]]],
+        *,
+        chunk_size: int = TENANTS_CHUNK_SIZE,
+        max_concurrency: int = 1,
+    ) -> None:
         """Remove the specified tenants from a collection in Weaviate.
 
-        The collection must have been created with multi-tenancy enabled.
+        The collection must have been created with multi-tenancy enabled. The tenants are removed in chunks of
+        `chunk_size` tenants; if a chunk fails, the chunks that were not sent yet are cancelled and the
+        `completed_chunks` attribute of the raised error lists the chunks that were completed.
 
         Arguments:
             `tenants`
                 A tenant name, `wvc.config.tenants.Tenant` object, or a list of tenants names
                 and/or `wvc.config.tenants.Tenant` objects to remove from the given class.
+            `chunk_size`
+                The maximum number of tenants sent in a single request. Default 100.
+            `max_concurrency`
+                The maximum number of requests sent at the same time. Default 1.
 
         Raises:
             `weaviate.WeaviateConnectionError`
@@ -137,15 +252,21 @@ class _TenantsAsync(_TenantsBase):
             for tenant in tenants:
                 tenant_names.append(tenant.name if isinstance(tenant, Tenant) else tenant)
 
+        self._validate_chunking(chunk_size, max_concurrency)
+
         path = "/schema/" + self._name + "/tenants"
-        await self._connection.delete(
-            path=path,
-            weaviate_object=tenant_names,
-            error_msg=f"Collection tenants may not have been deleted for {self._name}",
-            status_codes=_ExpectedStatusCodes(
-                ok_in=200, error=f"Delete collection tenants for {self._name}"
-            ),
-        )
+
+        async def send(chunk: List[str]) -> None:
+            await self._connection.delete(
+                path=path,
+                weaviate_object=chunk,
+                error_msg=f"Collection tenants may not have been deleted for {self._name}",
+                status_codes=_ExpectedStatusCodes(
+                    ok_in=200, error=f"Delete collection tenants for {self._name}"
+                ),
+            )
+
+        await self._send_in_chunks(send, tenant_names, chunk_size, max_concurrency)
 
     async def __get_with_rest(self) -> Dict[str, TenantOutputType]:
         path = "/schema/" + self._name + "/tenants"
@@ -157,7 +278,7 @@ class _TenantsAsync(_TenantsBase):
             ),
         )
 
-        tenant_resp: List[Dict[str, Any]] = response.json()
+        tenant_resp: List[Dict[str, Any]] = json_codec.loads(response.content)
         for tenant in tenant_resp:
             tenant["activityStatusInternal"] = tenant["activityStatus"]
             del tenant["activityStatus"]
@@ -174,13 +295,40 @@ class _TenantsAsync(_TenantsBase):
             )
         )
 
-        return {
-            tenant.name: Tenant(
+        return {tenant.name: tenant for tenant in self.__map_grpc_tenants(response)}
+
+    def __map_grpc_tenants(self, response: tenants_pb2.TenantsGetReply) -> Iterable[Tenant]:
+        return (
+            Tenant(
                 name=tenant.name,
                 activity_status=self._grpc.map_activity_status(tenant.activity_status),
             )
             for tenant in response.tenants
-        }
+        )
+
+    async def _get_page(self, names: Optional[Sequence[str]]) -> Iterable[TenantOutputType]:
+        if names is None and not self._connection._weaviate_version.supports_tenants_get_grpc:
+            return (await self.__get_with_rest()).values()
+        return self.__map_grpc_tenants(await self._grpc.get(names=names))
+
+    def _pages(
+        self, tenants: Optional[Sequence[Union[str, Tenant]]], page_size: int
+    ) -> List[Optional[Sequence[str]]]:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(
+                        expected=[Sequence[Union[str, Tenant]], None], name="tenants", value=tenants
+                    ),
+                    _ValidateArgument(expected=[int], name="page_size", value=page_size),
+                ]
+            )
+        if page_size < 1:
+            raise WeaviateInvalidInputError(f"'page_size' must be positive, got {page_size}")
+        if tenants is None:
+            return [None]
+        names = [tenant.name if isinstance(tenant, Tenant) else tenant for tenant in tenants]
+        return list(_chunks(names, page_size))
 
     def __map_create_tenant(self, tenant: TenantCreateInputType) -> TenantCreate:
         if isinstance(tenant, str):
@@ -225,25 +373,17 @@ class _TenantsAsync(_TenantsBase):
 
     def __map_update_tenants(
         self, tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]]
-    ) -> List[List[dict]]:
+    ) -> List[dict]:
         if (
             isinstance(tenants, str)
             or isinstance(tenants, Tenant)
             or isinstance(tenants, TenantUpdate)
         ):
-            return [[self.__map_update_tenant(tenants).model_dump()]]
+            return [self.__map_update_tenant(tenants).model_dump()]
         else:
-            batches = ceil(len(tenants) / UPDATE_TENANT_BATCH_SIZE)
-            return [
-                [
-                    self.__map_update_tenant(tenants[i + b * UPDATE_TENANT_BATCH_SIZE]).model_dump()
-                    for i in range(
-                        min(len(tenants) - b * UPDATE_TENANT_BATCH_SIZE, UPDATE_TENANT_BATCH_SIZE)
-                    )
-                ]
-                for b in range(batches)
-            ]
+            return [self.__map_update_tenant(tenant).model_dump() for tenant in tenants]
 
+    @syncify.grpc_only
     async def get(self) -> Dict[str, TenantOutputType]:
         """Return all tenants currently associated with a collection in Weaviate.
 
@@ -260,6 +400,7 @@ class _TenantsAsync(_TenantsBase):
         else:
             return await self.__get_with_rest()
 
+    @syncify.grpc_only
     async def get_by_names(
         self, tenants: Sequence[Union[str, Tenant]]
     ) -> Dict[str, TenantOutputType]:
@@ -290,6 +431,7 @@ class _TenantsAsync(_TenantsBase):
             )
         return await self.__get_with_grpc(tenants=tenants)
 
+    @syncify.grpc_only
     async def get_by_name(self, tenant: Union[str, Tenant]) -> Optional[TenantOutputType]:
         """Return a specific tenant associated with a collection in Weaviate.
 
@@ -322,17 +464,61 @@ class _TenantsAsync(_TenantsBase):
             activity_status=self._grpc.map_activity_status(response.tenants[0].activity_status),
         )
 
+    async def __iterate(
+        self, pages: List[Optional[Sequence[str]]]
+    ) -> AsyncIterator[TenantOutputType]:
+        for names in pages:
+            for tenant in await self._get_page(names):
+                yield tenant
+
+    def iterator(
+        self,
+        tenants: Optional[Sequence[Union[str, Tenant]]] = None,
+        page_size: int = TENANTS_PAGE_SIZE,
+    ) -> AsyncIterator[TenantOutputType]:
+        """Iterate over the tenants of a collection in Weaviate without building a dictionary of all of them.
+
+        If `tenants` are given, they are fetched in requests of `page_size` tenants so that only one page is held in
+        memory at a time; tenants that do not exist are skipped. Otherwise, all the tenants are received in a single
+        reply, as Weaviate does not paginate the tenants listing, but converted one at a time while iterating.
+
+        Arguments:
+            `tenants`
+                Sequence of tenant names or `wvc.tenants.Tenant` objects to retrieve. If `None`, all tenants are returned.
+            `page_size`
+                The maximum number of named tenants requested at once. Default 1000.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`
+                If the network connection to Weaviate fails.
+            `weaviate.UnexpectedStatusCodeError`
+                If Weaviate reports a non-OK status.
+        """
+        if tenants is not None:
+            self._connection._weaviate_version.check_is_at_least_1_25_0("The 'iterator' method")
+        return self.__iterate(self._pages(tenants, page_size))
+
     async def update(
-        self, tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]]
+        self,
+        tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]],
+        *,
+        chunk_size: int = UPDATE_TENANT_BATCH_SIZE,
+        max_concurrency: int = 1,
     ) -> None:
         """Update the specified tenants for a collection in Weaviate.
 
-        The collection must have been created with multi-tenancy enabled.
+        The collection must have been created with multi-tenancy enabled. The tenants are updated in chunks of
+        `chunk_size` tenants; if a chunk fails, the chunks that were not sent yet are cancelled and the
+        `completed_chunks` attribute of the raised error lists the chunks that were completed.
 
         Arguments:
             `tenants`
                 A tenant name, `wvc.config.tenants.Tenant` object, or a list of tenants names
                 and/or `wvc.config.tenants.Tenant` objects to update for the given collection.
+            `chunk_size`
+                The maximum number of tenants sent in a single request. Default 100.
+            `max_concurrency`
+                The maximum number of requests sent at the same time. Default 1.
 
         Raises:
             `weaviate.WeaviateConnectionError`
@@ -351,17 +537,24 @@ class _TenantsAsync(_TenantsBase):
                 )
             )
 
+        self._validate_chunking(chunk_size, max_concurrency)
+
         path = "/schema/" + self._name + "/tenants"
-        for mapped_tenants in self.__map_update_tenants(tenants):
+
+        async def send(chunk: List[dict]) -> None:
             await self._connection.put(
                 path=path,
-                weaviate_object=mapped_tenants,
+                weaviate_object=chunk,
                 error_msg=f"Collection tenants may not have been updated properly for {self._name}",
                 status_codes=_ExpectedStatusCodes(
                     ok_in=200, error=f"Update collection tenants for {self._name}"
                 ),
             )
 
+        await self._send_in_chunks(
+            send, self.__map_update_tenants(tenants), chunk_size, max_concurrency
+        )
+
     async def exists(self, tenant: Union[str, Tenant]) -> bool:
         """Check if a tenant exists for a collection in Weaviate.
 
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from weaviate.instrumentation import Instrumentation
 
 
 @dataclass
@@ -9,6 +11,17 @@ class ConnectionConfig:
     session_pool_connections: int = 20
     session_pool_maxsize: int = 100
     session_pool_max_retries: int = 3
+    grpc_sync_transport: bool = False
+    """Additionally open a blocking gRPC channel so that the sync client sends gRPC-only calls (queries, `insert_many`,
+    `delete_many` and `tenants.get`) directly from the calling thread instead of going through the event loop thread.
+    Only used by the v4 client."""
+    server_version_ttl: Optional[float] = None
+    """Reuse the version of a Weaviate instance that was looked up by another client connecting to the same URL within
+    this many seconds instead of requesting `/meta` again. Only used by the v4 client."""
+    event_loop_shards: Optional[int] = None
+    """Spread the sync clients of this process over this many background event loop threads, each new client being
+    pinned to the thread with the fewest open clients. Overrides the `WEAVIATE_EVENT_LOOP_SHARDS` environment variable,
+    which defaults to a single thread shared by all clients. Only used by the v4 client."""
 
     def __post_init__(self) -> None:
         if not isinstance(self.session_pool_connections, int):
@@ -23,6 +36,28 @@ class ConnectionConfig:
             raise TypeError(
                 f"session_pool_max_retries must be {int}, received {type(self.session_pool_max_retries)}"
             )
+        if not isinstance(self.grpc_sync_transport, bool):
+            raise TypeError(
+                f"grpc_sync_transport must be {bool}, received {type(self.grpc_sync_transport)}"
+            )
+        if self.event_loop_shards is not None:
+            if not isinstance(self.event_loop_shards, int):
+                raise TypeError(
+                    f"event_loop_shards must be {int} or None, received {type(self.event_loop_shards)}"
+                )
+            if self.event_loop_shards < 1:
+                raise ValueError(
+                    f"event_loop_shards must be a positive integer, received {self.event_loop_shards}"
+                )
+        if self.server_version_ttl is not None:
+            if not isinstance(self.server_version_ttl, (int, float)):
+                raise TypeError(
+                    f"server_version_ttl must be {float} or None, received {type(self.server_version_ttl)}"
+                )
+            if self.server_version_ttl <= 0:
+                raise ValueError(
+                    f"server_version_ttl must be a positive number, received {self.server_version_ttl}"
+                )
 
 
 # used in v3 only
@@ -61,6 +96,27 @@ class Proxies(BaseModel):
     grpc: Optional[str] = Field(default=None)
 
 
+class TenantActivation(BaseModel):
+    """Automatically activate the inactive and offloaded tenants targeted by queries and batches.
+
+    The activity status of the tenants is fetched in bulk and the active ones are cached for `ttl` seconds, so that
+    only tenants that have not been seen recently cost an additional request.
+    """
+
+    ttl: Union[int, float] = Field(default=60, gt=0)
+
+
+class SchemaCache(BaseModel):
+    """Cache the collection configurations, e.g. of `collection.config.get()` or `client.collections.exists()`.
+
+    The configurations are cached for `ttl` seconds and the whole cache is cleared whenever the schema is changed through
+    the client. Changes made by other clients only become visible once the cached configurations expired. The returned
+    configuration objects are shared between calls and must not be modified.
+    """
+
+    ttl: Union[int, float] = Field(default=60, gt=0)
+
+
 class AdditionalConfig(BaseModel):
     """Use this class to specify the connection and proxy settings for your client when connecting to Weaviate.
 
@@ -70,12 +126,25 @@ class AdditionalConfig(BaseModel):
 
     When specifying the proxies, be aware that supplying a URL (`str`) will populate all of the `http`, `https`, and grpc proxies.
     In order for this to be possible, you must have a proxy that is capable of handling simultaneous HTTP/1.1 and HTTP/2 traffic.
+
+    When specifying the instrumentation, the hooks of the given `weaviate.instrumentation.Instrumentation` instance are called
+    for every request and batch so that you can export metrics and traces of the client.
+
+    When specifying the tenant activation, the tenants of `collection.with_tenant(...)` queries and of batched objects
+    are activated before the requests are sent if they are inactive or offloaded, see `TenantActivation`.
+
+    When specifying the schema cache, the collection configurations are cached by the client, see `SchemaCache`.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     connection: ConnectionConfig = Field(default_factory=ConnectionConfig)
     proxies: Union[str, Proxies, None] = Field(default=None)
     timeout_: Union[Tuple[int, int], Timeout] = Field(default_factory=Timeout, alias="timeout")
     trust_env: bool = Field(default=False)
+    instrumentation: Optional[Instrumentation] = Field(default=None)
+    tenant_activation: Optional[TenantActivation] = Field(default=None)
+    schema_cache: Optional[SchemaCache] = Field(default=None)
 
     @property
     def timeout(self) -> Timeout:
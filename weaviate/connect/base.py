@@ -6,7 +6,7 @@ from typing import Dict, Tuple, TypeVar, Union, cast
 from urllib.parse import urlparse
 
 import grpc  # type: ignore
-from grpc import ssl_channel_credentials
+from grpc import Channel as SyncChannel, ssl_channel_credentials
 from grpc.aio import Channel  # type: ignore
 
 # from grpclib.client import Channel
@@ -111,11 +111,14 @@ class ConnectionParams(BaseModel):
     def _grpc_target(self) -> str:
         return f"{self.grpc.host}:{self.grpc.port}"
 
-    def _grpc_channel(self, proxies: Dict[str, str]) -> Channel:
+    @staticmethod
+    def _grpc_options(proxies: Dict[str, str]) -> list:
         if (p := proxies.get("grpc")) is not None:
-            options: list = [*GRPC_DEFAULT_OPTIONS, ("grpc.http_proxy", p)]
-        else:
-            options = GRPC_DEFAULT_OPTIONS
+            return [*GRPC_DEFAULT_OPTIONS, ("grpc.http_proxy", p)]
+        return GRPC_DEFAULT_OPTIONS
+
+    def _grpc_channel(self, proxies: Dict[str, str]) -> Channel:
+        options = self._grpc_options(proxies)
         if self.grpc.secure:
             return grpc.aio.secure_channel(
                 target=self._grpc_target,
@@ -128,6 +131,20 @@ class ConnectionParams(BaseModel):
                 options=options,
             )
 
+    def _grpc_channel_sync(self, proxies: Dict[str, str]) -> SyncChannel:
+        options = self._grpc_options(proxies)
+        if self.grpc.secure:
+            return grpc.secure_channel(
+                target=self._grpc_target,
+                credentials=ssl_channel_credentials(),
+                options=options,
+            )
+        else:
+            return grpc.insecure_channel(
+                target=self._grpc_target,
+                options=options,
+            )
+
     @property
     def _http_scheme(self) -> str:
         return "https" if self.http.secure else "http"
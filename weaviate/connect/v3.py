@@ -17,7 +17,7 @@ from requests.exceptions import ConnectionError as RequestsConnectionError, Read
 from requests.exceptions import HTTPError as RequestsHTTPError
 from requests.exceptions import JSONDecodeError
 
-from weaviate import __version__ as client_version
+from weaviate import __version__ as client_version, json_codec
 from weaviate.auth import AuthCredentials, AuthClientCredentials, AuthApiKey
 from weaviate.config import ConnectionConfig
 from weaviate.connect.authentication import _Auth
@@ -49,6 +49,10 @@ TIMEOUT_TYPE_RETURN = Tuple[NUMBER, NUMBER]
 INIT_CHECK_TIMEOUT = 0.5
 
 
+def _encode_json(weaviate_object: Optional[JSONPayload]) -> Optional[bytes]:
+    return json_codec.dumps(weaviate_object) if weaviate_object is not None else None
+
+
 class Connection(_ConnectionBase):
     """
     Connection class used to communicate to a weaviate instance.
@@ -374,7 +378,7 @@ class Connection(_ConnectionBase):
 
         return self._session.delete(
             url=request_url,
-            json=weaviate_object,
+            data=_encode_json(weaviate_object),
             headers=self._headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -415,7 +419,7 @@ class Connection(_ConnectionBase):
 
         return self._session.patch(
             url=request_url,
-            json=weaviate_object,
+            data=_encode_json(weaviate_object),
             headers=self._headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -458,7 +462,7 @@ class Connection(_ConnectionBase):
 
         return self._session.post(
             url=request_url,
-            json=weaviate_object,
+            data=_encode_json(weaviate_object),
             headers=self._headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -499,7 +503,7 @@ class Connection(_ConnectionBase):
 
         return self._session.put(
             url=request_url,
-            json=weaviate_object,
+            data=_encode_json(weaviate_object),
             headers=self._headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -659,6 +663,21 @@ class Connection(_ConnectionBase):
     def grpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
         return self._grpc_stub
 
+    def grpc_metadata(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        The metadata to send with every gRPC request, i.e. the authorization and the additional
+        headers.
+        """
+        metadata = [
+            (key, value)
+            for key, value in self._headers.items()
+            if key not in ("content-type", "authorization") and value is not None
+        ]
+        access_token = self.get_current_bearer_token()
+        if len(access_token) > 0:
+            metadata.append(("authorization", access_token))
+        return tuple(metadata)
+
     @property
     def server_version(self) -> str:
         """
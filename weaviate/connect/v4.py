@@ -5,13 +5,25 @@ import time
 from copy import copy
 from dataclasses import dataclass, field
 from ssl import SSLZeroReturnError
-from threading import Event, Thread
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
+from threading import Event, Lock, Thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from authlib.integrations.httpx_client import (  # type: ignore
     AsyncOAuth2Client,
     OAuth2Client,
 )
+import grpc  # type: ignore
 from grpc.aio import Channel  # type: ignore
 from grpc_health.v1 import health_pb2  # type: ignore
 
@@ -33,7 +45,7 @@ from httpx import (
     Timeout,
 )
 
-from weaviate import __version__ as client_version
+from weaviate import __version__ as client_version, json_codec
 from weaviate.auth import (
     AuthCredentials,
     AuthApiKey,
@@ -49,6 +61,7 @@ from weaviate.connect.base import (
 )
 from weaviate.connect.integrations import _IntegrationConfig
 from weaviate.embedded import EmbeddedV4
+from weaviate.event_loop import _CallerThreadUnsupportedError, _EventLoop, _in_caller_thread
 from weaviate.exceptions import (
     AuthenticationFailedError,
     UnexpectedStatusCodeError,
@@ -58,20 +71,31 @@ from weaviate.exceptions import (
     WeaviateStartUpError,
     WeaviateTimeoutError,
 )
+from weaviate.instrumentation import Instrumentation, RequestEvent, _call_hook, _span
 from weaviate.proto.v1 import weaviate_pb2_grpc
 from weaviate.util import (
     PYPI_PACKAGE_URL,
     _decode_json_response_dict,
     _ServerVersion,
+    _read_cached_pypi_version,
+    _write_cached_pypi_version,
     is_weaviate_client_too_old,
     is_weaviate_domain,
 )
 from weaviate.validator import _validate_input, _ValidateArgument
 from weaviate.warnings import _Warnings
 
+if TYPE_CHECKING:
+    from weaviate.collections.config.cache import _SchemaCache
+    from weaviate.collections.tenants.activation import _TenantActivationCache
+
 Session = Union[Client, OAuth2Client]
 AsyncSession = Union[AsyncClient, AsyncOAuth2Client]
 
+# the versions of the Weaviate instances connected to, by their URL, see `ConnectionConfig.server_version_ttl`
+_server_versions: Dict[str, Tuple[float, _ServerVersion]] = {}
+_server_versions_lock = Lock()
+
 
 @dataclass
 class _ExpectedStatusCodes:
@@ -102,6 +126,8 @@ class ConnectionV4(_ConnectionBase):
         connection_config: ConnectionConfig,
         loop: asyncio.AbstractEventLoop,  # required for background token refresh
         embedded_db: Optional[EmbeddedV4] = None,
+        event_loop: Optional[_EventLoop] = None,  # the background loop the sync client is pinned to
+        instrumentation: Optional[Instrumentation] = None,
     ):
         self.url = connection_params._http_url
         self.embedded_db = embedded_db
@@ -112,12 +138,20 @@ class ConnectionV4(_ConnectionBase):
         self._connection_params = connection_params
         self._grpc_stub: Optional[weaviate_pb2_grpc.WeaviateStub] = None
         self._grpc_channel: Optional[Channel] = None
+        self._grpc_stub_sync: Optional[weaviate_pb2_grpc.WeaviateStub] = None
+        self._grpc_channel_sync: Optional[grpc.Channel] = None
         self.timeout_config = timeout_config
         self.__connection_config = connection_config
         self.__trust_env = trust_env
         self._weaviate_version = _ServerVersion.from_string("")
         self.__connected = False
         self.__loop = loop
+        self._event_loop = event_loop
+        self._instrumentation = instrumentation
+        # set by the client if the tenants targeted by queries and batches should be activated automatically
+        self._tenant_activation: Optional["_TenantActivationCache"] = None
+        # set by the client if the collection configurations should be cached
+        self._schema_cache: Optional["_SchemaCache"] = None
 
         self._headers = {"content-type": "application/json"}
         if additional_headers is not None:
@@ -153,18 +187,36 @@ class ConnectionV4(_ConnectionBase):
                 self.__connected = False
                 raise e
 
+        # all init checks are independent of each other and run concurrently
+        check_login = (
+            not skip_init_checks and self._auth is None and "authorization" not in self._headers
+        )
+        checks = [] if skip_init_checks else [self._ping_grpc(), self.__check_package_version()]
+        if check_login:
+            checks.insert(0, self.__check_login_not_required())
+        version, *results = await asyncio.gather(
+            self.__get_server_version(), *checks, return_exceptions=True
+        )
+        # a missing login or an unreachable instance explains any other failure
+        if check_login and isinstance(results[0], BaseException):
+            self.__connected = False
+            raise results[0]
+
         # need this to get the version of weaviate for version checks
-        try:
-            meta = await self.get_meta()
-            self._weaviate_version = _ServerVersion.from_string(meta["version"])
-        except (
-            WeaviateConnectionError,
-            ReadError,
-            RemoteProtocolError,
-            SSLZeroReturnError,  # required for async 3.8,3.9 due to ssl.SSLZeroReturnError: TLS/SSL connection has been closed (EOF) (_ssl.c:1131)
-        ) as e:
+        if isinstance(version, BaseException):
             self.__connected = False
-            raise WeaviateStartUpError(f"Could not connect to Weaviate:{e}.") from e
+            if isinstance(
+                version,
+                (
+                    WeaviateConnectionError,
+                    ReadError,
+                    RemoteProtocolError,
+                    SSLZeroReturnError,  # required for async 3.8,3.9 due to ssl.SSLZeroReturnError: TLS/SSL connection has been closed (EOF) (_ssl.c:1131)
+                ),
+            ):
+                raise WeaviateStartUpError(f"Could not connect to Weaviate:{version}.") from version
+            raise version
+        self._weaviate_version = version
 
         # do it after all other init checks so as not to break all the tests
         if self._weaviate_version.is_lower_than(1, 23, 7):
@@ -173,25 +225,44 @@ class ConnectionV4(_ConnectionBase):
                 f"Weaviate version {self._weaviate_version} is not supported. Please use Weaviate version 1.23.7 or higher."
             )
 
-        if not skip_init_checks:
-            try:
-                await asyncio.gather(self._ping_grpc(), self.__check_package_version())
-            except Exception as e:
+        for result in results:
+            if isinstance(result, BaseException):
                 self.__connected = False
-                raise e
+                raise result
 
         self.__connected = True
 
+    async def __get_server_version(self) -> _ServerVersion:
+        ttl = self.__connection_config.server_version_ttl
+        if ttl is not None:
+            with _server_versions_lock:
+                cached = _server_versions.get(self.url)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        meta = await self.get_meta()
+        version = _ServerVersion.from_string(meta["version"])
+        if ttl is not None:
+            with _server_versions_lock:
+                _server_versions[self.url] = (time.monotonic() + ttl, version)
+        return version
+
     async def __check_package_version(self) -> None:
-        try:
-            async with AsyncClient() as client:
-                res = await client.get(PYPI_PACKAGE_URL, timeout=self.timeout_config.init)
-            pkg_info: dict = res.json().get("info", {})
-            latest_version = pkg_info.get("version", "unknown version")
-            if is_weaviate_client_too_old(client_version, latest_version):
-                _Warnings.weaviate_client_too_old_vs_latest(client_version, latest_version)
-        except RequestError:
-            pass  # ignore any errors related to requests, it is a best-effort warning
+        found, latest_version = _read_cached_pypi_version()
+        if not found:
+            latest_version = None
+            try:
+                async with AsyncClient() as client:
+                    res = await client.get(PYPI_PACKAGE_URL, timeout=self.timeout_config.init)
+                pkg_info: dict = res.json().get("info", {})
+                latest_version = pkg_info.get("version", "unknown version")
+            except RequestError:
+                pass  # ignore any errors related to requests, it is a best-effort warning
+            _write_cached_pypi_version(latest_version)
+        if latest_version is not None and is_weaviate_client_too_old(
+            client_version, latest_version
+        ):
+            _Warnings.weaviate_client_too_old_vs_latest(client_version, latest_version)
 
     def is_connected(self) -> bool:
         return self.__connected
@@ -232,6 +303,11 @@ class ConnectionV4(_ConnectionBase):
         self._grpc_channel = self._connection_params._grpc_channel(proxies=self._proxies)
         assert self._grpc_channel is not None
         self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel)
+        if self.__connection_config.grpc_sync_transport:
+            self._grpc_channel_sync = self._connection_params._grpc_channel_sync(
+                proxies=self._proxies
+            )
+            self._grpc_stub_sync = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel_sync)
 
         # API keys are separate from OIDC and do not need any config from weaviate
         if auth_client_secret is not None and isinstance(auth_client_secret, AuthApiKey):
@@ -242,19 +318,13 @@ class ConnectionV4(_ConnectionBase):
             self.__make_clients()
             return
 
-        # no need to check OIDC if no auth is provided and users dont want any checks at initialization time
-        if skip_init_checks and auth_client_secret is None:
+        # without auth, OIDC is only checked to fail early if weaviate requires a login, which is done together with
+        # the other init checks in `connect`
+        if auth_client_secret is None:
             self.__make_clients()
             return
 
-        oidc_url = self.url + self._api_version_path + "/.well-known/openid-configuration"
-        async with self.__make_async_client() as client:
-            try:
-                response = await client.get(oidc_url)
-            except Exception as e:
-                raise WeaviateConnectionError(
-                    f"Error: {e}. \nIs Weaviate running and reachable at {self.url}?"
-                )
+        oidc_url, response = await self.__get_oidc_configuration()
 
         if response.status_code == 200:
             # Some setups are behind proxies that return some default page - for example a login - for all requests.
@@ -267,45 +337,63 @@ class ConnectionV4(_ConnectionBase):
                 self.__make_clients()
                 return
 
-            if auth_client_secret is not None:
-                _auth = await _Auth.use(
-                    oidc_config=resp,
-                    credentials=auth_client_secret,
-                    connection=self,
+            _auth = await _Auth.use(
+                oidc_config=resp,
+                credentials=auth_client_secret,
+                connection=self,
+            )
+            try:
+                self._client = await _auth.get_auth_session()
+            except HTTPError as e:
+                raise AuthenticationFailedError(f"Failed to authenticate with OIDC: {repr(e)}")
+
+            if isinstance(auth_client_secret, AuthClientCredentials):
+                # credentials should only be saved for client credentials, otherwise use refresh token
+                self._create_background_token_refresh(_auth)
+            else:
+                self._create_background_token_refresh()
+        elif response.status_code == 404:
+            _Warnings.auth_with_anon_weaviate()
+            self.__make_clients()
+        else:
+            self.__make_clients()
+
+    async def __get_oidc_configuration(self) -> Tuple[str, Response]:
+        oidc_url = self.url + self._api_version_path + "/.well-known/openid-configuration"
+        async with self.__make_async_client() as client:
+            try:
+                return oidc_url, await client.get(oidc_url)
+            except Exception as e:
+                raise WeaviateConnectionError(
+                    f"Error: {e}. \nIs Weaviate running and reachable at {self.url}?"
                 )
-                try:
-                    self._client = await _auth.get_auth_session()
-                except HTTPError as e:
-                    raise AuthenticationFailedError(f"Failed to authenticate with OIDC: {repr(e)}")
 
-                if isinstance(auth_client_secret, AuthClientCredentials):
-                    # credentials should only be saved for client credentials, otherwise use refresh token
-                    self._create_background_token_refresh(_auth)
-                else:
-                    self._create_background_token_refresh()
+    async def __check_login_not_required(self) -> None:
+        oidc_url, response = await self.__get_oidc_configuration()
+        if response.status_code != 200:
+            return
+        try:
+            response.json()
+        except Exception:
+            _Warnings.auth_cannot_parse_oidc_config(oidc_url)
+            return
 
-            else:
-                msg = f""""No login credentials provided. The weaviate instance at {self.url} requires login credentials.
+        msg = f""""No login credentials provided. The weaviate instance at {self.url} requires login credentials.
 
-                    Please check our documentation at https://weaviate.io/developers/weaviate/client-libraries/python#authentication
-                    for more information about how to use authentication."""
+            Please check our documentation at https://weaviate.io/developers/weaviate/client-libraries/python#authentication
+            for more information about how to use authentication."""
 
-                if is_weaviate_domain(self.url):
-                    msg += """
+        if is_weaviate_domain(self.url):
+            msg += """
 
-                    You can instantiate the client with login credentials for Weaviate Cloud using
+            You can instantiate the client with login credentials for Weaviate Cloud using
 
-                    client = weaviate.connect_to_weaviate_cloud(
-                      url=YOUR_WEAVIATE_URL,
-                      auth_client_secret=wvc.init.Auth.api_key("YOUR_API_KEY")
-                    )
-                    """
-                raise AuthenticationFailedError(msg)
-        elif response.status_code == 404 and auth_client_secret is not None:
-            _Warnings.auth_with_anon_weaviate()
-            self.__make_clients()
-        else:
-            self.__make_clients()
+            client = weaviate.connect_to_weaviate_cloud(
+              url=YOUR_WEAVIATE_URL,
+              auth_client_secret=wvc.init.Auth.api_key("YOUR_API_KEY")
+            )
+            """
+        raise AuthenticationFailedError(msg)
 
     def get_current_bearer_token(self) -> str:
         if not self.is_connected():
@@ -387,6 +475,10 @@ class ConnectionV4(_ConnectionBase):
             await self._grpc_channel.close()
             self._grpc_stub = None
             self._grpc_channel = None
+        if self._grpc_channel_sync is not None:
+            self._grpc_channel_sync.close()
+            self._grpc_stub_sync = None
+            self._grpc_channel_sync = None
         if self.embedded_db is not None:
             self.embedded_db.stop()
         self.__connected = False
@@ -440,18 +532,59 @@ class ConnectionV4(_ConnectionBase):
     ) -> Response:
         if not self.is_connected():
             raise WeaviateClosedClientError()
+        if _in_caller_thread.get() is not None:
+            # REST requests are only sent from the event loop
+            raise _CallerThreadUnsupportedError()
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
         assert self._client is not None
+        if self._instrumentation is None:
+            return await self.__send_request(
+                method, url, error_msg, status_codes, is_gql_query, weaviate_object, params
+            )
+
+        timings: List[float] = [time.perf_counter()]
+        with _span(self._instrumentation, f"weaviate.http.{method}", {"url": url}):
+            try:
+                res = await self.__send_request(
+                    method,
+                    url,
+                    error_msg,
+                    status_codes,
+                    is_gql_query,
+                    weaviate_object,
+                    params,
+                    timings,
+                )
+            except BaseException as e:
+                self.__record_http_request(method, url, timings, None, e)
+                raise
+            self.__record_http_request(method, url, timings, res, None)
+            return res
+
+    async def __send_request(
+        self,
+        method: Literal["DELETE", "GET", "HEAD", "PATCH", "POST", "PUT"],
+        url: str,
+        error_msg: str,
+        status_codes: Optional[_ExpectedStatusCodes],
+        is_gql_query: bool,
+        weaviate_object: Optional[JSONPayload],
+        params: Optional[Dict[str, Any]],
+        timings: Optional[List[float]] = None,
+    ) -> Response:
+        assert self._client is not None
         try:
             req = self._client.build_request(
                 method,
                 url,
-                json=weaviate_object,
+                content=json_codec.dumps(weaviate_object) if weaviate_object is not None else None,
                 params=params,
                 headers=self.__get_latest_headers(),
                 timeout=self.__get_timeout(method, is_gql_query),
             )
+            if timings is not None:
+                timings.extend((time.perf_counter(), len(req.content)))
             res = await self._client.send(req)
             if status_codes is not None and res.status_code not in status_codes.ok:
                 raise UnexpectedStatusCodeError(error_msg, response=res)
@@ -465,6 +598,70 @@ class ConnectionV4(_ConnectionBase):
         except Exception as e:
             raise e
 
+    def __record_http_request(
+        self,
+        method: str,
+        url: str,
+        timings: List[float],
+        res: Optional[Response],
+        error: Optional[BaseException],
+    ) -> None:
+        # timings holds the start time and, once the request was built, the time it was sent and its size
+        start = timings[0]
+        sent, request_bytes = (timings[1], int(timings[2])) if len(timings) == 3 else (start, 0)
+        _call_hook(
+            self._instrumentation,
+            "on_request",
+            RequestEvent(
+                protocol="http",
+                method=method,
+                target=url,
+                duration_seconds=time.perf_counter() - sent,
+                serialization_seconds=sent - start,
+                request_bytes=request_bytes,
+                response_bytes=len(res.content) if res is not None else 0,
+                status_code=(
+                    res.status_code
+                    if res is not None
+                    else (
+                        error.status_code if isinstance(error, UnexpectedStatusCodeError) else None
+                    )
+                ),
+                error=error,
+            ),
+        )
+
+    def _record_grpc_request(
+        self,
+        method: str,
+        target: Optional[str],
+        start: float,
+        request: Any,
+        response: Any,
+        error: Optional[BaseException] = None,
+        serialization_seconds: Optional[float] = None,
+    ) -> None:
+        """Report a gRPC request to the instrumentation hooks, if any, given the time it was sent at."""
+        if self._instrumentation is None:
+            return
+        _call_hook(
+            self._instrumentation,
+            "on_request",
+            RequestEvent(
+                protocol="grpc",
+                method=method,
+                target=target,
+                duration_seconds=time.perf_counter() - start,
+                serialization_seconds=serialization_seconds,
+                request_bytes=request.ByteSize(),
+                response_bytes=response.ByteSize() if response is not None else 0,
+                error=error,
+            ),
+        )
+
+    def _grpc_span(self, method: str, target: Optional[str]) -> ContextManager[Any]:
+        return _span(self._instrumentation, f"weaviate.grpc.{method}", {"collection": target})
+
     async def delete(
         self,
         path: str,
@@ -617,12 +814,15 @@ class ConnectionV4(_ConnectionBase):
         WeaviateStartUpError
             If weaviate takes longer than the time limit to respond.
         """
-        for _i in range(startup_period):
+        deadline = time.monotonic() + startup_period
+        interval = 0.1
+        while (remaining := deadline - time.monotonic()) > 0:
             try:
                 (await self.get("/.well-known/ready")).raise_for_status()
                 return
             except (ConnectError, ReadError, TimeoutError, HTTPStatusError):
-                time.sleep(1)
+                await asyncio.sleep(min(interval, remaining))
+                interval = min(interval * 2, 1)
 
         try:
             (await self.get("/.well-known/ready")).raise_for_status()
@@ -716,6 +916,23 @@ class ConnectionV4(_ConnectionBase):
             raise WeaviateClosedClientError()
         return self._grpc_stub
 
+    @property
+    def grpc_stub_sync(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
+        """The blocking gRPC stub.
+
+        It is only returned while a call is being run in the caller's thread, in every other case the calls must use
+        `grpc_stub` so as not to block the event loop.
+        """
+        if (caller_thread := _in_caller_thread.get()) is None:
+            return None
+        if not self.is_connected():
+            raise WeaviateClosedClientError()
+        caller_thread.sent_request = True
+        return self._grpc_stub_sync
+
+    def has_sync_grpc_transport(self) -> bool:
+        return self._grpc_stub_sync is not None
+
     def __del__(self) -> None:
         if self._client is not None or self._grpc_channel is not None:
             _Warnings.unclosed_connection()
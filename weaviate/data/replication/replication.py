@@ -1,7 +1,16 @@
 from enum import Enum
 
+from weaviate.proto.v1 import base_pb2
+
 
 class ConsistencyLevel(str, Enum):
     ALL = "ALL"
     ONE = "ONE"
     QUORUM = "QUORUM"
+
+    def _to_grpc(self) -> "base_pb2.ConsistencyLevel":
+        if self == ConsistencyLevel.ONE:
+            return base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_ONE
+        if self == ConsistencyLevel.QUORUM:
+            return base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_QUORUM
+        return base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_ALL
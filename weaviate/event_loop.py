@@ -1,8 +1,11 @@
 import asyncio
+import os
 import threading
 import time
 from concurrent.futures import Future
-from typing import Any, Callable, Coroutine, Dict, Generic, Optional, TypeVar, cast
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Dict, Generic, List, Optional, TypeVar, cast
 
 from typing_extensions import ParamSpec
 
@@ -12,14 +15,91 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
+class _CallerThread:
+    """The state of a coroutine that is being driven in the caller's thread."""
+
+    def __init__(self) -> None:
+        # whether the coroutine already sent a request, after which it must not be run again on the event loop
+        self.sent_request = False
+
+
+# set while a coroutine is being driven in the caller's thread by `_EventLoop.run_in_caller_thread`
+_in_caller_thread: ContextVar[Optional[_CallerThread]] = ContextVar(
+    "_in_caller_thread", default=None
+)
+
+
+class _CallerThreadUnsupportedError(Exception):
+    """Raised when a coroutine run in the caller's thread needs the event loop, e.g. to send a REST request.
+
+    It must be raised before the coroutine sends any request, so that the coroutine can be run again on the event loop.
+    """
+
+
+# number of background event loop threads shared by the sync clients of this process
+_SHARDS_ENV = "WEAVIATE_EVENT_LOOP_SHARDS"
+# opt-in to measure the busy and idle time of the background event loop threads, see `EventLoopStats.busy_seconds`
+_INSTRUMENTATION_ENV = "WEAVIATE_EVENT_LOOP_INSTRUMENTATION"
+
+
+@dataclass
+class EventLoopStats:
+    """Utilization metrics of one of the background event loop threads that run the requests of the sync clients.
+
+    Attributes:
+        `index`
+            The index of the event loop within the pool.
+        `clients`
+            The number of clients that are pinned to this event loop.
+        `in_flight`
+            The number of coroutines that are currently scheduled on or running in this event loop.
+        `submitted`
+            The total number of coroutines that have been submitted to this event loop.
+        `busy_seconds`
+            The total time the event loop thread spent running callbacks, i.e. not waiting for I/O. Only measured if the
+            `WEAVIATE_EVENT_LOOP_INSTRUMENTATION` environment variable is set to `1` when the event loop is started,
+            because it wraps the selector of the event loop, which is a private attribute of asyncio. `None` otherwise,
+            or if the event loop implementation cannot be instrumented.
+        `idle_seconds`
+            The total time the event loop thread spent waiting for I/O. `None` under the same conditions as
+            `busy_seconds`.
+        `lag_seconds`
+            The time it took for a callback submitted from another thread to be run by the event loop, measured when
+            these stats were collected. `None` if the event loop did not respond in time.
+    """
+
+    index: int
+    clients: int
+    in_flight: int
+    submitted: int
+    busy_seconds: Optional[float]
+    idle_seconds: Optional[float]
+    lag_seconds: Optional[float]
+
+    @property
+    def utilization(self) -> Optional[float]:
+        """The fraction of its lifetime that the event loop thread spent running callbacks."""
+        if self.busy_seconds is None or self.idle_seconds is None:
+            return None
+        total = self.busy_seconds + self.idle_seconds
+        return self.busy_seconds / total if total > 0 else 0.0
+
+
 class _Future(Future, Generic[T]):
     def result(self, timeout: Optional[float] = None) -> T:
         return cast(T, super().result(timeout))
 
 
 class _EventLoop:
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None, index: int = 0) -> None:
         self.loop = loop
+        self.index = index
+        self.clients = 0
+        self.__lock = threading.Lock()
+        self.__in_flight = 0
+        self.__submitted = 0
+        self.__busy: Optional[float] = None
+        self.__idle: Optional[float] = None
 
     def start(self) -> None:
         if self.loop is not None:
@@ -37,8 +117,43 @@ class _EventLoop:
         if self.loop is None or self.loop.is_closed():
             raise WeaviateClosedClientError()
         fut = asyncio.run_coroutine_threadsafe(f(*args, **kwargs), self.loop)
+        self.__track(fut)
         return fut.result()
 
+    @staticmethod
+    def run_in_caller_thread(
+        f: Callable[P, Coroutine[Any, Any, T]], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """This method runs the provided coroutine to completion in the calling thread without handing it over to
+        the event loop.
+
+        This only works for coroutines that never suspend, i.e. those that perform their I/O with blocking calls.
+        If the coroutine needs the event loop before it sent any request, `_CallerThreadUnsupportedError` is raised so
+        that the caller can fall back to `run_until_complete`. Afterwards, running it again would repeat the requests
+        that were already sent, so a `RuntimeError` is raised instead.
+        """
+        state = _CallerThread()
+        token = _in_caller_thread.set(state)
+        coro = f(*args, **kwargs)
+        try:
+            coro.send(None)
+        except StopIteration as e:
+            return cast(T, e.value)
+        except _CallerThreadUnsupportedError as e:
+            if state.sent_request:
+                raise RuntimeError(
+                    f"{f.__qualname__} needs the event loop after it sent a request in the calling thread"
+                ) from e
+            raise
+        finally:
+            _in_caller_thread.reset(token)
+        coro.close()
+        if state.sent_request:
+            raise RuntimeError(
+                f"{f.__qualname__} suspended after it sent a request in the calling thread"
+            )
+        raise _CallerThreadUnsupportedError()
+
     def schedule(
         self, f: Callable[P, Coroutine[Any, Any, T]], *args: P.args, **kwargs: P.kwargs
     ) -> _Future[T]:
@@ -48,10 +163,45 @@ class _EventLoop:
         """
         if self.loop is None or self.loop.is_closed():
             raise WeaviateClosedClientError()
-        return cast(_Future[T], asyncio.run_coroutine_threadsafe(f(*args, **kwargs), self.loop))
+        fut = asyncio.run_coroutine_threadsafe(f(*args, **kwargs), self.loop)
+        self.__track(fut)
+        return cast(_Future[T], fut)
+
+    def __track(self, fut: "Future[Any]") -> None:
+        with self.__lock:
+            self.__in_flight += 1
+            self.__submitted += 1
+        fut.add_done_callback(self.__untrack)
+
+    def __untrack(self, fut: "Future[Any]") -> None:
+        with self.__lock:
+            self.__in_flight -= 1
+
+    def get_stats(self, lag_timeout: float = 1.0) -> EventLoopStats:
+        """Collect the utilization metrics of this event loop.
+
+        Measuring the lag waits for up to `lag_timeout` seconds for the event loop to run a callback.
+        """
+        lag: Optional[float] = None
+        if self.loop is not None and self.loop.is_running():
+            ran = threading.Event()
+            start = time.perf_counter()
+            self.loop.call_soon_threadsafe(ran.set)
+            if ran.wait(lag_timeout):
+                lag = time.perf_counter() - start
+        with self.__lock:
+            return EventLoopStats(
+                index=self.index,
+                clients=self.clients,
+                in_flight=self.__in_flight,
+                submitted=self.__submitted,
+                busy_seconds=self.__busy,
+                idle_seconds=self.__idle,
+                lag_seconds=lag,
+            )
 
     def shutdown(self) -> None:
-        if self.loop is None:
+        if self.loop is None or self.loop.is_closed():
             return
         self.loop.call_soon_threadsafe(self.loop.stop)
 
@@ -64,15 +214,42 @@ class _EventLoop:
             loop.run_until_complete(loop.shutdown_asyncgens())
             loop.close()
 
-    @staticmethod
-    def __start_new_event_loop() -> asyncio.AbstractEventLoop:
+    def __instrument(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The selector of the default event loops is the only place where the loop thread waits for I/O, so the time
+        # spent outside of it is the time spent running callbacks, e.g. decoding responses.
+        if os.getenv(_INSTRUMENTATION_ENV, "0") != "1":
+            return
+        selector = getattr(loop, "_selector", None)
+        if selector is None:
+            return
+        select = selector.select
+        self.__busy = 0.0
+        self.__idle = 0.0
+        woken = time.perf_counter()
+
+        def timed_select(timeout: Optional[float] = None) -> Any:
+            nonlocal woken
+            start = time.perf_counter()
+            try:
+                return select(timeout)
+            finally:
+                end = time.perf_counter()
+                with self.__lock:
+                    self.__busy = cast(float, self.__busy) + start - woken
+                    self.__idle = cast(float, self.__idle) + end - start
+                woken = end
+
+        selector.select = timed_select
+
+    def __start_new_event_loop(self) -> asyncio.AbstractEventLoop:
         loop = asyncio.new_event_loop()
+        self.__instrument(loop)
 
         event_loop = threading.Thread(
             target=_EventLoop.__run_event_loop,
             daemon=True,
             args=(loop,),
-            name="eventLoop",
+            name="eventLoop" if self.index == 0 else f"eventLoop-{self.index}",
         )
         event_loop.start()
 
@@ -111,16 +288,78 @@ class _EventLoop:
 
 class _EventLoopSingleton:
     _instance: Optional[_EventLoop] = None
+    _shards: List[_EventLoop] = []
+    _lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> _EventLoop:
         if cls._instance is not None:
             return cls._instance
-        cls._instance = _EventLoop()
-        cls._instance.start()
+        cls._instance = cls.__get_or_start(0)
         return cls._instance
 
+    @classmethod
+    def get_shard(cls, shards: Optional[int] = None) -> _EventLoop:
+        """Get the event loop that a new sync client should be pinned to.
+
+        By default, all clients share a single event loop thread. Setting `shards`, or else the
+        `WEAVIATE_EVENT_LOOP_SHARDS` environment variable, to a number greater than one spreads the clients over that
+        many event loop threads, so that a busy client, e.g. one running a large batch import, does not starve the
+        others. A new client is pinned to the event loop with the fewest open clients.
+
+        The client must call `release` once it is closed.
+        """
+        size = cls.__size() if shards is None else shards
+        for index in range(size):
+            cls.__get_or_start(index)
+        with cls._lock:
+            shard = min(cls._shards[:size], key=lambda shard: shard.clients)
+            shard.clients += 1
+        return shard
+
+    @classmethod
+    def retain(cls, shard: _EventLoop) -> None:
+        """Count a client that is pinned to the event loop again, e.g. after it was reconnected."""
+        with cls._lock:
+            shard.clients += 1
+
+    @classmethod
+    def release(cls, shard: _EventLoop) -> None:
+        """Stop counting a client that was pinned to the event loop because it was closed."""
+        with cls._lock:
+            shard.clients = max(shard.clients - 1, 0)
+
+    @classmethod
+    def get_stats(cls) -> List[EventLoopStats]:
+        return [shard.get_stats() for shard in list(cls._shards)]
+
+    @classmethod
+    def __get_or_start(cls, index: int) -> _EventLoop:
+        with cls._lock:
+            while len(cls._shards) <= index:
+                cls._shards.append(_EventLoop(index=len(cls._shards)))
+            shard = cls._shards[index]
+            shard.start()
+            return shard
+
+    @staticmethod
+    def __size() -> int:
+        size = os.getenv(_SHARDS_ENV, "1")
+        try:
+            return max(int(size), 1)
+        except ValueError:
+            raise ValueError(f"{_SHARDS_ENV} must be a positive integer, got {size!r}")
+
     def __del__(self) -> None:
         if self._instance is not None:
             self._instance.shutdown()
             self._instance = None
+
+
+def get_event_loop_stats() -> List[EventLoopStats]:
+    """Get the utilization metrics of all background event loop threads used by the sync clients of this process.
+
+    See `EventLoopStats` for the available metrics and `ConnectionConfig.event_loop_shards` for how to spread the
+    clients over multiple event loop threads.
+    """
+    return _EventLoopSingleton.get_stats()
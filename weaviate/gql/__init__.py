@@ -2,7 +2,25 @@
 GraphQL module used to create `get` and/or `aggregate`  GraphQL requests from Weaviate.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .get import AdditionalProperties, LinkTo
+    from .query import Query
+
 __all__ = ["AdditionalProperties", "LinkTo", "Query"]
 
-from .get import AdditionalProperties, LinkTo
-from .query import Query
+# resolved lazily so that the v4 aggregations, which only need `weaviate.gql.aggregate`, do not load the
+# whole v3 query builder
+_lazy_attrs = {
+    "AdditionalProperties": "get",
+    "LinkTo": "get",
+    "Query": "query",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attrs:
+        return getattr(importlib.import_module(f"{__name__}.{_lazy_attrs[name]}"), name)
+    raise AttributeError(f"module {__name__} has no attribute {name}")
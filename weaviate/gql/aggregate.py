@@ -86,6 +86,7 @@ class AggregateBuilder(GraphQL):
         self._tenant: Optional[str] = None
         self._limit: Optional[int] = None
         self._hybrid: Optional[Hybrid] = None
+        self._alias: Optional[str] = None
 
     def with_tenant(self, tenant: str) -> "AggregateBuilder":
         """Sets a tenant for the query."""
@@ -1172,10 +1173,29 @@ class AggregateBuilder(GraphQL):
         self._uses_filter = True
         return self
 
-    def build(self) -> str:
+    def with_alias(self, alias: str) -> "AggregateBuilder":
+        """Gives an alias for the query. Needs to be used if several aggregations of the same class are sent in a
+        single request.
+
+        Parameters
+        ----------
+        alias: str
+            The alias for the query.
+        """
+
+        self._alias = alias
+        return self
+
+    def build(self, wrap_aggregate: bool = True) -> str:
         """
         Build the query and return the string.
 
+        Parameters
+        ----------
+        wrap_aggregate: bool
+            A boolean to decide whether {Aggregate{...}} is placed around the query. Useful to send several
+            aggregations in a single request.
+
         Returns
         -------
         str
@@ -1183,7 +1203,10 @@ class AggregateBuilder(GraphQL):
         """
 
         # Path
-        query = f"{{Aggregate{{{self._class_name}"
+        query = "{Aggregate{" if wrap_aggregate else ""
+        if self._alias is not None:
+            query += self._alias + ": "
+        query += self._class_name
 
         # Filter
         if self._uses_filter:
@@ -1212,5 +1235,7 @@ class AggregateBuilder(GraphQL):
             query += field
 
         # close
-        query += "}}}"
+        query += "}"
+        if wrap_aggregate:
+            query += "}}"
         return query
@@ -8,12 +8,13 @@ from abc import ABC, abstractmethod
 from copy import deepcopy
 from enum import Enum
 from json import dumps
-from typing import Any, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.error_msgs import FILTER_BEACON_V14_CLS_NS_W
+from weaviate.proto.v1 import base_pb2, search_get_pb2
 from weaviate.util import get_vector, _sanitize_str, _decode_json_response_dict
 
 VALUE_LIST_TYPES = {
@@ -63,6 +64,22 @@ WHERE_OPERATORS = [
     "WithinGeoRange",
 ]
 
+_GRPC_OPERATORS = {
+    "And": base_pb2.Filters.OPERATOR_AND,
+    "ContainsAll": base_pb2.Filters.OPERATOR_CONTAINS_ALL,
+    "ContainsAny": base_pb2.Filters.OPERATOR_CONTAINS_ANY,
+    "Equal": base_pb2.Filters.OPERATOR_EQUAL,
+    "GreaterThan": base_pb2.Filters.OPERATOR_GREATER_THAN,
+    "GreaterThanEqual": base_pb2.Filters.OPERATOR_GREATER_THAN_EQUAL,
+    "IsNull": base_pb2.Filters.OPERATOR_IS_NULL,
+    "LessThan": base_pb2.Filters.OPERATOR_LESS_THAN,
+    "LessThanEqual": base_pb2.Filters.OPERATOR_LESS_THAN_EQUAL,
+    "Like": base_pb2.Filters.OPERATOR_LIKE,
+    "NotEqual": base_pb2.Filters.OPERATOR_NOT_EQUAL,
+    "Or": base_pb2.Filters.OPERATOR_OR,
+    "WithinGeoRange": base_pb2.Filters.OPERATOR_WITHIN_GEO_RANGE,
+}
+
 
 class MediaType(Enum):
     IMAGE = "image"
@@ -738,6 +755,12 @@ class Sort(Filter):
                 }
             )
 
+    def _to_grpc(self) -> List["search_get_pb2.SortBy"]:
+        return [
+            search_get_pb2.SortBy(ascending=clause["order"] == "asc", path=clause["path"])
+            for clause in self._content["sort"]
+        ]
+
     def __str__(self) -> str:
         sort = "sort: ["
         for clause in self._content["sort"]:
@@ -843,6 +866,90 @@ class Where(Filter):
         for operand in _content["operands"]:
             self.operands.append(Where(operand))
 
+    def _to_grpc(self) -> Optional["base_pb2.Filters"]:
+        """
+        Translate the filter into its gRPC representation.
+
+        Returns
+        -------
+        Optional[base_pb2.Filters]
+            The gRPC filter, None if the filter can only be expressed in GraphQL, e.g. filters on
+            the properties of referenced objects.
+        """
+
+        operator = _GRPC_OPERATORS[self.operator]
+        if not self.is_filter:
+            operands = []
+            for operand in self.operands:
+                operand_grpc = operand._to_grpc()
+                if operand_grpc is None:
+                    return None
+                operands.append(operand_grpc)
+            return base_pb2.Filters(operator=operator, filters=operands)
+
+        path = self._content["path"]
+        if isinstance(path, str):
+            path = [path]
+        if len(path) != 1:
+            return None
+        target = base_pb2.FilterTarget(property="_id" if path[0] == "id" else path[0])
+
+        value = self.value
+        value_type = _convert_value_type(self.value_type)
+        is_list = self.value_type in VALUE_LIST_TYPES or self.value_type in VALUE_ARRAY_TYPES
+        if is_list:
+            _check_is_list(value, self.value_type)
+        if value_type in ("valueText", "valueString", "valueDate"):
+            if not all(isinstance(v, str) for v in (value if is_list else [value])):
+                return None
+            if is_list:
+                return base_pb2.Filters(
+                    operator=operator,
+                    target=target,
+                    value_text_array=base_pb2.TextArray(values=value),
+                )
+            return base_pb2.Filters(operator=operator, target=target, value_text=value)
+        if value_type == "valueInt":
+            if not all(
+                isinstance(v, int) and not isinstance(v, bool)
+                for v in (value if is_list else [value])
+            ):
+                return None
+            if is_list:
+                return base_pb2.Filters(
+                    operator=operator,
+                    target=target,
+                    value_int_array=base_pb2.IntArray(values=value),
+                )
+            return base_pb2.Filters(operator=operator, target=target, value_int=value)
+        if value_type == "valueNumber":
+            if is_list:
+                return base_pb2.Filters(
+                    operator=operator,
+                    target=target,
+                    value_number_array=base_pb2.NumberArray(values=[float(v) for v in value]),
+                )
+            return base_pb2.Filters(operator=operator, target=target, value_number=float(value))
+        if value_type == "valueBoolean":
+            if is_list:
+                return base_pb2.Filters(
+                    operator=operator,
+                    target=target,
+                    value_boolean_array=base_pb2.BooleanArray(values=value),
+                )
+            return base_pb2.Filters(operator=operator, target=target, value_boolean=value)
+        assert value_type == "valueGeoRange"
+        _check_is_not_list(value, self.value_type)
+        return base_pb2.Filters(
+            operator=operator,
+            target=target,
+            value_geo=base_pb2.GeoCoordinatesFilter(
+                latitude=value["geoCoordinates"]["latitude"],
+                longitude=value["geoCoordinates"]["longitude"],
+                distance=value["distance"]["max"],
+            ),
+        )
+
     def __str__(self) -> str:
         if self.is_filter:
             gql = f"where: {{path: {self.path} operator: {self.operator} {_convert_value_type(self.value_type)}: "
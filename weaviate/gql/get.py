@@ -2,10 +2,11 @@
 GraphQL `Get` command.
 """
 
+import struct
 from dataclasses import dataclass, Field, fields
 from enum import Enum
 from json import dumps
-from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import grpc  # type: ignore
 
@@ -30,7 +31,7 @@ from weaviate.gql.filter import (
     MediaType,
     Sort,
 )
-from weaviate.proto.v1 import search_get_pb2
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
 from weaviate.str_enum import BaseEnum
 from weaviate.types import UUID
 from weaviate.util import (
@@ -38,6 +39,7 @@ from weaviate.util import (
     _capitalize_first_letter,
     get_valid_uuid,
     file_encoder_b64,
+    _ServerVersion,
 )
 from weaviate.warnings import _Warnings
 
@@ -139,6 +141,23 @@ class AdditionalProperties:
             return ""
 
 
+# `_additional` fields that can be requested through the gRPC `Search` API
+_GRPC_ADDITIONAL_PROPERTIES = {
+    "id",
+    "vector",
+    "creationTimeUnix",
+    "lastUpdateTimeUnix",
+    "distance",
+    "certainty",
+    "score",
+    "explainScore",
+}
+
+
+def _pack_vector(vector: List[float]) -> bytes:
+    return struct.pack(f"{len(vector)}f", *vector)
+
+
 class GetBuilder(GraphQL):
     """
     GetBuilder class used to create GraphQL queries.
@@ -189,8 +208,8 @@ class GetBuilder(GraphQL):
         self._additional_dataclass: Optional[AdditionalProperties] = None
         self._where: Optional[Where] = None  # To store the where filter if it is added
         self._limit: Optional[int] = None  # To store the limit filter if it is added
-        self._offset: Optional[str] = None  # To store the offset filter if it is added
-        self._after: Optional[str] = None  # To store the offset filter if it is added
+        self._offset: Optional[int] = None  # To store the offset filter if it is added
+        self._after: Optional[str] = None  # To store the after cursor if it is added
         self._near_clause: Optional[Filter] = (
             None  # To store the `near`/`ask` clause if it is added
         )
@@ -202,7 +221,7 @@ class GetBuilder(GraphQL):
         self._alias: Optional[str] = None
         self._tenant: Optional[str] = None
         self._autocut: Optional[int] = None
-        self._consistency_level: Optional[str] = None
+        self._consistency_level: Optional[ConsistencyLevel] = None
 
     def with_autocut(self, autocut: int) -> "GetBuilder":
         """Cuts off irrelevant results based on "jumps" in scores."""
@@ -230,7 +249,7 @@ class GetBuilder(GraphQL):
         if not isinstance(after_uuid, UUID.__args__):  # type: ignore # __args__ is workaround for python 3.8
             raise TypeError("after_uuid must be of type UUID (str or uuid.UUID)")
 
-        self._after = f'after: "{get_valid_uuid(after_uuid)}"'
+        self._after = get_valid_uuid(after_uuid)
         self._contains_filter = True
         return self
 
@@ -1218,7 +1237,7 @@ class GetBuilder(GraphQL):
         if offset < 0:
             raise ValueError("offset cannot be non-positive (offset >=0).")
 
-        self._offset = f"offset: {offset} "
+        self._offset = offset
         self._contains_filter = True
         return self
 
@@ -1722,7 +1741,7 @@ class GetBuilder(GraphQL):
     def with_consistency_level(self, consistency_level: ConsistencyLevel) -> "GetBuilder":
         """Set the consistency level for the request."""
 
-        self._consistency_level = f"consistencyLevel: {consistency_level.value} "
+        self._consistency_level = consistency_level
         self._contains_filter = True
         return self
 
@@ -1755,7 +1774,7 @@ class GetBuilder(GraphQL):
             if self._limit is not None:
                 query += f"limit: {self._limit} "
             if self._offset is not None:
-                query += self._offset
+                query += f"offset: {self._offset} "
             if self._near_clause is not None:
                 query += str(self._near_clause)
             if self._sort is not None:
@@ -1767,9 +1786,9 @@ class GetBuilder(GraphQL):
             if self._group_by is not None:
                 query += str(self._group_by)
             if self._after is not None:
-                query += self._after
+                query += f'after: "{self._after}"'
             if self._consistency_level is not None:
-                query += self._consistency_level
+                query += f"consistencyLevel: {self._consistency_level.value} "
             if self._tenant is not None:
                 query += f'tenant: "{self._tenant}"'
             if self._autocut is not None:
@@ -1807,139 +1826,186 @@ class GetBuilder(GraphQL):
         weaviate.UnexpectedStatusCodeException
             If weaviate reports a none OK status.
         """
-        grpc_enabled = (  # only implemented for some scenarios
-            self._connection.grpc_stub is not None
-            and (
+        # the typed properties of gRPC results, which keep integers apart from numbers, were added in Weaviate 1.23
+        request = (
+            self._to_grpc_request()
+            if self._connection.grpc_stub is not None
+            and _ServerVersion.from_string(self._connection.server_version).is_at_least(1, 23, 0)
+            else None
+        )
+        if request is None:
+            return super().do()
+
+        try:
+            res, _ = self._connection.grpc_stub.Search.with_call(  # type: ignore
+                request,
+                metadata=self._connection.grpc_metadata(),
+                timeout=self._connection.timeout_config[1],
+            )
+
+            additional_properties = self._grpc_additional_properties()
+            assert additional_properties is not None
+            objects = []
+            for result in res.results:
+                obj = self._convert_references_to_grpc_result(result.properties)
+                additional = self._extract_additional_properties(
+                    result.metadata, additional_properties
+                )
+                if len(additional) > 0:
+                    obj["_additional"] = additional
+                objects.append(obj)
+
+            results: Union[Dict[str, Dict[str, Dict[str, List]]], Dict[str, List]] = {
+                "data": {"Get": {self._alias or self._class_name: objects}}
+            }
+
+        except grpc.RpcError as e:
+            results = {"errors": [e.details()]}  # pyright: ignore
+        return results
+
+    def _to_grpc_request(self) -> Optional["search_get_pb2.SearchRequest"]:
+        """
+        Translate the query into a gRPC `Search` request.
+
+        Returns
+        -------
+        Optional[search_get_pb2.SearchRequest]
+            The request, None if the query uses features that are only available through GraphQL,
+            e.g. `nearText`, `groupBy`, generative search or filters on referenced objects.
+        """
+        additional_properties = self._grpc_additional_properties()
+        if (
+            additional_properties is None
+            or not (
                 self._near_clause is None
                 or isinstance(self._near_clause, NearVector)
                 or isinstance(self._near_clause, NearObject)
             )
-            and len(self._additional) == 1
-            and (
-                len(self._additional["__one_level"]) == 0 or "id" in self._additional["__one_level"]
-            )
-            and self._offset is None
-            and self._sort is None
-            and self._where is None
-            and self._after is None
-            and all(
-                "..." not in prop and "_additional" not in prop
+            or self._group_by is not None
+            or any(
+                "..." in prop or "_additional" in prop
                 for prop in self._properties
                 if isinstance(prop, str)
             )  # no ref props as strings
-        )
-        if grpc_enabled:
-            metadata: Union[Tuple, Tuple[Tuple[Literal["authorization"], str]]] = ()
-            access_token = self._connection.get_current_bearer_token()
-            if len(access_token) > 0:
-                metadata = (("authorization", access_token),)
-
-            try:
-                res, _ = self._connection.grpc_stub.Search.with_call(  # type: ignore
-                    search_get_pb2.SearchRequest(
-                        collection=self._class_name,
-                        limit=self._limit,
-                        near_vector=(
-                            search_get_pb2.NearVector(
-                                vector=self._near_clause.content["vector"],
-                                certainty=self._near_clause.content.get("certainty", None),
-                                distance=self._near_clause.content.get("distance", None),
-                            )
-                            if self._near_clause is not None
-                            and isinstance(self._near_clause, NearVector)
-                            else None
-                        ),
-                        near_object=(
-                            search_get_pb2.NearObject(
-                                id=self._near_clause.content["id"],
-                                certainty=self._near_clause.content.get("certainty", None),
-                                distance=self._near_clause.content.get("distance", None),
-                            )
-                            if self._near_clause is not None
-                            and isinstance(self._near_clause, NearObject)
-                            else None
-                        ),
-                        properties=self._convert_references_to_grpc(self._properties),
-                        metadata=(
-                            search_get_pb2.MetadataRequest(
-                                uuid=self._additional_dataclass.uuid,
-                                vector=self._additional_dataclass.vector,
-                                creation_time_unix=self._additional_dataclass.creationTimeUnix,
-                                last_update_time_unix=self._additional_dataclass.lastUpdateTimeUnix,
-                                distance=self._additional_dataclass.distance,
-                                explain_score=self._additional_dataclass.explainScore,
-                                score=self._additional_dataclass.score,
-                            )
-                            if self._additional_dataclass is not None
-                            else None
-                        ),
-                        bm25_search=(
-                            search_get_pb2.BM25(
-                                properties=self._bm25.properties, query=self._bm25.query
-                            )
-                            if self._bm25 is not None
-                            else None
-                        ),
-                        hybrid_search=(
-                            search_get_pb2.Hybrid(
-                                properties=self._hybrid.properties,
-                                query=self._hybrid.query,
-                                alpha=self._hybrid.alpha,
-                                vector=self._hybrid.vector,
-                            )
-                            if self._hybrid is not None
-                            else None
-                        ),
+        ):
+            return None
+
+        filters = None
+        if self._where is not None:
+            filters = self._where._to_grpc()
+            if filters is None:
+                return None
+
+        return search_get_pb2.SearchRequest(
+            uses_123_api=True,
+            collection=self._class_name,
+            tenant=self._tenant,
+            consistency_level=(
+                self._consistency_level._to_grpc() if self._consistency_level is not None else None
+            ),
+            limit=self._limit,
+            offset=self._offset,
+            autocut=self._autocut,
+            after=self._after,
+            sort_by=self._sort._to_grpc() if self._sort is not None else None,
+            filters=filters,
+            near_vector=(
+                search_get_pb2.NearVector(
+                    vector_bytes=_pack_vector(self._near_clause.content["vector"]),
+                    certainty=self._near_clause.content.get("certainty", None),
+                    distance=self._near_clause.content.get("distance", None),
+                    target_vectors=(
+                        [self._near_clause.content["targetVector"]]
+                        if "targetVector" in self._near_clause.content
+                        else None
                     ),
-                    metadata=metadata,
                 )
+                if self._near_clause is not None and isinstance(self._near_clause, NearVector)
+                else None
+            ),
+            near_object=(
+                search_get_pb2.NearObject(
+                    id=self._near_clause.content["id"],
+                    certainty=self._near_clause.content.get("certainty", None),
+                    distance=self._near_clause.content.get("distance", None),
+                )
+                if self._near_clause is not None and isinstance(self._near_clause, NearObject)
+                else None
+            ),
+            properties=self._convert_references_to_grpc(self._properties),
+            metadata=search_get_pb2.MetadataRequest(
+                uuid=additional_properties.uuid,
+                vector=additional_properties.vector,
+                creation_time_unix=additional_properties.creationTimeUnix,
+                last_update_time_unix=additional_properties.lastUpdateTimeUnix,
+                distance=additional_properties.distance,
+                certainty=additional_properties.certainty,
+                explain_score=additional_properties.explainScore,
+                score=additional_properties.score,
+            ),
+            bm25_search=(
+                search_get_pb2.BM25(properties=self._bm25.properties, query=self._bm25.query)
+                if self._bm25 is not None
+                else None
+            ),
+            hybrid_search=(
+                search_get_pb2.Hybrid(
+                    properties=self._hybrid.properties,
+                    query=self._hybrid.query,
+                    alpha=self._hybrid.alpha,
+                    vector=self._hybrid.vector,
+                )
+                if self._hybrid is not None
+                else None
+            ),
+        )
 
-                objects = []
-                for result in res.results:
-                    obj = self._convert_references_to_grpc_result(result.properties)
-                    additional = self._extract_additional_properties(result.metadata)
-                    if len(additional) > 0:
-                        obj["_additional"] = additional
-                    objects.append(obj)
-
-                results: Union[Dict[str, Dict[str, Dict[str, List]]], Dict[str, List]] = {
-                    "data": {"Get": {self._class_name: objects}}
-                }
-
-            except grpc.RpcError as e:
-                results = {"errors": [e.details()]}  # pyright: ignore
-            return results
-        else:
-            return super().do()
+    def _grpc_additional_properties(self) -> Optional[AdditionalProperties]:
+        """
+        The `_additional` fields of the query as `AdditionalProperties`, None if some of them can
+        only be requested through GraphQL.
+        """
+        if self._additional_dataclass is not None:
+            return self._additional_dataclass
+        if len(self._additional) > 1:  # clauses with sub-fields, e.g. `classification{...}`
+            return None
+        one_level: Set[str] = self._additional["__one_level"]
+        if not one_level.issubset(_GRPC_ADDITIONAL_PROPERTIES):
+            return None
+        return AdditionalProperties(
+            **{("uuid" if prop == "id" else prop): True for prop in one_level}
+        )
 
     def _extract_additional_properties(
-        self, props: "search_get_pb2.MetadataResult"
+        self, props: "search_get_pb2.MetadataResult", additional_properties: AdditionalProperties
     ) -> Dict[str, str]:
         additional_props: Dict[str, Any] = {}
-        if self._additional_dataclass is None:
-            return additional_props
-
-        if self._additional_dataclass.uuid:
+        if additional_properties.uuid:
             additional_props["id"] = props.id
-        if self._additional_dataclass.vector:
-            additional_props["vector"] = (
-                [float(num) for num in props.vector] if len(props.vector) > 0 else None
-            )
-        if self._additional_dataclass.distance:
+        if additional_properties.vector:
+            if len(props.vector_bytes) > 0:
+                additional_props["vector"] = list(
+                    struct.unpack(f"{len(props.vector_bytes) // 4}f", props.vector_bytes)
+                )
+            else:
+                additional_props["vector"] = (
+                    [float(num) for num in props.vector] if len(props.vector) > 0 else None
+                )
+        if additional_properties.distance:
             additional_props["distance"] = props.distance if props.distance_present else None
-        if self._additional_dataclass.certainty:
+        if additional_properties.certainty:
             additional_props["certainty"] = props.certainty if props.certainty_present else None
-        if self._additional_dataclass.creationTimeUnix:
+        if additional_properties.creationTimeUnix:
             additional_props["creationTimeUnix"] = (
                 str(props.creation_time_unix) if props.creation_time_unix_present else None
             )
-        if self._additional_dataclass.lastUpdateTimeUnix:
+        if additional_properties.lastUpdateTimeUnix:
             additional_props["lastUpdateTimeUnix"] = (
                 str(props.last_update_time_unix) if props.last_update_time_unix_present else None
             )
-        if self._additional_dataclass.score:
+        if additional_properties.score:
             additional_props["score"] = props.score if props.score_present else None
-        if self._additional_dataclass.explainScore:
+        if additional_properties.explainScore:
             additional_props["explainScore"] = (
                 props.explain_score if props.explain_score_present else None
             )
@@ -1948,9 +2014,10 @@ class GetBuilder(GraphQL):
     def _convert_references_to_grpc_result(
         self, properties: "search_get_pb2.PropertiesResult"
     ) -> Dict:
-        result: Dict[str, Any] = {}
-        for name, non_ref_prop in properties.non_ref_properties.items():
-            result[name] = non_ref_prop
+        result: Dict[str, Any] = {
+            name: _grpc_value_to_json(value)
+            for name, value in properties.non_ref_props.fields.items()
+        }
 
         for ref_prop in properties.ref_props:
             result[ref_prop.prop_name] = [
@@ -2092,3 +2159,38 @@ class GetBuilder(GraphQL):
                     " `list` then all items must be of type `str`!"
                 )
             self._additional[clause_with_settings].add(value)
+
+
+def _grpc_value_to_json(value: "properties_pb2.Value") -> Any:
+    """
+    Convert a typed property of a gRPC result into the value GraphQL returns for it.
+    """
+    kind = value.WhichOneof("kind")
+    if kind in (
+        "int_value",
+        "number_value",
+        "bool_value",
+        "string_value",
+        "text_value",
+        "uuid_value",
+        "date_value",
+        "blob_value",
+    ):
+        return getattr(value, kind)
+    if kind == "list_value":
+        return [_grpc_value_to_json(item) for item in value.list_value.values]
+    if kind == "object_value":
+        return {name: _grpc_value_to_json(item) for name, item in value.object_value.fields.items()}
+    if kind == "geo_value":
+        return {"latitude": value.geo_value.latitude, "longitude": value.geo_value.longitude}
+    if kind == "phone_value":
+        return {
+            "countryCode": value.phone_value.country_code,
+            "defaultCountry": value.phone_value.default_country,
+            "input": value.phone_value.input,
+            "internationalFormatted": value.phone_value.international_formatted,
+            "national": value.phone_value.national,
+            "nationalFormatted": value.phone_value.national_formatted,
+            "valid": value.phone_value.valid,
+        }
+    return None
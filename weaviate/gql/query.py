@@ -2,15 +2,17 @@
 GraphQL query module.
 """
 
-from typing import List, Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Dict, Optional, Sequence, Union
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from .aggregate import AggregateBuilder
+from .filter import GraphQL
 from .get import GetBuilder, PROPERTIES
 from .multi_get import MultiGetBuilder
-from ..util import _decode_json_response_dict
+from ..util import _check_positive_num, _decode_json_response_dict
 
 
 class Query:
@@ -173,3 +175,63 @@ class Query:
         res = _decode_json_response_dict(response, "GQL query failed")
         assert res is not None
         return res
+
+    def execute_many(
+        self, queries: Sequence[Union[GraphQL, str]], max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many independent queries concurrently, each as its own request. Unlike `multi_get`,
+        which bundles the queries into one GraphQL document that is resolved as a single request,
+        the queries are spread over the pooled HTTP connections and `get` queries use the gRPC API
+        where possible (see `GetBuilder.do`).
+
+        Parameters
+        ----------
+        queries : Sequence of GraphQL or str
+            The queries to run, either builders like the ones returned by `get`, `multi_get` and
+            `aggregate`, or GraphQL strings which are sent like in `raw`.
+        max_concurrency : int, optional
+            The maximal number of queries in flight at the same time. Should not exceed the
+            `session_pool_maxsize` of the connection config, by default 8
+
+        Returns
+        -------
+        list of dict
+            The response of each query, in the order of `queries`.
+
+        Examples
+        --------
+        >>> client.query.execute_many(
+        ...     [client.query.get(class_name, ["name"]).with_limit(10) for class_name in classes]
+        ...     + [client.query.aggregate("Article").with_meta_count()],
+        ...     max_concurrency=16,
+        ... )
+
+        Raises
+        ------
+        TypeError
+            If one of the queries is neither a GraphQL builder nor a str.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status. The exception of the first failing query is
+            raised after all the queries have finished.
+        """
+
+        _check_positive_num(max_concurrency, "max_concurrency", int)
+        for query in queries:
+            if not isinstance(query, (GraphQL, str)):
+                raise TypeError(
+                    f"All queries must be GraphQL builders or of type str but one was {type(query)}"
+                )
+        if len(queries) == 0:
+            return []
+
+        def execute(query: Union[GraphQL, str]) -> Dict[str, Any]:
+            return self.raw(query) if isinstance(query, str) else query.do()
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(queries)), thread_name_prefix="weaviate-query"
+        ) as executor:
+            futures = [executor.submit(execute, query) for query in queries]
+        return [future.result() for future in futures]
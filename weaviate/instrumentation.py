@@ -0,0 +1,174 @@
+"""
+Hooks to observe the requests and the batching of the v4 client, e.g. to export metrics or traces.
+"""
+
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, ContextManager, Dict, Literal, Optional
+
+from weaviate.logger import logger
+
+
+@dataclass
+class RequestEvent:
+    """A single request that was sent to Weaviate.
+
+    Attributes:
+        `protocol`
+            The protocol of the request, either `"http"` or `"grpc"`.
+        `method`
+            The HTTP method or the name of the gRPC method, e.g. `"GET"` or `"Search"`.
+        `target`
+            The URL of an HTTP request or the collection of a gRPC request, if any.
+        `duration_seconds`
+            The time spent waiting for the response.
+        `serialization_seconds`
+            The time spent encoding the request before it was sent. `None` if it is not measured separately.
+        `request_bytes`
+            The size of the encoded request body.
+        `response_bytes`
+            The size of the encoded response body, `0` if the request failed.
+        `status_code`
+            The HTTP status code of the response, `None` for gRPC requests and failed HTTP requests.
+        `error`
+            The exception raised by the request, if it failed.
+    """
+
+    protocol: Literal["http", "grpc"]
+    method: str
+    target: Optional[str]
+    duration_seconds: float
+    serialization_seconds: Optional[float]
+    request_bytes: int
+    response_bytes: int
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class BatchSendEvent:
+    """A batch of objects and/or references that was sent by one of the batching context managers.
+
+    Attributes:
+        `objects`
+            The number of objects in the batch.
+        `references`
+            The number of references in the batch.
+        `failed_objects`
+            The number of objects that could not be imported.
+        `failed_references`
+            The number of references that could not be imported.
+        `retried_objects`
+            The number of objects that were put back into the queue to be retried, e.g. after a rate limit.
+        `duration_seconds`
+            The time it took to send the batch and process the response.
+    """
+
+    objects: int
+    references: int
+    failed_objects: int
+    failed_references: int
+    retried_objects: int
+    duration_seconds: float
+
+
+@dataclass
+class BatchStateEvent:
+    """A snapshot of the internal state of a batching context manager, reported about once a second while it is open.
+
+    Attributes:
+        `queued_objects`
+            The number of objects waiting to be sent.
+        `queued_references`
+            The number of references waiting to be sent.
+        `recommended_num_objects`
+            The number of objects that are currently sent per request.
+        `concurrent_requests`
+            The number of requests that are currently allowed to run concurrently.
+        `active_requests`
+            The number of requests that are currently running.
+    """
+
+    queued_objects: int
+    queued_references: int
+    recommended_num_objects: int
+    concurrent_requests: int
+    active_requests: int
+
+
+class Instrumentation:
+    """Base class for client-side metrics and tracing hooks.
+
+    All hooks do nothing by default. Subclass it, override the hooks you are interested in and pass an instance to the
+    client with `AdditionalConfig(instrumentation=...)`.
+
+    The hooks are called synchronously from the thread that runs the instrumented code, which is often the event loop
+    thread, so they should be fast and must not block. Exceptions raised by a hook are logged and otherwise ignored.
+
+    Example:
+        >>> class Metrics(Instrumentation):
+        ...     def on_request(self, event: RequestEvent) -> None:
+        ...         latency.record(event.duration_seconds, {"method": event.method})
+        ...
+        ...     def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+        ...         return tracer.start_as_current_span(name, attributes=attributes)  # OpenTelemetry
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called after every HTTP and gRPC request, successful or not."""
+
+    def on_batch_send(self, event: BatchSendEvent) -> None:
+        """Called after every batch that was sent by a batching context manager."""
+
+    def on_batch_state(self, event: BatchStateEvent) -> None:
+        """Called periodically with the state of the open batching context managers."""
+
+    def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+        """Return a context manager that encloses a single request, e.g. an OpenTelemetry span."""
+        return nullcontext()
+
+
+def _call_hook(instrumentation: Optional[Instrumentation], hook: str, event: Any) -> None:
+    if instrumentation is None:
+        return
+    try:
+        getattr(instrumentation, hook)(event)
+    except Exception as e:
+        logger.warning(f"Instrumentation hook {hook} failed: {e!r}")
+
+
+class _GuardedSpan:
+    """Enters and exits the span of a hook, logging and otherwise ignoring its exceptions."""
+
+    def __init__(self, instrumentation: Instrumentation, name: str, attributes: Dict[str, Any]):
+        self.__instrumentation = instrumentation
+        self.__name = name
+        self.__attributes = attributes
+        self.__span: Optional[ContextManager[Any]] = None
+
+    def __enter__(self) -> Any:
+        try:
+            span = self.__instrumentation.span(self.__name, self.__attributes)
+            value = span.__enter__()
+        except Exception as e:
+            logger.warning(f"Instrumentation span {self.__name} failed: {e!r}")
+            return None
+        self.__span = span
+        return value
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        # returns None, the exception of the request is never suppressed whatever the span returns
+        if self.__span is None:
+            return
+        try:
+            self.__span.__exit__(exc_type, exc_value, traceback)
+        except Exception as e:
+            logger.warning(f"Instrumentation span {self.__name} failed: {e!r}")
+
+
+def _span(
+    instrumentation: Optional[Instrumentation], name: str, attributes: Dict[str, Any]
+) -> ContextManager[Any]:
+    if instrumentation is None:
+        return nullcontext()
+    return _GuardedSpan(instrumentation, name, attributes)
@@ -0,0 +1,79 @@
+"""
+JSON encoding and decoding of the REST and GraphQL requests and responses.
+
+`orjson` or `msgspec` are used when they are installed, in this order, as they are several times faster than the
+`json` module of the standard library for large payloads like schemas, node listings or reference batches. Set the
+environment variable `WEAVIATE_JSON_CODEC` to `orjson`, `msgspec` or `json` to choose one explicitly.
+
+Anything the fast codec cannot handle, e.g. integers that do not fit into 64 bits or invalid JSON, is retried with the
+standard library. `orjson` is configured to hand `datetime` and dataclass objects to the standard library too, which
+rejects them like it would without a fast codec. The remaining differences to the standard library are:
+
+- `NaN` and `Infinity` floats are encoded as `null` instead of the non-standard `NaN` and `Infinity` literals.
+- `UUID` and `Enum` objects are encoded as their string and value, and `msgspec` also encodes `datetime`, dataclass and
+  `set` objects, instead of raising a `TypeError`.
+- `orjson` decodes integers that do not fit into 64 bits as floats.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Tuple, Union
+
+CODEC_ENV_VAR = "WEAVIATE_JSON_CODEC"
+
+
+def _std_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _std_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def _load_codec(
+    name: Optional[str],
+) -> Tuple[str, Callable[[Any], bytes], Callable[[Union[bytes, str]], Any]]:
+    if name in (None, "orjson"):
+        try:
+            import orjson
+
+            option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+            def orjson_dumps(obj: Any) -> bytes:
+                return orjson.dumps(obj, option=option)
+
+            return "orjson", orjson_dumps, orjson.loads
+        except ImportError:
+            if name is not None:
+                raise
+    if name in (None, "msgspec"):
+        try:
+            import msgspec
+
+            encoder = msgspec.json.Encoder()
+            return "msgspec", encoder.encode, msgspec.json.decode
+        except ImportError:
+            if name is not None:
+                raise
+    if name not in (None, "json"):
+        raise ValueError(f"{CODEC_ENV_VAR} must be one of orjson, msgspec or json, got {name}")
+    return "json", _std_dumps, _std_loads
+
+
+CODEC, _dumps, _loads = _load_codec(os.environ.get(CODEC_ENV_VAR) or None)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode `obj` as UTF-8 JSON bytes."""
+    try:
+        return _dumps(obj)
+    except (TypeError, ValueError, OverflowError):
+        return _std_dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from bytes or str, raises `json.JSONDecodeError` if `data` is not valid JSON."""
+    try:
+        return _loads(data)
+    except (TypeError, ValueError):
+        return _std_loads(data)
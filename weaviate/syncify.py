@@ -1,10 +1,22 @@
 import asyncio
 from functools import wraps
-from typing import TypeVar
+from typing import Any, Callable, TypeVar
 
-from weaviate.event_loop import _EventLoopSingleton
+from weaviate.event_loop import _CallerThreadUnsupportedError, _EventLoop, _EventLoopSingleton
 
 C = TypeVar("C")
+F = TypeVar("F", bound=Callable[..., Any])
+
+_GRPC_ONLY = "__weaviate_grpc_only__"
+
+
+def grpc_only(method: F) -> F:
+    """
+    Marks an async method whose only I/O is gRPC so that, if the connection uses the blocking gRPC transport, its
+    sync version runs directly in the calling thread instead of being handed to the event loop thread.
+    """
+    setattr(method, _GRPC_ONLY, True)
+    return method
 
 
 def convert(cls: C) -> C:
@@ -20,9 +32,16 @@ def convert(cls: C) -> C:
             @wraps(method)  # type: ignore
             def sync_method(self, *args, __new_name=new_name, **kwargs):
                 async_func = getattr(cls, __new_name)
-                return _EventLoopSingleton.get_instance().run_until_complete(
-                    async_func, self, *args, **kwargs
-                )
+                if (
+                    getattr(async_func, _GRPC_ONLY, False)
+                    and self._connection.has_sync_grpc_transport()
+                ):
+                    try:
+                        return _EventLoop.run_in_caller_thread(async_func, self, *args, **kwargs)
+                    except _CallerThreadUnsupportedError:
+                        pass
+                event_loop = self._connection._event_loop or _EventLoopSingleton.get_instance()
+                return event_loop.run_until_complete(async_func, self, *args, **kwargs)
 
             setattr(cls, name, sync_method)
     return cls
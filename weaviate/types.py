@@ -1,5 +1,8 @@
 import datetime
+import mmap
 import uuid as uuid_package
+from io import BufferedReader
+from pathlib import Path
 from typing import Dict, Union, List, Sequence, Tuple
 
 DATE = datetime.datetime
@@ -9,6 +12,7 @@ NUMBER = Union[int, float]
 GEO_COORDINATES = Tuple[float, float]
 VECTORS = Union[Dict[str, List[float]], List[float]]
 INCLUDE_VECTOR = Union[bool, str, List[str]]
+BLOB_INPUT = Union[str, Path, BufferedReader, bytes, bytearray, memoryview, mmap.mmap]
 
 BEACON = "weaviate://localhost/"
 
@@ -3,19 +3,25 @@ Helper functions!
 """
 
 import base64
+import binascii
 import datetime
 import io
 import json
+import mmap
+import threading
+from collections import OrderedDict
+from json import JSONDecodeError
 import os
 import re
+import tempfile
+import time
 import uuid as uuid_lib
 from pathlib import Path
-from typing import Union, Sequence, Any, Optional, List, Dict, Generator, Tuple, cast
+from typing import Union, Sequence, Any, Optional, List, Dict, Tuple, cast
 
 import httpx
 import requests
 import validators
-from requests.exceptions import JSONDecodeError
 
 from weaviate.exceptions import (
     SchemaValidationError,
@@ -24,16 +30,24 @@ from weaviate.exceptions import (
     WeaviateInvalidInputError,
     WeaviateUnsupportedFeatureError,
 )
-from weaviate.types import NUMBER, UUIDS, TIME
+from weaviate import json_codec
+from weaviate.types import BLOB_INPUT, NUMBER, UUIDS, TIME
 from weaviate.validator import _is_valid, _ExtraTypes
 from weaviate.warnings import _Warnings
 
 PYPI_PACKAGE_URL = "https://pypi.org/pypi/weaviate-client/json"
+PYPI_VERSION_CACHE_TTL = (
+    24 * 60 * 60
+)  # How long the latest client version found on PyPI is cached on disk, in seconds
+PYPI_VERSION_CACHE_DISABLE_ENV = "WEAVIATE_DISABLE_VERSION_CACHE"  # Set to 1 to never read or write the cache file, e.g. on read-only file systems
 MAXIMUM_MINOR_VERSION_DELTA = 3  # The maximum delta between minor versions of Weaviate Client that will not trigger an upgrade warning.
 MINIMUM_NO_WARNING_VERSION = (
     "v1.16.0"  # The minimum version of Weaviate that will not trigger an upgrade warning.
 )
-BYTES_PER_CHUNK = 65535  # The number of bytes to read per chunk when encoding files ~ 64kb
+MEDIA_CACHE_MAX_BYTES = (
+    64 * 1024 * 1024
+)  # The maximum size of all encoded files kept by `file_encoder_b64`
+MAX_PATH_LENGTH = 4096  # Longer strings passed as media are never file paths
 
 
 def image_encoder_b64(image_or_image_path: Union[str, io.BufferedReader]) -> str:
@@ -75,17 +89,79 @@ def image_encoder_b64(image_or_image_path: Union[str, io.BufferedReader]) -> str
     return base64.b64encode(content).decode("utf-8")
 
 
-def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) -> str:
+def _bytes_encoder_b64(content: Union[bytes, bytearray, memoryview, mmap.mmap]) -> str:
+    """Encode binary content in a single pass without copying it first."""
+    return binascii.b2a_base64(content, newline=False).decode("ascii")
+
+
+class _EncodedFilesCache:
+    """LRU cache of base64 encoded files keyed by their path, modification time and size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.__max_bytes = max_bytes
+        self.__size = 0
+        self.__lock = threading.Lock()
+        self.__entries: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+
+    def get(self, key: Tuple[str, int, int]) -> Optional[str]:
+        with self.__lock:
+            encoded = self.__entries.get(key)
+            if encoded is not None:
+                self.__entries.move_to_end(key)
+            return encoded
+
+    def put(self, key: Tuple[str, int, int], encoded: str) -> None:
+        if len(encoded) > self.__max_bytes:
+            return
+        with self.__lock:
+            if key in self.__entries:
+                return
+            self.__entries[key] = encoded
+            self.__size += len(encoded)
+            while self.__size > self.__max_bytes:
+                _, evicted = self.__entries.popitem(last=False)
+                self.__size -= len(evicted)
+
+
+_encoded_files = _EncodedFilesCache(MEDIA_CACHE_MAX_BYTES)
+
+
+def _encode_file_at_path(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        stat = None
+    if stat is None or not path.is_file():
+        raise ValueError("No file found at location " + str(path))
+
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if (encoded := _encoded_files.get(key)) is not None:
+        return encoded
+
+    with path.open("br") as file:
+        if stat.st_size == 0:  # empty files cannot be mapped
+            encoded = _bytes_encoder_b64(file.read())
+        else:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                encoded = _bytes_encoder_b64(mapped)
+    _encoded_files.put(key, encoded)
+    return encoded
+
+
+def file_encoder_b64(file_or_file_path: BLOB_INPUT) -> str:
     """
-    Encode a file in a Weaviate understandable format from an io.BufferedReader binary read file or by providing
-    the file path as either a string of a pathlib.Path object
+    Encode a file in a Weaviate understandable format from an io.BufferedReader binary read file, by providing
+    the file path as either a string of a pathlib.Path object or from its binary content.
+
+    Files given by their path are memory mapped and encoded in a single pass. The encoded files are cached by their
+    path, modification time and size, so that the same file is not encoded again by repeated queries.
 
     If you pass an io.BufferedReader object, it is your responsibility to close it after encoding.
 
     Parameters
     ----------
-    file_or_file_path : str, pathlib.Path io.BufferedReader
-        The binary read file or the path to the file.
+    file_or_file_path : str, pathlib.Path, io.BufferedReader, bytes, bytearray, memoryview, mmap.mmap
+        The binary read file, the path to the file or the binary content of the file.
 
     Returns
     -------
@@ -100,50 +176,26 @@ def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) ->
         If the argument is of a wrong data type.
     """
 
-    def _chunks(buffer: io.BufferedReader, chunk_size: int) -> Generator[bytes, Any, Any]:
-        while True:
-            data = buffer.read(chunk_size)
-            if not data:
-                break
-            yield data
-
-    should_close_file = False
-    use_buffering = True
-    file = None
-
-    try:
-        if isinstance(file_or_file_path, str):
-            if not os.path.isfile(file_or_file_path):
-                raise ValueError("No file found at location " + file_or_file_path)
-            file = open(file_or_file_path, "br")
-            should_close_file = True
-            use_buffering = os.path.getsize(file_or_file_path) > BYTES_PER_CHUNK
-        elif isinstance(file_or_file_path, Path):
-            if not file_or_file_path.is_file():
-                raise ValueError("No file found at location " + str(file_or_file_path))
-            file = file_or_file_path.open("br")
-            should_close_file = True
-            use_buffering = file_or_file_path.stat().st_size > BYTES_PER_CHUNK
-        elif isinstance(file_or_file_path, io.BufferedReader):
-            file = file_or_file_path
-        else:
-            raise TypeError(
-                '"file_or_file_path" should be a file path or a binary read file'
-                " (io.BufferedReader)"
-            )
-
-        if use_buffering:
-            encoded: str = ""
-            for chunk in _chunks(file, BYTES_PER_CHUNK):
-                encoded += base64.b64encode(chunk).decode("utf-8")
-        else:
-            encoded = base64.b64encode(file.read()).decode("utf-8")
+    if isinstance(file_or_file_path, (str, Path)):
+        return _encode_file_at_path(Path(file_or_file_path))
+    elif isinstance(file_or_file_path, io.BufferedReader):
+        return _bytes_encoder_b64(file_or_file_path.read())
+    elif isinstance(file_or_file_path, (bytes, bytearray, memoryview, mmap.mmap)):
+        return _bytes_encoder_b64(file_or_file_path)
+    else:
+        raise TypeError(
+            '"file_or_file_path" should be a file path, a binary read file (io.BufferedReader) or bytes'
+        )
 
-    finally:
-        if should_close_file and file is not None:
-            file.close()
 
-    return encoded
+def _parse_media(media: BLOB_INPUT) -> str:
+    """Encode the media of a near media query unless it is already a base64 encoded string."""
+    if isinstance(media, str):  # if already encoded by user or string to path
+        # encoded media is far too long to be a path, no need to ask the filesystem
+        if len(media) <= MAX_PATH_LENGTH and os.path.isfile(media):
+            return file_encoder_b64(media)
+        return media
+    return file_encoder_b64(media)
 
 
 def image_decoder_b64(encoded_image: str) -> bytes:
@@ -847,6 +899,50 @@ def is_weaviate_client_too_old(current_version_str: str, latest_version_str: str
         return False
 
 
+def _pypi_version_cache_path() -> Optional[Path]:
+    """Return the file caching the latest client version on PyPI, `None` if caching is disabled."""
+    if os.environ.get(PYPI_VERSION_CACHE_DISABLE_ENV, "0") == "1":
+        return None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(cache_home) / "weaviate-python-client" / "pypi_version.json"
+
+
+def _read_cached_pypi_version() -> Tuple[bool, Optional[str]]:
+    """Return whether the latest client version on PyPI was looked up recently and the version if it was found."""
+    path = _pypi_version_cache_path()
+    if path is None:
+        return False, None
+    try:
+        with path.open() as file:
+            cached = json.load(file)
+        if time.time() - cached["checked_at"] < PYPI_VERSION_CACHE_TTL:
+            return True, cached["version"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return False, None
+
+
+def _write_cached_pypi_version(version: Optional[str]) -> None:
+    """Remember the latest client version on PyPI, `None` if it could not be looked up."""
+    path = _pypi_version_cache_path()
+    if path is None:
+        return
+    tmp: Optional[str] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as file:
+            tmp = file.name
+            json.dump({"checked_at": time.time(), "version": version}, file)
+        os.replace(tmp, path)  # atomic, concurrently starting clients never read a partial file
+    except (OSError, ValueError, TypeError):
+        # caching is best-effort, the version is looked up again by the next client
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
 def _get_valid_timeout_config(
     timeout_config: Union[Tuple[NUMBER, NUMBER], NUMBER, None]
 ) -> Tuple[NUMBER, NUMBER]:
@@ -922,7 +1018,7 @@ def _decode_json_response_dict(
 
     if 200 <= response.status_code < 300:
         try:
-            json_response = cast(Dict[str, Any], response.json())
+            json_response = cast(Dict[str, Any], json_codec.loads(response.content))
             return json_response
         except JSONDecodeError:
             raise ResponseCannotBeDecodedError(location, response)
@@ -938,7 +1034,7 @@ def _decode_json_response_list(
 
     if 200 <= response.status_code < 300:
         try:
-            json_response = response.json()
+            json_response = json_codec.loads(response.content)
             return cast(list, json_response)
         except JSONDecodeError:
             raise ResponseCannotBeDecodedError(location, response)